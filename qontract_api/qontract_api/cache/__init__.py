@@ -2,5 +2,6 @@
 
 from qontract_api.cache.base import CacheBackend
 from qontract_api.cache.redis import RedisCacheBackend
+from qontract_api.cache.serializer import CompactSerializer
 
-__all__ = ["CacheBackend", "RedisCacheBackend"]
+__all__ = ["CacheBackend", "CompactSerializer", "RedisCacheBackend"]
@@ -5,10 +5,19 @@ All methods are synchronous. FastAPI runs them in thread pool automatically.
 
 Two-Tier Cache Architecture (ADR-016):
 - Tier 1: In-memory LRU cache (Python objects, no serialization overhead)
-- Tier 2: Redis/Valkey backend (JSON serialization for persistence)
+- Tier 2: Redis/Valkey backend (JSON serialization for persistence, optionally
+  compressed via qontract_api.cache.serializer.CompactSerializer)
 
 Cache backends store string values. Callers are responsible for serialization/deserialization.
 
+Bulk Access:
+- get_many()/set_many() read and write several keys in one backend round-trip
+- get_many_obj()/set_many_obj() do the same two-tier, warming the memory cache in bulk
+
+Stampede Protection:
+- get_or_compute() lets a single worker rebuild a missing or expiring entry
+- Within the stale window, other workers keep serving the previous value meanwhile
+
 Singleton Pattern:
 - CacheBackend.get_instance() provides thread-safe singleton per backend type
 - Ensures in-memory cache is shared across all users in the same process
@@ -17,18 +26,21 @@ Singleton Pattern:
 from __future__ import annotations
 
 import threading
+import time
 from abc import ABC, abstractmethod
 from contextlib import contextmanager
+from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any, ClassVar, TypeVar
 
 from cachetools import TTLCache
 from pydantic import BaseModel
 from qontract_utils.json_utils import json_dumps, json_loads
 
+from qontract_api.cache.serializer import UnsupportedCacheFormatError
 from qontract_api.logger import get_logger
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, Generator
+    from collections.abc import Callable, Generator, Iterable, Mapping, Sequence
 
     from redis import Redis
 
@@ -37,6 +49,21 @@ logger = get_logger(__name__)
 T = TypeVar("T", bound=BaseModel)
 
 
+@dataclass(frozen=True)
+class ComputedEntry:
+    """Value cached by get_or_compute() with its freshness deadlines.
+
+    Attributes:
+        value: Cached Pydantic model
+        refresh_at: Unix timestamp after which the value is stale and gets refreshed
+        expires_at: Unix timestamp after which the value must not be served anymore
+    """
+
+    value: Any
+    refresh_at: float
+    expires_at: float
+
+
 class CacheBackend(ABC):
     """Abstract base class for cache backends with two-tier caching.
 
@@ -155,6 +182,12 @@ class CacheBackend(ABC):
         self.serializer = serializer or json_dumps
         self.deserializer = deserializer or json_loads
         self._memory_cache: TTLCache[str, Any] | None = None
+        # TTLCache isn't thread-safe, the Redis invalidation subscriber evicts
+        # entries from a background thread
+        self._memory_lock = threading.Lock()
+        # In-process single-flight locks for get_or_compute(), by key with user count
+        self._flights: dict[str, tuple[threading.Lock, int]] = {}
+        self._flights_lock = threading.Lock()
 
         # Tier 1: In-memory cache (Python objects, no serialization overhead)
         if memory_max_size > 0:
@@ -186,6 +219,33 @@ class CacheBackend(ABC):
         """
         ...
 
+    def get_many(self, keys: Sequence[str]) -> list[str | None]:
+        """Get string values for several keys.
+
+        The default implementation calls get() per key. Backends override it
+        with a single round-trip (e.g. Redis MGET).
+
+        Args:
+            keys: Cache keys
+
+        Returns:
+            Cached string values in key order, None for keys that don't exist
+        """
+        return [self.get(key) for key in keys]
+
+    def set_many(self, values: Mapping[str, str], ttl: int | None = None) -> None:
+        """Set string values for several keys with optional TTL.
+
+        The default implementation calls set() per key. Backends override it
+        with a single round-trip (e.g. a Redis pipeline).
+
+        Args:
+            values: String values by cache key
+            ttl: Time-to-live in seconds (None = no expiration)
+        """
+        for key, value in values.items():
+            self.set(key, value, ttl)
+
     @abstractmethod
     def _delete_from_backend(self, key: str) -> None:
         """Delete key from backend storage (Redis/Valkey).
@@ -202,8 +262,7 @@ class CacheBackend(ABC):
             key: Cache key to delete
         """
         # Tier 1: Delete from memory cache
-        if self._memory_cache is not None:
-            self._memory_cache.pop(key, None)
+        self._memory_pop(key)
 
         # Tier 2: Delete from Redis backend
         self._delete_from_backend(key)
@@ -246,7 +305,27 @@ class CacheBackend(ABC):
         Does not affect Redis cache (Tier 2).
         """
         if self._memory_cache is not None:
-            self._memory_cache.clear()
+            with self._memory_lock:
+                self._memory_cache.clear()
+
+    def _memory_get(self, key: str) -> Any | None:
+        """Get a value from the memory cache (Tier 1), None if missing."""
+        if self._memory_cache is None:
+            return None
+        with self._memory_lock:
+            return self._memory_cache.get(key)
+
+    def _memory_set(self, values: Mapping[str, Any]) -> None:
+        """Set values in the memory cache (Tier 1)."""
+        if self._memory_cache is not None:
+            with self._memory_lock:
+                self._memory_cache.update(values)
+
+    def _memory_pop(self, key: str) -> None:
+        """Evict a key from the memory cache (Tier 1)."""
+        if self._memory_cache is not None:
+            with self._memory_lock:
+                self._memory_cache.pop(key, None)
 
     def get_obj(self, key: str, cls: type[T]) -> T | None:
         """Get object from cache with two-tier lookup (memory → Redis).
@@ -265,8 +344,8 @@ class CacheBackend(ABC):
         """
         # Tier 1: Memory cache (99% hit rate expected - FAST!)
         # TODO: https://github.com/app-sre/qontract-reconcile/pull/5332#discussion_r2608966256
-        if self._memory_cache is not None and key in self._memory_cache:
-            return self._memory_cache[key]
+        if (obj := self._memory_get(key)) is not None:
+            return obj
 
         # Tier 2: Redis/Valkey cache (JSON deserialization)
         try:
@@ -280,15 +359,28 @@ class CacheBackend(ABC):
             )
             return None
 
-        data = self.deserializer(value)
+        data = self._deserialize(key, value)
+        if data is None:
+            return None
         obj = cls.model_validate(data)
 
         # Warm memory cache for next access
-        if self._memory_cache is not None:
-            self._memory_cache[key] = obj
+        self._memory_set({key: obj})
 
         return obj
 
+    def _deserialize(self, key: str, value: str) -> Any:
+        """Deserialize a Tier 2 value, None if it was written in an unsupported format.
+
+        Lets processes still running an older serializer treat values written in a
+        newer format as cache misses during a rollout.
+        """
+        try:
+            return self.deserializer(value)
+        except UnsupportedCacheFormatError as e:
+            logger.warning(f"Ignoring cached value: {e}", cache_key=key)
+            return None
+
     def set_obj(self, key: str, value: Any, ttl: int | None = None) -> None:
         """Set object in cache (both tiers: memory + Redis).
 
@@ -302,8 +394,7 @@ class CacheBackend(ABC):
             ttl: Time-to-live in seconds (None = no expiration)
         """
         # Tier 1: Memory cache (Python object, no serialization)
-        if self._memory_cache is not None:
-            self._memory_cache[key] = value
+        self._memory_set({key: value})
 
         # Tier 2: Redis cache (JSON serialization for persistence)
         try:
@@ -315,6 +406,210 @@ class CacheBackend(ABC):
                 cache_key=key,
             )
 
+    def get_many_obj(self, keys: Iterable[str], cls: type[T]) -> dict[str, T]:
+        """Get several objects from cache with two-tier lookup (memory → Redis).
+
+        Keys missing in the memory cache (Tier 1) are fetched from Redis (Tier 2)
+        with a single get_many() call and warm the memory cache.
+
+        Args:
+            keys: Cache keys
+            cls: Pydantic BaseModel class to deserialize into
+
+        Returns:
+            Deserialized Pydantic model instances by key, keys that don't exist
+            are left out
+        """
+        found: dict[str, T] = {}
+        missing: list[str] = []
+        for key in dict.fromkeys(keys):
+            if (obj := self._memory_get(key)) is not None:
+                found[key] = obj
+            else:
+                missing.append(key)
+        if not missing:
+            return found
+
+        try:
+            values = self.get_many(missing)
+        except (ConnectionError, TimeoutError) as e:
+            logger.warning(
+                f"Cache backend unavailable, memory-only mode: {e}",
+                cache_keys=missing,
+            )
+            return found
+
+        for key, value in zip(missing, values, strict=True):
+            data = None if value is None else self._deserialize(key, value)
+            if data is None:
+                continue
+            obj = cls.model_validate(data)
+            self._memory_set({key: obj})
+            found[key] = obj
+        return found
+
+    def set_many_obj(self, values: Mapping[str, Any], ttl: int | None = None) -> None:
+        """Set several objects in cache (both tiers: memory + Redis).
+
+        Args:
+            values: Objects to cache by key (will be serialized for Redis)
+            ttl: Time-to-live in seconds (None = no expiration)
+        """
+        self._memory_set(values)
+
+        try:
+            self.set_many(
+                {key: self.serializer(value) for key, value in values.items()}, ttl
+            )
+        except (ConnectionError, TimeoutError) as e:
+            logger.warning(
+                f"Cache backend unavailable, memory-only mode: {e}",
+                cache_keys=list(values),
+            )
+
+    def get_or_compute(
+        self,
+        key: str,
+        cls: type[T],
+        compute: Callable[[], T],
+        ttl: int,
+        stale_ttl: int = 0,
+        lock_timeout: float = 300,
+        cacheable: Callable[[T], bool] | None = None,
+    ) -> T:
+        """Get object from cache, computing and caching it if missing or stale.
+
+        Stampede protection:
+        - Missing entry: a single worker computes it (in-process single-flight +
+          distributed lock), concurrent callers wait and get the computed value
+        - Stale entry (older than ttl, younger than ttl + stale_ttl): a single
+          worker per process refreshes it, all other callers keep getting the
+          stale value instead of waiting
+
+        Entries carry their own freshness deadlines, so keys used with
+        get_or_compute() must not be read or written with get_obj()/set_obj().
+
+        Args:
+            key: Cache key
+            cls: Pydantic BaseModel class to deserialize into
+            compute: Function fetching the current value, e.g. from an upstream API
+            ttl: Seconds a computed value is served as is
+            stale_ttl: Seconds a value is still served after ttl while being refreshed
+            lock_timeout: Distributed lock timeout in seconds
+            cacheable: Predicate deciding whether a computed value is cached at
+                all, e.g. to never share transient failures. Default: cache all
+
+        Returns:
+            Cached or freshly computed Pydantic model instance
+        """
+        entry = self._get_entry(key, cls)
+        if entry is not None:
+            if time.time() < entry.refresh_at:
+                return entry.value
+            # Stale-while-revalidate: only one worker refreshes, others don't wait
+            with self._single_flight(key, blocking=False) as acquired:
+                if not acquired:
+                    return entry.value
+                return self._compute_entry(
+                    key, cls, compute, ttl, stale_ttl, lock_timeout, cacheable
+                )
+
+        with self._single_flight(key):
+            return self._compute_entry(
+                key, cls, compute, ttl, stale_ttl, lock_timeout, cacheable
+            )
+
+    def _compute_entry(
+        self,
+        key: str,
+        cls: type[T],
+        compute: Callable[[], T],
+        ttl: int,
+        stale_ttl: int,
+        lock_timeout: float,
+        cacheable: Callable[[T], bool] | None,
+    ) -> T:
+        """Compute and cache the entry for get_or_compute() under the distributed lock."""
+        with self.lock(key, timeout=lock_timeout):
+            # Double-check Redis: another worker or process may have refreshed it
+            entry = self._get_entry(key, cls, memory=False)
+            if entry is not None and time.time() < entry.refresh_at:
+                self._memory_set({key: entry})
+                return entry.value
+
+            value = compute()
+            if cacheable is not None and not cacheable(value):
+                return value
+            now = time.time()
+            entry = ComputedEntry(
+                value=value, refresh_at=now + ttl, expires_at=now + ttl + stale_ttl
+            )
+            self._memory_set({key: entry})
+            try:
+                self.set(
+                    key,
+                    self.serializer({
+                        "refresh_at": entry.refresh_at,
+                        "expires_at": entry.expires_at,
+                        "value": value.model_dump(mode="json", by_alias=True),
+                    }),
+                    ttl + stale_ttl,
+                )
+            except (ConnectionError, TimeoutError) as e:
+                logger.warning(
+                    f"Cache backend unavailable, memory-only mode: {e}",
+                    cache_key=key,
+                )
+            return value
+
+    def _get_entry(
+        self, key: str, cls: type[T], *, memory: bool = True
+    ) -> ComputedEntry | None:
+        """Get a get_or_compute() entry that hasn't expired yet."""
+        entry: ComputedEntry | None = None
+        if memory:
+            entry = self._memory_get(key)
+
+        if entry is None:
+            try:
+                value = self.get(key)
+            except (ConnectionError, TimeoutError) as e:
+                logger.warning(
+                    f"Cache backend unavailable, memory-only mode: {e}",
+                    cache_key=key,
+                )
+                return None
+            data = None if value is None else self._deserialize(key, value)
+            if data is None:
+                return None
+            entry = ComputedEntry(
+                value=cls.model_validate(data["value"]),
+                refresh_at=data["refresh_at"],
+                expires_at=data["expires_at"],
+            )
+            self._memory_set({key: entry})
+
+        return entry if time.time() < entry.expires_at else None
+
+    @contextmanager
+    def _single_flight(self, key: str, *, blocking: bool = True) -> Generator[bool]:
+        """In-process lock per key, yields whether it was acquired."""
+        with self._flights_lock:
+            lock, users = self._flights.get(key, (threading.Lock(), 0))
+            self._flights[key] = (lock, users + 1)
+        acquired = lock.acquire(blocking=blocking)
+        try:
+            yield acquired
+        finally:
+            if acquired:
+                lock.release()
+            with self._flights_lock:
+                lock, users = self._flights[key]
+                if users == 1:
+                    del self._flights[key]
+                else:
+                    self._flights[key] = (lock, users - 1)
+
     @abstractmethod
     @contextmanager
     def lock(self, key: str, timeout: float = 300) -> Generator[None]:
@@ -7,6 +7,7 @@ Uses CacheBackend.get_instance() factory pattern.
 from redis import Redis
 
 from qontract_api.cache.base import CacheBackend
+from qontract_api.cache.serializer import CompactSerializer
 from qontract_api.config import settings
 
 
@@ -36,11 +37,19 @@ def get_cache() -> CacheBackend:
             encoding="utf-8",
             decode_responses=True,
         )
+        serializer = (
+            CompactSerializer(codec=settings.cache_compression_codec)
+            if settings.cache_serializer == "compact"
+            else None
+        )
         return CacheBackend.get_instance(
             backend_type="redis",
             client=client,
+            serializer=serializer.serialize if serializer else None,
+            deserializer=CompactSerializer.deserialize,
             memory_max_size=settings.cache_memory_max_size,
             memory_ttl=settings.cache_memory_ttl,
+            invalidation_channel=settings.cache_invalidation_channel or None,
         )
     msg = f"Unsupported cache backend: {settings.cache_backend}"
     raise ValueError(msg)
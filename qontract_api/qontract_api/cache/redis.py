@@ -2,15 +2,26 @@
 
 from __future__ import annotations
 
+import time
+import uuid
 from contextlib import contextmanager, suppress
 from typing import TYPE_CHECKING, Any
 
+from qontract_utils.json_utils import json_dumps, json_loads
+
 from qontract_api.cache.base import CacheBackend
+from qontract_api.logger import get_logger
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, Generator
+    from collections.abc import Callable, Generator, Iterable, Mapping, Sequence
 
     from redis import Redis
+    from redis.client import PubSub, PubSubWorkerThread
+
+logger = get_logger(__name__)
+
+# Pause before the subscriber polls again after a connection error
+INVALIDATION_RETRY_SECONDS = 1.0
 
 
 class RedisCacheBackend(CacheBackend):
@@ -21,6 +32,11 @@ class RedisCacheBackend(CacheBackend):
     - Tier 2: Redis/Valkey (JSON strings, persistent/shared)
 
     Stores values as strings. Caller is responsible for serialization/deserialization.
+
+    Tier-1 Invalidation:
+    - With an invalidation_channel, every write/delete in Redis is published on it
+    - Each backend instance subscribes and evicts those keys from its memory cache,
+      so other processes/pods don't serve stale Tier-1 data until memory_ttl expires
     """
 
     def __init__(
@@ -30,6 +46,7 @@ class RedisCacheBackend(CacheBackend):
         deserializer: Callable[[str], Any] | None = None,
         memory_max_size: int = 1000,
         memory_ttl: int = 60,
+        invalidation_channel: str | None = None,
     ) -> None:
         """Initialize Redis/Valkey cache backend with two-tier caching.
 
@@ -39,6 +56,8 @@ class RedisCacheBackend(CacheBackend):
             deserializer: Function to deserialize strings to objects (default: json_loads)
             memory_max_size: Max items in memory cache (LRU eviction). 0 = disabled.
             memory_ttl: Memory cache TTL in seconds
+            invalidation_channel: Pub/sub channel to broadcast and receive Tier-1
+                invalidations on (None = disabled)
         """
         super().__init__(
             serializer=serializer,
@@ -47,6 +66,16 @@ class RedisCacheBackend(CacheBackend):
             memory_ttl=memory_ttl,
         )
         self._client = client
+        # Identifies this instance's own messages, its memory cache is already current
+        self._instance_id = uuid.uuid4().hex
+        self._invalidation_channel = invalidation_channel
+        self._invalidation_thread: PubSubWorkerThread | None = None
+        if invalidation_channel and self._memory_cache is not None:
+            pubsub = client.pubsub(ignore_subscribe_messages=True)
+            pubsub.subscribe(**{invalidation_channel: self._on_invalidation})
+            self._invalidation_thread = pubsub.run_in_thread(
+                daemon=True, exception_handler=self._on_invalidation_error
+            )
 
     def get(self, key: str) -> str | None:
         """Get value from cache as string.
@@ -72,6 +101,38 @@ class RedisCacheBackend(CacheBackend):
             self.client.setex(key, ttl, value)
         else:
             self.client.set(key, value)
+        self._publish_invalidation([key])
+
+    def get_many(self, keys: Sequence[str]) -> list[str | None]:
+        """Get values for several keys in one round-trip (MGET).
+
+        Args:
+            keys: Cache keys
+
+        Returns:
+            Cached string values in key order, None for keys that don't exist
+        """
+        if not keys:
+            return []
+        return [str(value) if value else None for value in self.client.mget(keys)]
+
+    def set_many(self, values: Mapping[str, str], ttl: int | None = None) -> None:
+        """Set values for several keys in one round-trip (pipeline).
+
+        Args:
+            values: String values by cache key
+            ttl: Time-to-live in seconds (None = no expiration)
+        """
+        if not values:
+            return
+        pipeline = self.client.pipeline(transaction=False)
+        for key, value in values.items():
+            if ttl:
+                pipeline.setex(key, ttl, value)
+            else:
+                pipeline.set(key, value)
+        self._publish_invalidation(values, client=pipeline)
+        pipeline.execute()
 
     def _delete_from_backend(self, key: str) -> None:
         """Delete key from Redis backend storage.
@@ -80,6 +141,7 @@ class RedisCacheBackend(CacheBackend):
             key: Cache key to delete
         """
         self.client.delete(key)
+        self._publish_invalidation([key])
 
     def exists(self, key: str) -> bool:
         """Check if key exists in cache.
@@ -111,8 +173,52 @@ class RedisCacheBackend(CacheBackend):
         Note: Synchronous redis client uses connection pool which is
         closed automatically. Explicit close for cleanup.
         """
+        if self._invalidation_thread is not None:
+            self._invalidation_thread.stop()
+            self._invalidation_thread = None
         self.client.close()
 
+    def _publish_invalidation(
+        self, keys: Iterable[str], client: Redis | None = None
+    ) -> None:
+        """Tell other instances to evict the given keys from their memory cache.
+
+        Args:
+            keys: Cache keys written or deleted in Redis
+            client: Client or pipeline to publish with (default: self.client)
+        """
+        if not self._invalidation_channel:
+            return
+        message = json_dumps({"origin": self._instance_id, "keys": list(keys)})
+        (client or self.client).publish(self._invalidation_channel, message)
+
+    def _on_invalidation(self, message: dict[str, Any]) -> None:
+        """Evict keys written or deleted by another instance from the memory cache."""
+        if self._memory_cache is None:
+            return
+        try:
+            data = json_loads(message["data"])
+            origin, keys = data["origin"], data["keys"]
+        except TypeError, ValueError, KeyError:
+            logger.warning("Ignoring malformed cache invalidation message")
+            return
+        if origin == self._instance_id:
+            return
+        for key in keys:
+            self._memory_pop(key)
+
+    def _on_invalidation_error(
+        self, e: BaseException, _pubsub: PubSub, _thread: PubSubWorkerThread
+    ) -> None:
+        """Handle subscriber errors, the pub/sub connection is re-established on the next poll.
+
+        Invalidations published while disconnected are lost, so the memory cache
+        is cleared to not serve stale Tier-1 data.
+        """
+        logger.warning(f"Cache invalidation subscriber failed: {e}")
+        self.clear_memory_cache()
+        time.sleep(INVALIDATION_RETRY_SECONDS)
+
     @property
     def client(self) -> Redis:
         """Return the underlying Redis client."""
@@ -0,0 +1,128 @@
+"""Compact serialization for cache Tier 2 (Redis/Valkey) values.
+
+The default JSON serializer (json_dumps) stores large cached collections
+(e.g. Slack users, Glitchtip projects) as multi-megabyte strings.
+CompactSerializer stores them compressed instead.
+
+Value Format:
+- Small values (below min_size) are plain compact JSON, as before
+- Larger values are "qc<version>:<codec>:<base64 payload>", the payload being
+  the compressed compact JSON document
+
+Safe Rollout:
+- deserialize() reads both formats, whatever the configured serializer
+- Deploy first, then switch cache_serializer to "compact" once every process
+  reads the new format
+- Values in a format this process can't read raise UnsupportedCacheFormatError,
+  which the cache treats as a miss
+"""
+
+from __future__ import annotations
+
+import base64
+import json
+import zlib
+from typing import TYPE_CHECKING, Any
+
+from pydantic import BaseModel
+from qontract_utils.json_utils import json_dumps, json_loads
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+FORMAT_VERSION = 1
+FORMAT_PREFIX = "qc"
+DEFAULT_MIN_SIZE = 1024
+
+type Codec = tuple[Callable[[bytes], bytes], Callable[[bytes], bytes]]
+
+CODECS: dict[str, Codec] = {
+    "zlib": (lambda data: zlib.compress(data, 1), zlib.decompress),
+}
+
+try:
+    from compression import zstd  # Python 3.14+ stdlib
+
+    CODECS["zstd"] = (zstd.compress, zstd.decompress)
+    DEFAULT_CODEC = "zstd"
+except ImportError:
+    DEFAULT_CODEC = "zlib"
+
+
+class UnsupportedCacheFormatError(ValueError):
+    """Cached value was written in a format version or codec this process can't read."""
+
+
+class CompactSerializer:
+    """Serializer/deserializer pair for CacheBackend storing compressed JSON.
+
+    Example:
+        serializer = CompactSerializer(codec="zstd")
+        cache = RedisCacheBackend(
+            client,
+            serializer=serializer.serialize,
+            deserializer=serializer.deserialize,
+        )
+    """
+
+    def __init__(
+        self, codec: str = DEFAULT_CODEC, min_size: int = DEFAULT_MIN_SIZE
+    ) -> None:
+        """Initialize compact serializer.
+
+        Args:
+            codec: Compression codec for values >= min_size ("zstd", "zlib")
+            min_size: Values with a smaller JSON document are stored as plain JSON
+
+        Raises:
+            ValueError: If the codec is not available
+        """
+        if codec not in CODECS:
+            msg = f"Unsupported cache compression codec: {codec}"
+            raise ValueError(msg)
+        self.codec = codec
+        self.min_size = min_size
+        self._compress = CODECS[codec][0]
+        self._header = f"{FORMAT_PREFIX}{FORMAT_VERSION}:{codec}:"
+
+    def serialize(self, obj: Any) -> str:
+        """Serialize an object to a cache string.
+
+        Args:
+            obj: Pydantic model or JSON compatible object
+
+        Returns:
+            Plain JSON for small values, versioned compressed payload otherwise
+        """
+        if isinstance(obj, BaseModel):
+            document = obj.model_dump_json(by_alias=True)
+        else:
+            document = json_dumps(obj, compact=True)
+        if len(document) < self.min_size:
+            return document
+        payload = base64.b64encode(self._compress(document.encode()))
+        return self._header + payload.decode("ascii")
+
+    @staticmethod
+    def deserialize(value: str) -> Any:
+        """Deserialize a cache string written by CompactSerializer or json_dumps.
+
+        Args:
+            value: Cached string
+
+        Returns:
+            Deserialized JSON data
+
+        Raises:
+            UnsupportedCacheFormatError: If the format version or codec is unknown
+        """
+        if not value.startswith(FORMAT_PREFIX):
+            return json_loads(value)
+        # base64 payloads never contain ":"
+        header, _, payload = value.rpartition(":")
+        version, _, codec = header.removeprefix(FORMAT_PREFIX).partition(":")
+        if version != str(FORMAT_VERSION) or codec not in CODECS:
+            msg = f"Unsupported cache value format: {header}"
+            raise UnsupportedCacheFormatError(msg)
+        decompress = CODECS[codec][1]
+        return json.loads(decompress(base64.b64decode(payload)))
@@ -1,6 +1,6 @@
 """Configuration management using Pydantic Settings."""
 
-from typing import Any
+from typing import Any, Literal
 
 from pydantic import BaseModel, Field, field_validator
 from pydantic_settings import (
@@ -460,6 +460,18 @@ class Settings(BaseSettings):
         default=60,
         description="In-memory cache TTL in seconds (time-based expiration)",
     )
+    cache_serializer: Literal["json", "compact"] = Field(
+        default="json",
+        description="Redis cache value format: json or compact (compressed JSON with a version header). Every process reads both formats, switch to compact only after all processes run a version that does.",
+    )
+    cache_compression_codec: Literal["zstd", "zlib"] = Field(
+        default="zstd",
+        description="Compression codec of the compact cache serializer: zstd or zlib",
+    )
+    cache_invalidation_channel: str = Field(
+        default="",
+        description="Redis pub/sub channel used to evict in-memory cache entries across processes on writes, e.g. qontract-api:cache-invalidation. Every process runs a subscriber thread when set. Empty (default) disables it.",
+    )
 
     # Celery
     celery_broker_url: str = Field(
@@ -470,6 +482,10 @@ class Settings(BaseSettings):
         default="",
         description="Celery result backend URL (defaults to cache_broker_url if empty)",
     )
+    task_dry_run_cache_ttl: int = Field(
+        default=0,
+        description="Seconds a dry-run task result is reused for tasks with identical input (e.g. repeated MR checks). 0 = disabled.",
+    )
     # worker metrics config
     worker_metrics_port: int = Field(
         default=8000,
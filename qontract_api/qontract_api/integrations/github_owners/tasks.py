@@ -50,7 +50,11 @@ def generate_lock_key(
 # Use <integration-name>.<task-name> format for task names
 # This helps to relate tasks to integrations in dashboards and monitoring
 @celery_app.task(bind=True, name="github-owners.reconcile", acks_late=True)
-@deduplicated_task(lock_key_fn=generate_lock_key, timeout=600)
+@deduplicated_task(
+    lock_key_fn=generate_lock_key,
+    timeout=600,
+    dry_run_cache_ttl=settings.task_dry_run_cache_ttl,
+)
 def reconcile_github_owners_task(
     self: Any,  # Celery Task instance (bind=True)
     organizations: list[GithubOrgDesiredState],
@@ -54,7 +54,11 @@ def generate_lock_key(_self: Task, instances: list[GlitchtipInstance], **_: Any)
 # Use <integration-name>.<task-name> format for task names
 # This helps to relate tasks to integrations in the dashboards and monitoring
 @celery_app.task(bind=True, name="glitchtip-project-alerts.reconcile", acks_late=True)
-@deduplicated_task(lock_key_fn=generate_lock_key, timeout=600)
+@deduplicated_task(
+    lock_key_fn=generate_lock_key,
+    timeout=600,
+    dry_run_cache_ttl=settings.task_dry_run_cache_ttl,
+)
 def reconcile_glitchtip_project_alerts_task(
     self: Any,  # Celery Task instance (bind=True)
     instances: list[GlitchtipInstance],
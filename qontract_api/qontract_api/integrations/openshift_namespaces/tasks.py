@@ -97,7 +97,11 @@ def generate_lock_key(_self: Task, clusters: list[ClusterNamespaces], **_: Any)
 
 
 @celery_app.task(bind=True, name="openshift_namespaces.reconcile", acks_late=True)
-@deduplicated_task(lock_key_fn=generate_lock_key, timeout=600)
+@deduplicated_task(
+    lock_key_fn=generate_lock_key,
+    timeout=600,
+    dry_run_cache_ttl=settings.task_dry_run_cache_ttl,
+)
 def reconcile_openshift_namespaces_task(
     self: Any,
     clusters: list[ClusterNamespaces],
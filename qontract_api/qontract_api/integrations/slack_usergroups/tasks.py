@@ -84,7 +84,11 @@ def generate_lock_key(_self: Task, workspaces: list[SlackWorkspace], **_: Any) -
 # Use <integration-name>.<task-name> format for task names
 # This helps to relate tasks to integrations in the dahsboards and monitoring
 @celery_app.task(bind=True, name="slack-usergroups.reconcile", acks_late=True)
-@deduplicated_task(lock_key_fn=generate_lock_key, timeout=600)
+@deduplicated_task(
+    lock_key_fn=generate_lock_key,
+    timeout=600,
+    dry_run_cache_ttl=settings.task_dry_run_cache_ttl,
+)
 def reconcile_slack_usergroups_task(
     self: Any,  # Celery Task instance (bind=True)
     workspaces: list[SlackWorkspace],
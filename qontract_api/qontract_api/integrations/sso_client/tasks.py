@@ -47,7 +47,11 @@ def generate_lock_key(
 
 
 @celery_app.task(bind=True, name="sso-client.reconcile", acks_late=True)
-@deduplicated_task(lock_key_fn=generate_lock_key, timeout=600)
+@deduplicated_task(
+    lock_key_fn=generate_lock_key,
+    timeout=600,
+    dry_run_cache_ttl=settings.task_dry_run_cache_ttl,
+)
 def reconcile_sso_client_task(
     self: Any,  # Celery Task instance (bind=True)
     ocm_environment: str,
@@ -2,13 +2,19 @@
 
 This module provides a decorator for Celery tasks to prevent duplicate
 task execution using distributed locking through the CacheBackend abstraction.
+Identical dry-run tasks can optionally share one result via a short-lived cache.
 
 Uses global cache instance (get_cache()) to avoid creating multiple connections.
 """
 
+import hashlib
+from annotationlib import Format, ForwardRef, get_annotations
 from collections.abc import Callable
 from functools import wraps
-from typing import ParamSpec, TypeVar, cast, get_type_hints
+from typing import Any, ParamSpec, TypeVar, cast, evaluate_forward_ref
+
+from celery import Task
+from qontract_utils.json_utils import json_dumps, pydantic_encoder
 
 from qontract_api.cache.factory import get_cache
 from qontract_api.logger import get_logger
@@ -20,9 +26,51 @@ P = ParamSpec("P")
 R = TypeVar("R")
 
 
+def _return_type(func: Callable[..., Any]) -> Any:
+    """Resolve the return annotation of a task function, None if unresolvable.
+
+    Parameter types are often imported under TYPE_CHECKING only, which makes
+    get_type_hints() fail for the whole function - only the return annotation
+    is resolved.
+    """
+    annotation = get_annotations(func, format=Format.FORWARDREF).get(
+        "return", TaskResult
+    )
+    if isinstance(annotation, str):
+        annotation = ForwardRef(annotation)
+    if not isinstance(annotation, ForwardRef):
+        return annotation
+    try:
+        return evaluate_forward_ref(annotation, owner=func)
+    except NameError:
+        return None
+
+
+def dry_run_cache_key(func_name: str, *args: Any, **kwargs: Any) -> str | None:
+    """Generate the result cache key of a dry-run task from its canonicalized input.
+
+    The Celery task instance (bind=True) is not part of the input. Keyword
+    arguments and model fields are sorted, so equal inputs give equal keys.
+
+    Returns:
+        Cache key, or None if the input can't be canonicalized (not JSON serializable)
+    """
+    payload = {
+        "args": [arg for arg in args if not isinstance(arg, Task)],
+        "kwargs": kwargs,
+    }
+    try:
+        canonical = json_dumps(payload, compact=True, defaults=pydantic_encoder)
+    except TypeError, ValueError:
+        return None
+    digest = hashlib.sha256(canonical.encode()).hexdigest()
+    return f"task_result:{func_name}:dry_run=true:{digest}"
+
+
 def deduplicated_task(
     lock_key_fn: Callable[..., str],
     timeout: int = 600,
+    dry_run_cache_ttl: int = 0,
 ) -> Callable[[Callable[P, R]], Callable[P, R]]:
     """Decorator for task deduplication using distributed locks via CacheBackend.
 
@@ -36,11 +84,19 @@ def deduplicated_task(
     only applies to production (`dry_run=False`) runs, where concurrent
     writes to the same resource must be prevented.
 
+    Dry-run result memoization (opt-in via `dry_run_cache_ttl`): MR checks
+    often run the identical dry run many times. Dry runs with the same input
+    share one result for `dry_run_cache_ttl` seconds, and duplicates arriving
+    while it's computed wait for it instead of hitting the upstream APIs
+    again (CacheBackend.get_or_compute()). Only successful results are kept.
+
     Args:
         lock_key_fn: Function to generate lock key from task arguments.
                     Example: `lambda workspace, **kw: workspace`
         timeout: Lock timeout in seconds (default: 600 = 10 minutes).
                 TTL ensures lock is released even if task crashes.
+        dry_run_cache_ttl: Seconds a dry-run result is reused for identical input
+                (default: 0 = disabled). Requires a TaskResult return type.
 
     Returns:
         Decorated function that skips execution if lock cannot be acquired
@@ -54,6 +110,7 @@ def deduplicated_task(
 
     Usage Notes:
         - Lock key is: task_lock:{function_name}:{lock_key}
+        - Dry-run result key is: task_result:{function_name}:dry_run=true:{input hash}
         - Non-blocking: Returns the function's own result type with SKIPPED status if duplicate detected
         - Lock is automatically released when function returns
         - Uses global cache (get_cache()) - shared across all tasks in worker
@@ -63,15 +120,29 @@ def deduplicated_task(
         # Resolve the return type once at decoration time so the skip result
         # is an instance of the concrete task result class (e.g.
         # GithubOwnersTaskResult) rather than the base TaskResult.
-        try:
-            return_hint = get_type_hints(func).get("return", TaskResult)
-            skip_result_cls: type[TaskResult] = (
-                return_hint
-                if isinstance(return_hint, type) and issubclass(return_hint, TaskResult)
-                else TaskResult
+        return_hint = _return_type(func)
+        skip_result_cls: type[TaskResult] = (
+            return_hint
+            if isinstance(return_hint, type) and issubclass(return_hint, TaskResult)
+            else TaskResult
+        )
+        # The cached result is deserialized into the declared return type
+        memoize_dry_run = dry_run_cache_ttl > 0 and return_hint is skip_result_cls
+
+        def run_dry_run(*args: P.args, **kwargs: P.kwargs) -> R:
+            key = dry_run_cache_key(func.__name__, *args, **kwargs)
+            if key is None:
+                return func(*args, **kwargs)
+            result = get_cache().get_or_compute(
+                key,
+                skip_result_cls,
+                lambda: cast("TaskResult", func(*args, **kwargs)),
+                ttl=dry_run_cache_ttl,
+                lock_timeout=timeout,
+                # Don't answer later dry runs with a transient failure
+                cacheable=lambda r: r.status == TaskStatus.SUCCESS,
             )
-        except NameError:
-            skip_result_cls = TaskResult
+            return cast("R", result)
 
         @wraps(func)
         def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
@@ -79,6 +150,8 @@ def deduplicated_task(
             # reason to serialize them - skip locking entirely so MR-check
             # traffic isn't throttled by unrelated in-flight dry runs.
             if kwargs.get("dry_run", True):
+                if memoize_dry_run:
+                    return run_dry_run(*args, **kwargs)
                 return func(*args, **kwargs)
 
             # Keep the pre-existing key format (with the now-constant
@@ -3,6 +3,7 @@
 import json
 import threading
 from collections.abc import Callable, Generator
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from typing import Any
 from unittest.mock import MagicMock
@@ -289,6 +290,192 @@ def test_custom_serializer_deserializer() -> None:
     assert result.value == value
 
 
+# Bulk Access Tests
+
+
+def test_get_many_returns_values_in_key_order(cache: ConcreteCacheBackend) -> None:
+    """Test get_many() returns values in key order, None for missing keys."""
+    cache.set_many({"key1": "value1", "key3": "value3"})
+
+    assert cache.get_many(["key3", "key2", "key1"]) == ["value3", None, "value1"]
+
+
+def test_get_many_obj_warms_memory_cache(cache: ConcreteCacheBackend) -> None:
+    """Test get_many_obj() fetches memory misses in one get_many() call."""
+    one, two = SampleModel(name="one", value=1), SampleModel(name="two", value=2)
+    cache.set_many_obj({"key1": one, "key2": two})
+    cache.clear_memory_cache()
+    cache.get_obj("key1", cls=SampleModel)
+    cache.get_many = MagicMock(wraps=cache.get_many)  # type: ignore[method-assign]
+
+    result = cache.get_many_obj(["key1", "key2", "key3", "key2"], cls=SampleModel)
+
+    assert result == {"key1": one, "key2": two}
+    cache.get_many.assert_called_once_with(["key2", "key3"])
+    assert cache.get_many_obj(["key1", "key2"], cls=SampleModel) == result
+    cache.get_many.assert_called_once()
+
+
+def test_get_many_obj_memory_only_on_backend_error(
+    cache: ConcreteCacheBackend,
+) -> None:
+    """Test get_many_obj() falls back to the memory cache if the backend is down."""
+    model = SampleModel(name="test", value=42)
+    cache.set_obj("key1", model)
+    cache.get_many = MagicMock(side_effect=ConnectionError)  # type: ignore[method-assign]
+
+    assert cache.get_many_obj(["key1", "key2"], cls=SampleModel) == {"key1": model}
+
+
+def test_memory_cache_concurrent_access(cache: ConcreteCacheBackend) -> None:
+    """Test concurrent memory cache writes, reads and evictions don't raise."""
+    model = SampleModel(name="test", value=1)
+
+    def worker(n: int) -> None:
+        for i in range(500):
+            key = f"key{(n + i) % 50}"
+            cache.set_obj(key, model)
+            cache.get_obj(key, cls=SampleModel)
+            cache._memory_pop(key)
+            if i % 100 == 0:
+                cache.clear_memory_cache()
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        for future in [executor.submit(worker, n) for n in range(8)]:
+            future.result()
+
+
+# get_or_compute Tests
+
+
+def test_get_or_compute_caches_computed_value(cache: ConcreteCacheBackend) -> None:
+    """Test get_or_compute() computes once and serves the cached value after."""
+    compute = MagicMock(return_value=SampleModel(name="test", value=42))
+
+    first = cache.get_or_compute("key", SampleModel, compute, ttl=60)
+    cache.clear_memory_cache()
+    second = cache.get_or_compute("key", SampleModel, compute, ttl=60)
+
+    assert first == second == SampleModel(name="test", value=42)
+    compute.assert_called_once_with()
+
+
+def test_get_or_compute_single_flight_on_miss(cache: ConcreteCacheBackend) -> None:
+    """Test concurrent get_or_compute() calls on a missing key compute it once."""
+    started = threading.Event()
+    release = threading.Event()
+    calls = 0
+
+    def compute() -> SampleModel:
+        nonlocal calls
+        calls += 1
+        started.set()
+        release.wait(timeout=5)
+        return SampleModel(name="test", value=calls)
+
+    results: list[SampleModel] = []
+
+    def worker() -> None:
+        results.append(cache.get_or_compute("key", SampleModel, compute, ttl=60))
+
+    threads = [threading.Thread(target=worker) for _ in range(5)]
+    threads[0].start()
+    started.wait(timeout=5)
+    for thread in threads[1:]:
+        thread.start()
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert calls == 1
+    assert results == [SampleModel(name="test", value=1)] * 5
+
+
+def test_get_or_compute_serves_stale_value_while_refreshing(
+    cache: ConcreteCacheBackend,
+) -> None:
+    """Test a stale entry is refreshed by one caller while others get it as is."""
+    stale = SampleModel(name="stale", value=1)
+    fresh = SampleModel(name="fresh", value=2)
+    # ttl=0: the entry is stale right away but still served for stale_ttl
+    cache.get_or_compute("key", SampleModel, lambda: stale, ttl=0, stale_ttl=60)
+    refreshing = threading.Event()
+    release = threading.Event()
+
+    def compute() -> SampleModel:
+        refreshing.set()
+        release.wait(timeout=5)
+        return fresh
+
+    results: list[SampleModel] = []
+    refresher = threading.Thread(
+        target=lambda: results.append(
+            cache.get_or_compute("key", SampleModel, compute, ttl=60, stale_ttl=60)
+        )
+    )
+    refresher.start()
+    refreshing.wait(timeout=5)
+
+    other = cache.get_or_compute("key", SampleModel, compute, ttl=60, stale_ttl=60)
+    release.set()
+    refresher.join()
+
+    assert other == stale
+    assert results == [fresh]
+    assert cache.get_or_compute("key", SampleModel, compute, ttl=60) == fresh
+
+
+def test_get_or_compute_recomputes_expired_entry(cache: ConcreteCacheBackend) -> None:
+    """Test an entry past its stale window is not served anymore."""
+    cache.get_or_compute(
+        "key", SampleModel, lambda: SampleModel(name="old", value=1), ttl=0
+    )
+
+    result = cache.get_or_compute(
+        "key", SampleModel, lambda: SampleModel(name="new", value=2), ttl=60
+    )
+
+    assert result == SampleModel(name="new", value=2)
+
+
+def test_get_or_compute_uses_value_refreshed_by_other_process(
+    cache: ConcreteCacheBackend,
+) -> None:
+    """Test the double-check under the lock picks up a value stored meanwhile."""
+    cache.get_or_compute(
+        "key", SampleModel, lambda: SampleModel(name="old", value=1), ttl=0
+    )
+    other = ConcreteCacheBackend()
+    other.storage = cache.storage
+    other.get_or_compute(
+        "key", SampleModel, lambda: SampleModel(name="new", value=2), ttl=60
+    )
+    compute = MagicMock()
+
+    result = cache.get_or_compute("key", SampleModel, compute, ttl=60)
+
+    assert result == SampleModel(name="new", value=2)
+    compute.assert_not_called()
+
+
+def test_get_or_compute_does_not_cache_rejected_values(
+    cache: ConcreteCacheBackend,
+) -> None:
+    """Test values rejected by cacheable are neither stored nor kept in memory."""
+    compute = MagicMock(return_value=SampleModel(name="failed", value=0))
+
+    result = cache.get_or_compute(
+        "key", SampleModel, compute, ttl=60, cacheable=lambda m: m.value > 0
+    )
+    cache.get_or_compute(
+        "key", SampleModel, compute, ttl=60, cacheable=lambda m: m.value > 0
+    )
+
+    assert result == SampleModel(name="failed", value=0)
+    assert compute.call_count == 2
+    assert "key" not in cache.storage
+
+
 # Singleton Pattern Tests
 
 
@@ -6,6 +6,7 @@ from unittest.mock import Mock
 
 import pytest
 from pydantic import BaseModel
+from pytest_mock import MockerFixture
 
 from qontract_api.cache.redis import RedisCacheBackend
 
@@ -201,6 +202,54 @@ def test_multiple_operations(cache: RedisCacheBackend, mock_redis_client: Mock)
     assert mock_redis_client.delete.called
 
 
+def test_get_many_uses_mget(cache: RedisCacheBackend, mock_redis_client: Mock) -> None:
+    """Test get_many() reads all keys with a single MGET."""
+    mock_redis_client.mget.return_value = ["value1", None, ""]
+
+    result = cache.get_many(["key1", "key2", "key3"])
+
+    assert result == ["value1", None, None]
+    mock_redis_client.mget.assert_called_once_with(["key1", "key2", "key3"])
+
+
+def test_get_many_without_keys(
+    cache: RedisCacheBackend, mock_redis_client: Mock
+) -> None:
+    """Test get_many() doesn't send an empty MGET."""
+    assert cache.get_many([]) == []
+    mock_redis_client.mget.assert_not_called()
+
+
+def test_set_many_uses_pipeline(
+    cache: RedisCacheBackend, mock_redis_client: Mock
+) -> None:
+    """Test set_many() writes all keys in one pipeline."""
+    pipeline = mock_redis_client.pipeline.return_value
+
+    cache.set_many({"key1": "value1", "key2": "value2"}, ttl=300)
+
+    mock_redis_client.pipeline.assert_called_once_with(transaction=False)
+    assert pipeline.setex.call_count == 2
+    pipeline.setex.assert_any_call("key1", 300, "value1")
+    pipeline.setex.assert_any_call("key2", 300, "value2")
+    pipeline.execute.assert_called_once_with()
+
+
+def test_get_many_obj_fills_memory_cache(
+    cache: RedisCacheBackend, mock_redis_client: Mock
+) -> None:
+    """Test get_many_obj() warms the memory cache from one MGET."""
+    models = [SampleModel(name=f"n{i}", value=i) for i in range(3)]
+    mock_redis_client.mget.return_value = [m.model_dump_json() for m in models]
+    keys = [f"key{i}" for i in range(3)]
+
+    first = cache.get_many_obj(keys, cls=SampleModel)
+    second = cache.get_many_obj(keys, cls=SampleModel)
+
+    assert first == second == dict(zip(keys, models, strict=True))
+    mock_redis_client.mget.assert_called_once_with(keys)
+
+
 def test_get_obj_returns_none_for_missing_key(
     cache: RedisCacheBackend, mock_redis_client: Mock
 ) -> None:
@@ -331,3 +380,135 @@ def test_custom_serializer_deserializer() -> None:
     assert result is not None
     assert result.name == "test"
     assert result.value == 42
+
+
+# Tier-1 Invalidation Tests
+
+
+class FakePubSubBus:
+    """Delivers published messages to every subscribed handler, like Redis pub/sub."""
+
+    def __init__(self) -> None:
+        self.handlers: dict[str, list[Any]] = {}
+        self.published: list[tuple[str, str]] = []
+
+    def client(self) -> Mock:
+        client = Mock()
+        pubsub = client.pubsub.return_value
+
+        def subscribe(**handlers: Any) -> None:
+            for channel, handler in handlers.items():
+                self.handlers.setdefault(channel, []).append(handler)
+
+        def publish(channel: str, message: str) -> None:
+            self.published.append((channel, message))
+            for handler in self.handlers.get(channel, []):
+                handler({"type": "message", "channel": channel, "data": message})
+
+        pubsub.subscribe.side_effect = subscribe
+        client.publish.side_effect = publish
+        client.pipeline.return_value.publish.side_effect = publish
+        return client
+
+
+@pytest.fixture
+def bus() -> FakePubSubBus:
+    """Create a fake pub/sub bus shared by several cache instances."""
+    return FakePubSubBus()
+
+
+def _pod(bus: FakePubSubBus) -> tuple[RedisCacheBackend, Mock]:
+    client = bus.client()
+    return RedisCacheBackend(client, invalidation_channel="invalidate"), client
+
+
+def test_set_obj_evicts_memory_cache_of_other_instances(bus: FakePubSubBus) -> None:
+    """Test a write on one instance evicts the key from the others' memory cache."""
+    (pod_a, client_a), (pod_b, client_b) = _pod(bus), _pod(bus)
+    old, new = SampleModel(name="old", value=1), SampleModel(name="new", value=2)
+    pod_a.set_obj("key", old)
+    pod_b.set_obj("key", old)
+    client_b.get.return_value = new.model_dump_json()
+
+    pod_a.set_obj("key", new)
+
+    assert pod_b.get_obj("key", cls=SampleModel) == new
+    # the writer's own memory cache is current and not evicted
+    client_a.get.assert_not_called()
+    assert pod_a.get_obj("key", cls=SampleModel) == new
+
+
+def test_delete_evicts_memory_cache_of_other_instances(bus: FakePubSubBus) -> None:
+    """Test a delete on one instance evicts the key from the others' memory cache."""
+    (pod_a, _), (pod_b, client_b) = _pod(bus), _pod(bus)
+    pod_b.set_obj("key", SampleModel(name="test", value=1))
+    client_b.get.return_value = None
+
+    pod_a.delete("key")
+
+    assert pod_b.get_obj("key", cls=SampleModel) is None
+
+
+def test_set_many_publishes_in_pipeline(bus: FakePubSubBus) -> None:
+    """Test set_many() publishes one invalidation for all keys in its pipeline."""
+    (pod_a, client_a), (pod_b, client_b) = _pod(bus), _pod(bus)
+    pod_b.set_many_obj({
+        "key1": SampleModel(name="a", value=1),
+        "key2": SampleModel(name="b", value=2),
+        "key3": SampleModel(name="c", value=3),
+    })
+    client_b.mget.return_value = [None, None]
+
+    pod_a.set_many({"key1": "x", "key2": "y"})
+
+    client_a.pipeline.return_value.publish.assert_called_once()
+    assert pod_b.get_many_obj(["key1", "key2", "key3"], cls=SampleModel) == {
+        "key3": SampleModel(name="c", value=3)
+    }
+
+
+def test_malformed_invalidation_message_is_ignored(bus: FakePubSubBus) -> None:
+    """Test a malformed message doesn't break the subscriber."""
+    pod, client = _pod(bus)
+    model = SampleModel(name="test", value=1)
+    pod.set_obj("key", model)
+
+    client.publish("invalidate", "not json")
+
+    assert pod.get_obj("key", cls=SampleModel) == model
+
+
+def test_subscriber_error_clears_memory_cache(mocker: MockerFixture) -> None:
+    """Test the memory cache is cleared when invalidations may have been lost."""
+    mocker.patch("qontract_api.cache.redis.time.sleep")
+    client = Mock()
+    cache = RedisCacheBackend(client, invalidation_channel="invalidate")
+    cache.set_obj("key", SampleModel(name="test", value=1))
+    exception_handler = client.pubsub.return_value.run_in_thread.call_args.kwargs[
+        "exception_handler"
+    ]
+
+    exception_handler(ConnectionError("lost"), Mock(), Mock())
+
+    client.get.return_value = None
+    assert cache.get_obj("key", cls=SampleModel) is None
+
+
+def test_invalidation_disabled_without_memory_cache() -> None:
+    """Test no subscriber is started when there is no memory cache to evict."""
+    client = Mock()
+
+    RedisCacheBackend(client, memory_max_size=0, invalidation_channel="invalidate")
+
+    client.pubsub.assert_not_called()
+
+
+def test_close_stops_invalidation_subscriber() -> None:
+    """Test close() stops the subscriber thread."""
+    client = Mock()
+    cache = RedisCacheBackend(client, invalidation_channel="invalidate")
+
+    cache.close()
+
+    client.pubsub.return_value.run_in_thread.return_value.stop.assert_called_once_with()
+    client.close.assert_called_once_with()
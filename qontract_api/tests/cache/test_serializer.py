@@ -0,0 +1,209 @@
+"""Unit tests and benchmark for the compact cache serializer."""
+
+import json
+import time
+from collections.abc import Callable
+from typing import Any
+from unittest.mock import Mock
+
+import pytest
+from pydantic import BaseModel
+from qontract_utils.glitchtip_api.models import Project
+from qontract_utils.json_utils import json_dumps, json_loads
+from qontract_utils.slack_api import SlackChannel, SlackUser, SlackUsergroup
+from qontract_utils.slack_api.models import SlackUserProfile
+
+from qontract_api.cache.redis import RedisCacheBackend
+from qontract_api.cache.serializer import (
+    CODECS,
+    CompactSerializer,
+    UnsupportedCacheFormatError,
+)
+from qontract_api.github.github_org_workspace_client import CachedOrgMembers
+from qontract_api.glitchtip.glitchtip_workspace_client import CachedProjects
+from qontract_api.slack.slack_workspace_client import (
+    CachedChannels,
+    CachedUsergroups,
+    CachedUsers,
+)
+
+
+class SampleModel(BaseModel):
+    """Sample Pydantic model for serializer tests."""
+
+    name: str
+    tags: list[str] = []
+
+
+@pytest.mark.parametrize("codec", sorted(CODECS))
+def test_large_value_roundtrip(codec: str) -> None:
+    """Test values above min_size are stored compressed with a version header."""
+    serializer = CompactSerializer(codec=codec, min_size=10)
+    model = SampleModel(name="test", tags=["tag"] * 100)
+
+    value = serializer.serialize(model)
+
+    assert value.startswith(f"qc1:{codec}:")
+    assert len(value) < len(model.model_dump_json())
+    assert SampleModel.model_validate(serializer.deserialize(value)) == model
+
+
+def test_small_value_is_plain_json() -> None:
+    """Test values below min_size are stored as plain JSON."""
+    value = CompactSerializer(min_size=1024).serialize(SampleModel(name="test"))
+
+    assert json.loads(value) == {"name": "test", "tags": []}
+
+
+def test_deserialize_reads_json_dumps_values() -> None:
+    """Test values written by the default JSON serializer are still readable."""
+    model = SampleModel(name="test", tags=["a"])
+
+    assert CompactSerializer.deserialize(json_dumps(model)) == model.model_dump()
+
+
+@pytest.mark.parametrize("header", ["qc2:zlib:", "qc1:brotli:", "qc:"])
+def test_deserialize_rejects_unknown_formats(header: str) -> None:
+    """Test values in an unknown format version or codec are rejected."""
+    with pytest.raises(UnsupportedCacheFormatError):
+        CompactSerializer.deserialize(header + "AAAA")
+
+
+def test_unknown_codec_raises() -> None:
+    """Test an unavailable codec is rejected at construction."""
+    with pytest.raises(ValueError, match="brotli"):
+        CompactSerializer(codec="brotli")
+
+
+def test_unsupported_format_is_a_cache_miss() -> None:
+    """Test the cache treats values in an unsupported format as a miss."""
+    client = Mock()
+    client.get.return_value = "qc2:zlib:AAAA"
+    client.mget.return_value = ["qc2:zlib:AAAA"]
+    cache = RedisCacheBackend(client, deserializer=CompactSerializer.deserialize)
+
+    assert cache.get_obj("key", cls=SampleModel) is None
+    assert cache.get_many_obj(["key"], cls=SampleModel) == {}
+
+
+#
+# benchmark on the current cached model types
+#
+
+
+def _slack_users(n: int) -> CachedUsers:
+    return CachedUsers(
+        items=[
+            SlackUser(
+                id=f"U{i:010d}",
+                name=f"user{i}",
+                profile=SlackUserProfile(
+                    email=f"user{i}@example.com",
+                    real_name=f"User Number {i}",
+                    display_name=f"user{i}",
+                ),
+            )
+            for i in range(n)
+        ]
+    )
+
+
+def _slack_usergroups(n: int) -> CachedUsergroups:
+    return CachedUsergroups(
+        items=[
+            SlackUsergroup(
+                id=f"S{i:010d}",
+                handle=f"team-{i}",
+                name=f"Team {i}",
+                description=f"Members of team {i}",
+                users=[f"U{(i * 7 + j) % 5000:010d}" for j in range(40)],
+            )
+            for i in range(n)
+        ]
+    )
+
+
+def _slack_channels(n: int) -> CachedChannels:
+    return CachedChannels(
+        items=[
+            SlackChannel(id=f"C{i:010d}", name=f"channel-{i}", is_member=i % 3 == 0)
+            for i in range(n)
+        ]
+    )
+
+
+def _github_members(n: int) -> CachedOrgMembers:
+    return CachedOrgMembers(members=[f"github-user-{i}" for i in range(n)])
+
+
+def _glitchtip_projects(n: int) -> CachedProjects:
+    return CachedProjects(
+        items=[
+            Project(
+                id=i,
+                name=f"Project {i}",
+                slug=f"project-{i}",
+                platform="python",
+                team_slugs=[f"team-{i % 50}", f"team-{i % 7}"],
+            )
+            for i in range(n)
+        ]
+    )
+
+
+large_payloads = pytest.mark.parametrize(
+    "build",
+    [
+        lambda: _slack_users(5000),
+        lambda: _slack_usergroups(500),
+        lambda: _slack_channels(5000),
+        lambda: _github_members(5000),
+        lambda: _glitchtip_projects(2000),
+    ],
+    ids=["slack-users", "slack-usergroups", "slack-channels", "github", "glitchtip"],
+)
+
+
+def _best_of(runs: int, func: Callable[[], Any]) -> float:
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+@large_payloads
+def test_compact_serializer_large_payloads(build: Callable[[], BaseModel]) -> None:
+    model = build()
+    cls = type(model)
+    serializer = CompactSerializer()
+    json_value = json_dumps(model)
+    compact_value = serializer.serialize(model)
+
+    assert cls.model_validate(serializer.deserialize(compact_value)) == model
+    # payloads shrink 5-10x, the margin keeps this stable across data shapes
+    assert len(compact_value) * 3 < len(json_value)
+
+
+@pytest.mark.benchmark
+@large_payloads
+def test_benchmark_compact_serializer(build: Callable[[], BaseModel]) -> None:
+    model = build()
+    cls = type(model)
+    serializer = CompactSerializer()
+    json_value = json_dumps(model)
+    compact_value = serializer.serialize(model)
+
+    json_dump = _best_of(3, lambda: json_dumps(model))
+    compact_dump = _best_of(3, lambda: serializer.serialize(model))
+    json_load = _best_of(3, lambda: cls.model_validate(json_loads(json_value)))
+    compact_load = _best_of(
+        3, lambda: cls.model_validate(serializer.deserialize(compact_value))
+    )
+
+    print(  # ruff: ignore[print]
+        f"{cls.__name__}: {len(json_value)} -> {len(compact_value)} bytes, "
+        f"dump {json_dump * 1000:.1f} -> {compact_dump * 1000:.1f}ms, "
+        f"load {json_load * 1000:.1f} -> {compact_load * 1000:.1f}ms"
+    )
@@ -1,11 +1,18 @@
 """Unit tests for task deduplication decorator."""
 
+import threading
+from collections.abc import Generator
+from contextlib import contextmanager
 from unittest.mock import MagicMock, patch
 
 import pytest
+from celery import Task
+from pydantic import BaseModel
 
+from qontract_api.cache.base import CacheBackend
 from qontract_api.models import TaskResult, TaskStatus
 from qontract_api.tasks import deduplicated_task
+from qontract_api.tasks._deduplication import dry_run_cache_key
 
 
 @pytest.fixture
@@ -251,3 +258,267 @@ def test_deduplicated_task_with_complex_lock_key(mock_cache: MagicMock) -> None:
     mock_cache.lock.assert_called_once_with(
         "task_lock:test_task:dry_run=false:ws-a,ws-b", timeout=600
     )
+
+
+# Dry-run result memoization
+
+
+class InMemoryCacheBackend(CacheBackend):
+    """Minimal in-memory CacheBackend with process-local locks."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.storage: dict[str, str] = {}
+        self._locks: dict[str, threading.Lock] = {}
+
+    def get(self, key: str) -> str | None:
+        return self.storage.get(key)
+
+    def set(self, key: str, value: str, ttl: int | None = None) -> None:  # ruff: ignore[unused-method-argument]
+        self.storage[key] = value
+
+    def _delete_from_backend(self, key: str) -> None:
+        self.storage.pop(key, None)
+
+    def exists(self, key: str) -> bool:
+        return key in self.storage
+
+    def ping(self) -> bool:
+        return True
+
+    def close(self) -> None:
+        self.storage.clear()
+
+    @contextmanager
+    def lock(self, key: str, timeout: float = 300) -> Generator[None]:  # ruff: ignore[unused-method-argument]
+        with self._locks.setdefault(key, threading.Lock()):
+            yield
+
+
+class Workspace(BaseModel):
+    """Sample task input model."""
+
+    name: str
+    labels: dict[str, str] = {}
+
+
+class MemoizedTaskResult(TaskResult, frozen=True):
+    """Sample task result."""
+
+    calls: int = 0
+
+
+@pytest.fixture
+def memory_cache() -> Generator[InMemoryCacheBackend]:
+    """Patch get_cache with an in-memory cache backend."""
+    cache = InMemoryCacheBackend()
+    with patch("qontract_api.tasks._deduplication.get_cache", return_value=cache):
+        yield cache
+
+
+def test_dry_run_cache_key_is_canonical() -> None:
+    """Equal inputs give equal keys, regardless of ordering or the task instance."""
+    first = dry_run_cache_key(
+        "task",
+        MagicMock(spec=Task),
+        [Workspace(name="ws", labels={"a": "1", "b": "2"})],
+        dry_run=True,
+        limit=3,
+    )
+    second = dry_run_cache_key(
+        "task",
+        [Workspace(name="ws", labels={"b": "2", "a": "1"})],
+        limit=3,
+        dry_run=True,
+    )
+    other = dry_run_cache_key("task", [Workspace(name="other")], dry_run=True)
+
+    assert first is not None
+    assert first.startswith("task_result:task:dry_run=true:")
+    assert first == second
+    assert first != other
+
+
+def test_dry_run_cache_key_without_serializable_input() -> None:
+    """Inputs that can't be canonicalized disable memoization."""
+    assert dry_run_cache_key("task", object(), dry_run=True) is None
+
+
+def test_deduplicated_task_memoizes_dry_run_results(
+    memory_cache: InMemoryCacheBackend,
+) -> None:
+    """Identical dry runs are answered from the first computation."""
+    calls = 0
+
+    @deduplicated_task(lock_key_fn=lambda ws, **_: ws.name, dry_run_cache_ttl=60)
+    def test_task(ws: Workspace, *, dry_run: bool = True) -> MemoizedTaskResult:
+        nonlocal calls
+        calls += 1
+        return MemoizedTaskResult(status=TaskStatus.SUCCESS, calls=calls)
+
+    first = test_task(Workspace(name="ws-1"), dry_run=True)
+    memory_cache.clear_memory_cache()
+    second = test_task(Workspace(name="ws-1"), dry_run=True)
+    other = test_task(Workspace(name="ws-2"), dry_run=True)
+
+    assert first == second == MemoizedTaskResult(status=TaskStatus.SUCCESS, calls=1)
+    assert isinstance(second, MemoizedTaskResult)
+    assert other.calls == 2
+
+
+def test_deduplicated_task_coalesces_concurrent_dry_runs(
+    memory_cache: InMemoryCacheBackend,
+) -> None:
+    """Duplicate dry runs arriving while the first one runs wait for its result."""
+    started = threading.Event()
+    release = threading.Event()
+    calls = 0
+
+    @deduplicated_task(lock_key_fn=lambda ws, **_: ws.name, dry_run_cache_ttl=60)
+    def test_task(ws: Workspace, *, dry_run: bool = True) -> MemoizedTaskResult:
+        nonlocal calls
+        calls += 1
+        started.set()
+        release.wait(timeout=5)
+        return MemoizedTaskResult(status=TaskStatus.SUCCESS, calls=calls)
+
+    results: list[MemoizedTaskResult] = []
+
+    def run() -> None:
+        results.append(test_task(Workspace(name="ws-1"), dry_run=True))
+
+    threads = [threading.Thread(target=run) for _ in range(4)]
+    threads[0].start()
+    started.wait(timeout=5)
+    for thread in threads[1:]:
+        thread.start()
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert calls == 1
+    assert [r.calls for r in results] == [1, 1, 1, 1]
+
+
+def test_deduplicated_task_does_not_keep_failed_dry_runs(
+    memory_cache: InMemoryCacheBackend,
+) -> None:
+    """A failed dry run is not served to later dry runs."""
+    statuses = iter([TaskStatus.FAILED, TaskStatus.SUCCESS])
+
+    @deduplicated_task(lock_key_fn=lambda ws, **_: ws.name, dry_run_cache_ttl=60)
+    def test_task(ws: Workspace, *, dry_run: bool = True) -> MemoizedTaskResult:
+        return MemoizedTaskResult(status=next(statuses))
+
+    assert test_task(Workspace(name="ws-1"), dry_run=True).status == "failed"
+    assert test_task(Workspace(name="ws-1"), dry_run=True).status == "success"
+    assert memory_cache.storage
+
+
+def test_deduplicated_task_failed_dry_runs_never_reach_other_workers(
+    memory_cache: InMemoryCacheBackend,
+) -> None:
+    """Another worker reading the key right after a write never sees a failure."""
+    other_worker = InMemoryCacheBackend()
+    other_worker.storage = memory_cache.storage
+    seen: list[TaskStatus] = []
+    store = memory_cache.set
+
+    def store_and_peek(key: str, value: str, ttl: int | None = None) -> None:
+        store(key, value, ttl)
+        entry = other_worker._get_entry(key, MemoizedTaskResult)
+        assert entry is not None
+        seen.append(entry.value.status)
+
+    statuses = iter([TaskStatus.FAILED, TaskStatus.SUCCESS])
+
+    @deduplicated_task(lock_key_fn=lambda ws, **_: ws.name, dry_run_cache_ttl=60)
+    def test_task(ws: Workspace, *, dry_run: bool = True) -> MemoizedTaskResult:
+        return MemoizedTaskResult(status=next(statuses))
+
+    with patch.object(memory_cache, "set", side_effect=store_and_peek):
+        assert test_task(Workspace(name="ws-1"), dry_run=True).status == "failed"
+        assert not memory_cache.storage
+        assert test_task(Workspace(name="ws-1"), dry_run=True).status == "success"
+
+    assert seen == [TaskStatus.SUCCESS]
+
+
+def test_deduplicated_task_never_memoizes_production_runs(
+    memory_cache: InMemoryCacheBackend,
+) -> None:
+    """Production runs always execute."""
+    calls = 0
+
+    @deduplicated_task(lock_key_fn=lambda ws, **_: ws.name, dry_run_cache_ttl=60)
+    def test_task(ws: Workspace, *, dry_run: bool = True) -> MemoizedTaskResult:
+        nonlocal calls
+        calls += 1
+        return MemoizedTaskResult(status=TaskStatus.SUCCESS, calls=calls)
+
+    test_task(Workspace(name="ws-1"), dry_run=False)
+    test_task(Workspace(name="ws-1"), dry_run=False)
+
+    assert calls == 2
+    assert not memory_cache.storage
+
+
+def test_deduplicated_task_dry_run_memoization_needs_task_result(
+    mock_cache: MagicMock,
+) -> None:
+    """Tasks not returning a TaskResult are never memoized."""
+
+    @deduplicated_task(lock_key_fn=lambda ws, **_: ws, dry_run_cache_ttl=60)
+    def test_task(ws: str, *, dry_run: bool = True) -> str:
+        return ws
+
+    with patch("qontract_api.tasks._deduplication.get_cache", return_value=mock_cache):
+        assert test_task("ws-1", dry_run=True) == "ws-1"
+
+    mock_cache.get_or_compute.assert_not_called()
+
+
+def test_deduplicated_task_memoizes_with_type_checking_only_params(
+    memory_cache: InMemoryCacheBackend,
+) -> None:
+    """Parameter types imported under TYPE_CHECKING don't disable memoization."""
+    calls = 0
+
+    def test_task(ws: str, *, dry_run: bool = True) -> MemoizedTaskResult:
+        nonlocal calls
+        calls += 1
+        return MemoizedTaskResult(status=TaskStatus.SUCCESS, calls=calls)
+
+    # as written under "from __future__ import annotations"
+    test_task.__annotations__ = {
+        "ws": "UnresolvableWorkspace",
+        "return": "MemoizedTaskResult",
+    }
+    task = deduplicated_task(lock_key_fn=lambda ws, **_: ws, dry_run_cache_ttl=60)(
+        test_task
+    )
+
+    task("ws-1", dry_run=True)
+    result = task("ws-1", dry_run=True)
+
+    assert calls == 1
+    assert isinstance(result, MemoizedTaskResult)
+
+
+def test_deduplicated_task_unresolvable_return_type_not_memoized(
+    mock_cache: MagicMock,
+) -> None:
+    """An unresolvable return annotation disables memoization."""
+
+    def test_task(ws: str, *, dry_run: bool = True) -> TaskResult:
+        return TaskResult(status=TaskStatus.SUCCESS)
+
+    test_task.__annotations__ = {"return": "UnresolvableTaskResult"}
+    task = deduplicated_task(lock_key_fn=lambda ws, **_: ws, dry_run_cache_ttl=60)(
+        test_task
+    )
+
+    with patch("qontract_api.tasks._deduplication.get_cache", return_value=mock_cache):
+        assert task("ws-1", dry_run=True).status == TaskStatus.SUCCESS
+
+    mock_cache.get_or_compute.assert_not_called()
@@ -5,20 +5,26 @@ a full mirror of OCM's schema. See qontract_utils.ocm_api.models for the domain
 these are mapped into.
 
 RawOcmClient owns the URLs/paths, pagination, and JSON<->pydantic (de)serialization for
-each operation - callers get back the full (already paginated) list of raw items. It has
-no business logic, no hooks, no retries - it's handed an already authenticated/configured
-httpx2.Client by qontract_utils.ocm_api.client.OcmApi, which owns that client's lifecycle
-(construction, close()).
+each operation - list operations stream the raw items of all pages, in page order, while
+the remaining pages are still being fetched. It has no business logic, no hooks, no
+retries - it's handed an already authenticated/configured httpx2.Client by
+qontract_utils.ocm_api.client.OcmApi, which owns that client's lifecycle (construction,
+close()).
 """
 
 from __future__ import annotations
 
-from collections.abc import Callable
-from typing import Annotated, Any, Literal
+from typing import TYPE_CHECKING, Annotated, Any, Literal
 
-import httpx2
 from pydantic import BaseModel, Field
 
+from qontract_utils.pagination import Page, iter_pages
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+    import httpx2
+
 MAX_PAGE_SIZE = 100
 
 
@@ -149,34 +155,36 @@ def _parse_raw_identity_provider(
 class RawOcmClient:
     """Thin httpx2-based OCM client - request building, pagination, and pydantic (de)serialization only."""
 
-    def __init__(self, client: httpx2.Client) -> None:
+    def __init__(self, client: httpx2.Client, page_concurrency: int = 1) -> None:
+        """Initialize the raw client.
+
+        Args:
+            client: authenticated httpx2 client, must be safe to share across threads
+                when page_concurrency > 1
+            page_concurrency: max number of pages fetched in parallel, once the first
+                page reported the total number of records (1 = one after another)
+        """
         self._client = client
+        self._page_concurrency = page_concurrency
 
-    @staticmethod
-    def _fetch_all_pages[T](
-        fetch_page: Callable[[int], tuple[list[T], int]],
-    ) -> list[T]:
-        """Fetch all pages from a paginated OCM endpoint.
+    def _iter_all_pages[T](self, fetch_page: Callable[[int], Page[T]]) -> Iterator[T]:
+        """Stream the items of all pages from a paginated OCM endpoint, in page order.
 
         Args:
-            fetch_page: given a page number, returns (items_on_page, records_on_page)
+            fetch_page: given a page number, returns that page
 
         Note: pagination ordering is unreliable unless the request is sorted by a
         field with a db index (e.g. "id" or "created_at") - see callers.
         """
-        items: list[T] = []
-        page = 1
-        while True:
-            page_items, records_on_page = fetch_page(page)
-            items.extend(page_items)
-            if records_on_page < MAX_PAGE_SIZE:
-                return items
-            page += 1
+        for items in iter_pages(
+            fetch_page, page_size=MAX_PAGE_SIZE, concurrency=self._page_concurrency
+        ):
+            yield from items
 
     def get_labels(
         self, *, search: str, order_by: Literal["created_at"]
-    ) -> list[RawLabel]:
-        def fetch_page(page: int) -> tuple[list[RawLabel], int]:
+    ) -> Iterator[RawLabel]:
+        def fetch_page(page: int) -> Page[RawLabel]:
             response = self._client.get(
                 "/api/accounts_mgmt/v1/labels",
                 params={
@@ -188,9 +196,9 @@ class RawOcmClient:
             )
             response.raise_for_status()
             raw_list = RawLabelList.model_validate(response.json())
-            return raw_list.items, raw_list.size
+            return Page(raw_list.items, raw_list.size, raw_list.total)
 
-        return self._fetch_all_pages(fetch_page)
+        return self._iter_all_pages(fetch_page)
 
     def get_subscriptions(
         self,
@@ -199,8 +207,8 @@ class RawOcmClient:
         order_by: Literal["id"],
         fetch_labels: bool,
         fetch_capabilities: bool,
-    ) -> list[RawSubscription]:
-        def fetch_page(page: int) -> tuple[list[RawSubscription], int]:
+    ) -> Iterator[RawSubscription]:
+        def fetch_page(page: int) -> Page[RawSubscription]:
             response = self._client.get(
                 "/api/accounts_mgmt/v1/subscriptions",
                 params={
@@ -214,14 +222,14 @@ class RawOcmClient:
             )
             response.raise_for_status()
             raw_list = RawSubscriptionList.model_validate(response.json())
-            return raw_list.items, raw_list.size
+            return Page(raw_list.items, raw_list.size, raw_list.total)
 
-        return self._fetch_all_pages(fetch_page)
+        return self._iter_all_pages(fetch_page)
 
     def get_clusters(
         self, *, search: str, order: Literal["creation_timestamp"]
-    ) -> list[RawCluster]:
-        def fetch_page(page: int) -> tuple[list[RawCluster], int]:
+    ) -> Iterator[RawCluster]:
+        def fetch_page(page: int) -> Page[RawCluster]:
             response = self._client.get(
                 "/api/clusters_mgmt/v1/clusters",
                 params={
@@ -233,26 +241,26 @@ class RawOcmClient:
             )
             response.raise_for_status()
             raw_list = RawClusterList.model_validate(response.json())
-            return raw_list.items, raw_list.size
+            return Page(raw_list.items, raw_list.size, raw_list.total)
 
-        return self._fetch_all_pages(fetch_page)
+        return self._iter_all_pages(fetch_page)
 
     def get_identity_providers(
         self, *, cluster_id: str
-    ) -> list[RawIdentityProviderOidc | RawIdentityProvider]:
-        def fetch_page(page: int) -> tuple[list[dict[str, Any]], int]:
+    ) -> Iterator[RawIdentityProviderOidc | RawIdentityProvider]:
+        def fetch_page(page: int) -> Page[dict[str, Any]]:
             response = self._client.get(
                 f"/api/clusters_mgmt/v1/clusters/{cluster_id}/identity_providers",
                 params={"page": page, "size": MAX_PAGE_SIZE},
             )
             response.raise_for_status()
             raw_list = RawIdentityProviderList.model_validate(response.json())
-            return raw_list.items, raw_list.size
+            return Page(raw_list.items, raw_list.size, raw_list.total)
 
-        return [
+        return (
             _parse_raw_identity_provider(item)
-            for item in self._fetch_all_pages(fetch_page)
-        ]
+            for item in self._iter_all_pages(fetch_page)
+        )
 
     def create_identity_provider(
         self, *, cluster_id: str, body: dict[str, Any]
@@ -175,6 +175,7 @@ class OcmApi:
         timeout: float = TIMEOUT,
         max_retries: int = MAX_RETRIES,
         user_agent: str = DEFAULT_USER_AGENT,
+        page_concurrency: int = 1,
     ) -> None:
         """Initialize the OCM API client.
 
@@ -190,6 +191,9 @@ class OcmApi:
                 callers embedded in a larger service (e.g. qontract-api) should pass
                 their own app name/version so OCM can attribute traffic to the actual
                 caller.
+            page_concurrency: max number of pages of a list operation fetched in
+                parallel once the first page reported the total (default: 1, one
+                page after another)
             hooks: Optional custom hooks to merge with built-in hooks. Not read here -
                 @with_hooks intercepts and merges it into self._hooks before this body runs.
         """
@@ -212,7 +216,7 @@ class OcmApi:
             timeout=timeout,
             transport=httpx2.HTTPTransport(retries=max_retries),
         )
-        self._raw = RawOcmClient(self._client)
+        self._raw = RawOcmClient(self._client, page_concurrency=page_concurrency)
 
     def close(self) -> None:
         """Close the underlying HTTP client."""
@@ -0,0 +1,101 @@
+"""Page iteration for page/size paginated REST APIs (e.g. OCM).
+
+The first page is always fetched on its own. Sequential iteration then walks
+page after page until a short page shows up. With concurrency > 1, the
+``total`` reported by the first page tells how many pages remain - those are
+fetched by a bounded worker pool and yielded in page order, so callers can
+process page N while pages N+1.. are still in flight.
+"""
+
+from __future__ import annotations
+
+import math
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Generator, Iterable
+
+
+@dataclass(frozen=True)
+class Page[T]:
+    """A single fetched page.
+
+    Attributes:
+        items: items on the page
+        size: number of records on the page as reported by the server
+        total: total number of records across all pages, None if not reported
+    """
+
+    items: list[T]
+    size: int
+    total: int | None = None
+
+
+def _fetch_concurrently[T](
+    fetch_page: Callable[[int], Page[T]],
+    page_numbers: Iterable[int],
+    concurrency: int,
+) -> Generator[Page[T]]:
+    """Fetch pages with at most `concurrency` requests in flight, yield them in order."""
+    numbers = iter(page_numbers)
+    executor = ThreadPoolExecutor(max_workers=concurrency)
+    in_flight: deque[Future[Page[T]]] = deque()
+
+    def submit_next() -> None:
+        if (number := next(numbers, None)) is not None:
+            in_flight.append(executor.submit(fetch_page, number))
+
+    try:
+        for _ in range(concurrency):
+            submit_next()
+        while in_flight:
+            page = in_flight.popleft().result()
+            # keep the window full while the caller processes the page
+            submit_next()
+            yield page
+    finally:
+        # the caller may stop early, don't wait for pages nobody asked for
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def iter_pages[T](
+    fetch_page: Callable[[int], Page[T]],
+    page_size: int,
+    concurrency: int = 1,
+    max_pages: int | None = None,
+) -> Generator[list[T]]:
+    """Yield the items of each page, in page order.
+
+    Args:
+        fetch_page: given a 1-based page number, returns that page
+        page_size: requested page size, a page with fewer records is the last one
+        concurrency: max number of pages fetched in parallel, 1 fetches pages
+            one after another. Parallel fetching needs the server to report
+            `total`, otherwise it falls back to sequential fetching.
+        max_pages: stop after this many pages
+
+    Pages past the one `total` points to are still fetched sequentially when the
+    last expected page is full, so records added in the meantime are not lost.
+    """
+    number = 1
+    page = fetch_page(number)
+    yield page.items
+    while page.size >= page_size and (max_pages is None or number < max_pages):
+        last = math.ceil(page.total / page_size) if page.total else 0
+        if max_pages is not None:
+            last = min(last, max_pages)
+        if concurrency > 1 and last > number + 1:
+            for page in _fetch_concurrently(
+                fetch_page, range(number + 1, last + 1), concurrency
+            ):
+                number += 1
+                yield page.items
+                if page.size < page_size:
+                    return
+            continue
+        number += 1
+        page = fetch_page(number)
+        yield page.items
@@ -44,6 +44,7 @@ def _make_ocm_api(
     token: str,
     hooks: Hooks | None = None,
     user_agent: str = DEFAULT_USER_AGENT,
+    page_concurrency: int = 1,
 ) -> OcmApi:
     httpserver.expect_request(TOKEN_PATH, method="POST").respond_with_json(
         _token_response(token)
@@ -56,6 +57,7 @@ def _make_ocm_api(
         hooks=hooks,
         timeout=5,
         user_agent=user_agent,
+        page_concurrency=page_concurrency,
     )
     _created_apis.append(api)
     return api
@@ -208,6 +210,27 @@ def test_get_labels_paginates_across_pages(httpserver: HTTPServer) -> None:
     assert label_requests[1].args["page"] == "2"
 
 
+def test_get_labels_fetches_remaining_pages_concurrently(
+    httpserver: HTTPServer,
+) -> None:
+    api = _make_ocm_api(httpserver, token="test-token", page_concurrency=3)
+
+    def handler(request: Request) -> Response:
+        page = int(request.args["page"])
+        keys = range((page - 1) * 100, min(page * 100, 350))
+        items = [_label_json(f"k{i}", "Subscription", "sub-1") for i in keys]
+        body = {"items": items, "page": page, "size": len(items), "total": 350}
+        return Response(json.dumps(body), content_type="application/json")
+
+    httpserver.expect_request(LABELS_PATH, method="GET").respond_with_handler(handler)
+
+    labels = api.get_labels(Filter().like("key", "k%"))
+
+    assert [label.key for label in labels] == [f"k{i}" for i in range(350)]
+    label_requests = [req for req, _ in httpserver.log if req.path == LABELS_PATH]
+    assert sorted(req.args["page"] for req in label_requests) == ["1", "2", "3", "4"]
+
+
 def test_get_subscriptions_chunks_by_id(httpserver: HTTPServer) -> None:
     api = _make_ocm_api(httpserver, token="test-token")
     ids = [f"sub-{i}" for i in range(150)]
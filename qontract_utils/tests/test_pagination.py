@@ -0,0 +1,108 @@
+"""Unit tests for pagination module."""
+
+import threading
+
+import pytest
+from qontract_utils.pagination import Page, iter_pages
+
+PAGE_SIZE = 2
+
+
+class FakeEndpoint:
+    """Paginated endpoint serving `nr_of_items` ids, recording requested pages."""
+
+    def __init__(self, nr_of_items: int, *, report_total: bool = True) -> None:
+        self.nr_of_items = nr_of_items
+        self.report_total = report_total
+        self.requested: list[int] = []
+        self._lock = threading.Lock()
+
+    def fetch_page(self, page: int) -> Page[int]:
+        with self._lock:
+            self.requested.append(page)
+        items = list(
+            range((page - 1) * PAGE_SIZE, min(page * PAGE_SIZE, self.nr_of_items))
+        )
+        return Page(items, len(items), self.nr_of_items if self.report_total else None)
+
+
+def _flatten(pages: list[list[int]]) -> list[int]:
+    return [item for page in pages for item in page]
+
+
+@pytest.mark.parametrize("concurrency", [1, 4])
+@pytest.mark.parametrize(
+    ("nr_of_items", "expected_requests"),
+    [(0, 1), (1, 1), (2, 2), (7, 4), (8, 5)],
+)
+def test_iter_pages_yields_all_items_in_order(
+    nr_of_items: int, expected_requests: int, concurrency: int
+) -> None:
+    endpoint = FakeEndpoint(nr_of_items)
+
+    pages = list(iter_pages(endpoint.fetch_page, PAGE_SIZE, concurrency=concurrency))
+
+    assert _flatten(pages) == list(range(nr_of_items))
+    assert sorted(endpoint.requested) == list(range(1, expected_requests + 1))
+
+
+def test_iter_pages_fetches_remaining_pages_concurrently() -> None:
+    endpoint = FakeEndpoint(7)
+    # pages 2-4 only return once all of them are in flight
+    barrier = threading.Barrier(3, timeout=5)
+
+    def fetch_page(page: int) -> Page[int]:
+        if page > 1:
+            barrier.wait()
+        return endpoint.fetch_page(page)
+
+    pages = list(iter_pages(fetch_page, PAGE_SIZE, concurrency=3))
+
+    assert _flatten(pages) == list(range(7))
+
+
+def test_iter_pages_without_total_is_sequential() -> None:
+    endpoint = FakeEndpoint(7, report_total=False)
+
+    pages = list(iter_pages(endpoint.fetch_page, PAGE_SIZE, concurrency=4))
+
+    assert _flatten(pages) == list(range(7))
+    assert endpoint.requested == [1, 2, 3, 4]
+
+
+@pytest.mark.parametrize("concurrency", [1, 4])
+def test_iter_pages_max_pages(concurrency: int) -> None:
+    endpoint = FakeEndpoint(20)
+
+    pages = list(
+        iter_pages(endpoint.fetch_page, PAGE_SIZE, concurrency=concurrency, max_pages=3)
+    )
+
+    assert _flatten(pages) == list(range(6))
+    assert sorted(endpoint.requested) == [1, 2, 3]
+
+
+def test_iter_pages_stops_at_short_page_when_total_shrinks() -> None:
+    endpoint = FakeEndpoint(20)
+
+    def fetch_page(page: int) -> Page[int]:
+        # records got deleted after the first page reported the total
+        endpoint.nr_of_items = 5
+        return endpoint.fetch_page(page)
+
+    pages = list(iter_pages(fetch_page, PAGE_SIZE, concurrency=2))
+
+    assert _flatten(pages) == list(range(5))
+    assert max(endpoint.requested) <= 5
+
+
+def test_iter_pages_bounds_pages_in_flight() -> None:
+    endpoint = FakeEndpoint(100)
+    pages = iter_pages(endpoint.fetch_page, PAGE_SIZE, concurrency=3)
+
+    assert next(pages) == [0, 1]
+    assert next(pages) == [2, 3]
+    pages.close()
+
+    # page 2 was handed out, 3 and 4 were in flight when the caller stopped
+    assert max(endpoint.requested) <= 5
@@ -19,7 +19,9 @@ from typing import (
 
 from croniter import croniter
 from pydantic import BaseModel, Field
-from requests.exceptions import HTTPError
+from requests.exceptions import ConnectionError as RequestsConnectionError
+from requests.exceptions import HTTPError, Timeout
+from sretoolbox.utils import retry, threaded
 
 from reconcile.aus.aus_sts_gate_handler import (
     AUS_VERSION_GATE_APPROVALS_LABEL,
@@ -71,6 +73,7 @@ from reconcile.utils.clusterhealth.telemeter import (
     TELEMETER_SOURCE,
     TelemeterClusterHealthProvider,
 )
+from reconcile.utils.constants import DEFAULT_THREAD_POOL_SIZE
 from reconcile.utils.datetime_util import (
     ensure_utc,
     from_utc_iso_format,
@@ -148,6 +151,7 @@ class AdvancedUpgradeSchedulerBaseIntegrationParams(PydanticRunParams):
     excluded_ocm_organization_ids: set[str] | None = None
     ignore_sts_clusters: bool = False
     rosa_role_upgrade_handler_params: RosaRoleUpgradeHandlerParams | None = None
+    thread_pool_size: int = DEFAULT_THREAD_POOL_SIZE
 
 
 class ReconcileError(Exception):
@@ -673,66 +677,103 @@ class UpgradePolicyHandler(BaseModel, extra="forbid"):
             self.policy.create(ocm_api, rosa_role_upgrade_handler_params, secret_reader)
 
 
-def fetch_current_state(
+def _raise_client_errors(e: Exception) -> None:
+    """Stop retrying on 4xx responses, only connection errors, timeouts and
+    5xx responses are transient."""
+    if (
+        isinstance(e, HTTPError)
+        and e.response is not None
+        and e.response.status_code < 500
+    ):
+        raise e
+
+
+@retry(
+    exceptions=(RequestsConnectionError, Timeout, HTTPError),
+    hook=_raise_client_errors,
+)
+def _fetch_spec_current_state(
+    spec: ClusterUpgradeSpec,
     ocm_api: OCMBaseClient,
-    org_upgrade_spec: OrganizationUpgradeSpec,
-    addons: bool = False,
+    addon_service: AddonService,
+    addons: bool,
 ) -> list[AbstractUpgradePolicy]:
     current_state: list[AbstractUpgradePolicy] = []
-    addon_service = init_addon_service(org_upgrade_spec.org.environment)
-    for spec in org_upgrade_spec.specs:
-        if addons and isinstance(spec, ClusterAddonUpgradeSpec):
-            addon_spec = cast("ClusterAddonUpgradeSpec", spec)
-            addon_upgrade_policies = addon_service.get_addon_upgrade_policies(
-                ocm_api, spec.cluster.id, addon_id=addon_spec.addon.addon.id
-            )
-            current_state.extend(
-                AddonUpgradePolicy(
-                    organization_id=spec.org.org_id,
-                    id=addon_upgrade_policy.id,
-                    addon_id=addon_spec.addon.addon.id,
-                    cluster=spec.cluster,
-                    next_run=addon_upgrade_policy.next_run,
-                    schedule=addon_upgrade_policy.schedule,
-                    schedule_type=addon_upgrade_policy.schedule_type,
-                    version=addon_upgrade_policy.version,
-                    state=addon_upgrade_policy.state,
-                    addon_service=addon_service,
-                )
-                for addon_upgrade_policy in addon_upgrade_policies
+    if addons and isinstance(spec, ClusterAddonUpgradeSpec):
+        addon_spec = cast("ClusterAddonUpgradeSpec", spec)
+        addon_upgrade_policies = addon_service.get_addon_upgrade_policies(
+            ocm_api, spec.cluster.id, addon_id=addon_spec.addon.addon.id
+        )
+        current_state.extend(
+            AddonUpgradePolicy(
+                organization_id=spec.org.org_id,
+                id=addon_upgrade_policy.id,
+                addon_id=addon_spec.addon.addon.id,
+                cluster=spec.cluster,
+                next_run=addon_upgrade_policy.next_run,
+                schedule=addon_upgrade_policy.schedule,
+                schedule_type=addon_upgrade_policy.schedule_type,
+                version=addon_upgrade_policy.version,
+                state=addon_upgrade_policy.state,
+                addon_service=addon_service,
             )
-        elif spec.cluster.is_rosa_hypershift():
-            upgrade_policies = get_control_plane_upgrade_policies(
-                ocm_api, spec.cluster.id
+            for addon_upgrade_policy in addon_upgrade_policies
+        )
+    elif spec.cluster.is_rosa_hypershift():
+        upgrade_policies = get_control_plane_upgrade_policies(ocm_api, spec.cluster.id)
+        for upgrade_policy in upgrade_policies:
+            policy = upgrade_policy | {
+                "cluster": spec.cluster,
+            }
+            current_state.append(ControlPlaneUpgradePolicy(**policy))
+        for node_pool in spec.node_pools:
+            node_upgrade_policies = get_node_pool_upgrade_policies(
+                ocm_api, spec.cluster.id, node_pool.id
             )
-            for upgrade_policy in upgrade_policies:
+            for upgrade_policy in node_upgrade_policies:
                 policy = upgrade_policy | {
                     "cluster": spec.cluster,
+                    "node_pool": node_pool.id,
                 }
-                current_state.append(ControlPlaneUpgradePolicy(**policy))
-            for node_pool in spec.node_pools:
-                node_upgrade_policies = get_node_pool_upgrade_policies(
-                    ocm_api, spec.cluster.id, node_pool.id
-                )
-                for upgrade_policy in node_upgrade_policies:
-                    policy = upgrade_policy | {
-                        "cluster": spec.cluster,
-                        "node_pool": node_pool.id,
-                    }
-                    current_state.append(NodePoolUpgradePolicy(**policy))
-        else:
-            upgrade_policies = get_upgrade_policies(ocm_api, spec.cluster.id)
-            for upgrade_policy in upgrade_policies:
-                policy = upgrade_policy | {
-                    "cluster": spec.cluster,
-                    "organization_id": spec.org.org_id,
-                    "cluster_labels": spec.cluster_labels,
-                }
-                current_state.append(ClusterUpgradePolicy(**policy))
-
+                current_state.append(NodePoolUpgradePolicy(**policy))
+    else:
+        upgrade_policies = get_upgrade_policies(ocm_api, spec.cluster.id)
+        for upgrade_policy in upgrade_policies:
+            policy = upgrade_policy | {
+                "cluster": spec.cluster,
+                "organization_id": spec.org.org_id,
+                "cluster_labels": spec.cluster_labels,
+            }
+            current_state.append(ClusterUpgradePolicy(**policy))
     return current_state
 
 
+def fetch_current_state(
+    ocm_api: OCMBaseClient,
+    org_upgrade_spec: OrganizationUpgradeSpec,
+    addons: bool = False,
+    thread_pool_size: int = DEFAULT_THREAD_POOL_SIZE,
+) -> list[AbstractUpgradePolicy]:
+    """
+    Fetch the upgrade policies of all clusters of an organization.
+
+    OCM only exposes upgrade policies per cluster (and per node pool), so the
+    clusters are queried concurrently. Organizations are processed one after
+    the other, which makes thread_pool_size the concurrency limit towards an
+    OCM environment. Connection errors and server errors are retried per cluster.
+    """
+    addon_service = init_addon_service(org_upgrade_spec.org.environment)
+    results: list[list[AbstractUpgradePolicy]] = threaded.run(
+        _fetch_spec_current_state,
+        org_upgrade_spec.specs,
+        thread_pool_size,
+        ocm_api=ocm_api,
+        addon_service=addon_service,
+        addons=addons,
+    )
+    return [policy for policies in results for policy in policies]
+
+
 # consider first lower versions and lower soakdays (when versions are equal)
 def sort_key(spec: ClusterUpgradeSpec) -> tuple:
     return (
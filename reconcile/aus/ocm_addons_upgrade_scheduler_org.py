@@ -69,6 +69,7 @@ class OCMAddonsUpgradeSchedulerOrgIntegration(
                 org_ocm_api,
                 org_upgrade_spec,
                 addons=True,
+                thread_pool_size=self.params.thread_pool_size,
             )
 
             addons = {
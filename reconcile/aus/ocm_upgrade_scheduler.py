@@ -45,6 +45,7 @@ class OCMClusterUpgradeSchedulerIntegration(
             current_state = aus.fetch_current_state(
                 ocm_api=ocm_api,
                 org_upgrade_spec=org_upgrade_spec,
+                thread_pool_size=self.params.thread_pool_size,
             )
 
             # expose version data metrics for the current organization
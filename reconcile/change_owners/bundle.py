@@ -1,5 +1,5 @@
 from abc import abstractmethod
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import StrEnum
 from typing import (
     Any,
@@ -171,16 +171,23 @@ class QontractServerFileDiffResolver:
     """
 
     comparison_sha: str
+    _file_diffs: dict[FileRef, tuple[dict[str, Any] | None, dict[str, Any] | None]] = (
+        field(init=False, default_factory=dict, repr=False, compare=False)
+    )
 
     def lookup_file_diff(
         self, file_ref: FileRef
     ) -> tuple[dict[str, Any] | None, dict[str, Any] | None]:
-        data = get_diff(
-            old_sha=self.comparison_sha,
-            file_type=file_ref.file_type.value,
-            file_path=file_ref.path,
-        )
-        return data.get("old"), data.get("new")
+        # context expansion looks up the same files over and over again
+        # and the diff between two SHAs never changes
+        if file_ref not in self._file_diffs:
+            data = get_diff(
+                old_sha=self.comparison_sha,
+                file_type=file_ref.file_type.value,
+                file_path=file_ref.path,
+            )
+            self._file_diffs[file_ref] = (data.get("old"), data.get("new"))
+        return self._file_diffs[file_ref]
 
 
 class NoOpFileDiffResolver:
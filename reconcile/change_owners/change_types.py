@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import hashlib
 from abc import (
     ABC,
     abstractmethod,
@@ -17,6 +18,7 @@ from dataclasses import (
     field,
 )
 from enum import Enum
+from functools import cached_property
 from typing import (
     Any,
 )
@@ -43,6 +45,7 @@ from reconcile.gql_definitions.change_owners.queries.change_types import (
     ChangeTypeImplicitOwnershipV1,
     ChangeTypeV1,
 )
+from reconcile.utils.json import json_dumps, pydantic_encoder
 from reconcile.utils.jsonpath import (
     is_prefix_of,
     parse_jsonpath,
@@ -266,6 +269,20 @@ class PathExpression:
         )
 
 
+def content_hash(content: Any) -> str | None:
+    """
+    a hash of the file content, used to memoize work done per file content.
+    the content SHAs reported by qontract-server can't be used for that purpose
+    because they are not always available.
+    """
+    try:
+        return hashlib.sha256(
+            json_dumps(content, compact=True, defaults=pydantic_encoder).encode()
+        ).hexdigest()
+    except TypeError, ValueError:
+        return None
+
+
 @dataclass
 class FileChange:
     file_ref: FileRef
@@ -274,6 +291,14 @@ class FileChange:
     old_backrefs: set[FileRef] = field(default_factory=set)
     new_backrefs: set[FileRef] = field(default_factory=set)
 
+    @cached_property
+    def old_content_hash(self) -> str | None:
+        return content_hash(self.old)
+
+    @cached_property
+    def new_content_hash(self) -> str | None:
+        return content_hash(self.new)
+
 
 class OwnershipContext(ABC):
     @abstractmethod
@@ -367,6 +392,10 @@ class ContextExpansion:
     context: OwnershipContext
     change_type: ChangeTypeProcessor
     file_diff_resolver: FileDiffResolver
+    _context_file_refs_cache: dict[
+        tuple[FileRef, str, str, frozenset[FileRef], frozenset[FileRef]],
+        list[FileRef],
+    ] = field(init=False, default_factory=dict, repr=False, compare=False)
 
     def expand_from_file_ref(
         self,
@@ -393,10 +422,7 @@ class ContextExpansion:
         that new context and expose everything as a new `ResolvedContext` with
         `self.change_type` as the change type.
         """
-        context_file_refs = self.context.find_ownership_context(
-            context_schema=self.change_type.context_schema,
-            change=change,
-        )
+        context_file_refs = self._find_ownership_context(change)
         expaned_context_file_refs: list[ResolvedContext] = []
         for ref in context_file_refs:
             ref_old_data, ref_new_data = self.file_diff_resolver.lookup_file_diff(ref)
@@ -412,6 +438,31 @@ class ContextExpansion:
             )
         return expaned_context_file_refs
 
+    def _find_ownership_context(self, change: FileChange) -> list[FileRef]:
+        # a context expansion is shared by all change-types inheriting it, so
+        # the same file is usually looked at many times during a run
+        old_hash, new_hash = change.old_content_hash, change.new_content_hash
+        if old_hash is None or new_hash is None:
+            return self.context.find_ownership_context(
+                context_schema=self.change_type.context_schema,
+                change=change,
+            )
+        cache_key = (
+            change.file_ref,
+            old_hash,
+            new_hash,
+            frozenset(change.old_backrefs),
+            frozenset(change.new_backrefs),
+        )
+        if cache_key not in self._context_file_refs_cache:
+            self._context_file_refs_cache[cache_key] = (
+                self.context.find_ownership_context(
+                    context_schema=self.change_type.context_schema,
+                    change=change,
+                )
+            )
+        return self._context_file_refs_cache[cache_key]
+
 
 @dataclass
 class ResolvedContext:
@@ -491,13 +542,41 @@ class ChangeTypeProcessor:
             tuple[BundleFileType, str | None], list[PathExpression]
         ] = defaultdict(list)
         self._change_detectors: list[ChangeDetector] = []
+        self._change_detectors_by_schema: dict[str | None, list[ChangeDetector]] = (
+            defaultdict(list)
+        )
         self._context_expansions: list[ContextExpansion] = []
         self._heritage: set[str] = set()
+        # allowed paths only depend on the context if a path expression
+        # renders the context file path
+        self._context_dependent_paths = False
+        self._allowed_changed_paths_cache: dict[
+            tuple[FileRef, str, str | None], list[jsonpath_ng.JSONPath]
+        ] = {}
 
     @property
     def change_detectors(self) -> Sequence[ChangeDetector]:
         return self._change_detectors
 
+    @property
+    def change_schemas(self) -> AbstractSet[str | None]:
+        """
+        The schemas of files this change-type detects changes in via its
+        change detectors.
+        """
+        return self._change_detectors_by_schema.keys()
+
+    def reacts_to_schema(self, schema: str | None) -> bool:
+        """
+        whether `find_context_file_refs` can find any context for a changed
+        file of the given schema
+        """
+        return (
+            self.context_schema is None
+            or self.context_schema == schema
+            or schema in self._change_detectors_by_schema
+        )
+
     def find_context_file_refs(
         self,
         change: FileChange,
@@ -593,39 +672,64 @@ class ChangeTypeProcessor:
         # the context for approver extraction can be found within the changed
         # file with a `context.selector`
         # see doc string for more details
-        for c in self.change_detectors:
-            if c.change_schema == change.file_ref.schema:
-                for ctx_file_ref in c.find_context_file_refs(change):
-                    contexts.append(
+        for c in self._change_detectors_by_schema.get(change.file_ref.schema, []):
+            for ctx_file_ref in c.find_context_file_refs(change):
+                contexts.append(
+                    ResolvedContext(
+                        owned_file_ref=ctx_file_ref,
+                        context_file_ref=ctx_file_ref,
+                        change_type=self,
+                    )
+                )
+                for ce in self._context_expansions:
+                    # add expanded contexts (derived owned files)
+                    contexts.extend(
                         ResolvedContext(
-                            owned_file_ref=ctx_file_ref,
+                            owned_file_ref=ec.owned_file_ref,
                             context_file_ref=ctx_file_ref,
-                            change_type=self,
+                            change_type=ec.change_type,
                         )
-                    )
-                    for ce in self._context_expansions:
-                        # add expanded contexts (derived owned files)
-                        contexts.extend(
-                            ResolvedContext(
-                                owned_file_ref=ec.owned_file_ref,
-                                context_file_ref=ctx_file_ref,
-                                change_type=ec.change_type,
-                            )
-                            for ec in ce.expand_from_file_ref(
-                                ctx_file_ref, expansion_trail_copy
-                            )
+                        for ec in ce.expand_from_file_ref(
+                            ctx_file_ref, expansion_trail_copy
                         )
+                    )
 
         return contexts
 
     def allowed_changed_paths(
-        self, file_ref: FileRef, file_content: Any, ctx: ChangeTypeContext
+        self,
+        file_ref: FileRef,
+        file_content: Any,
+        ctx: ChangeTypeContext,
+        content_hash: str | None = None,
     ) -> list[jsonpath_ng.JSONPath]:
         """
         find all paths within the provide file_content, that are covered by this
         ChangeTypeV1. the paths are represented as jsonpath expressions pinpointing
         the root element that can be changed
+
+        if a `content_hash` of the file_content is provided, the result is
+        memoized. the same file is usually checked for many contexts (e.g. every
+        role binding this change-type), but the allowed paths only differ between
+        contexts if a path expression refers to the context file.
         """
+        if content_hash is None:
+            return self._allowed_changed_paths(file_ref, file_content, ctx)
+
+        cache_key = (
+            file_ref,
+            content_hash,
+            ctx.context_file.path if self._context_dependent_paths else None,
+        )
+        if cache_key not in self._allowed_changed_paths_cache:
+            self._allowed_changed_paths_cache[cache_key] = self._allowed_changed_paths(
+                file_ref, file_content, ctx
+            )
+        return list(self._allowed_changed_paths_cache[cache_key])
+
+    def _allowed_changed_paths(
+        self, file_ref: FileRef, file_content: Any, ctx: ChangeTypeContext
+    ) -> list[jsonpath_ng.JSONPath]:
         paths = self._allowed_changed_paths_for_file_type_and_schema(
             file_ref.file_type, file_ref.schema, file_content, ctx
         )
@@ -667,6 +771,7 @@ class ChangeTypeProcessor:
     ) -> None:
         if isinstance(detector, JsonPathChangeDetector):
             self._change_detectors.append(detector)
+            self._change_detectors_by_schema[detector.change_schema].append(detector)
             change_schema = detector.change_schema or self.context_schema
             expressions = self._expressions_by_file_type_schema[
                 self.context_type, change_schema
@@ -674,6 +779,9 @@ class ChangeTypeProcessor:
             for path_expression in detector.json_path_expressions:
                 if path_expression not in expressions:
                     expressions.append(path_expression)
+                if path_expression.parsed_jsonpath is None:
+                    self._context_dependent_paths = True
+            self._allowed_changed_paths_cache.clear()
         else:
             raise TypeError(
                 f"{type(detector)} is not a supported change detection provider within ChangeTypes"
@@ -692,6 +800,39 @@ class ChangeTypeProcessor:
         return self._heritage.union({self.name})
 
 
+class ChangeTypeProcessorIndex:
+    """
+    A precompiled lookup for the change-types that can react to changes in
+    files of a given schema. A change-type reacts to a file if the file is of
+    its context schema (or the change-type has no context schema) or if one of
+    its change detectors watches the schema of the file. All other change-types
+    will never find a context for the file and don't need to be looked at.
+    """
+
+    def __init__(self, change_type_processors: Sequence[ChangeTypeProcessor]) -> None:
+        self._unbound = [
+            ctp for ctp in change_type_processors if ctp.context_schema is None
+        ]
+        schemas = {
+            schema
+            for ctp in change_type_processors
+            for schema in (ctp.context_schema, *ctp.change_schemas)
+        }
+        self._by_schema: dict[str | None, list[ChangeTypeProcessor]] = {
+            schema: [
+                ctp for ctp in change_type_processors if ctp.reacts_to_schema(schema)
+            ]
+            for schema in schemas
+        }
+
+    def processors_for_file(self, file_ref: FileRef) -> list[ChangeTypeProcessor]:
+        """
+        the change-types that can react to a change of the file, in the order
+        they were provided to the index
+        """
+        return self._by_schema.get(file_ref.schema, self._unbound)
+
+
 def build_ownership_context(
     file_diff_resolver: FileDiffResolver,
     selector: jsonpath_ng.JSONPath,
@@ -8,6 +8,7 @@ from dataclasses import (
     dataclass,
     field,
 )
+from functools import cached_property
 from typing import TYPE_CHECKING, Any
 
 import anymarkup
@@ -24,6 +25,7 @@ from reconcile.change_owners.change_types import (
     ChangeTypePriority,
     ChangeTypeProcessor,
     DiffCoverage,
+    FileChange,
 )
 from reconcile.change_owners.diff import (
     Diff,
@@ -133,22 +135,41 @@ class BundleFileChange:
             self._cover_changes_for_diffs(
                 self._filter_diffs([DiffType.ADDED, DiffType.CHANGED]),
                 self.new,
+                self.file_change.new_content_hash,
                 change_type_context,
             )
         )
         # look at the old state for removed fields or list items or object subtrees
         covered_diffs.update(
             self._cover_changes_for_diffs(
-                self._filter_diffs([DiffType.REMOVED]), self.old, change_type_context
+                self._filter_diffs([DiffType.REMOVED]),
+                self.old,
+                self.file_change.old_content_hash,
+                change_type_context,
             )
         )
 
         return covered_diffs
 
+    @cached_property
+    def file_change(self) -> FileChange:
+        """
+        The change as seen by ownership contexts. It is built once, so the
+        content hashes it memoizes are shared by all change-types.
+        """
+        return FileChange(
+            file_ref=self.fileref,
+            old=self.old,
+            new=self.new,
+            old_backrefs=self.old_backrefs,
+            new_backrefs=self.new_backrefs,
+        )
+
     def _cover_changes_for_diffs(
         self,
         diffs: list[DiffCoverage],
         file_content: Any,
+        content_hash: str | None,
         change_type_context: ChangeTypeContext,
     ) -> dict[str, Diff]:
         covered_diffs = {}
@@ -156,7 +177,7 @@ class BundleFileChange:
             for (
                 allowed_path
             ) in change_type_context.change_type_processor.allowed_changed_paths(
-                self.fileref, file_content, change_type_context
+                self.fileref, file_content, change_type_context, content_hash
             ):
                 for dc in diffs:
                     if dc.changed_path_covered_by_path(allowed_path):
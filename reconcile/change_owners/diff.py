@@ -1,13 +1,14 @@
 from __future__ import annotations
 
 import copy
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
 from functools import reduce
+from hashlib import blake2b
 from typing import TYPE_CHECKING, Any
 
 import jsonpath_ng
-from deepdiff import DeepDiff
+from deepdiff import DeepDiff, DeepHash
 from deepdiff.helper import CannotCompare
 from deepdiff.path import parse_path
 
@@ -15,6 +16,8 @@ from reconcile.utils.json import json_dumps
 from reconcile.utils.jsonpath import jsonpath_parts, remove_prefix_from_path
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     from deepdiff.model import DiffLevel
 
 
@@ -174,84 +177,387 @@ def compare_object_ctx_identifier(
     raise CannotCompare() from None
 
 
-def extract_diffs(old_file_content: Any, new_file_content: Any) -> list[Diff]:
-    diffs: list[Diff] = []
-    if old_file_content and new_file_content:
-        deep_diff = DeepDiff(
-            old_file_content,
-            new_file_content,
-            ignore_order=True,
-            iterable_compare_func=compare_object_ctx_identifier,
-            cutoff_intersection_for_pairs=1,
-        )
+_DEEPDIFF_OPTIONS: dict[str, Any] = {
+    "ignore_order": True,
+    "iterable_compare_func": compare_object_ctx_identifier,
+    "cutoff_intersection_for_pairs": 1,
+}
+
+_SCALAR_TYPES = (str, bytes, bool, int, float, type(None))
+
+PathParts = tuple[str | int, ...]
+
+_UNCHANGED_ITEM = "<unchanged item>"
+
+
+class UnsupportedContentError(Exception):
+    """
+    Raised when a document contains values the structural diff engine can't
+    hash, e.g. custom objects or non-string mapping keys.
+    """
+
+
+class MerkleTree:
+    """
+    Content hashes for every container of a JSON-like document, computed
+    bottom-up in a single pass.
+
+    The hashes follow the same equality rules `extract_diffs` applies when
+    diffing: list hashes ignore item order and repetition, and private keys
+    (starting with `__`, e.g. `__identifier`) don't contribute to a mapping's
+    hash. Two subtrees with the same hash are therefore guaranteed to produce
+    no diffs and can be skipped without descending into them.
+    """
+
+    def __init__(self, root: Any) -> None:
+        self._digests: dict[int, bytes] = {}
+        # keyed by type too, so 1, 1.0 and True don't share a digest
+        self._scalar_digests: dict[tuple[type, Any], bytes] = {}
+        self.root = root
+        self.root_digest = self.digest(root)
+
+    def _scalar_digest(self, value: Any) -> bytes:
+        key = (type(value), value)
+        digest = self._scalar_digests.get(key)
+        if digest is None:
+            digest = blake2b(
+                f"{type(value).__name__}:{value!r}".encode(), digest_size=16
+            ).digest()
+            self._scalar_digests[key] = digest
+        return digest
+
+    def digest(self, obj: Any) -> bytes:
+        if isinstance(obj, _SCALAR_TYPES):
+            return self._scalar_digest(obj)
+        cached = self._digests.get(id(obj))
+        if cached is not None:
+            return cached
+        h = blake2b(type(obj).__name__.encode(), digest_size=16)
+        if isinstance(obj, dict):
+            entries = []
+            for key, value in obj.items():
+                if not isinstance(key, str):
+                    raise UnsupportedContentError(f"non-string key {key!r}")
+                if key.startswith("__"):
+                    continue
+                entries.append(self._scalar_digest(key) + self.digest(value))
+            for entry in sorted(entries):
+                h.update(entry)
+        elif isinstance(obj, list | tuple):
+            for item_digest in sorted({self.digest(item) for item in obj}):
+                h.update(item_digest)
+        else:
+            raise UnsupportedContentError(f"unsupported type {type(obj).__name__}")
+        digest = h.digest()
+        self._digests[id(obj)] = digest
+        return digest
+
+
+def _parts_to_jsonpath(parts: PathParts) -> jsonpath_ng.JSONPath:
+    if not parts:
+        return jsonpath_ng.Root()
+    return reduce(
+        lambda a, b: a.child(b),
+        (
+            jsonpath_ng.Index(p) if isinstance(p, int) else jsonpath_ng.Fields(p)
+            for p in parts
+        ),
+    )
+
+
+@dataclass
+class _DiffCollector:
+    """
+    Collects diffs per category so they can be emitted in the same order
+    `extract_diffs` has always reported them.
+    """
+
+    old_root: Any
+    new_root: Any
+    values_changed: list[Diff] = field(default_factory=list)
+    dictionary_item_added: list[Diff] = field(default_factory=list)
+    dictionary_item_removed: list[Diff] = field(default_factory=list)
+    iterable_item_added: list[Diff] = field(default_factory=list)
+    iterable_item_removed: list[Diff] = field(default_factory=list)
+    type_changes: list[Diff] = field(default_factory=list)
+
+    def diffs(self) -> list[Diff]:
+        return [
+            *self.values_changed,
+            *self.dictionary_item_added,
+            *self.dictionary_item_removed,
+            *self.iterable_item_added,
+            *self.iterable_item_removed,
+            *self.type_changes,
+        ]
+
+    def add_deepdiff(self, old: Any, new: Any, prefix: PathParts = ()) -> None:
+        """
+        Runs DeepDiff on `old` and `new`, which are located at `prefix` within
+        the documents.
+        """
+        deep_diff = DeepDiff(old, new, **_DEEPDIFF_OPTIONS)
+
+        def to_jsonpath(path: str) -> jsonpath_ng.JSONPath:
+            return deepdiff_path_to_jsonpath(path, prefix)
 
         # handle changed values
-        diffs.extend([
+        self.values_changed.extend(
             Diff(
-                path=deepdiff_path_to_jsonpath(path),
+                path=to_jsonpath(path),
                 diff_type=DiffType.CHANGED,
                 old=change.get("old_value"),
                 new=change.get("new_value"),
             )
             for path, change in deep_diff.get("values_changed", {}).items()
-        ])
+        )
         # handle property added
         for path in deep_diff.get("dictionary_item_added", []):
-            jpath = deepdiff_path_to_jsonpath(path)
-            change = jpath.find(new_file_content)
-            change_value = change[0].value if change else None
-            diffs.append(
+            jpath = to_jsonpath(path)
+            change = jpath.find(self.new_root)
+            self.dictionary_item_added.append(
                 Diff(
                     path=jpath,
                     diff_type=DiffType.ADDED,
                     old=None,
-                    new=change_value,
+                    new=change[0].value if change else None,
                 )
             )
         # handle property removed
         for path in deep_diff.get("dictionary_item_removed", []):
-            jpath = deepdiff_path_to_jsonpath(path)
-            change = jpath.find(old_file_content)
-            change_value = change[0].value if change else None
-            diffs.append(
+            jpath = to_jsonpath(path)
+            change = jpath.find(self.old_root)
+            self.dictionary_item_removed.append(
                 Diff(
                     path=jpath,
                     diff_type=DiffType.REMOVED,
-                    old=change_value,
+                    old=change[0].value if change else None,
                     new=None,
                 )
             )
         # handle added items
-        diffs.extend([
+        self.iterable_item_added.extend(
             Diff(
-                path=deepdiff_path_to_jsonpath(path),
+                path=to_jsonpath(path),
                 diff_type=DiffType.ADDED,
                 old=None,
                 new=change,
             )
             for path, change in deep_diff.get("iterable_item_added", {}).items()
-        ])
+        )
         # handle removed items
-        diffs.extend([
+        self.iterable_item_removed.extend(
             Diff(
-                path=deepdiff_path_to_jsonpath(path),
+                path=to_jsonpath(path),
                 diff_type=DiffType.REMOVED,
                 old=change,
                 new=None,
             )
             for path, change in deep_diff.get("iterable_item_removed", {}).items()
-        ])
-
+        )
         # handle type changes
-        diffs.extend([
+        self.type_changes.extend(
             Diff(
-                path=deepdiff_path_to_jsonpath(path),
+                path=to_jsonpath(path),
                 diff_type=DiffType.CHANGED,
                 old=change.get("old_value"),
                 new=change.get("new_value"),
             )
             for path, change in deep_diff.get("type_changes", {}).items()
-        ])
+        )
+
+
+class _StructuralDiffer:
+    """
+    Walks two documents side by side and descends only into subtrees whose
+    Merkle hashes differ.
+
+    List items whose hashes appear on both sides are unchanged and are never
+    looked at again. If the remaining items are only added or only removed,
+    they are reported right away. Only if items got added and removed at the
+    same time, DeepDiff is asked to pair the remaining items, so identity
+    pairing via `compare_object_ctx_identifier` and similarity pairing of
+    objects without identity behave exactly like before, just on a fraction
+    of the data.
+    """
+
+    # mirrors DeepDiff's threshold_to_diff_deeper default
+    _THRESHOLD_TO_DIFF_DEEPER = 0.33
+
+    def __init__(self, old_tree: MerkleTree, new_tree: MerkleTree) -> None:
+        self._old_tree = old_tree
+        self._new_tree = new_tree
+        self._collector = _DiffCollector(old_tree.root, new_tree.root)
+
+    def diffs(self) -> list[Diff]:
+        self._diff(self._old_tree.root, self._new_tree.root, ())
+        return self._collector.diffs()
+
+    def _diff(self, old: Any, new: Any, path: PathParts) -> None:
+        if old is new:
+            return
+        if type(old) is not type(new):
+            self._collector.type_changes.append(
+                Diff(
+                    path=_parts_to_jsonpath(path),
+                    diff_type=DiffType.CHANGED,
+                    old=old,
+                    new=new,
+                )
+            )
+        elif isinstance(old, dict):
+            self._diff_dict(old, new, path)
+        elif isinstance(old, list | tuple):
+            self._diff_list(old, new, path)
+        elif old != new:
+            self._collector.values_changed.append(
+                Diff(
+                    path=_parts_to_jsonpath(path),
+                    diff_type=DiffType.CHANGED,
+                    old=old,
+                    new=new,
+                )
+            )
+
+    def _same(self, old: Any, new: Any) -> bool:
+        if isinstance(old, _SCALAR_TYPES) or isinstance(new, _SCALAR_TYPES):
+            return type(old) is type(new) and old == new
+        return self._old_tree.digest(old) == self._new_tree.digest(new)
+
+    def _diff_dict(self, old: dict, new: dict, path: PathParts) -> None:
+        old_keys = [k for k in old if not k.startswith("__")]
+        new_keys = [k for k in new if not k.startswith("__")]
+        old_key_set = set(old_keys)
+        new_key_set = set(new_keys)
+        intersect = [k for k in new_keys if k in old_key_set]
+        union_len = len(old_key_set | new_key_set)
+        if (
+            union_len > 1
+            and len(intersect) / union_len < self._THRESHOLD_TO_DIFF_DEEPER
+        ):
+            self._collector.values_changed.append(
+                Diff(
+                    path=_parts_to_jsonpath(path),
+                    diff_type=DiffType.CHANGED,
+                    old=old,
+                    new=new,
+                )
+            )
+            return
+        self._collector.dictionary_item_added.extend(
+            Diff(
+                path=_parts_to_jsonpath((*path, k)),
+                diff_type=DiffType.ADDED,
+                old=None,
+                new=new[k],
+            )
+            for k in new_keys
+            if k not in old_key_set
+        )
+        self._collector.dictionary_item_removed.extend(
+            Diff(
+                path=_parts_to_jsonpath((*path, k)),
+                diff_type=DiffType.REMOVED,
+                old=old[k],
+                new=None,
+            )
+            for k in old_keys
+            if k not in new_key_set
+        )
+        for k in intersect:
+            if not self._same(old[k], new[k]):
+                self._diff(old[k], new[k], (*path, k))
+
+    def _diff_list(self, old: Sequence, new: Sequence, path: PathParts) -> None:
+        # first index per distinct item, repetitions are not reported
+        old_index: dict[bytes, int] = {}
+        for i, item in enumerate(old):
+            old_index.setdefault(self._old_tree.digest(item), i)
+        new_index: dict[bytes, int] = {}
+        for i, item in enumerate(new):
+            new_index.setdefault(self._new_tree.digest(item), i)
+        removed = [i for d, i in old_index.items() if d not in new_index]
+        added = [i for d, i in new_index.items() if d not in old_index]
+        if added and removed:
+            # pairing the remaining items is left to DeepDiff. unchanged items
+            # are masked so DeepDiff doesn't have to look at them again, while
+            # the reported indexes still match the original lists
+            self._collector.add_deepdiff(
+                [
+                    _UNCHANGED_ITEM
+                    if self._old_tree.digest(item) in new_index
+                    else item
+                    for item in old
+                ],
+                [
+                    _UNCHANGED_ITEM
+                    if self._new_tree.digest(item) in old_index
+                    else item
+                    for item in new
+                ],
+                prefix=path,
+            )
+            return
+        self._collector.iterable_item_added.extend(
+            Diff(
+                path=_parts_to_jsonpath((*path, i)),
+                diff_type=DiffType.ADDED,
+                old=None,
+                new=new[i],
+            )
+            for i in added
+        )
+        self._collector.iterable_item_removed.extend(
+            Diff(
+                path=_parts_to_jsonpath((*path, i)),
+                diff_type=DiffType.REMOVED,
+                old=old[i],
+                new=None,
+            )
+            for i in removed
+        )
+
+
+def has_diff(old_content: Any, new_content: Any) -> bool:
+    """
+    Checks in linear time whether `extract_diffs` would find any differences
+    between the two documents.
+    """
+    try:
+        return (
+            MerkleTree(old_content).root_digest != MerkleTree(new_content).root_digest
+        )
+    except UnsupportedContentError:
+        return DeepHash(old_content).get(old_content) != DeepHash(new_content).get(
+            new_content
+        )
+
+
+def extract_diffs_with_deepdiff(
+    old_file_content: Any, new_file_content: Any
+) -> list[Diff]:
+    """
+    Diffs two documents with DeepDiff alone. `extract_diffs` falls back to
+    this for content the structural diff engine can't hash.
+    """
+    collector = _DiffCollector(old_file_content, new_file_content)
+    collector.add_deepdiff(old_file_content, new_file_content)
+    return collector.diffs()
+
+
+def extract_diffs(old_file_content: Any, new_file_content: Any) -> list[Diff]:
+    diffs: list[Diff] = []
+    if old_file_content and new_file_content:
+        try:
+            differ = _StructuralDiffer(
+                MerkleTree(old_file_content), MerkleTree(new_file_content)
+            )
+        except UnsupportedContentError:
+            diffs.extend(
+                extract_diffs_with_deepdiff(old_file_content, new_file_content)
+            )
+        else:
+            diffs.extend(differ.diffs())
 
     elif old_file_content:
         # file was deleted
@@ -277,7 +583,9 @@ def extract_diffs(old_file_content: Any, new_file_content: Any) -> list[Diff]:
     return diffs
 
 
-def deepdiff_path_to_jsonpath(deep_diff_path: str) -> jsonpath_ng.JSONPath:
+def deepdiff_path_to_jsonpath(
+    deep_diff_path: str, prefix: PathParts = ()
+) -> jsonpath_ng.JSONPath:
     """
     deepdiff's way to describe a path within a data structure differs from jsonpath.
     This function translates deepdiff paths into regular jsonpath expressions.
@@ -285,18 +593,9 @@ def deepdiff_path_to_jsonpath(deep_diff_path: str) -> jsonpath_ng.JSONPath:
     deepdiff paths start with "root" followed by a series of square bracket expressions
     fields and indices, e.g. `root['openshiftResources'][1]['version']`. The matching
     jsonpath expression is `openshiftResources.[1].version`
+
+    `prefix` is the location of the diffed object within the document.
     """
     if not deep_diff_path.startswith("root"):
         raise ValueError("a deepdiff path must start with 'root'")
-
-    def build_jsonpath_part(element: str | int) -> jsonpath_ng.JSONPath:
-        match element:
-            case int():
-                return jsonpath_ng.Index(element)
-            case str():
-                return jsonpath_ng.Fields(element)
-
-    path_parts = [build_jsonpath_part(p) for p in parse_path(deep_diff_path)]
-    if path_parts:
-        return reduce(lambda a, b: a.child(b), path_parts)
-    return jsonpath_ng.Root()
+    return _parts_to_jsonpath((*prefix, *parse_path(deep_diff_path)))
@@ -42,6 +42,8 @@ def change_type_contexts_for_implicit_ownership(
     ]
     for ctp in processors_with_implicit_ownership:
         for bc in bundle_changes:
+            if not ctp.reacts_to_schema(bc.fileref.schema):
+                continue
             for ownership in ctp.find_context_file_refs(
                 change=FileChange(
                     file_ref=bc.fileref,
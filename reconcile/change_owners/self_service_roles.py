@@ -13,7 +13,7 @@ from reconcile.change_owners.bundle import BundleFileType
 from reconcile.change_owners.change_types import (
     ChangeTypeContext,
     ChangeTypeProcessor,
-    FileChange,
+    ChangeTypeProcessorIndex,
 )
 from reconcile.gql_definitions.change_owners.queries import self_service_roles
 from reconcile.gql_definitions.change_owners.queries.self_service_roles import (
@@ -144,17 +144,12 @@ def change_type_contexts_for_self_service_roles(
     resolved_approvers = resolve_role_members([r for r in roles if r.self_service])
 
     # match every BundleChange with every relevant ChangeTypeV1
+    change_type_index = ChangeTypeProcessorIndex(change_type_processors)
     change_type_contexts: list[tuple[BundleFileChange, ChangeTypeContext]] = []
     for bc in bundle_changes:
-        for ctp in change_type_processors:
+        for ctp in change_type_index.processors_for_file(bc.fileref):
             for ownership in ctp.find_context_file_refs(
-                change=FileChange(
-                    file_ref=bc.fileref,
-                    old=bc.old,
-                    new=bc.new,
-                    old_backrefs=bc.old_backrefs,
-                    new_backrefs=bc.new_backrefs,
-                ),
+                change=bc.file_change,
                 expansion_trail=set(),
             ):
                 # if the context file is bound with the change type in
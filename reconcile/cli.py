@@ -11,14 +11,11 @@ from signal import SIGUSR1
 from typing import TYPE_CHECKING, Any
 
 import click
-import sentry_sdk
-from sentry_sdk.integrations.logging import LoggingIntegration
 
 from reconcile.status import (
     ExitCodes,
     RunningState,
 )
-from reconcile.utils import gql
 from reconcile.utils.aggregated_list import RunnerError
 from reconcile.utils.amtool import AMTOOL_VERSION, AMTOOL_VERSION_REGEX
 from reconcile.utils.binary import (
@@ -28,30 +25,27 @@ from reconcile.utils.binary import (
 from reconcile.utils.constants import DEFAULT_THREAD_POOL_SIZE
 from reconcile.utils.exceptions import PrintToFileInGitRepositoryError
 from reconcile.utils.git import is_file_in_git_repo
-from reconcile.utils.gql import GqlApiSingleton
 from reconcile.utils.json import json_dumps
-from reconcile.utils.promtool import PROMTOOL_VERSION, PROMTOOL_VERSION_REGEX
-from reconcile.utils.runtime.environment import init_env
-from reconcile.utils.runtime.integration import (
-    ModuleArgsKwargsRunParams,
-    ModuleBasedQontractReconcileIntegration,
-    NoParams,
-    PydanticRunParams,
-    QontractReconcileApiIntegration,
-    QontractReconcileIntegration,
+from reconcile.utils.promtool import (
+    PROMTOOL_BATCH_SIZE,
+    PROMTOOL_VERSION,
+    PROMTOOL_VERSION_REGEX,
 )
 from reconcile.utils.runtime.meta import IntegrationMeta
-from reconcile.utils.runtime.runner import (
-    IntegrationRunConfiguration,
-    run_integration_cfg,
-)
-from reconcile.utils.unleash import get_feature_toggle_state
 
+# Integrations and the runtime they share are imported by the commands
+# running them, importing this module (e.g. for --help or from the tools)
+# must stay cheap.
 if TYPE_CHECKING:
     from collections.abc import Callable, Iterable
     from io import TextIOWrapper
     from types import ModuleType
 
+    from reconcile.utils.runtime.integration import (
+        QontractReconcileApiIntegration,
+        QontractReconcileIntegration,
+    )
+
 TERRAFORM_VERSION = ["1.6.6"]
 TERRAFORM_VERSION_REGEX = r"^Terraform\sv([\d]+\.[\d]+\.[\d]+)$"
 
@@ -78,6 +72,9 @@ def before_breadcrumb(crumb: dict, _: Any) -> dict:
 
 # Enable Sentry
 if os.getenv("SENTRY_DSN"):
+    import sentry_sdk
+    from sentry_sdk.integrations.logging import LoggingIntegration
+
     match os.environ.get("SENTRY_EVENT_LEVEL", "CRITICAL").upper():
         case "CRITICAL":
             sentry_event_level = logging.CRITICAL
@@ -542,6 +539,11 @@ def run_integration(
     *args: Any,
     **kwargs: Any,
 ) -> None:
+    from reconcile.utils.runtime.integration import (
+        ModuleArgsKwargsRunParams,
+        ModuleBasedQontractReconcileIntegration,
+    )
+
     run_class_integration(
         integration=ModuleBasedQontractReconcileIntegration(
             ModuleArgsKwargsRunParams(func_container, *args, **kwargs)
@@ -554,6 +556,13 @@ def run_class_integration(
     integration: QontractReconcileIntegration | QontractReconcileApiIntegration,
     ctx: click.Context,
 ) -> None:
+    from reconcile.utils import gql
+    from reconcile.utils.runtime.runner import (
+        IntegrationRunConfiguration,
+        run_integration_cfg,
+    )
+    from reconcile.utils.unleash import get_feature_toggle_state
+
     register_faulthandler()
     dump_schemas_file = ctx.obj["dump_schemas_file"]
     try:
@@ -622,6 +631,8 @@ def integration(
     gql_sha_url: bool,
     gql_url_print: bool,
 ) -> None:
+    from reconcile.utils.runtime.environment import init_env
+
     ctx.ensure_object(dict)
     ctx.obj["gql_url_print"] = not dry_run and gql_url_print
 
@@ -644,6 +655,8 @@ def integration(
 
 @integration.result_callback()
 def exit_integration(*args: Any, **kwargs: Any) -> None:
+    from reconcile.utils.gql import GqlApiSingleton
+
     GqlApiSingleton.close()
 
 
@@ -1918,6 +1931,14 @@ def gcp_image_mirror(ctx: click.Context) -> None:
     help="excludes this repository  to mirror. It can be specified multiple times.",
     multiple=True,
 )
+@threaded(default=1)
+@click.option(
+    "--max-jobs-per-registry",
+    help="Maximum number of concurrent tag comparisons and copies against a single "
+    "source or destination registry. Unlimited by default.",
+    type=int,
+    default=None,
+)
 @click.pass_context
 @binary(["skopeo"])
 def quay_mirror(
@@ -1927,6 +1948,8 @@ def quay_mirror(
     compare_tags_interval: int,
     repository_url: Iterable[str] | None,
     exclude_repository_url: Iterable[str] | None,
+    thread_pool_size: int,
+    max_jobs_per_registry: int | None,
 ) -> None:
     import reconcile.container_registry_mirror.quay
 
@@ -1938,6 +1961,8 @@ def quay_mirror(
         compare_tags_interval,
         repository_url,
         exclude_repository_url,
+        thread_pool_size,
+        max_jobs_per_registry,
     )
 
 
@@ -1977,6 +2002,13 @@ def quay_mirror(
     "times.",
     multiple=True,
 )
+@threaded()
+@click.option(
+    "--copy-pool-size",
+    help="Maximum number of concurrent skopeo copies.",
+    type=int,
+    default=4,
+)
 @click.pass_context
 @binary(["skopeo"])
 def quay_mirror_org(
@@ -1986,6 +2018,8 @@ def quay_mirror_org(
     compare_tags_interval: int,
     org: Iterable[str] | None,
     repository: Iterable[str] | None,
+    thread_pool_size: int,
+    copy_pool_size: int,
 ) -> None:
     import reconcile.quay_mirror_org
 
@@ -1997,6 +2031,8 @@ def quay_mirror_org(
         compare_tags_interval,
         org,
         repository,
+        thread_pool_size,
+        copy_pool_size,
     )
 
 
@@ -2197,6 +2233,7 @@ def terraform_repo(
 @click.pass_context
 def template_validator(ctx: click.Context) -> None:
     from reconcile.templating import validator
+    from reconcile.utils.runtime.integration import PydanticRunParams
 
     run_class_integration(
         integration=validator.TemplateValidatorIntegration(PydanticRunParams()),
@@ -2673,9 +2710,13 @@ def ocm_machine_pools(ctx: click.Context) -> None:
 @integration.command(short_help="Manage Upgrade Policy schedules in OCM organizations.")
 @org_id_multiple
 @exclude_org_id
+@threaded()
 @click.pass_context
 def ocm_upgrade_scheduler_org(
-    ctx: click.Context, org_id: Iterable[str], exclude_org_id: Iterable[str]
+    ctx: click.Context,
+    org_id: Iterable[str],
+    exclude_org_id: Iterable[str],
+    thread_pool_size: int,
 ) -> None:
     from reconcile.aus.base import AdvancedUpgradeSchedulerBaseIntegrationParams
     from reconcile.aus.ocm_upgrade_scheduler_org import (
@@ -2687,6 +2728,7 @@ def ocm_upgrade_scheduler_org(
             AdvancedUpgradeSchedulerBaseIntegrationParams(
                 ocm_organization_ids=set(org_id),
                 excluded_ocm_organization_ids=set(exclude_org_id),
+                thread_pool_size=thread_pool_size,
             )
         ),
         ctx=ctx,
@@ -2715,12 +2757,14 @@ def ocm_upgrade_scheduler_org_updater(
 )
 @org_id_multiple
 @exclude_org_id
+@threaded()
 @click.pass_context
 def ocm_addons_upgrade_scheduler_org(
     ctx: click.Context,
     ocm_env: str,
     org_id: Iterable[str],
     exclude_org_id: Iterable[str],
+    thread_pool_size: int,
 ) -> None:
     from reconcile.aus.base import AdvancedUpgradeSchedulerBaseIntegrationParams
     from reconcile.aus.ocm_addons_upgrade_scheduler_org import (
@@ -2733,6 +2777,7 @@ def ocm_addons_upgrade_scheduler_org(
                 ocm_environment=ocm_env,
                 ocm_organization_ids=set(org_id),
                 excluded_ocm_organization_ids=set(exclude_org_id),
+                thread_pool_size=thread_pool_size,
             )
         ),
         ctx=ctx,
@@ -2786,6 +2831,7 @@ def ocm_addons_upgrade_scheduler_org(
     required=False,
     envvar="ROSA_ROLE",
 )
+@threaded()
 @click.pass_context
 def advanced_upgrade_scheduler(
     ctx: click.Context,
@@ -2798,6 +2844,7 @@ def advanced_upgrade_scheduler(
     rosa_job_service_account: str | None,
     rosa_role: str | None,
     rosa_job_image: str | None,
+    thread_pool_size: int,
 ) -> None:
     from reconcile.aus.advanced_upgrade_service import (
         QONTRACT_INTEGRATION,
@@ -2832,6 +2879,7 @@ def advanced_upgrade_scheduler(
                     rosa_role,
                 ])
                 else None,
+                thread_pool_size=thread_pool_size,
             )
         ),
         ctx=ctx,
@@ -2920,6 +2968,7 @@ def database_access_manager(ctx: click.Context, vault_output_path: str) -> None:
 @click.pass_context
 def status_board_exporter(ctx: click.Context) -> None:
     from reconcile.status_board import StatusBoardExporterIntegration
+    from reconcile.utils.runtime.integration import PydanticRunParams
 
     run_class_integration(
         integration=StatusBoardExporterIntegration(PydanticRunParams()),
@@ -3250,9 +3299,24 @@ def dashdotdb_dora(
 @binary(["promtool"])
 @binary_version("promtool", ["--version"], PROMTOOL_VERSION_REGEX, PROMTOOL_VERSION)
 @cluster_name
+@click.option(
+    "--result-cache-dir",
+    help="Directory where promtool results are cached between runs, "
+    "unchanged rules and tests are not run again. No caching if not given.",
+)
+@click.option(
+    "--batch-size",
+    help="Number of rules or tests checked by a single promtool process.",
+    type=int,
+    default=PROMTOOL_BATCH_SIZE,
+)
 @click.pass_context
 def prometheus_rules_tester(
-    ctx: click.Context, thread_pool_size: int, cluster_name: Iterable[str] | None
+    ctx: click.Context,
+    thread_pool_size: int,
+    cluster_name: Iterable[str] | None,
+    result_cache_dir: str | None,
+    batch_size: int,
 ) -> None:
     import reconcile.prometheus_rules_tester.integration
 
@@ -3261,6 +3325,8 @@ def prometheus_rules_tester(
         ctx,
         thread_pool_size,
         cluster_names=cluster_name,
+        result_cache_dir=result_cache_dir,
+        batch_size=batch_size,
     )
 
 
@@ -3360,6 +3426,7 @@ def status_page_maintenances(ctx: click.Context) -> None:
     from reconcile.statuspage.integrations.maintenances import (
         StatusPageMaintenancesIntegration,
     )
+    from reconcile.utils.runtime.integration import NoParams
 
     run_class_integration(StatusPageMaintenancesIntegration(NoParams()), ctx)
 
@@ -3464,11 +3531,25 @@ def parse_image_tag_from_ref(
 
 
 @integration.command(short_help="Allow vault to replicate secrets to other instances.")
+@threaded()
+@click.option(
+    "--vault-requests-per-second",
+    help="Maximum number of requests per second sent to each Vault instance.",
+    type=float,
+    default=None,
+)
 @click.pass_context
-def vault_replication(ctx: click.Context) -> None:
+def vault_replication(
+    ctx: click.Context, thread_pool_size: int, vault_requests_per_second: float | None
+) -> None:
     import reconcile.vault_replication
 
-    run_integration(reconcile.vault_replication, ctx)
+    run_integration(
+        reconcile.vault_replication,
+        ctx,
+        thread_pool_size,
+        vault_requests_per_second,
+    )
 
 
 @integration.command(short_help="Manages Qontract Reconcile integrations.")
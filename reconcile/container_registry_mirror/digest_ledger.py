@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+
+_LOG = logging.getLogger(__name__)
+
+LEDGER_VERSION = 1
+# Entries are trusted for a week. Past that, the destination is compared
+# again in full, which catches tags overwritten outside of the mirror.
+DEFAULT_MAX_AGE = 7 * 24 * 60 * 60
+
+
+class DigestLedger:
+    """Remembers which source digest was last synced to which
+    destination reference.
+
+    A deep sync compares the manifests of every mirrored tag at both
+    registries. Most tags do not change between deep syncs, so once a
+    (source digest, destination ref) pair has been verified or copied,
+    the next deep sync only needs the source digest to know the
+    destination is still in sync, saving the destination round-trip.
+    The ledger lives next to the deep sync control file so it survives
+    pod restarts when that directory is a persistent volume."""
+
+    def __init__(self, path: str, max_age: int = DEFAULT_MAX_AGE) -> None:
+        self.path = path
+        self.max_age = max_age
+        self._lock = threading.Lock()
+        # destination ref -> (source digest, timestamp of the last sync)
+        self._entries: dict[str, tuple[str, float]] = self._load()
+
+    @classmethod
+    def from_dir(
+        cls,
+        control_file_dir: str | None,
+        ledger_file_name: str,
+        max_age: int = DEFAULT_MAX_AGE,
+    ) -> DigestLedger:
+        """Construct a ledger with the file path resolved the same way
+        as DeepSyncTimer.from_dir resolves its control file."""
+        if control_file_dir:
+            if not os.path.isdir(control_file_dir):
+                raise FileNotFoundError(
+                    f"'{control_file_dir}' does not exist or it is not a directory"
+                )
+            path = os.path.join(control_file_dir, ledger_file_name)
+        else:
+            path = os.path.join(tempfile.gettempdir(), ledger_file_name)
+        return cls(path=path, max_age=max_age)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def is_synced(self, source_digest: str, destination_ref: str) -> bool:
+        """Whether destination_ref was synced from source_digest
+        recently enough to skip comparing it."""
+        with self._lock:
+            entry = self._entries.get(destination_ref)
+        if entry is None:
+            return False
+        digest, synced_at = entry
+        return digest == source_digest and time.time() - synced_at < self.max_age
+
+    def record(self, source_digest: str, destination_ref: str) -> None:
+        """Record a successful sync (or a successful comparison) of
+        destination_ref from source_digest."""
+        with self._lock:
+            self._entries[destination_ref] = (source_digest, time.time())
+
+    def save(self) -> None:
+        """Write the ledger, dropping expired entries. The file is
+        replaced atomically so an interrupted write leaves the previous
+        ledger in place."""
+        now = time.time()
+        with self._lock:
+            entries = {
+                ref: [digest, synced_at]
+                for ref, (digest, synced_at) in self._entries.items()
+                if now - synced_at < self.max_age
+            }
+        directory = os.path.dirname(self.path) or "."
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".ledger-")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({"version": LEDGER_VERSION, "entries": entries}, f)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def _load(self) -> dict[str, tuple[str, float]]:
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") != LEDGER_VERSION:
+                return {}
+            return {
+                ref: (str(digest), float(synced_at))
+                for ref, (digest, synced_at) in data["entries"].items()
+            }
+        except FileNotFoundError:
+            return {}
+        except (ValueError, TypeError, KeyError, AttributeError) as details:
+            # A corrupt ledger only costs a full comparison, never a
+            # failed run.
+            _LOG.warning("Ignoring unreadable digest ledger %s: %s", self.path, details)
+            return {}
@@ -1,8 +1,12 @@
 from __future__ import annotations
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack, contextmanager
+from threading import BoundedSemaphore, Lock
 from typing import TYPE_CHECKING, Any
 
+from requests import HTTPError
 from sretoolbox.container.image import (
     ImageComparisonError,
     ImageContainsError,
@@ -12,7 +16,10 @@ from sretoolbox.container.skopeo import SkopeoCmdError
 from reconcile.utils.quay_mirror import sync_tag
 
 if TYPE_CHECKING:
+    from collections.abc import Generator
+
     from reconcile.container_registry_mirror.deep_sync_timer import DeepSyncTimer
+    from reconcile.container_registry_mirror.digest_ledger import DigestLedger
     from reconcile.container_registry_mirror.mirror_spec import MirrorSpec
 
 _LOG = logging.getLogger(__name__)
@@ -32,6 +39,9 @@ class MirrorEngine:
         image_class: type | None = None,
         response_cache: dict | None = None,
         session: Any | None = None,
+        thread_pool_size: int = 1,
+        max_jobs_per_registry: int | None = None,
+        ledger: DigestLedger | None = None,
     ) -> None:
         self.skopeo = skopeo
         self.dry_run = dry_run
@@ -52,6 +62,15 @@ class MirrorEngine:
         self._image_class = image_class
         self._response_cache = response_cache
         self._session = session
+        # thread_pool_size=1 keeps the historical one-tag-at-a-time
+        # behavior. max_jobs_per_registry caps the concurrent jobs
+        # against any single registry (e.g. to stay below Docker Hub
+        # rate limits), None leaves only the pool size as a limit.
+        self.thread_pool_size = thread_pool_size
+        self._max_jobs_per_registry = max_jobs_per_registry
+        self._registry_semaphores: dict[str, BoundedSemaphore] = {}
+        self._registry_semaphores_lock = Lock()
+        self._ledger = ledger
 
     def _build_images(self, spec: MirrorSpec) -> tuple[Any, Any]:
         """Build source and destination Image objects for a spec.
@@ -102,113 +121,200 @@ class MirrorEngine:
         """Process all mirror specs: enumerate tags, filter, compare,
         and copy. Individual copy failures are collected and raised as
         an ExceptionGroup at the end so that one broken mirror does not
-        prevent the rest from syncing."""
+        prevent the rest from syncing.
+
+        Specs are listed and tags are synced by a pool of
+        thread_pool_size workers. A tag job holds a slot of both its
+        source and its destination registry for its whole duration, so
+        no registry sees more than max_jobs_per_registry concurrent
+        comparisons or copies, however many of its tags changed."""
         errors: list[Exception] = []
 
-        for spec in specs:
-            source_image, dest_image = self._build_images(spec)
+        with ThreadPoolExecutor(max_workers=self.thread_pool_size) as executor:
+            # Listing tags is the first request against each repository;
+            # do it for all specs in parallel, failing the run like the
+            # sequential loop did if a repository cannot be listed.
+            listed = executor.map(self._list_tags, specs)
+            jobs = [
+                executor.submit(self._sync_tag, spec, source_image, dest_image, tag)
+                for spec, source_image, dest_image, tags in listed
+                for tag in tags
+            ]
+            for job in jobs:
+                try:
+                    job.result()
+                except SkopeoCmdError as details:
+                    _LOG.error("skopeo command error: '%s'", details)
+                    errors.append(details)
+
+        # Verified and copied digests are kept even if some copies
+        # failed, so the next run does not compare them again.
+        if self._ledger is not None and not self.dry_run:
+            self._ledger.save()
 
-            for tag in source_image:
-                if not sync_tag(
+        # Raise before recording the timestamp so that a failed deep
+        # sync is not marked as successful. Otherwise, failed images
+        # would not be re-compared until the full interval elapses.
+        if errors:
+            raise ExceptionGroup("skopeo copy failures", errors)
+
+        # Record the deep sync timestamp only when a real deep sync
+        # completed without errors and not in dry-run mode.
+        if self._deep_sync_timer and self.is_deep_sync and not self.dry_run:
+            self._deep_sync_timer.record()
+
+    def _list_tags(self, spec: MirrorSpec) -> tuple[MirrorSpec, Any, Any, list[str]]:
+        """Build the images of a spec and list the source tags to sync."""
+        source_image, dest_image = self._build_images(spec)
+        with self._registry_slots(spec):
+            tags = [
+                tag
+                for tag in source_image
+                if sync_tag(
                     tags=spec.tag_include,
                     tags_exclude=spec.tag_exclude,
                     candidate=tag,
-                ):
-                    continue
-
-                upstream = source_image[tag]
-                downstream = dest_image[tag]
+                )
+            ]
+        return spec, source_image, dest_image, tags
 
-                # Fast path: tag does not exist at destination, so it
-                # must be copied regardless of deep sync mode.
-                if tag not in dest_image:
-                    _LOG.debug(
-                        "Image %s does not exist. Syncing from %s",
-                        downstream,
-                        upstream,
+    @contextmanager
+    def _registry_slots(self, spec: MirrorSpec) -> Generator[None]:
+        """Hold one slot of the spec's source and destination registry.
+        Slots are taken in name order so two jobs going in opposite
+        directions between the same registries cannot deadlock."""
+        if self._max_jobs_per_registry is None:
+            yield
+            return
+        registries = sorted({
+            registry_of(spec.source_url),
+            registry_of(spec.destination_url),
+        })
+        with ExitStack() as stack:
+            for registry in registries:
+                with self._registry_semaphores_lock:
+                    semaphore = self._registry_semaphores.setdefault(
+                        registry, BoundedSemaphore(self._max_jobs_per_registry)
                     )
-                    try:
-                        self.skopeo.copy(
-                            src_image=str(upstream),
-                            src_creds=spec.source_creds,
-                            dst_image=str(downstream),
-                            dest_creds=spec.destination_creds,
-                        )
-                    except SkopeoCmdError as details:
-                        _LOG.error("skopeo command error: '%s'", details)
-                        errors.append(details)
-                    continue
-
-                # Slow path: tag exists at destination. Only compare
-                # manifests when deep sync is active, to detect drift
-                # on mutable tags.
-                if not self.is_deep_sync:
+                stack.enter_context(semaphore)
+            yield
+
+    def _copy(self, spec: MirrorSpec, upstream: Any, downstream: Any) -> None:
+        self.skopeo.copy(
+            src_image=str(upstream),
+            src_creds=spec.source_creds,
+            dst_image=str(downstream),
+            dest_creds=spec.destination_creds,
+        )
+
+    def _source_digest(self, upstream: Any) -> str | None:
+        """Digest of the upstream manifest, None if there is no ledger
+        to look it up in or the registry did not return one. Fetching
+        it caches the manifest on the image, so a following comparison
+        does not fetch it again."""
+        if self._ledger is None:
+            return None
+        try:
+            return upstream.digest
+        except HTTPError as details:
+            _LOG.debug("No digest for %s: %s", upstream, details)
+            return None
+
+    def _sync_tag(
+        self, spec: MirrorSpec, source_image: Any, dest_image: Any, tag: str
+    ) -> None:
+        """Sync a single tag. Raises SkopeoCmdError if the copy fails."""
+        with self._registry_slots(spec):
+            upstream = source_image[tag]
+            downstream = dest_image[tag]
+
+            # Fast path: tag does not exist at destination, so it
+            # must be copied regardless of deep sync mode.
+            if tag not in dest_image:
+                _LOG.debug(
+                    "Image %s does not exist. Syncing from %s",
+                    downstream,
+                    upstream,
+                )
+                self._copy(spec, upstream, downstream)
+                return
+
+            # Slow path: tag exists at destination. Only compare
+            # manifests when deep sync is active, to detect drift
+            # on mutable tags.
+            if not self.is_deep_sync:
+                _LOG.debug(
+                    "Fast mode: skipping comparison of %s and %s",
+                    downstream,
+                    upstream,
+                )
+                return
+
+            source_digest = self._source_digest(upstream)
+            destination_ref = str(downstream)
+            if source_digest and self._ledger is not None:
+                if self._ledger.is_synced(source_digest, destination_ref):
                     _LOG.debug(
-                        "Fast mode: skipping comparison of %s and %s",
+                        "Image %s was synced from %s (%s) before",
                         downstream,
                         upstream,
+                        source_digest,
                     )
-                    continue
+                    return
 
-                should_copy = False
-                try:
-                    if downstream == upstream:
-                        _LOG.debug(
-                            "Image %s and mirror %s are in sync",
-                            downstream,
-                            upstream,
-                        )
-                        continue
-                    # Multi-arch case: destination may be a single-arch
-                    # component of the upstream multi-arch manifest list.
-                    if downstream.is_part_of(upstream):
-                        _LOG.debug(
-                            "Image %s is part of multi-arch image %s",
-                            downstream,
-                            upstream,
-                        )
-                        continue
-                    should_copy = True
-                except ImageComparisonError as details:
-                    # Manifest could not be fetched (network/auth/404).
-                    # Skip this tag rather than failing the entire run.
-                    _LOG.error(
-                        "Error comparing %s and %s: %s",
+            try:
+                if downstream == upstream:
+                    _LOG.debug(
+                        "Image %s and mirror %s are in sync",
                         downstream,
                         upstream,
-                        details,
                     )
-                    continue
-                except ImageContainsError:
-                    # Manifest types are incompatible for is_part_of
-                    # (e.g., both single-arch). The images are
-                    # structurally different, so copy.
-                    should_copy = True
-
-                if should_copy:
+                    self._record(source_digest, destination_ref)
+                    return
+                # Multi-arch case: destination may be a single-arch
+                # component of the upstream multi-arch manifest list.
+                if downstream.is_part_of(upstream):
                     _LOG.debug(
-                        "Image %s and mirror %s are out of sync",
+                        "Image %s is part of multi-arch image %s",
                         downstream,
                         upstream,
                     )
-                    try:
-                        self.skopeo.copy(
-                            src_image=str(upstream),
-                            src_creds=spec.source_creds,
-                            dst_image=str(downstream),
-                            dest_creds=spec.destination_creds,
-                        )
-                    except SkopeoCmdError as details:
-                        _LOG.error("skopeo command error: '%s'", details)
-                        errors.append(details)
+                    self._record(source_digest, destination_ref)
+                    return
+            except ImageComparisonError as details:
+                # Manifest could not be fetched (network/auth/404).
+                # Skip this tag rather than failing the entire run.
+                _LOG.error(
+                    "Error comparing %s and %s: %s",
+                    downstream,
+                    upstream,
+                    details,
+                )
+                return
+            except ImageContainsError:
+                # Manifest types are incompatible for is_part_of
+                # (e.g., both single-arch). The images are
+                # structurally different, so copy.
+                pass
 
-        # Raise before recording the timestamp so that a failed deep
-        # sync is not marked as successful. Otherwise, failed images
-        # would not be re-compared until the full interval elapses.
-        if errors:
-            raise ExceptionGroup("skopeo copy failures", errors)
+            _LOG.debug(
+                "Image %s and mirror %s are out of sync",
+                downstream,
+                upstream,
+            )
+            self._copy(spec, upstream, downstream)
+            self._record(source_digest, destination_ref)
 
-        # Record the deep sync timestamp only when a real deep sync
-        # completed without errors and not in dry-run mode.
-        if self._deep_sync_timer and self.is_deep_sync and not self.dry_run:
-            self._deep_sync_timer.record()
+    def _record(self, source_digest: str | None, destination_ref: str) -> None:
+        if source_digest and self._ledger is not None and not self.dry_run:
+            self._ledger.record(source_digest, destination_ref)
+
+
+def registry_of(image_url: str) -> str:
+    """Registry host of an image reference, following the docker
+    convention that a first path component without a "." or ":" (and
+    other than "localhost") is a Docker Hub namespace."""
+    first, sep, _ = image_url.partition("/")
+    if sep and ("." in first or ":" in first or first == "localhost"):
+        return first
+    return "docker.io"
@@ -10,6 +10,7 @@ from sretoolbox.container import Image
 from reconcile import queries
 from reconcile.container_registry_mirror import register
 from reconcile.container_registry_mirror.deep_sync_timer import DeepSyncTimer
+from reconcile.container_registry_mirror.digest_ledger import DigestLedger
 from reconcile.container_registry_mirror.engine import MirrorEngine
 from reconcile.container_registry_mirror.mirror_spec import MirrorSpec
 from reconcile.utils import gql
@@ -213,6 +214,7 @@ register("quay-mirror", QuayMirror)
 # and early-exit cache keys.
 QONTRACT_INTEGRATION = "quay-mirror"
 CONTROL_FILE_NAME = "qontract-reconcile-quay-mirror.timestamp"
+LEDGER_FILE_NAME = "qontract-reconcile-quay-mirror.ledger.json"
 
 
 def run(
@@ -222,6 +224,8 @@ def run(
     compare_tags_interval: int,
     repository_urls: Iterable[str] | None,
     exclude_repository_urls: Iterable[str] | None,
+    thread_pool_size: int = 1,
+    max_jobs_per_registry: int | None = None,
 ) -> None:
     """Module-level entry point called by the integration framework.
     Parameters map directly to CLI options in reconcile/cli.py."""
@@ -235,6 +239,10 @@ def run(
         interval=compare_tags_interval,
         compare_tags_override=compare_tags,
     )
+    ledger = DigestLedger.from_dir(
+        control_file_dir=control_file_dir,
+        ledger_file_name=LEDGER_FILE_NAME,
+    )
     specs = impl.discover_mirrors()
     # InstrumentedImage counts manifest fetches via the
     # registry_reachouts Prometheus counter. The shared cache and
@@ -250,6 +258,9 @@ def run(
             image_class=InstrumentedImage,
             response_cache=response_cache,
             session=session,
+            thread_pool_size=thread_pool_size,
+            max_jobs_per_registry=max_jobs_per_registry,
+            ledger=ledger,
         )
         engine.sync(specs)
     finally:
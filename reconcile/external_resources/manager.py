@@ -1,7 +1,12 @@
 from __future__ import annotations
 
 import logging
+import shutil
+import sys
+import tempfile
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
 from typing import TYPE_CHECKING, cast
 
 from sretoolbox.utils import threaded
@@ -454,6 +459,22 @@ class ExternalResourcesManager:
         if to_sync_keys or pending_sync_keys:
             self._sync_secrets(to_sync_keys=to_sync_keys | pending_sync_keys)
 
+    def _print_reconcile_logs(
+        self, reconciliation: Reconciliation, output_lock: Lock
+    ) -> None:
+        """
+        Downloads the logs of a reconciliation into a temporary file and writes them
+        to stdout in one piece, so logs of concurrently finished jobs don't interleave.
+        """
+        with tempfile.TemporaryFile(mode="w+", encoding="locale") as f:
+            self.reconciler.get_resource_reconcile_logs(
+                reconciliation=reconciliation, output=f
+            )
+            f.seek(0)
+            with output_lock:
+                shutil.copyfileobj(f, sys.stdout)
+                sys.stdout.flush()
+
     def handle_dry_run_resources(self) -> None:
         self.dry_runs_validator.validate()
         desired_r = self._get_desired_objects_reconciliations()
@@ -473,12 +494,20 @@ class ExternalResourcesManager:
             thread_pool_size=self.thread_pool_size,
         )
 
-        results = self.reconciler.wait_for_reconcile_list_completion(
-            triggered, check_interval_seconds=10, timeout_seconds=-1
-        )
-
-        for r in triggered:
-            self.reconciler.get_resource_reconcile_logs(reconciliation=r)
+        # logs of a finished job are collected while the other jobs are still running
+        results: dict[Reconciliation, ReconcileStatus] = {}
+        output_lock = Lock()
+        with ThreadPoolExecutor(max_workers=self.thread_pool_size) as executor:
+            log_futures = []
+            for r, status in self.reconciler.iter_reconcile_list_completion(
+                triggered, check_interval_seconds=10, timeout_seconds=-1
+            ):
+                results[r] = status
+                log_futures.append(
+                    executor.submit(self._print_reconcile_logs, r, output_lock)
+                )
+            for future in log_futures:
+                future.result()
 
         if ReconcileStatus.ERROR in list(results.values()):
             raise Exception("Some Resources have reconciliation errors.")
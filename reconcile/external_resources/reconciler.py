@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import sys
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, TextIO
 
 from kubernetes.client import (
     V1Container,
@@ -36,7 +36,7 @@ from reconcile.utils.jobcontroller.controller import (
 from reconcile.utils.jobcontroller.models import K8sJob
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable
+    from collections.abc import Iterable, Iterator
 
 
 class ExternalResourcesReconciler(ABC):
@@ -55,15 +55,17 @@ class ExternalResourcesReconciler(ABC):
     def reconcile_resource(self, reconciliation: Reconciliation) -> None: ...
 
     @abstractmethod
-    def get_resource_reconcile_logs(self, reconciliation: Reconciliation) -> None: ...
+    def get_resource_reconcile_logs(
+        self, reconciliation: Reconciliation, output: TextIO = sys.stdout
+    ) -> None: ...
 
     @abstractmethod
-    def wait_for_reconcile_list_completion(
+    def iter_reconcile_list_completion(
         self,
         reconcile_list: Iterable[Reconciliation],
         check_interval_seconds: int,
         timeout_seconds: int,
-    ) -> dict[str, ReconcileStatus]: ...
+    ) -> Iterator[tuple[Reconciliation, ReconcileStatus]]: ...
 
 
 class ReconciliationK8sJob(K8sJob, BaseModel, frozen=True):
@@ -266,31 +268,36 @@ class K8sExternalResourcesReconciler(ExternalResourcesReconciler):
             concurrency_policy=concurrency_policy,
         )
 
-    def wait_for_reconcile_list_completion(
+    def iter_reconcile_list_completion(
         self,
         reconcile_list: Iterable[Reconciliation],
         check_interval_seconds: int,
         timeout_seconds: int,
-    ) -> dict[str, ReconcileStatus]:
-        job_names = {
+    ) -> Iterator[tuple[Reconciliation, ReconcileStatus]]:
+        """
+        Yields every reconciliation with its status as soon as its job finishes.
+        """
+        reconciliations_by_job_name = {
             ReconciliationK8sJob(
                 reconciliation=r,
                 is_dry_run=self.dry_run,
                 dry_run_suffix=self.dry_run_job_suffix,
-            ).name()
+            ).name(): r
             for r in reconcile_list
         }
-        job_status = self.controller.wait_for_job_list_completion(
-            job_names=job_names,
+        for job_name, status in self.controller.iter_job_list_completion(
+            job_names=set(reconciliations_by_job_name),
             check_interval_seconds=check_interval_seconds,
             timeout_seconds=timeout_seconds,
-        )
-        return {job: ReconcileStatus(status) for job, status in job_status.items()}
+        ):
+            yield reconciliations_by_job_name[job_name], ReconcileStatus(status)
 
-    def get_resource_reconcile_logs(self, reconciliation: Reconciliation) -> None:
+    def get_resource_reconcile_logs(
+        self, reconciliation: Reconciliation, output: TextIO = sys.stdout
+    ) -> None:
         job = ReconciliationK8sJob(
             reconciliation=reconciliation,
             is_dry_run=True,
             dry_run_suffix=self.dry_run_job_suffix,
         )
-        self.controller.get_job_logs(job_name=job.name(), output=sys.stdout)
+        self.controller.get_job_logs(job_name=job.name(), output=output)
@@ -12,13 +12,14 @@ from operator import itemgetter
 from typing import TYPE_CHECKING, Any, cast
 
 import gitlab
+import requests
 from gitlab.const import PipelineStatus
 from prometheus_client import (
     Counter,
     Gauge,
     Histogram,
 )
-from sretoolbox.utils import retry
+from sretoolbox.utils import retry, threaded
 
 from reconcile import queries
 from reconcile.change_owners.change_types import ChangeTypePriority
@@ -66,6 +67,7 @@ if TYPE_CHECKING:
         ProjectIssue,
         ProjectMergeRequest,
         ProjectMergeRequestPipeline,
+        ProjectMergeRequestResourceLabelEvent,
     )
 
 MERGE_LABELS_PRIORITY = [
@@ -92,6 +94,7 @@ TENANT_LABEL_PREFIX = "tenant-"
 QONTRACT_INTEGRATION = "gitlab-housekeeping"
 EXPIRATION_DATE_FORMAT = "%Y-%m-%d"
 SQUASH_OPTION_ALWAYS = "always"
+PREFETCH_THREAD_POOL_SIZE = 10
 
 merged_merge_requests = Counter(
     name="qontract_reconcile_merged_merge_requests",
@@ -519,6 +522,68 @@ def get_merge_requests(
     )
 
 
+def _get_commit_count(mr: ProjectMergeRequest) -> int:
+    return len(mr.commits())
+
+
+def prefetch_commit_counts(
+    gl: GitLabApi,
+    mrs: list[ProjectMergeRequest],
+    thread_pool_size: int = PREFETCH_THREAD_POOL_SIZE,
+) -> dict[int, int]:
+    """
+    Fetch the commit counts of the given MRs up front, keyed by iid.
+
+    Commit counts are fetched in bulk through the GraphQL API, MRs without
+    a reported count fall back to listing their commits concurrently,
+    bounded by thread_pool_size.
+    """
+    if not mrs:
+        return {}
+    try:
+        graphql_commit_counts = gl.get_merge_request_commit_counts(mr.iid for mr in mrs)
+    except (gitlab.exceptions.GitlabError, requests.RequestException) as e:
+        logging.warning(
+            f"[{gl.project.name}] unable to fetch commit counts via GraphQL, "
+            f"falling back to REST: {e}"
+        )
+        graphql_commit_counts = {}
+    commit_counts = {
+        mr.iid: graphql_commit_counts[mr.iid]
+        for mr in mrs
+        if mr.iid in graphql_commit_counts
+    }
+    missing = [mr for mr in mrs if mr.iid not in commit_counts]
+    commit_counts.update(
+        zip(
+            (mr.iid for mr in missing),
+            threaded.run(_get_commit_count, missing, thread_pool_size),
+            strict=True,
+        )
+    )
+    return commit_counts
+
+
+def prefetch_label_events(
+    gl: GitLabApi,
+    mrs: list[ProjectMergeRequest],
+    thread_pool_size: int = PREFETCH_THREAD_POOL_SIZE,
+) -> dict[int, list[ProjectMergeRequestResourceLabelEvent]]:
+    """
+    Fetch the label events of the given MRs up front, keyed by iid.
+
+    Label events have no GraphQL equivalent, so they are listed per MR
+    concurrently, bounded by thread_pool_size.
+    """
+    return dict(
+        zip(
+            (mr.iid for mr in mrs),
+            threaded.run(gl.get_merge_request_label_events, mrs, thread_pool_size),
+            strict=True,
+        )
+    )
+
+
 def preprocess_merge_requests(
     dry_run: bool,
     gl: GitLabApi,
@@ -528,7 +593,7 @@ def preprocess_merge_requests(
     must_pass: Iterable[str] | None = None,
     skip_unmergeable: bool = True,
 ) -> list[dict[str, Any]]:
-    results = []
+    candidates = []
     for mr in project_merge_requests:
         if mr.merge_status in {
             MRStatus.CANNOT_BE_MERGED,
@@ -547,7 +612,15 @@ def preprocess_merge_requests(
             ])
         if mr.draft:
             continue
-        if len(mr.commits()) == 0:
+        candidates.append(mr)
+
+    commit_counts = prefetch_commit_counts(gl, candidates)
+
+    # label events are listed per MR, only fetch them for MRs that pass
+    # all the cheaper checks
+    labeled = []
+    for mr in candidates:
+        if commit_counts[mr.iid] == 0:
             continue
 
         if must_pass and not verify_on_demand_tests(
@@ -574,7 +647,14 @@ def preprocess_merge_requests(
                 gl.remove_label(mr, LGTM)
             continue
 
-        label_events = gl.get_merge_request_label_events(mr)
+        labeled.append(mr)
+
+    label_events_by_iid = prefetch_label_events(gl, labeled)
+
+    results = []
+    for mr in labeled:
+        labels = set(mr.labels)
+        label_events = label_events_by_iid[mr.iid]
         approval_found = False
         labels_by_unauthorized_users = set()
         labels_by_authorized_users = set()
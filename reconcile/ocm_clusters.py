@@ -392,6 +392,7 @@ class OcmClusters(QontractReconcileIntegration[OcmClustersParams]):
             settings=settings,
             init_provision_shards=True,
             product_portfolio=product_portfolio,
+            thread_pool_size=self.params.thread_pool_size,
         )
 
         # current_state is the state got from the ocm api
@@ -26,10 +26,14 @@ def get_allowed_labels_for_cluster(cluster: Mapping[str, Any]) -> set[str]:
 
 def fetch_current_state(
     clusters: Iterable[Mapping[str, Any]],
+    thread_pool_size: int = DEFAULT_THREAD_POOL_SIZE,
 ) -> tuple[OCMMap, list[dict[str, Any]]]:
     settings = queries.get_app_interface_settings()
     ocm_map = OCMMap(
-        clusters=clusters, integration=QONTRACT_INTEGRATION, settings=settings
+        clusters=clusters,
+        integration=QONTRACT_INTEGRATION,
+        settings=settings,
+        thread_pool_size=thread_pool_size,
     )
 
     current_state = []
@@ -135,7 +139,7 @@ def run(
         )
         sys.exit(ExitCodes.SUCCESS)
 
-    ocm_map, current_state = fetch_current_state(clusters)
+    ocm_map, current_state = fetch_current_state(clusters, thread_pool_size)
     desired_state = fetch_desired_state(clusters)
     diffs, err = calculate_diff(current_state, desired_state)
     act(dry_run, diffs, ocm_map)
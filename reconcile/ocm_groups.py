@@ -57,7 +57,10 @@ def fetch_current_state(
 ) -> tuple[OCMMap, list[dict[str, str]]]:
     settings = queries.get_app_interface_settings()
     ocm_map = OCMMap(
-        clusters=clusters, integration=QONTRACT_INTEGRATION, settings=settings
+        clusters=clusters,
+        integration=QONTRACT_INTEGRATION,
+        settings=settings,
+        thread_pool_size=thread_pool_size,
     )
     groups_list = create_groups_list(clusters)
     results = threaded.run(
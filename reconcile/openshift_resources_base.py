@@ -67,7 +67,7 @@ from reconcile.utils.openshift_resource import OpenshiftResource as OR
 from reconcile.utils.runtime.integration import DesiredStateShardConfig
 from reconcile.utils.secret_reader import SecretReader, SecretReaderBase
 from reconcile.utils.semver_helper import make_semver
-from reconcile.utils.sharding import is_in_shard
+from reconcile.utils.sharding import filter_in_shard
 from reconcile.utils.vault import (
     SecretVersionIsNoneError,
     SecretVersionNotFoundError,
@@ -815,6 +815,15 @@ def fetch_data(
         override_managed_types=overrides,
         cluster_scope_resource_validation=True,
     )
+    vault_secrets = [
+        {"path": spec.resource["path"], "version": spec.resource["version"]}
+        for spec in state_specs
+        if isinstance(spec, ob.DesiredStateSpec)
+        and spec.resource["provider"] == "vault-secret"
+    ]
+    if vault_secrets:
+        # namespaces often share secrets, read each one once
+        SecretReader(settings).prefetch(vault_secrets, thread_pool_size)
     threaded.run(
         fetch_states,
         state_specs,
@@ -901,13 +910,16 @@ def get_namespaces(
         namespace_info
         for namespace_info in gqlapi.query(NAMESPACES_QUERY)["namespaces"]
         if not ob.is_namespace_deleted(namespace_info)
-        and (
-            not filter_by_shard
-            or is_in_shard(
-                f"{namespace_info['cluster']['name']}/" + f"{namespace_info['name']}"
-            )
-        )
     ]
+    if filter_by_shard:
+        # balance shards by the number of resources they manage. with
+        # rendezvous sharding a namespace's shard then depends on all other
+        # namespaces, see SHARDING_STRATEGY
+        namespaces = filter_in_shard(
+            namespaces,
+            key=lambda ns: f"{ns['cluster']['name']}/{ns['name']}",
+            weight=lambda ns: 1 + len(ns.get("openshiftResources") or []),
+        )
     namespaces_ = filter_namespaces_by_cluster_and_namespace(
         namespaces, cluster_names, exclude_clusters, namespace_name
     )
@@ -194,6 +194,7 @@ def run(
         clusters=cluster_like_objects,
         integration=QONTRACT_INTEGRATION,
         settings=settings,
+        thread_pool_size=thread_pool_size,
     )
 
     notify_upgrades_start(
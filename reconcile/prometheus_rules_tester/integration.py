@@ -30,6 +30,7 @@ if TYPE_CHECKING:
     from collections.abc import (
         Iterable,
         Mapping,
+        Sequence,
     )
 
     from reconcile.gql_definitions.common.app_interface_vault_settings import (
@@ -211,7 +212,7 @@ def check_valid_services(
     return CommandExecutionResult(True, "")
 
 
-# We return here a CommandExecutionResult as it is what run_test function has to
+# We return here a CommandExecutionResult as it is what run_tests function has to
 # add to the "result" field.
 def check_rule_length(rule_length: int) -> CommandExecutionResult:
     """Checks rule length so that prom operator has no issues with it"""
@@ -222,24 +223,48 @@ def check_rule_length(rule_length: int) -> CommandExecutionResult:
     return CommandExecutionResult(True, "")
 
 
-def run_test(test: Test, alerting_services: Iterable[str]) -> None:
-    """Checks rules, run tests and stores the result in test.result"""
-    check_rule_result = promtool.check_rule(
-        test.rule["spec"], promtool_version=test.promtool_version
-    )
-    valid_services_result = check_valid_services(test.rule, alerting_services)
-    rule_length_result = check_rule_length(test.rule_length)
-    test.result = check_rule_result and valid_services_result and rule_length_result
-
-    if not test.result:
-        return
+def run_tests(
+    tests: Sequence[Test],
+    alerting_services: Iterable[str],
+    thread_pool_size: int,
+    result_cache: promtool.ResultCache | None = None,
+    batch_size: int = promtool.PROMTOOL_BATCH_SIZE,
+) -> None:
+    """Checks rules, run tests and stores the results in test.result. Rules and
+    tests are handed to promtool batch_size at a time."""
+    tests_by_promtool_version: dict[str, list[Test]] = defaultdict(list)
+    for test in tests:
+        tests_by_promtool_version[test.promtool_version].append(test)
+
+    for promtool_version, version_tests in tests_by_promtool_version.items():
+        check_rule_results = promtool.check_rules(
+            [test.rule["spec"] for test in version_tests],
+            promtool_version=promtool_version,
+            cache=result_cache,
+            batch_size=batch_size,
+            thread_pool_size=thread_pool_size,
+        )
+        for test, check_rule_result in zip(
+            version_tests, check_rule_results, strict=True
+        ):
+            valid_services_result = check_valid_services(test.rule, alerting_services)
+            rule_length_result = check_rule_length(test.rule_length)
+            test.result = (
+                check_rule_result and valid_services_result and rule_length_result
+            )
 
-    rule_files = {test.rule_path: test.rule["spec"]}
-    for t in test.tests or []:
-        result = promtool.run_test(
-            t.test, rule_files, promtool_version=test.promtool_version
+        rule_tests = [
+            (test, t) for test in version_tests if test.result for t in test.tests or []
+        ]
+        rule_test_results = promtool.run_tests(
+            [(t.test, {test.rule_path: test.rule["spec"]}) for test, t in rule_tests],
+            promtool_version=promtool_version,
+            cache=result_cache,
+            batch_size=batch_size,
+            thread_pool_size=thread_pool_size,
         )
-        test.result = test.result and result
+        for (test, _), result in zip(rule_tests, rule_test_results, strict=True):
+            test.result = test.result and result
 
 
 def check_rules_and_tests(
@@ -247,9 +272,13 @@ def check_rules_and_tests(
     alerting_services: Iterable[str],
     thread_pool_size: int,
     cluster_names: Iterable[str] | None = None,
+    result_cache: promtool.ResultCache | None = None,
+    batch_size: int = promtool.PROMTOOL_BATCH_SIZE,
 ) -> list[Test]:
     """Fetch rules and associated tests, run checks on rules and tests if they exist
-    and return a list of failed checks/tests"""
+    and return a list of failed checks/tests. Promtool results are taken from and
+    added to result_cache, if given. promtool runs on batch_size rules or tests at
+    a time."""
     tests = get_rules_and_tests(
         vault_settings=vault_settings,
         thread_pool_size=thread_pool_size,
@@ -262,12 +291,15 @@ def check_rules_and_tests(
 
     representatives = [group[0] for group in groups.values()]
 
-    threaded.run(
-        func=run_test,
-        iterable=representatives,
-        thread_pool_size=thread_pool_size,
+    run_tests(
+        representatives,
         alerting_services=alerting_services,
+        thread_pool_size=thread_pool_size,
+        result_cache=result_cache,
+        batch_size=batch_size,
     )
+    if result_cache is not None:
+        result_cache.save()
 
     for group in groups.values():
         for duplicate in group[1:]:
@@ -279,7 +311,11 @@ def check_rules_and_tests(
 
 
 def run(
-    dry_run: bool, thread_pool_size: int, cluster_names: Iterable[str] | None = None
+    dry_run: bool,
+    thread_pool_size: int,
+    cluster_names: Iterable[str] | None = None,
+    result_cache_dir: str | None = None,
+    batch_size: int = promtool.PROMTOOL_BATCH_SIZE,
 ) -> None:
     """Check prometheus rules syntax and run the tests associated to them"""
     orb.QONTRACT_INTEGRATION = QONTRACT_INTEGRATION
@@ -290,6 +326,10 @@ def run(
         vault_settings=get_app_interface_vault_settings(),
         alerting_services=get_alerting_services(),
         thread_pool_size=thread_pool_size,
+        result_cache=promtool.ResultCache.from_dir(result_cache_dir)
+        if result_cache_dir
+        else None,
+        batch_size=batch_size,
     )
     if failed_tests:
         for ft in failed_tests:
@@ -14,6 +14,7 @@ from sretoolbox.container.image import (
     ImageContainsError,
 )
 from sretoolbox.container.skopeo import SkopeoCmdError
+from sretoolbox.utils import threaded
 
 from reconcile.container_registry_mirror.deep_sync_timer import DeepSyncTimer
 from reconcile.quay_base import get_quay_api_store
@@ -41,6 +42,8 @@ class QuayMirrorOrg:
         compare_tags_interval: int = 28800,
         orgs: Iterable[str] | None = None,
         repositories: Iterable[str] | None = None,
+        thread_pool_size: int = 1,
+        copy_pool_size: int = 1,
     ) -> None:
         self.dry_run = dry_run
         self.skopeo_cli = Skopeo(dry_run)
@@ -49,6 +52,8 @@ class QuayMirrorOrg:
         self.compare_tags_interval = compare_tags_interval
         self.orgs = orgs
         self.repositories = repositories
+        self.thread_pool_size = thread_pool_size
+        self.copy_pool_size = copy_pool_size
 
         self._deep_sync_timer = DeepSyncTimer.from_dir(
             control_file_dir=control_file_dir,
@@ -74,20 +79,14 @@ class QuayMirrorOrg:
         return self._deep_sync_timer.should_run
 
     def run(self) -> None:
-        errors: list[Exception] = []
         sync_tasks = self.process_sync_tasks()
-        for org, data in sync_tasks.items():
-            for item in data:
-                try:
-                    self.skopeo_cli.copy(
-                        src_image=item["mirror_url"],
-                        src_creds=item["mirror_creds"],
-                        dst_image=item["image_url"],
-                        dest_creds=self.get_push_creds(org),
-                    )
-                except SkopeoCmdError as details:
-                    _LOG.error("skopeo command error message: '%s'", details)
-                    errors.append(details)
+        copies = [
+            (org_key, item) for org_key, data in sync_tasks.items() for item in data
+        ]
+        # At most copy_pool_size skopeo processes run at a time, the
+        # runtime grows with the number of changed tags only.
+        results = threaded.run(self._copy, copies, self.copy_pool_size)
+        errors: list[Exception] = [error for error in results if error is not None]
 
         if self.is_compare_tags and not self.dry_run:
             record_timestamp(self.control_file_path)
@@ -95,6 +94,20 @@ class QuayMirrorOrg:
         if errors:
             raise ExceptionGroup("skopeo copy failures", errors)
 
+    def _copy(self, org_item: tuple[OrgKey, dict[str, Any]]) -> SkopeoCmdError | None:
+        org, item = org_item
+        try:
+            self.skopeo_cli.copy(
+                src_image=item["mirror_url"],
+                src_creds=item["mirror_creds"],
+                dst_image=item["image_url"],
+                dest_creds=self.get_push_creds(org),
+            )
+        except SkopeoCmdError as details:
+            _LOG.error("skopeo command error message: '%s'", details)
+            return details
+        return None
+
     def process_org_mirrors(self) -> dict[OrgKey, list[dict[str, Any]]]:
         """It collects the list of repositories in the upstream org from an API
         call and not from App-Interface.
@@ -147,124 +160,142 @@ class QuayMirrorOrg:
         return summary
 
     def process_sync_tasks(self) -> dict[OrgKey, list[dict[str, Any]]]:
+        """Diff all mirrored repositories, thread_pool_size at a time."""
         summary = self.process_org_mirrors()
+        items = [(org_key, item) for org_key, data in summary.items() for item in data]
+        results = threaded.run(self._diff_repository, items, self.thread_pool_size)
 
         sync_tasks = defaultdict(list)
-        for org_key, data in summary.items():
-            org = self.quay_api_store[org_key]
-            org_name = org_key.org_name
+        for (org_key, _), tasks in zip(items, results, strict=True):
+            sync_tasks[org_key].extend(tasks)
+        return sync_tasks
 
-            server_url = org["url"]
-            push_token = org["push_token"]
-            assert push_token is not None
+    def _diff_repository(self, org_item: tuple[OrgKey, dict[str, Any]]) -> list[dict]:
+        """Return the copy tasks of a mirrored repository.
 
-            username = push_token["user"]
-            password = push_token["token"]
-
-            for item in data:
-                image = Image(
-                    f"{server_url}/{org_name}/{item['name']}",
-                    username=username,
-                    password=password,
-                    session=self.session,
-                    timeout=REQUEST_TIMEOUT,
-                )
+        Tags are compared by the manifest digests the Quay API lists for
+        both repositories, a couple of paginated calls per repository
+        instead of two manifest lookups per tag. Only tags whose digests
+        differ have their manifests compared, e.g. a destination holding
+        a single-arch copy of an upstream multi-arch image.
+        """
+        org_key, item = org_item
+        org = self.quay_api_store[org_key]
+        org_name = org_key.org_name
 
-                mirror_url = item["mirror"]["url"]
+        server_url = org["url"]
+        push_token = org["push_token"]
+        assert push_token is not None
 
-                mirror_username = None
-                mirror_password = None
-                mirror_creds = None
+        username = push_token["user"]
+        password = push_token["token"]
 
-                if item["mirror"].get("username") and item["mirror"].get("token"):
-                    mirror_username = item["mirror"]["username"]
-                    mirror_password = item["mirror"]["token"]
-                    mirror_creds = f"{mirror_username}:{mirror_password}"
+        image = Image(
+            f"{server_url}/{org_name}/{item['name']}",
+            username=username,
+            password=password,
+            session=self.session,
+            timeout=REQUEST_TIMEOUT,
+        )
 
-                image_mirror = Image(
-                    mirror_url,
-                    username=mirror_username,
-                    password=mirror_password,
-                    session=self.session,
-                    timeout=REQUEST_TIMEOUT,
-                )
+        mirror_url = item["mirror"]["url"]
 
-                tags = item["mirror_filters"].get("tags")
-                tags_exclude = item["mirror_filters"].get("tags_exclude")
+        mirror_username = None
+        mirror_password = None
+        mirror_creds = None
 
-                for tag in image_mirror:
-                    upstream = image_mirror[tag]
-                    downstream = image[tag]
+        if item["mirror"].get("username") and item["mirror"].get("token"):
+            mirror_username = item["mirror"]["username"]
+            mirror_password = item["mirror"]["token"]
+            mirror_creds = f"{mirror_username}:{mirror_password}"
 
-                    if not sync_tag(
-                        tags=tags, tags_exclude=tags_exclude, candidate=tag
-                    ):
-                        _LOG.debug(
-                            "Image %s excluded through a mirror filter",
-                            upstream,
-                        )
-                        continue
+        image_mirror = Image(
+            mirror_url,
+            username=mirror_username,
+            password=mirror_password,
+            session=self.session,
+            timeout=REQUEST_TIMEOUT,
+        )
 
-                    if tag not in image:
-                        _LOG.debug(
-                            "Image %s and mirror %s are out of sync",
-                            downstream,
-                            upstream,
-                        )
-                        task = {
-                            "mirror_url": str(upstream),
-                            "mirror_creds": mirror_creds,
-                            "image_url": str(downstream),
-                        }
-                        sync_tasks[org_key].append(task)
-                        continue
+        upstream_org_key = org["mirror"]
+        assert upstream_org_key is not None
+        # The mirror URL points at the repository of the same org name on
+        # the upstream instance.
+        upstream_digests = self.quay_api_store[upstream_org_key]["api"].list_repo_tags(
+            item["name"], namespace=org_name
+        )
+        digests = org["api"].list_repo_tags(item["name"])
+
+        tags = item["mirror_filters"].get("tags")
+        tags_exclude = item["mirror_filters"].get("tags_exclude")
+
+        sync_tasks = []
+        for tag, upstream_digest in upstream_digests.items():
+            if not sync_tag(tags=tags, tags_exclude=tags_exclude, candidate=tag):
+                _LOG.debug(
+                    "Tag %s of %s excluded through a mirror filter",
+                    tag,
+                    image_mirror,
+                )
+                continue
+
+            # Compare tags (slow) only from time to time.
+            if tag in digests and not self.is_compare_tags:
+                _LOG.debug(
+                    "Running in non compare-tags mode. We won't check if tag %s "
+                    "of %s and %s is actually in sync",
+                    tag,
+                    image,
+                    image_mirror,
+                )
+                continue
 
-                    # Compare tags (slow) only from time to time.
-                    if not self.is_compare_tags:
+            if digests.get(tag) == upstream_digest:
+                _LOG.debug(
+                    "Tag %s of %s and mirror %s is in sync",
+                    tag,
+                    image,
+                    image_mirror,
+                )
+                continue
+
+            upstream = image_mirror[tag]
+            downstream = image[tag]
+            if tag in digests:
+                try:
+                    if downstream == upstream:
                         _LOG.debug(
-                            "Running in non compare-tags mode. We won't check if %s "
-                            "and %s are actually in sync",
+                            "Image %s and mirror %s are in sync",
                             downstream,
                             upstream,
                         )
                         continue
-
-                    try:
-                        if downstream == upstream:
-                            _LOG.debug(
-                                "Image %s and mirror %s are in sync",
-                                downstream,
-                                upstream,
-                            )
-                            continue
-                        if downstream.is_part_of(upstream):
-                            _LOG.debug(
-                                "Image %s is part of mirror multi-arch image %s",
-                                downstream,
-                                upstream,
-                            )
-                            continue
-                    except ImageComparisonError as details:
-                        _LOG.error(
-                            "Error comparing image %s and %s - %s",
+                    if downstream.is_part_of(upstream):
+                        _LOG.debug(
+                            "Image %s is part of mirror multi-arch image %s",
                             downstream,
                             upstream,
-                            details,
                         )
                         continue
-                    except ImageContainsError:
-                        # Upstream and downstream images are different and not part
-                        # of each other. We will mirror them.
-                        pass
-
-                    _LOG.debug(
-                        "Image %s and mirror %s are out of sync", downstream, upstream
+                except ImageComparisonError as details:
+                    _LOG.error(
+                        "Error comparing image %s and %s - %s",
+                        downstream,
+                        upstream,
+                        details,
                     )
-                    sync_tasks[org_key].append({
-                        "mirror_url": str(upstream),
-                        "mirror_creds": mirror_creds,
-                        "image_url": str(downstream),
-                    })
+                    continue
+                except ImageContainsError:
+                    # Upstream and downstream images are different and not
+                    # part of each other. We will mirror them.
+                    pass
+
+            _LOG.debug("Image %s and mirror %s are out of sync", downstream, upstream)
+            sync_tasks.append({
+                "mirror_url": str(upstream),
+                "mirror_creds": mirror_creds,
+                "image_url": str(downstream),
+            })
 
         return sync_tasks
 
@@ -292,6 +323,8 @@ def run(
     compare_tags_interval: int,
     orgs: Iterable[str] | None,
     repositories: Iterable[str] | None,
+    thread_pool_size: int = 1,
+    copy_pool_size: int = 1,
 ) -> None:
     with QuayMirrorOrg(
         dry_run,
@@ -300,5 +333,7 @@ def run(
         compare_tags_interval,
         orgs,
         repositories,
+        thread_pool_size,
+        copy_pool_size,
     ) as quay_mirror_org:
         quay_mirror_org.run()
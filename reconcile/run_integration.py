@@ -4,15 +4,20 @@ from __future__ import annotations
 
 import contextlib
 import cProfile
+import hashlib
+import json
 import logging
 import os
 import shlex
 import sys
 import time
+import tomllib
 from importlib import metadata
 from typing import TYPE_CHECKING
+from urllib.parse import urlparse
 
 import click
+import requests
 from prometheus_client import (
     push_to_gateway,
     start_http_server,
@@ -27,6 +32,7 @@ from reconcile.utils.metrics import (
     pushgateway_run_time,
     run_status,
     run_time,
+    skipped_execution_counter,
 )
 from reconcile.utils.runtime.environment import (
     LOG_DATEFMT,
@@ -34,7 +40,7 @@ from reconcile.utils.runtime.environment import (
 )
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Iterable
 
 SHARDS = int(os.environ.get("SHARDS", "1"))
 SHARD_ID = int(os.environ.get("SHARD_ID", "0"))
@@ -61,6 +67,10 @@ SLEEP_ON_ERROR = int(os.environ.get("SLEEP_ON_ERROR", "10"))
 
 PUSHGATEWAY_ENABLED = bool(os.environ.get("PUSHGATEWAY_ENABLED"))
 
+SKIP_UNCHANGED_RUNS = bool(os.environ.get("SKIP_UNCHANGED_RUNS"))
+FORCED_REFRESH_SECS = int(os.environ.get("FORCED_REFRESH_SECS", "3600"))
+EXTERNAL_FINGERPRINT_URLS = os.environ.get("EXTERNAL_FINGERPRINT_URLS", "").split()
+
 LOG = logging.getLogger(__name__)
 
 # Messages to stdout
@@ -194,6 +204,81 @@ def _push_gateway_basic_auth_handler(
     return basic_auth_handler(url, method, timeout, headers, data, username, password)
 
 
+class UnchangedRunSkipper:
+    """
+    Decides whether a loop iteration can be skipped because nothing the
+    integration depends on changed since the last successful run.
+
+    A run is fingerprinted by its arguments, the content of the config
+    file, the bundle SHA served by the qontract-server /sha256 endpoint
+    and the ETag (or body) of every external fingerprint URL. The full
+    run is skipped while the fingerprint equals the one of the last
+    successful run, for at most forced_refresh_secs. If any part of the
+    fingerprint can't be fetched the integration runs.
+    """
+
+    def __init__(
+        self,
+        config_file: str,
+        forced_refresh_secs: int,
+        external_fingerprint_urls: Iterable[str] = (),
+    ) -> None:
+        self.config_file = config_file
+        self.forced_refresh_secs = forced_refresh_secs
+        self.external_fingerprint_urls = list(external_fingerprint_urls)
+        self._last_fingerprint: str | None = None
+        self._last_run = 0.0
+
+    def fingerprint(self, args: Iterable[str]) -> str | None:
+        from reconcile.utils.gql import (  # ruff: ignore[import-outside-top-level]
+            get_sha,
+        )
+
+        try:
+            with open(self.config_file, "rb") as f:
+                config_content = f.read()
+            graphql = tomllib.loads(config_content.decode())["graphql"]
+            sha = get_sha(urlparse(graphql["server"]), graphql.get("token"))
+            external = [
+                self._external_fingerprint(url)
+                for url in self.external_fingerprint_urls
+            ]
+        except Exception as e:
+            LOG.warning(f"Unable to fingerprint the integration inputs: {e}")
+            return None
+        content = json.dumps([
+            list(args),
+            hashlib.sha256(config_content).hexdigest(),
+            sha,
+            external,
+        ])
+        return hashlib.sha256(content.encode()).hexdigest()
+
+    @staticmethod
+    def _external_fingerprint(url: str) -> str:
+        response = requests.get(url, timeout=60)
+        response.raise_for_status()
+        return (
+            response.headers.get("ETag") or hashlib.sha256(response.content).hexdigest()
+        )
+
+    def should_skip(self, fingerprint: str | None) -> bool:
+        return (
+            fingerprint is not None
+            and fingerprint == self._last_fingerprint
+            and time.monotonic() - self._last_run < self.forced_refresh_secs
+        )
+
+    def record_run(self, fingerprint: str | None, return_code: int) -> None:
+        """Remember the fingerprint of a finished run, failed runs are
+        never skipped."""
+        if return_code == ExitCodes.SUCCESS:
+            self._last_fingerprint = fingerprint
+            self._last_run = time.monotonic()
+        else:
+            self._last_fingerprint = None
+
+
 def main() -> None:
     """
     This entry point script expects certain env variables
@@ -226,6 +311,15 @@ def main() -> None:
     * PUSHGATEWAY_ENABLED (defaults to false)
       send metrics to a Prometheus Pushgateway after the run. In expects
       "PUSHGATEWAY_USERNAME", "PUSHGATEWAY_PASSWORD" and "PUSHGATEWAY_URL" to be defined.
+    * SKIP_UNCHANGED_RUNS (defaults to false)
+      skip a loop iteration if the arguments, the config file, the bundle SHA
+      and the external fingerprints did not change since the last successful run
+    * FORCED_REFRESH_SECS (default 3600)
+      with SKIP_UNCHANGED_RUNS, amount of seconds after which the integration
+      runs even if nothing changed
+    * EXTERNAL_FINGERPRINT_URLS (optional)
+      with SKIP_UNCHANGED_RUNS, space separated list of URLs whose ETag, or
+      content, is part of the inputs of the integration
 
 
     Based on those variables, the following command will be executed
@@ -242,11 +336,24 @@ def main() -> None:
     start_http_server(int(PROMETHEUS_PORT))
 
     command = build_entry_point_func(COMMAND_NAME)
+    skipper = (
+        UnchangedRunSkipper(CONFIG, FORCED_REFRESH_SECS, EXTERNAL_FINGERPRINT_URLS)
+        if SKIP_UNCHANGED_RUNS and not RUN_ONCE
+        else None
+    )
     while True:
         args = build_entry_point_args(
             command, CONFIG, DRY_RUN, INTEGRATION_NAME, INTEGRATION_EXTRA_ARGS
         )
         sleep = SLEEP_DURATION_SECS
+        fingerprint = skipper.fingerprint(args) if skipper else None
+        if skipper and skipper.should_skip(fingerprint):
+            LOG.info("Integration inputs did not change, skipping run")
+            skipped_execution_counter.labels(
+                integration=INTEGRATION_NAME, shards=SHARDS, shard_id=SHARD_ID_LABEL
+            ).inc()
+            time.sleep(sleep)
+            continue
         start_time = time.monotonic()
         # Running the integration via Click, so we don't have to replicate
         # the CLI logic here
@@ -311,6 +418,9 @@ def main() -> None:
         if RUN_ONCE:
             sys.exit(return_code)
 
+        if skipper:
+            skipper.record_run(fingerprint, return_code)
+
         time.sleep(int(sleep))
 
 
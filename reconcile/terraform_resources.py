@@ -273,7 +273,10 @@ def setup(
     clusters = [c for c in queries.get_clusters() if c.get("ocm") is not None]
     if clusters:
         ocm_map = OCMMap(
-            clusters=clusters, integration=QONTRACT_INTEGRATION, settings=settings
+            clusters=clusters,
+            integration=QONTRACT_INTEGRATION,
+            settings=settings,
+            thread_pool_size=thread_pool_size,
         )
     else:
         ocm_map = None
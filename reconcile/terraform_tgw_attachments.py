@@ -330,6 +330,7 @@ def _build_requester(
 def _build_ocm_map(
     clusters: Iterable[ClusterV1],
     vault_settings: AppInterfaceSettingsV1,
+    thread_pool_size: int,
 ) -> OCMMap | None:
     ocm_clusters = [c.model_dump(by_alias=True) for c in clusters if c.ocm]
     return (
@@ -337,6 +338,7 @@ def _build_ocm_map(
             clusters=ocm_clusters,
             integration=QONTRACT_INTEGRATION,
             settings=vault_settings.model_dump(by_alias=True),
+            thread_pool_size=thread_pool_size,
         )
         if ocm_clusters
         # this is a case for an OCP cluster which is not provisioned
@@ -449,7 +451,9 @@ def setup(
     vault_settings = get_app_interface_vault_settings()
     secret_reader = create_secret_reader(vault_settings.vault)
     aws_api = AWSApi(1, all_accounts, secret_reader=secret_reader, init_users=False)
-    ocm_map = _build_ocm_map(desired_state_data_source.clusters, vault_settings)
+    ocm_map = _build_ocm_map(
+        desired_state_data_source.clusters, vault_settings, thread_pool_size
+    )
     tgw_account_names = [a["name"] for a in tgw_accounts]
     desired_state, err = _build_desired_state_tgw_attachments(
         desired_state_data_source.clusters,
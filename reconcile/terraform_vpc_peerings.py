@@ -607,6 +607,7 @@ def run(
             clusters=clusters,
             integration=QONTRACT_INTEGRATION,
             settings=settings,
+            thread_pool_size=thread_pool_size,
         )
     else:
         # this is a case for an OCP cluster which is not provisioned
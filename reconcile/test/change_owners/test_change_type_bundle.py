@@ -41,3 +41,19 @@ def test_qontract_server_file_diff_resolver(
     )
     assert resolved_old == old
     assert resolved_new == new
+
+
+def test_qontract_server_file_diff_resolver_caches_lookups(
+    mocker: MockerFixture,
+) -> None:
+    get_diff_mock = mocker.patch.object(bundle, "get_diff")
+    get_diff_mock.return_value = {"old": {"a": 1}, "new": {"a": 2}}
+
+    resolver = QontractServerFileDiffResolver("sha")
+    file_ref = FileRef(file_type=BundleFileType.DATAFILE, path="path", schema=None)
+    assert resolver.lookup_file_diff(file_ref) == ({"a": 1}, {"a": 2})
+    assert resolver.lookup_file_diff(file_ref) == ({"a": 1}, {"a": 2})
+
+    get_diff_mock.assert_called_once_with(
+        old_sha="sha", file_type="datafile", file_path="path"
+    )
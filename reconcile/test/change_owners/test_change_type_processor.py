@@ -6,10 +6,14 @@ import jsonpath_ng
 import pytest
 from jsonpath_ng.exceptions import JsonPathParserError
 
-from reconcile.change_owners.bundle import BundleFileType
+from reconcile.change_owners.bundle import BundleFileType, FileRef
 from reconcile.change_owners.change_types import (
     ChangeTypeContext,
     ChangeTypeProcessor,
+    ChangeTypeProcessorIndex,
+    ContextExpansion,
+    FileChange,
+    ForwardrefOwnershipContext,
 )
 from reconcile.test.change_owners.fixtures import (
     StubFile,
@@ -19,6 +23,8 @@ from reconcile.test.change_owners.fixtures import (
 )
 
 if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
     from reconcile.gql_definitions.change_owners.queries.change_types import (
         ChangeTypeV1,
     )
@@ -147,3 +153,170 @@ def test_change_type_processor_allowed_paths_conditions_ct_without_schema_file_w
     )
 
     assert {str(p) for p in paths} == {"$"}
+
+
+def test_change_type_processor_allowed_paths_memoized_per_content(
+    mocker: MockerFixture, role_member_change_type: ChangeTypeV1, user_file: StubFile
+) -> None:
+    changed_user_file = user_file.create_bundle_change({
+        "roles[0]": {"$ref": "some-role"}
+    })
+    processor = change_type_to_processor(role_member_change_type)
+    find_spy = mocker.spy(processor, "_allowed_changed_paths")
+
+    for role in ("role-1", "role-2"):
+        paths = processor.allowed_changed_paths(
+            file_ref=changed_user_file.fileref,
+            file_content=changed_user_file.new,
+            ctx=ChangeTypeContext(
+                change_type_processor=processor,
+                context=f"RoleV1 - {role}",
+                origin="",
+                approvers=[],
+                context_file=user_file.file_ref(),
+            ),
+            content_hash="hash",
+        )
+        assert {str(p) for p in paths} == {"roles"}
+
+    find_spy.assert_called_once()
+
+
+def test_change_type_processor_allowed_paths_memoized_per_context_file() -> None:
+    processor = build_change_type(
+        name="role-self-service",
+        change_schema="/access/user-1.yml",
+        context_schema="/access/role-1.yml",
+        change_selectors=["roles[?(@.'$ref'=='{{ ctx_file_path }}')]"],
+    )
+    file_ref = FileRef(
+        file_type=BundleFileType.DATAFILE,
+        path="/users/user.yml",
+        schema="/access/user-1.yml",
+    )
+    content = {"roles": [{"$ref": "/roles/a.yml"}, {"$ref": "/roles/b.yml"}]}
+
+    def allowed_paths(role_path: str) -> list[jsonpath_ng.JSONPath]:
+        return processor.allowed_changed_paths(
+            file_ref=file_ref,
+            file_content=content,
+            ctx=ChangeTypeContext(
+                change_type_processor=processor,
+                context=f"RoleV1 - {role_path}",
+                origin="",
+                approvers=[],
+                context_file=FileRef(
+                    file_type=BundleFileType.DATAFILE,
+                    path=role_path,
+                    schema="/access/role-1.yml",
+                ),
+            ),
+            content_hash="hash",
+        )
+
+    assert allowed_paths("/roles/a.yml") == [jsonpath_ng.parse("roles.[0]")]
+    assert allowed_paths("/roles/b.yml") == [jsonpath_ng.parse("roles.[1]")]
+
+
+#
+# change type processor index
+#
+
+
+def test_change_type_processor_index() -> None:
+    namespace_owner = build_change_type(
+        name="namespace-owner",
+        context_schema="/openshift/namespace-1.yml",
+        change_selectors=["$"],
+    )
+    role_member = build_change_type(
+        name="role-member",
+        context_schema="/access/role-1.yml",
+        change_schema="/access/user-1.yml",
+        change_selectors=["roles[*]"],
+    )
+    any_file_owner = build_change_type(name="any-file-owner", change_selectors=["$"])
+    index = ChangeTypeProcessorIndex([namespace_owner, role_member, any_file_owner])
+
+    def processors_for_schema(schema: str | None) -> list[str]:
+        return [
+            ctp.name
+            for ctp in index.processors_for_file(
+                FileRef(file_type=BundleFileType.DATAFILE, path="/f.yml", schema=schema)
+            )
+        ]
+
+    assert processors_for_schema("/openshift/namespace-1.yml") == [
+        "namespace-owner",
+        "any-file-owner",
+    ]
+    assert processors_for_schema("/access/role-1.yml") == [
+        "role-member",
+        "any-file-owner",
+    ]
+    assert processors_for_schema("/access/user-1.yml") == [
+        "role-member",
+        "any-file-owner",
+    ]
+    assert processors_for_schema("/app-sre/app-1.yml") == ["any-file-owner"]
+    assert processors_for_schema(None) == ["any-file-owner"]
+
+
+def test_context_expansion_memoized_per_content(mocker: MockerFixture) -> None:
+    expansion = ContextExpansion(
+        context=ForwardrefOwnershipContext(
+            selector=jsonpath_ng.parse("role.'$ref'"), when="added"
+        ),
+        change_type=build_change_type(
+            name="role-owner",
+            change_selectors=["$"],
+            context_schema="/access/role-1.yml",
+        ),
+        file_diff_resolver=mocker.Mock(),
+    )
+    file_ref = FileRef(
+        file_type=BundleFileType.DATAFILE,
+        path="/users/user.yml",
+        schema="/access/user-1.yml",
+    )
+
+    def contexts(role_path: str) -> list[FileRef]:
+        return expansion._find_ownership_context(
+            FileChange(file_ref=file_ref, old=None, new={"role": {"$ref": role_path}})
+        )
+
+    assert [c.path for c in contexts("/roles/a.yml")] == ["/roles/a.yml"]
+    assert [c.path for c in contexts("/roles/b.yml")] == ["/roles/b.yml"]
+
+
+def test_file_change_hashes_content_once(mocker: MockerFixture) -> None:
+    hash_content = mocker.patch(
+        "reconcile.change_owners.change_types.content_hash", return_value="hash"
+    )
+    expansion = ContextExpansion(
+        context=ForwardrefOwnershipContext(
+            selector=jsonpath_ng.parse("role.'$ref'"), when="added"
+        ),
+        change_type=build_change_type(
+            name="role-owner",
+            change_selectors=["$"],
+            context_schema="/access/role-1.yml",
+        ),
+        file_diff_resolver=mocker.Mock(),
+    )
+    change = FileChange(
+        file_ref=FileRef(
+            file_type=BundleFileType.DATAFILE,
+            path="/users/user.yml",
+            schema="/access/user-1.yml",
+        ),
+        old=None,
+        new={"role": {"$ref": "/roles/a.yml"}},
+    )
+
+    for _ in range(3):
+        assert [c.path for c in expansion._find_ownership_context(change)] == [
+            "/roles/a.yml"
+        ]
+
+    assert hash_content.call_count == 2
@@ -0,0 +1,313 @@
+from __future__ import annotations
+
+import copy
+import random
+import time
+from typing import TYPE_CHECKING, Any
+
+import pytest
+from deepdiff import DeepHash
+
+from reconcile.change_owners.diff import (
+    Diff,
+    MerkleTree,
+    extract_diffs,
+    extract_diffs_with_deepdiff,
+    has_diff,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+#
+# helpers to build bundle-like desired states
+#
+
+
+def namespace(i: int) -> dict[str, Any]:
+    return {
+        "name": f"ns-{i}",
+        "path": f"/services/app-{i % 50}/namespaces/ns-{i}.yml",
+        "cluster": {"$ref": f"/openshift/cluster-{i % 20}/cluster.yml"},
+        "labels": {"service": f"app-{i % 50}", "env": ["prod", "stage"][i % 2]},
+        "managedRoles": True,
+        "openshiftResources": [
+            {
+                "__identifier": f"vs-{i}-{j}",
+                "provider": "vault-secret",
+                "path": f"app/{i}/{j}",
+                "version": 2,
+            }
+            for j in range(8)
+        ]
+        + [
+            {
+                "provider": "resource-template",
+                "path": f"/templates/{i}/{j}.yml",
+                "variables": {"replicas": j},
+            }
+            for j in range(4)
+        ],
+        "sharedResources": [{"$ref": f"/shared/{k}.yml"} for k in range(i % 3)],
+    }
+
+
+def desired_state(namespaces: int) -> dict[str, Any]:
+    return {"namespaces": [namespace(i) for i in range(namespaces)]}
+
+
+def diff_keys(diffs: list[Diff]) -> list[tuple[str, str, str, str]]:
+    # DeepDiff itself does not guarantee a stable order for add/remove pairs
+    # that end up as value changes, hence the comparison is order agnostic
+    return sorted(
+        (d.path_str(), d.diff_type.value, repr(d.old), repr(d.new)) for d in diffs
+    )
+
+
+#
+# merkle tree
+#
+
+
+def test_merkle_tree_ignores_order_repetition_and_private_keys() -> None:
+    old = {"a": [1, 2, {"b": 1, "__identifier": "x"}]}
+    new = {"a": [{"__identifier": "y", "b": 1}, 2, 1, 1]}
+    assert MerkleTree(old).root_digest == MerkleTree(new).root_digest
+
+
+@pytest.mark.parametrize(
+    "new",
+    [
+        {"a": [1, 2, 3]},
+        {"a": [1, True]},
+        {"a": [1, 2.0]},
+        {"a": (1, 2)},
+        {"a": [1, 2], "b": None},
+        {"b": [1, 2]},
+    ],
+)
+def test_merkle_tree_detects_changes(new: dict[str, Any]) -> None:
+    assert MerkleTree({"a": [1, 2]}).root_digest != MerkleTree(new).root_digest
+
+
+def test_has_diff_falls_back_for_unsupported_content() -> None:
+    assert not has_diff({"a": {1, 2}}, {"a": {2, 1}})
+    assert has_diff({"a": {1, 2}}, {"a": {1, 3}})
+
+
+def test_extract_diffs_falls_back_for_unsupported_content() -> None:
+    diffs = extract_diffs({"a": {1: "one"}}, {"a": {1: "two"}})
+    assert diff_keys(diffs) == [("a.[1]", "changed", "'one'", "'two'")]
+
+
+#
+# parity with deepdiff on bundle-like desired states
+#
+
+
+def change_value(state: dict[str, Any]) -> None:
+    state["namespaces"][3]["openshiftResources"][2]["version"] = 3
+
+
+def change_item_without_identifier(state: dict[str, Any]) -> None:
+    state["namespaces"][3]["openshiftResources"][9]["variables"]["replicas"] = 5
+
+
+def add_item(state: dict[str, Any]) -> None:
+    state["namespaces"].insert(5, namespace(1000))
+
+
+def remove_item(state: dict[str, Any]) -> None:
+    del state["namespaces"][4]["openshiftResources"][1]
+
+
+def reorder_items(state: dict[str, Any]) -> None:
+    state["namespaces"].reverse()
+
+
+def replace_ref(state: dict[str, Any]) -> None:
+    state["namespaces"][2]["sharedResources"][1] = {"$ref": "/shared/other.yml"}
+
+
+def replace_identified_item(state: dict[str, Any]) -> None:
+    state["namespaces"][2]["openshiftResources"][0]["__identifier"] = "vs-new"
+    state["namespaces"][2]["openshiftResources"][0]["path"] = "app/new"
+
+
+def add_and_remove_keys(state: dict[str, Any]) -> None:
+    state["namespaces"][6]["labels"]["team"] = "sre"
+    del state["namespaces"][6]["managedRoles"]
+
+
+def change_type(state: dict[str, Any]) -> None:
+    state["namespaces"][1]["labels"] = ["service", "env"]
+
+
+def replace_object(state: dict[str, Any]) -> None:
+    state["namespaces"][1]["cluster"] = {"name": "other", "spec": {}}
+
+
+def many_changes(state: dict[str, Any]) -> None:
+    for ns in state["namespaces"][::3]:
+        ns["openshiftResources"][0]["version"] = 7
+        ns["openshiftResources"].append({"provider": "resource", "path": "/x.yml"})
+    state["namespaces"].pop()
+
+
+@pytest.mark.parametrize(
+    "mutation",
+    [
+        change_value,
+        change_item_without_identifier,
+        add_item,
+        remove_item,
+        reorder_items,
+        replace_ref,
+        replace_identified_item,
+        add_and_remove_keys,
+        change_type,
+        replace_object,
+        many_changes,
+    ],
+)
+def test_extract_diffs_matches_deepdiff(
+    mutation: Callable[[dict[str, Any]], None],
+) -> None:
+    old = desired_state(30)
+    new = copy.deepcopy(old)
+    mutation(new)
+
+    assert diff_keys(extract_diffs(old, new)) == diff_keys(
+        extract_diffs_with_deepdiff(old, new)
+    )
+    assert has_diff(old, new) == (DeepHash(old)[old] != DeepHash(new)[new])
+
+
+def _random_content(r: random.Random, depth: int) -> Any:
+    kind = r.random()
+    if depth <= 0 or kind < 0.3:
+        return r.choice(["a", "b", "xxx", 1, 2, 1.5, None, True])
+    if kind < 0.45:
+        return {"$ref": r.choice(["/a.yml", "/b.yml", "/c.yml"])}
+    if kind < 0.7:
+        obj: dict[str, Any] = {}
+        if r.random() < 0.6:
+            obj["__identifier"] = r.choice(["i1", "i2", "i3"])
+        for key in r.sample(["name", "v", "w", "items"], r.randint(1, 4)):
+            obj[key] = _random_content(r, depth - 1)
+        return obj
+    return [_random_content(r, depth - 1) for _ in range(r.randint(0, 5))]
+
+
+def _random_mutation(r: random.Random, obj: Any) -> Any:
+    if isinstance(obj, dict):
+        keys = list(obj)
+        if keys and r.random() < 0.5:
+            key = r.choice(keys)
+            obj[key] = _random_mutation(r, obj[key])
+        elif keys and r.random() < 0.5:
+            del obj[r.choice(keys)]
+        else:
+            obj[r.choice(["name", "v", "new"])] = _random_content(r, 2)
+        return obj
+    if isinstance(obj, list):
+        action = r.random()
+        if obj and action < 0.4:
+            i = r.randrange(len(obj))
+            obj[i] = _random_mutation(r, obj[i])
+        elif action < 0.6:
+            obj.insert(r.randint(0, len(obj)), _random_content(r, 2))
+        elif obj and action < 0.8:
+            obj.pop(r.randrange(len(obj)))
+        else:
+            r.shuffle(obj)
+        return obj
+    return _random_content(r, 0)
+
+
+@pytest.mark.parametrize("seed", range(200))
+def test_extract_diffs_matches_deepdiff_randomized(seed: int) -> None:
+    r = random.Random(seed)
+    old = {
+        "root": _random_content(r, 4),
+        "items": [_random_content(r, 3) for _ in range(r.randint(1, 6))],
+    }
+    new = copy.deepcopy(old)
+    for _ in range(r.randint(1, 3)):
+        key = r.choice(["root", "items"])
+        new[key] = _random_mutation(r, new[key])
+
+    assert diff_keys(extract_diffs(old, new)) == diff_keys(
+        extract_diffs_with_deepdiff(old, new)
+    )
+
+
+#
+# parity and benchmarks on a real-sized desired state
+#
+
+
+def _best_of(runs: int, func: Callable[[], Any]) -> float:
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+@pytest.fixture(scope="module")
+def large_desired_states() -> tuple[dict[str, Any], dict[str, Any]]:
+    old = desired_state(500)
+    new = copy.deepcopy(old)
+    change_value(new)
+    add_item(new)
+    return old, new
+
+
+def test_extract_diffs_parity_large_desired_state(
+    large_desired_states: tuple[dict[str, Any], dict[str, Any]],
+) -> None:
+    old, new = large_desired_states
+
+    assert diff_keys(extract_diffs(old, new)) == diff_keys(
+        extract_diffs_with_deepdiff(old, new)
+    )
+
+
+def test_has_diff_parity_large_desired_state(
+    large_desired_states: tuple[dict[str, Any], dict[str, Any]],
+) -> None:
+    old, new = large_desired_states
+
+    assert has_diff(old, new)
+    assert DeepHash(old)[old] != DeepHash(new)[new]
+    assert not has_diff(old, copy.deepcopy(old))
+
+
+@pytest.mark.benchmark
+def test_benchmark_extract_diffs(
+    large_desired_states: tuple[dict[str, Any], dict[str, Any]],
+) -> None:
+    old, new = large_desired_states
+    structural = _best_of(3, lambda: extract_diffs(old, new))
+    deepdiff = _best_of(1, lambda: extract_diffs_with_deepdiff(old, new))
+
+    print(
+        f"extract_diffs: merkle {structural * 1000:.1f}ms, "
+        f"deepdiff {deepdiff * 1000:.1f}ms ({deepdiff / structural:.1f}x)"
+    )
+
+
+@pytest.mark.benchmark
+def test_benchmark_has_diff(
+    large_desired_states: tuple[dict[str, Any], dict[str, Any]],
+) -> None:
+    old, new = large_desired_states
+    merkle = _best_of(3, lambda: has_diff(old, new))
+    deephash = _best_of(1, lambda: DeepHash(old)[old] != DeepHash(new)[new])
+
+    print(
+        f"has_diff: merkle {merkle * 1000:.1f}ms, "
+        f"deephash {deephash * 1000:.1f}ms ({deephash / merkle:.1f}x)"
+    )
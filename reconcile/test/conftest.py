@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import os
 import time
 from collections.abc import (
     Callable,
@@ -165,3 +166,46 @@ def set_httpserver_responses_based_on_fixture(httpserver: HTTPServer) -> Callabl
                     )
 
     return _
+
+
+@pytest.fixture
+def fake_promtool(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Generator[Path]:
+    """Put fake promtool binaries for all supported versions on PATH and
+    return the file they log their invocations to, one line per process.
+    Like promtool they report on every file given, files containing
+    `fake-promtool-fail` fail."""
+    from reconcile.utils import promtool
+
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    calls = tmp_path / "promtool-calls.log"
+    calls.touch()
+    for version in [None, *promtool.PROMTOOL_VERSION]:
+        binary = bin_dir / promtool._bin(version)
+        binary.write_text(
+            "#!/bin/sh\n"
+            'if [ "$1" = "--version" ]; then\n'
+            f'  echo "promtool, version {version or "0.0.0"} (fake)"\n'
+            "  exit 0\n"
+            "fi\n"
+            f'echo "$*" >> {calls}\n'
+            'if [ "$1" = "test" ]; then header="Unit Testing: "; else header="Checking"; fi\n'
+            "shift 2\n"
+            "rc=0\n"
+            "for spec; do\n"
+            '  echo "$header $spec"\n'
+            '  if grep -q fake-promtool-fail "$spec"; then\n'
+            '    echo "  FAILED:" >&2; echo "fake failure in $spec" >&2; rc=1\n'
+            "  else\n"
+            '    echo "  SUCCESS"\n'
+            "  fi\n"
+            "  echo\n"
+            "done\n"
+            "exit $rc\n",
+            encoding="utf-8",
+        )
+        binary.chmod(0o755)
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+    promtool._bin_version.cache_clear()
+    yield calls
+    promtool._bin_version.cache_clear()
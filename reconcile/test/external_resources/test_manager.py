@@ -283,3 +283,40 @@ def test_update_resource_state_deletes_state(
     manager.state_mgr = cast("Mock", manager.state_mgr)
     manager.state_mgr.del_external_resource_state.assert_called_once()
     manager.state_mgr.set_external_resource_state.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    "reconcile_status",
+    [ReconcileStatus.SUCCESS, ReconcileStatus.ERROR],
+)
+def test_handle_dry_run_resources_prints_logs(
+    mocker: MockerFixture,
+    manager: ExternalResourcesManager,
+    reconciliation: Reconciliation,
+    reconcile_status: ReconcileStatus,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    mocker.patch.object(manager.dry_runs_validator, "validate")
+    mocker.patch.object(
+        manager, "_get_desired_objects_reconciliations", return_value={reconciliation}
+    )
+    mocker.patch.object(
+        manager, "_get_deleted_objects_reconciliations", return_value=set()
+    )
+    mocker.patch.object(manager, "_reconciliation_needs_dry_run_run", return_value=True)
+    reconciler = cast("Mock", manager.reconciler)
+    reconciler.iter_reconcile_list_completion.return_value = iter([
+        (reconciliation, reconcile_status)
+    ])
+    reconciler.get_resource_reconcile_logs.side_effect = lambda reconciliation, output: (
+        output.write("some logs\n")
+    )
+
+    if reconcile_status == ReconcileStatus.ERROR:
+        with pytest.raises(Exception, match="reconciliation errors"):
+            manager.handle_dry_run_resources()
+    else:
+        manager.handle_dry_run_resources()
+
+    reconciler.reconcile_resource.assert_called_once_with(reconciliation)
+    assert capsys.readouterr().out == "some logs\n"
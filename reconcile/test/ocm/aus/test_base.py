@@ -9,6 +9,9 @@ from typing import TYPE_CHECKING, Any
 from unittest.mock import ANY, create_autospec
 
 import pytest
+from requests import Response
+from requests.exceptions import ConnectionError as RequestsConnectionError
+from requests.exceptions import HTTPError
 
 from reconcile.aus import base
 from reconcile.aus.base import (
@@ -16,8 +19,10 @@ from reconcile.aus.base import (
     AddonUpgradePolicy,
     ClusterUpgradePolicy,
     ControlPlaneUpgradePolicy,
+    NodePoolUpgradePolicy,
     RosaRoleUpgradeHandlerParams,
     UpgradePolicyHandler,
+    fetch_current_state,
     get_orgs_for_environment,
 )
 from reconcile.aus.cluster_version_data import (
@@ -26,6 +31,7 @@ from reconcile.aus.cluster_version_data import (
 )
 from reconcile.aus.models import (
     ClusterUpgradeSpec,
+    NodePoolSpec,
     OrganizationUpgradeSpec,
     Sector,
 )
@@ -1229,3 +1235,104 @@ def test_aus_get_orgs_for_environment(
     )
 
     assert {o.org_id for o in orgs} == expected_org_ids
+
+
+def upgrade_policy_response(policy_id: str) -> dict[str, Any]:
+    return {
+        "id": policy_id,
+        "schedule_type": "manual",
+        "schedule": None,
+        "next_run": "2021-08-30T18:00:00Z",
+        "version": "4.13.1",
+        "state": "scheduled",
+    }
+
+
+def test_fetch_current_state_fetches_clusters_concurrently(
+    mocker: MockerFixture,
+    patch_sleep: Any,
+) -> None:
+    org = build_organization()
+    classic = build_cluster_upgrade_spec(name="classic", org=org).model_copy(
+        update={"cluster_labels": build_cluster_labels()}
+    )
+    hcp = build_cluster_upgrade_spec(
+        name="hcp",
+        org=org,
+        hypershift=True,
+        node_pools=[
+            NodePoolSpec(id="np-1", version="4.13.0"),
+            NodePoolSpec(id="np-2", version="4.13.0"),
+        ],
+    )
+    get_upgrade_policies = mocker.patch.object(
+        base,
+        "get_upgrade_policies",
+        autospec=True,
+        side_effect=[
+            RequestsConnectionError(),
+            [upgrade_policy_response("classic-policy")],
+        ],
+    )
+    mocker.patch.object(
+        base,
+        "get_control_plane_upgrade_policies",
+        autospec=True,
+        return_value=[upgrade_policy_response("cp-policy")],
+    )
+    get_node_pool_upgrade_policies = mocker.patch.object(
+        base,
+        "get_node_pool_upgrade_policies",
+        autospec=True,
+        side_effect=lambda ocm_api, cluster_id, node_pool: [
+            upgrade_policy_response(f"{node_pool}-policy")
+        ],
+    )
+    ocm_api = mocker.Mock()
+
+    current_state = fetch_current_state(
+        ocm_api,
+        OrganizationUpgradeSpec(org=org, specs=[classic, hcp]),
+        thread_pool_size=2,
+    )
+
+    assert [(type(p), p.id) for p in current_state] == [
+        (ClusterUpgradePolicy, "classic-policy"),
+        (ControlPlaneUpgradePolicy, "cp-policy"),
+        (NodePoolUpgradePolicy, "np-1-policy"),
+        (NodePoolUpgradePolicy, "np-2-policy"),
+    ]
+    assert get_upgrade_policies.call_count == 2
+    assert get_node_pool_upgrade_policies.call_count == 2
+
+
+@pytest.mark.parametrize(
+    "status_code, expected_calls",
+    [
+        (404, 1),
+        (503, 3),
+    ],
+)
+def test_fetch_current_state_retries_server_errors_only(
+    mocker: MockerFixture,
+    patch_sleep: Any,
+    status_code: int,
+    expected_calls: int,
+) -> None:
+    org = build_organization()
+    spec = build_cluster_upgrade_spec(name="classic", org=org)
+    response = Response()
+    response.status_code = status_code
+    get_upgrade_policies = mocker.patch.object(
+        base,
+        "get_upgrade_policies",
+        autospec=True,
+        side_effect=HTTPError(response=response),
+    )
+
+    with pytest.raises(HTTPError):
+        fetch_current_state(
+            mocker.Mock(), OrganizationUpgradeSpec(org=org, specs=[spec])
+        )
+
+    assert get_upgrade_policies.call_count == expected_calls
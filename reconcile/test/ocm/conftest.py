@@ -9,7 +9,7 @@ from reconcile.test.fixtures import Fixtures
 from reconcile.test.ocm.fixtures import OcmUrl
 from reconcile.utils.json import json_dumps, pydantic_encoder
 from reconcile.utils.ocm import OCM
-from reconcile.utils.ocm_base_client import OCMBaseClient
+from reconcile.utils.ocm_base_client import OCMBaseClient, access_token_cache
 
 if TYPE_CHECKING:
     from collections.abc import Callable
@@ -41,6 +41,12 @@ def ocm_auth_mock(httpserver: HTTPServer, access_token_url: str) -> None:
     })
 
 
+@pytest.fixture(autouse=True)
+def clear_access_token_cache() -> None:
+    # the token endpoint is the same for all tests, don't share tokens
+    access_token_cache.clear()
+
+
 @pytest.fixture
 def ocm_api(
     access_token_url: str,
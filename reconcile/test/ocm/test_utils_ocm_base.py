@@ -1,17 +1,25 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import threading
+from typing import TYPE_CHECKING, Any
 
 import pytest
 
 from reconcile.test.ocm.fixtures import OcmUrl
 from reconcile.test.ocm.test_utils_ocm_get_json import build_paged_ocm_response
-from reconcile.utils.ocm_base_client import USER_AGENT, OCMBaseClient
+from reconcile.utils.ocm_base_client import (
+    USER_AGENT,
+    AccessToken,
+    AccessTokenCache,
+    OCMBaseClient,
+    shared_http_adapter,
+)
 
 if TYPE_CHECKING:
     from collections.abc import Callable
 
     from pytest_httpserver import HTTPServer
+    from pytest_mock import MockerFixture
     from werkzeug import Request
 
 
@@ -83,6 +91,7 @@ def test_user_agent_header_can_be_overridden(
     assert token_requests[0].headers["User-Agent"] == custom_user_agent
 
 
+@pytest.mark.parametrize("concurrency", [1, 3])
 @pytest.mark.parametrize(
     "nr_of_items, page_size",
     [(10, 3), (10, 2), (1, 10), (10, 10)],
@@ -90,6 +99,7 @@ def test_user_agent_header_can_be_overridden(
 def test_get_json_pagination(
     nr_of_items: int,
     page_size: int,
+    concurrency: int,
     ocm_api: OCMBaseClient,
     register_ocm_url_responses: Callable[[list[OcmUrl], int], int],
     find_all_ocm_http_requests: Callable[[str, str], list[Request]],
@@ -107,7 +117,9 @@ def test_get_json_pagination(
         page_size,
     )
 
-    resp = list(ocm_api.get_paginated("/api", max_page_size=page_size))
+    resp = list(
+        ocm_api.get_paginated("/api", max_page_size=page_size, concurrency=concurrency)
+    )
 
     assert resp == [{"id": i} for i in range(nr_of_items)]
 
@@ -144,3 +156,94 @@ def test_get_json_pagination_max_pages(
 
     ocm_calls = find_all_ocm_http_requests("GET", "/api")
     assert len(ocm_calls) == max_pages
+
+
+def test_get_paginated_fetches_remaining_pages_concurrently(
+    ocm_base: OCMBaseClient, mocker: MockerFixture
+) -> None:
+    # pages 2-4 only return once all of them have been requested
+    barrier = threading.Barrier(3, timeout=5)
+
+    def get(api_path: str, params: dict[str, Any]) -> dict[str, Any]:
+        page = params.get("page", 1)
+        if page > 1:
+            barrier.wait()
+        items = [{"id": i} for i in range((page - 1) * 2, min(page * 2, 7))]
+        return {"items": items, "page": page, "size": len(items), "total": 7}
+
+    mocker.patch.object(ocm_base, "get", side_effect=get)
+
+    resp = list(ocm_base.get_paginated("/api", max_page_size=2, concurrency=3))
+
+    assert resp == [{"id": i} for i in range(7)]
+
+
+def test_access_token_is_shared_by_clients(
+    access_token_url: str,
+    ocm_url: str,
+    httpserver: HTTPServer,
+) -> None:
+    for _ in range(3):
+        OCMBaseClient(
+            access_token_client_id="some_client_id",
+            access_token_client_secret="some_client_secret",
+            access_token_url=access_token_url,
+            url=ocm_url,
+        )
+    OCMBaseClient(
+        access_token_client_id="other_client_id",
+        access_token_client_secret="some_client_secret",
+        access_token_url=access_token_url,
+        url=ocm_url,
+    )
+
+    token_requests = [req for req, _ in httpserver.log if req.url == access_token_url]
+    assert len(token_requests) == 2
+
+
+def test_unauthorized_request_is_retried_with_new_token(
+    ocm_base: OCMBaseClient,
+    httpserver: HTTPServer,
+    access_token_url: str,
+    find_all_ocm_http_requests: Callable[[str, str], list[Request]],
+) -> None:
+    httpserver.expect_oneshot_request("/api/some_path").respond_with_data(status=401)
+    httpserver.expect_request("/api/some_path").respond_with_json({"id": "1"})
+
+    assert ocm_base.get("/api/some_path") == {"id": "1"}
+
+    token_requests = [req for req, _ in httpserver.log if req.url == access_token_url]
+    assert len(token_requests) == 2
+    requests = find_all_ocm_http_requests("GET", "/api/some_path")
+    assert [r.headers["Authorization"] for r in requests] == [
+        "Bearer 1234567890",
+        "Bearer 1234567890",
+    ]
+
+
+def test_access_token_cache_refreshes_expired_tokens(mocker: MockerFixture) -> None:
+    monotonic = mocker.patch(
+        "reconcile.utils.ocm_base_client.time.monotonic", return_value=1000.0
+    )
+    cache = AccessTokenCache()
+    tokens = iter(["t1", "t2", "t3"])
+
+    def fetch() -> AccessToken:
+        return AccessToken.build(value=next(tokens), expires_in=900)
+
+    assert cache.get(("url", "id"), fetch).value == "t1"
+    monotonic.return_value = 1000.0 + 839
+    assert cache.get(("url", "id"), fetch).value == "t1"
+    monotonic.return_value = 1000.0 + 840
+    assert cache.get(("url", "id"), fetch).value == "t2"
+    # a rejected token is only refreshed once
+    assert cache.get(("url", "id"), fetch, stale="t1").value == "t2"
+    assert cache.get(("url", "id"), fetch, stale="t2").value == "t3"
+
+
+def test_clients_share_connection_pool(ocm_base: OCMBaseClient) -> None:
+    ocm_base.close()
+
+    assert ocm_base._session.get_adapter("https://api.openshift.com") is (
+        shared_http_adapter
+    )
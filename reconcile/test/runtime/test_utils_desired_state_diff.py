@@ -11,10 +11,12 @@ from reconcile.change_owners.diff import (
     Diff,
     DiffType,
 )
+from reconcile.utils.jsonpath import apply_constraint_to_path, parse_jsonpath
 from reconcile.utils.runtime import desired_state_diff
 from reconcile.utils.runtime.desired_state_diff import (
     DiffDetectionFailureError,
     DiffDetectionTimeoutError,
+    ShardPathIndex,
     build_desired_state_diff,
     extract_diffs_with_timeout,
 )
@@ -373,3 +375,83 @@ def test_find_changed_shards_no_diff() -> None:
         ).affected_shards
         == set()
     )
+
+
+#
+# shard path index
+#
+
+SHARD_INDEX_DESIRED_STATE = {
+    "accounts": [
+        {"name": "acc-a", "policies": ["p1", "p2"]},
+        {"name": "acc-b", "policies": ["p3"]},
+    ],
+    "roles": [
+        {
+            "name": "role-1",
+            "aws_groups": [{"account": {"name": "acc-a"}}],
+        },
+        {
+            "name": "role-2",
+            "aws_groups": [
+                {"account": {"name": "acc-a"}},
+                {"account": {"name": "acc-b"}},
+            ],
+        },
+    ],
+    "state": {
+        "ns-1": {"shard": "cluster-1", "data": {"x": 1}},
+        "ns-2": {"shard": "cluster-2", "data": {"x": 2}},
+    },
+}
+
+
+@pytest.mark.parametrize(
+    "selector",
+    [
+        "accounts[*].name",
+        "roles[*].aws_groups[*].account.name",
+        "state.*.shard",
+        "accounts[0].name",
+        "accounts[?(@.name == 'acc-b')].name",
+    ],
+)
+@pytest.mark.parametrize(
+    "diff_path",
+    [
+        "accounts.[0].policies.[1]",
+        "accounts.[1].name",
+        "accounts.[5]",
+        "accounts",
+        "roles.[1].aws_groups.[1].account.name",
+        "roles.[1].name",
+        "roles.[0]",
+        "state.'ns-2'.data.x",
+        "state.'ns-3'",
+        "other.[0]",
+    ],
+)
+def test_shard_path_index_matches_constraint_lookup(
+    selector: str, diff_path: str
+) -> None:
+    path = jsonpath_ng.parse(diff_path)
+    shard_path = apply_constraint_to_path(parse_jsonpath(selector), path)
+    expected = (
+        {s.value for s in shard_path.find(SHARD_INDEX_DESIRED_STATE)}
+        if shard_path
+        else set()
+    )
+
+    index = ShardPathIndex(parse_jsonpath(selector), SHARD_INDEX_DESIRED_STATE)
+
+    assert (index.shards_by_prefix is None) == ("?" in selector)
+    assert index.find_shards(path) == expected
+
+
+def test_shard_path_index_falls_back_for_filters() -> None:
+    index = ShardPathIndex(
+        parse_jsonpath("accounts[?(@.name == 'acc-b')].name"),
+        SHARD_INDEX_DESIRED_STATE,
+    )
+    assert index.shards_by_prefix is None
+    assert index.find_shards(jsonpath_ng.parse("accounts.[1].policies")) == {"acc-b"}
@@ -1,3 +1,6 @@
+import subprocess
+import sys
+
 import pytest
 from click.testing import CliRunner
 
@@ -39,3 +42,40 @@ def test_parse_image_tag_from_ref_invalid_4() -> None:
     t = ("env=main=test",)
     with pytest.raises(SystemExit):
         reconcile_cli.parse_image_tag_from_ref(None, None, t)
+
+
+def _imported_modules(code: str) -> set[str]:
+    """Modules imported by a fresh interpreter running code, from the
+    -X importtime report on stderr."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    return {
+        line.rsplit("|", 1)[-1].strip()
+        for line in result.stderr.splitlines()
+        if line.startswith("import time:") and "|" in line
+    }
+
+
+def test_help_does_not_import_integrations() -> None:
+    modules = _imported_modules(
+        "from reconcile.cli import integration\n"
+        "try:\n"
+        "    integration(['--help'])\n"
+        "except SystemExit:\n"
+        "    pass\n"
+    )
+
+    assert "reconcile.cli" in modules
+    for module in [
+        "reconcile.openshift_resources",
+        "reconcile.utils.runtime.runner",
+        "reconcile.utils.gql",
+        "sentry_sdk",
+        "terrascript",
+        "UnleashClient",
+    ]:
+        assert module not in modules
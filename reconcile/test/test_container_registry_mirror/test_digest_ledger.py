@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+import pytest
+
+from reconcile.container_registry_mirror.digest_ledger import DigestLedger
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+NOW = 1662124612.995397
+
+
+def test_recorded_digest_is_synced(tmp_path: Path) -> None:
+    ledger = DigestLedger(str(tmp_path / "ledger.json"))
+    ledger.record("sha256:a", "quay.io/org/image:v1")
+
+    assert ledger.is_synced("sha256:a", "quay.io/org/image:v1")
+    assert not ledger.is_synced("sha256:b", "quay.io/org/image:v1")
+    assert not ledger.is_synced("sha256:a", "quay.io/org/image:v2")
+
+
+def test_ledger_survives_restarts(tmp_path: Path) -> None:
+    path = str(tmp_path / "ledger.json")
+    ledger = DigestLedger(path)
+    ledger.record("sha256:a", "quay.io/org/image:v1")
+    ledger.save()
+
+    restored = DigestLedger(path)
+
+    assert len(restored) == 1
+    assert restored.is_synced("sha256:a", "quay.io/org/image:v1")
+
+
+def test_expired_entries_are_not_trusted_nor_saved(tmp_path: Path) -> None:
+    path = str(tmp_path / "ledger.json")
+    ledger = DigestLedger(path, max_age=100)
+    with patch("time.time", return_value=NOW - 200):
+        ledger.record("sha256:a", "quay.io/org/image:v1")
+    with patch("time.time", return_value=NOW):
+        ledger.record("sha256:b", "quay.io/org/image:v2")
+
+        assert not ledger.is_synced("sha256:a", "quay.io/org/image:v1")
+
+        ledger.save()
+
+    assert list(json.loads((tmp_path / "ledger.json").read_text())["entries"]) == [
+        "quay.io/org/image:v2"
+    ]
+
+
+@pytest.mark.parametrize(
+    "content",
+    ["", "not json", '{"version": 1, "entries": {"ref": "digest"}}', '{"version": 0}'],
+)
+def test_unreadable_ledger_is_empty(tmp_path: Path, content: str) -> None:
+    path = tmp_path / "ledger.json"
+    path.write_text(content)
+
+    assert len(DigestLedger(str(path))) == 0
+
+
+def test_from_dir(tmp_path: Path) -> None:
+    ledger = DigestLedger.from_dir(str(tmp_path), "ledger.json")
+
+    assert ledger.path == str(tmp_path / "ledger.json")
+
+
+def test_from_dir_missing_dir() -> None:
+    with pytest.raises(FileNotFoundError):
+        DigestLedger.from_dir("/nonexistent/dir", "ledger.json")
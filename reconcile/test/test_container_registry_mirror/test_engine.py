@@ -1,5 +1,9 @@
 from __future__ import annotations
 
+import threading
+import time
+from collections import Counter
+from typing import TYPE_CHECKING, Any
 from unittest.mock import (
     MagicMock,
     patch,
@@ -13,9 +17,14 @@ from sretoolbox.container.image import (
 from sretoolbox.container.skopeo import SkopeoCmdError
 
 from reconcile.container_registry_mirror.deep_sync_timer import DeepSyncTimer
-from reconcile.container_registry_mirror.engine import MirrorEngine
+from reconcile.container_registry_mirror.digest_ledger import DigestLedger
+from reconcile.container_registry_mirror.engine import MirrorEngine, registry_of
 from reconcile.container_registry_mirror.mirror_spec import MirrorSpec
 
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
 
 def _make_spec(
     source_url: str = "docker.io/upstream/image",
@@ -873,3 +882,255 @@ class TestTimerRecordOnSuccess:
             engine.sync([spec])
 
         timer.record.assert_not_called()
+
+
+class FakeRegistry:
+    """In-memory registry serving repositories of tag -> digest, counting
+    manifest fetches. Every request takes `latency` seconds."""
+
+    def __init__(self, name: str, latency: float = 0.0) -> None:
+        self.name = name
+        self.latency = latency
+        self.repos: dict[str, dict[str, str]] = {}
+        self.manifest_fetches = 0
+        self._lock = threading.Lock()
+
+    def fetch_manifest(self, repo: str, tag: str) -> str:
+        time.sleep(self.latency)
+        with self._lock:
+            self.manifest_fetches += 1
+        return self.repos[repo][tag]
+
+
+class FakeImage:
+    """Just enough of sretoolbox's Image for the engine."""
+
+    def __init__(self, registry: FakeRegistry, repo: str, tag: str | None = None):
+        self.registry = registry
+        self.repo = repo
+        self.tag = tag
+        self._digest: str | None = None
+
+    def __iter__(self) -> Iterator[str]:
+        time.sleep(self.registry.latency)
+        return iter(list(self.registry.repos.get(self.repo, {})))
+
+    def __contains__(self, tag: str) -> bool:
+        return tag in self.registry.repos.get(self.repo, {})
+
+    def __getitem__(self, tag: str) -> FakeImage:
+        return FakeImage(self.registry, self.repo, tag)
+
+    def __str__(self) -> str:
+        return f"{self.registry.name}/{self.repo}:{self.tag}"
+
+    @property
+    def digest(self) -> str:
+        if self._digest is None:
+            assert self.tag
+            self._digest = self.registry.fetch_manifest(self.repo, self.tag)
+        return self._digest
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, FakeImage) and self.digest == other.digest
+
+    def __hash__(self) -> int:
+        return hash(str(self))
+
+    def is_part_of(self, other: FakeImage) -> bool:
+        raise ImageContainsError()
+
+
+class FakeSkopeo:
+    """Copies between fake registries, taking `latency` seconds per copy
+    and tracking the peak number of concurrent copies per registry."""
+
+    def __init__(self, registries: list[FakeRegistry], latency: float = 0.0):
+        self.registries = {r.name: r for r in registries}
+        self.latency = latency
+        self.copies: list[str] = []
+        self.in_flight: Counter[str] = Counter()
+        self.peak: Counter[str] = Counter()
+        self._lock = threading.Lock()
+
+    def _parse(self, ref: str) -> tuple[FakeRegistry, str, str]:
+        name, _, rest = ref.partition("/")
+        repo, _, tag = rest.rpartition(":")
+        return self.registries[name], repo, tag
+
+    def copy(
+        self, src_image: str, src_creds: str | None, dst_image: str, dest_creds: str
+    ) -> None:
+        src, src_repo, src_tag = self._parse(src_image)
+        dst, dst_repo, dst_tag = self._parse(dst_image)
+        with self._lock:
+            for name in {src.name, dst.name}:
+                self.in_flight[name] += 1
+                self.peak[name] = max(self.peak[name], self.in_flight[name])
+        time.sleep(self.latency)
+        with self._lock:
+            for name in {src.name, dst.name}:
+                self.in_flight[name] -= 1
+            self.copies.append(dst_image)
+            dst.repos.setdefault(dst_repo, {})[dst_tag] = src.repos[src_repo][src_tag]
+
+
+def _fake_engine(
+    skopeo: FakeSkopeo, ledger: DigestLedger | None = None, **kwargs: Any
+) -> MirrorEngine:
+    engine = MirrorEngine(skopeo=skopeo, ledger=ledger, **kwargs)
+
+    def build_images(spec: MirrorSpec) -> tuple[FakeImage, FakeImage]:
+        src_name, _, src_repo = spec.source_url.partition("/")
+        dst_name, _, dst_repo = spec.destination_url.partition("/")
+        return (
+            FakeImage(skopeo.registries[src_name], src_repo),
+            FakeImage(skopeo.registries[dst_name], dst_repo),
+        )
+
+    engine._build_images = build_images  # type: ignore[method-assign]
+    return engine
+
+
+def _fake_mirror_set(
+    nr_repos: int, nr_tags: int, latency: float = 0.0
+) -> tuple[list[FakeRegistry], list[MirrorSpec]]:
+    upstream = FakeRegistry("docker.io", latency)
+    ghcr = FakeRegistry("ghcr.io", latency)
+    quay = FakeRegistry("quay.io", latency)
+    specs = []
+    for i in range(nr_repos):
+        source = upstream if i % 2 else ghcr
+        source.repos[f"upstream/image-{i}"] = {
+            f"v{t}": f"sha256:{i}-{t}" for t in range(nr_tags)
+        }
+        specs.append(
+            _make_spec(
+                source_url=f"{source.name}/upstream/image-{i}",
+                destination_url=f"quay.io/org/image-{i}",
+            )
+        )
+    return [upstream, ghcr, quay], specs
+
+
+class TestConcurrentSync:
+    """With a worker pool, tags are synced concurrently, capped per
+    registry, with the same result as a sequential sync."""
+
+    def test_pool_syncs_everything_concurrently(self) -> None:
+        registries, specs = _fake_mirror_set(nr_repos=4, nr_tags=5)
+        sequential = FakeSkopeo(registries, latency=0.02)
+        _fake_engine(sequential).sync(specs)
+
+        registries, specs = _fake_mirror_set(nr_repos=4, nr_tags=5)
+        pooled = FakeSkopeo(registries, latency=0.02)
+        _fake_engine(pooled, thread_pool_size=10).sync(specs)
+
+        assert sorted(pooled.copies) == sorted(sequential.copies)
+        assert len(pooled.copies) == 20
+        assert registries[2].repos == {
+            f"org/image-{i}": {f"v{t}": f"sha256:{i}-{t}" for t in range(5)}
+            for i in range(4)
+        }
+        assert sequential.peak["quay.io"] == 1
+        assert pooled.peak["quay.io"] > 1
+
+    def test_jobs_per_registry_are_capped(self) -> None:
+        registries, specs = _fake_mirror_set(nr_repos=6, nr_tags=4)
+        skopeo = FakeSkopeo(registries, latency=0.01)
+
+        _fake_engine(skopeo, thread_pool_size=10, max_jobs_per_registry=2).sync(specs)
+
+        assert len(skopeo.copies) == 24
+        assert skopeo.peak["quay.io"] == 2
+        assert skopeo.peak["docker.io"] <= 2
+        assert skopeo.peak["ghcr.io"] <= 2
+
+    def test_copy_failures_are_collected(self) -> None:
+        class FailingSkopeo(FakeSkopeo):
+            def copy(
+                self,
+                src_image: str,
+                src_creds: str | None,
+                dst_image: str,
+                dest_creds: str,
+            ) -> None:
+                if dst_image.endswith(":v1"):
+                    raise SkopeoCmdError("copy failed")
+                super().copy(src_image, src_creds, dst_image, dest_creds)
+
+        registries, specs = _fake_mirror_set(nr_repos=2, nr_tags=3)
+        skopeo = FailingSkopeo(registries)
+
+        with pytest.raises(ExceptionGroup) as exc_info:
+            _fake_engine(skopeo, thread_pool_size=4).sync(specs)
+
+        assert len(exc_info.value.exceptions) == 2
+        assert len(skopeo.copies) == 4
+
+
+class TestDigestLedger:
+    """A deep sync skips the destination round-trip for tags whose
+    source digest the ledger already recorded for the destination."""
+
+    def test_second_deep_sync_skips_destination(self, tmp_path: Path) -> None:
+        registries, specs = _fake_mirror_set(nr_repos=3, nr_tags=4)
+        upstream, ghcr, quay = registries
+        skopeo = FakeSkopeo(registries)
+        path = str(tmp_path / "ledger.json")
+        # the first, fast, sync creates all tags at the destination
+        _fake_engine(skopeo, DigestLedger(path)).sync(specs)
+
+        # the first deep sync compares every tag and fills the ledger
+        _fake_engine(skopeo, DigestLedger(path), is_deep_sync=True).sync(specs)
+        assert quay.manifest_fetches == 12
+
+        # an upstream tag moved, only that one is compared and copied
+        ghcr.repos["upstream/image-0"]["v0"] = "sha256:moved"
+        _fake_engine(skopeo, DigestLedger(path), is_deep_sync=True).sync(specs)
+
+        assert quay.manifest_fetches == 13
+        assert upstream.manifest_fetches + ghcr.manifest_fetches == 24
+        assert skopeo.copies.count("quay.io/org/image-0:v0") == 2
+        assert quay.repos["org/image-0"]["v0"] == "sha256:moved"
+        assert len(DigestLedger(path)) == 12
+
+    def test_drift_is_copied_and_recorded(self, tmp_path: Path) -> None:
+        registries, specs = _fake_mirror_set(nr_repos=1, nr_tags=1)
+        quay = registries[2]
+        quay.repos["org/image-0"] = {"v0": "sha256:stale"}
+        skopeo = FakeSkopeo(registries)
+        ledger = DigestLedger(str(tmp_path / "ledger.json"))
+
+        _fake_engine(skopeo, ledger, is_deep_sync=True).sync(specs)
+
+        assert skopeo.copies == ["quay.io/org/image-0:v0"]
+        assert ledger.is_synced("sha256:0-0", "quay.io/org/image-0:v0")
+
+    def test_dry_run_does_not_write_ledger(self, tmp_path: Path) -> None:
+        registries, specs = _fake_mirror_set(nr_repos=1, nr_tags=2)
+        registries[2].repos["org/image-0"] = {"v0": "sha256:0-0", "v1": "sha256:0-1"}
+        path = tmp_path / "ledger.json"
+
+        _fake_engine(
+            FakeSkopeo(registries),
+            DigestLedger(str(path)),
+            is_deep_sync=True,
+            dry_run=True,
+        ).sync(specs)
+
+        assert not path.exists()
+
+
+@pytest.mark.parametrize(
+    ("url", "registry"),
+    [
+        ("quay.io/org/image", "quay.io"),
+        ("registry.example.com:5000/image", "registry.example.com:5000"),
+        ("localhost/image", "localhost"),
+        ("library/nginx", "docker.io"),
+        ("nginx", "docker.io"),
+    ],
+)
+def test_registry_of(url: str, registry: str) -> None:
+    assert registry_of(url) == registry
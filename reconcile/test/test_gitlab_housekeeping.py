@@ -1821,6 +1821,97 @@ def test_preprocess_merge_requests_includes_unmergeable_when_flag_set(
     assert results[0]["mr"] is mr
 
 
+def test_preprocess_merge_requests_uses_graphql_commit_counts(
+    state: Mock,
+    project: Project,
+    add_lgtm_merge_request_resource_label_event: ProjectMergeRequestResourceLabelEvent,
+) -> None:
+    mrs = []
+    for iid in range(1, 4):
+        mr = create_autospec(ProjectMergeRequest)
+        mr.merge_status = "can_be_merged"
+        mr.draft = False
+        mr.labels = ["lgtm"]
+        mr.iid = iid
+        mrs.append(mr)
+
+    mocked_gl = create_autospec(GitLabApi)
+    mocked_gl.project = project
+    mocked_gl.get_merge_request_commit_counts.return_value = {1: 1, 2: 0, 3: 2}
+    mocked_gl.get_merge_request_label_events.return_value = [
+        add_lgtm_merge_request_resource_label_event
+    ]
+
+    results = gl_h.preprocess_merge_requests(
+        dry_run=False,
+        gl=mocked_gl,
+        project_merge_requests=mrs,
+        state=state,
+        users_allowed_to_label=None,
+    )
+
+    assert [r["mr"] for r in results] == [mrs[0], mrs[2]]
+    for mr in mrs:
+        mr.commits.assert_not_called()
+    # no label events for the MR without commits
+    assert sorted(
+        c.args[0].iid for c in mocked_gl.get_merge_request_label_events.call_args_list
+    ) == [1, 3]
+
+
+def test_preprocess_merge_requests_fetches_label_events_after_filtering(
+    state: Mock,
+    project: Project,
+    add_lgtm_merge_request_resource_label_event: ProjectMergeRequestResourceLabelEvent,
+) -> None:
+    mrs = []
+    for iid, labels in enumerate(
+        [["lgtm"], [], [gl_h.SELF_SERVICEABLE, "lgtm"], ["lgtm"]], start=1
+    ):
+        mr = create_autospec(ProjectMergeRequest)
+        mr.merge_status = "can_be_merged"
+        mr.draft = False
+        mr.labels = labels
+        mr.iid = iid
+        mrs.append(mr)
+
+    mocked_gl = create_autospec(GitLabApi)
+    mocked_gl.project = project
+    mocked_gl.get_merge_request_commit_counts.return_value = {mr.iid: 1 for mr in mrs}
+    mocked_gl.get_merge_request_label_events.return_value = [
+        add_lgtm_merge_request_resource_label_event
+    ]
+
+    results = gl_h.preprocess_merge_requests(
+        dry_run=True,
+        gl=mocked_gl,
+        project_merge_requests=mrs,
+        state=state,
+    )
+
+    assert [r["mr"] for r in results] == [mrs[0], mrs[3]]
+    assert sorted(
+        c.args[0].iid for c in mocked_gl.get_merge_request_label_events.call_args_list
+    ) == [1, 4]
+
+
+def test_prefetch_commit_counts_falls_back_to_rest(project: Project) -> None:
+    mrs = []
+    for iid, commit_count in [(1, 2), (2, 0)]:
+        mr = create_autospec(ProjectMergeRequest)
+        mr.iid = iid
+        mr.commits.return_value = [create_autospec(ProjectCommit)] * commit_count
+        mrs.append(mr)
+
+    mocked_gl = create_autospec(GitLabApi)
+    mocked_gl.project = project
+    mocked_gl.get_merge_request_commit_counts.side_effect = GitlabGetError()
+
+    commit_counts = gl_h.prefetch_commit_counts(mocked_gl, mrs, thread_pool_size=2)
+
+    assert commit_counts == {1: 2, 2: 0}
+
+
 class TestMergeErrorCycleEndToEnd:
     """End-to-end test for the silent merge-error label flow.
 
@@ -34,12 +34,12 @@ class TestOCMAdditionalRouters(TestCase):
 
     @patch.object(queries, "get_app_interface_settings")
     @patch.object(queries, "get_clusters")
-    @patch.object(OCMMap, "init_ocm_client_from_cluster")
+    @patch.object(OCMMap, "init_ocm_clients")
     @patch.object(OCMMap, "get")
     def test_integ(
         self,
         get: Mock,
-        init_ocm_client_from_cluster: Mock,
+        init_ocm_clients: Mock,
         get_clusters: Mock,
         get_app_interface_settings: Mock,
     ) -> None:
@@ -67,18 +67,20 @@ class TestOCMAdditionalRouters(TestCase):
 
     # unit test
     @patch.object(queries, "get_app_interface_settings")
-    @patch.object(OCMMap, "init_ocm_client_from_cluster")
+    @patch.object(OCMMap, "init_ocm_clients")
     @patch.object(OCMMap, "get")
     def test_current_state(
         self,
         get: Mock,
-        init_ocm_client_from_cluster: Mock,
+        init_ocm_clients: Mock,
         get_app_interface_settings: Mock,
     ) -> None:
         fixture = fxt.get_anymarkup("state.yml")
 
         ocm_api = fixture["ocm_api"]
-        clusters: list[Mapping[str, Any]] = [{"name": c} for c in ocm_api]
+        clusters: list[Mapping[str, Any]] = [
+            {"name": c, "ocm": {"name": "ocm-production"}} for c in ocm_api
+        ]
         ocm = get.return_value
         ocm.get_additional_routers.side_effect = lambda x: fixture["ocm_api"][x]
 
@@ -105,9 +107,9 @@ class TestOCMAdditionalRouters(TestCase):
         expected = fixture["diffs"]
         self.assertEqual(diffs, expected)
 
-    @patch.object(OCMMap, "init_ocm_client_from_cluster")
+    @patch.object(OCMMap, "init_ocm_clients")
     @patch.object(OCMMap, "get")
-    def test_act(self, get: Mock, init_ocm_client_from_cluster: Mock) -> None:
+    def test_act(self, get: Mock, init_ocm_clients: Mock) -> None:
         fixture = fxt.get_anymarkup("state.yml")
         ocm = get.return_value
 
@@ -359,7 +359,7 @@ def ocmmap_mock(
     ocm_osd_cluster_spec: OCMSpec, ocm_mock: tuple[Mock, Mock]
 ) -> Generator[tuple[Mock, Mock]]:
     with patch.object(OCMMap, "get", autospec=True) as get:
-        with patch.object(OCMMap, "init_ocm_client_from_cluster", autospec=True):
+        with patch.object(OCMMap, "init_ocm_clients", autospec=True):
             with patch.object(OCMMap, "cluster_specs", autospec=True) as cs:
                 get.return_value = ocm_mock
                 cs.return_value = ({"cluster1": ocm_osd_cluster_spec}, {})
@@ -1,4 +1,6 @@
-from typing import Any
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
 from unittest.mock import (
     MagicMock,
     create_autospec,
@@ -17,10 +19,13 @@ from reconcile.prometheus_rules_tester.integration import (
     run,
 )
 from reconcile.status import ExitCodes
-from reconcile.utils import gql
+from reconcile.utils import gql, promtool
 
 from .fixtures import Fixtures
 
+if TYPE_CHECKING:
+    from pathlib import Path
+
 THREAD_POOL_SIZE = 2
 
 
@@ -65,12 +70,17 @@ class TestPrometheusRulesTester:
         """cleanup patches created in setup_method"""
         self.gql_patcher.stop()
 
-    def run_check(self, cluster_name: str | None = None) -> list[PTest]:
+    def run_check(
+        self,
+        cluster_name: str | None = None,
+        result_cache: promtool.ResultCache | None = None,
+    ) -> list[PTest]:
         return check_rules_and_tests(
             vault_settings=self.vault_settings,
             alerting_services=self.alerting_services,
             thread_pool_size=THREAD_POOL_SIZE,
             cluster_names=cluster_name,
+            result_cache=result_cache,
         )
 
     def test_ok_non_templated(self) -> None:
@@ -153,3 +163,39 @@ class TestPrometheusRulesTester:
             f"cluster {cluster_name[0]}: Error running promtool command"
         )
         assert error_msg in caplog.text
+
+    @patch("reconcile.prometheus_rules_tester.integration.check_rules_and_tests")
+    @patch("reconcile.prometheus_rules_tester.integration.get_alerting_services")
+    @patch(
+        "reconcile.prometheus_rules_tester.integration.get_app_interface_vault_settings"
+    )
+    def test_run_result_cache_opt_in(
+        self,
+        mocker_vault_settings: MagicMock,
+        mocker_alerting_services: MagicMock,
+        mocker_check: MagicMock,
+        tmp_path: Path,
+    ) -> None:
+        mocker_check.return_value = []
+
+        run(False, THREAD_POOL_SIZE)
+        assert mocker_check.call_args.kwargs["result_cache"] is None
+
+        run(False, THREAD_POOL_SIZE, result_cache_dir=str(tmp_path))
+        result_cache = mocker_check.call_args.kwargs["result_cache"]
+        assert result_cache.path == str(tmp_path / promtool.RESULT_CACHE_FILE_NAME)
+
+    def test_result_cache_skips_unchanged_tests(
+        self, fake_promtool: Path, tmp_path: Path
+    ) -> None:
+        self.ns_data = self.fxt.get_anymarkup("2-ns-ok-non-templated.yaml")
+
+        result_cache = promtool.ResultCache.from_dir(str(tmp_path))
+        assert self.run_check(result_cache=result_cache) == []
+        calls = fake_promtool.read_text(encoding="utf-8").splitlines()
+        assert calls
+
+        # a later run (or MR check) loads the saved results
+        result_cache = promtool.ResultCache.from_dir(str(tmp_path))
+        assert self.run_check(result_cache=result_cache) == []
+        assert fake_promtool.read_text(encoding="utf-8").splitlines() == calls
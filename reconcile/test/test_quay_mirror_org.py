@@ -1,19 +1,28 @@
 from __future__ import annotations
 
+import json
 import os
 import tempfile
-from typing import TYPE_CHECKING
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import TYPE_CHECKING, Any
 from unittest.mock import MagicMock, patch
+from urllib.parse import parse_qs, urlparse
 
 import pytest
+from sretoolbox.container.image import ImageContainsError
 from sretoolbox.container.skopeo import SkopeoCmdError
 
+from reconcile.quay_base import OrgKey, QuayApiStore
 from reconcile.quay_mirror_org import (
     CONTROL_FILE_NAME,
     QuayMirrorOrg,
 )
+from reconcile.utils.quay_api import QuayApi
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
     from unittest.mock import Mock
 
     from pytest_mock import MockerFixture
@@ -171,3 +180,237 @@ def test_run_raises_exception_group_on_skopeo_error(
     assert mock_skopeo.copy.call_count == 2
     assert len(exc_info.value.exceptions) == 1
     assert isinstance(exc_info.value.exceptions[0], SkopeoCmdError)
+
+
+class FakeQuay(ThreadingHTTPServer):
+    """Quay API stand-in serving the repositories and tags of one org,
+    taking `latency` seconds per request. Registry (manifest) requests
+    are counted and answered with 404."""
+
+    latency = 0.0
+    repos: dict[str, dict[str, str]]
+    tag_requests: int
+    manifest_requests: int
+
+
+class FakeQuayHandler(BaseHTTPRequestHandler):
+    server: FakeQuay
+
+    def do_GET(self) -> None:
+        time.sleep(self.server.latency)
+        url = urlparse(self.path)
+        query = {k: v[0] for k, v in parse_qs(url.query).items()}
+        if url.path.startswith("/v2/"):
+            self.server.manifest_requests += 1
+            self.send_error(404)
+            return
+        if url.path == "/api/v1/repository":
+            body: dict[str, Any] = {
+                "repositories": [{"name": name} for name in self.server.repos]
+            }
+        else:
+            # /api/v1/repository/<org>/<repo>/tag/
+            repo = url.path.split("/")[5]
+            self.server.tag_requests += 1
+            limit, page = int(query["limit"]), int(query["page"])
+            tags = list(self.server.repos[repo].items())
+            body = {
+                "tags": [
+                    {"name": name, "manifest_digest": digest}
+                    for name, digest in tags[(page - 1) * limit : page * limit]
+                ],
+                "has_additional": page * limit < len(tags),
+            }
+        content = json.dumps(body).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, *args: object) -> None:
+        pass
+
+
+def _start_fake_quay(latency: float) -> FakeQuay:
+    server = FakeQuay(("127.0.0.1", 0), FakeQuayHandler)
+    server.latency = latency
+    server.repos = {}
+    server.tag_requests = 0
+    server.manifest_requests = 0
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+@pytest.fixture
+def fake_quays() -> Iterator[tuple[FakeQuay, FakeQuay]]:
+    """An upstream and a downstream Quay instance."""
+    servers = (_start_fake_quay(0.005), _start_fake_quay(0.005))
+    yield servers
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
+def _mirror_org(fake_quays: tuple[FakeQuay, FakeQuay], **kwargs: Any) -> QuayMirrorOrg:
+    upstream, downstream = fake_quays
+    upstream_key = OrgKey("upstream", "org")
+    store = QuayApiStore({
+        upstream_key: {
+            "url": f"127.0.0.1:{upstream.server_address[1]}",
+            "push_token": {"user": "upstream-user", "token": "upstream-token"},
+            "teams": [],
+            "managedRepos": False,
+            "managedRobotAccounts": False,
+            "mirror": None,
+            "mirror_filters": {},
+            "api": QuayApi(
+                "token",
+                "org",
+                base_url=f"http://127.0.0.1:{upstream.server_address[1]}",
+            ),
+        },
+        OrgKey("downstream", "org"): {
+            "url": f"127.0.0.1:{downstream.server_address[1]}",
+            "push_token": {"user": "user", "token": "token"},
+            "teams": [],
+            "managedRepos": False,
+            "managedRobotAccounts": False,
+            "mirror": upstream_key,
+            "mirror_filters": {},
+            "api": QuayApi(
+                "token",
+                "org",
+                base_url=f"http://127.0.0.1:{downstream.server_address[1]}",
+            ),
+        },
+    })
+    with (
+        patch("reconcile.quay_mirror_org.get_quay_api_store", return_value=store),
+        patch("reconcile.quay_mirror_org.Skopeo"),
+    ):
+        return QuayMirrorOrg(dry_run=True, compare_tags=True, **kwargs)
+
+
+def _populate(
+    fake_quays: tuple[FakeQuay, FakeQuay], nr_repos: int, nr_tags: int
+) -> None:
+    """Mirror `nr_repos` repositories of `nr_tags` tags, the last 10 tags
+    of each repository are missing downstream."""
+    upstream, downstream = fake_quays
+    for i in range(nr_repos):
+        tags = {f"v{t}": f"sha256:{i}-{t}" for t in range(nr_tags)}
+        upstream.repos[f"repo-{i}"] = tags
+        downstream.repos[f"repo-{i}"] = dict(list(tags.items())[:-10])
+
+
+def test_sync_tasks_diff_by_digest(fake_quays: tuple[FakeQuay, FakeQuay]) -> None:
+    _populate(fake_quays, nr_repos=2, nr_tags=250)
+    qm = _mirror_org(fake_quays, thread_pool_size=2)
+
+    with patch.object(QuayMirrorOrg, "is_compare_tags", True):
+        sync_tasks = qm.process_sync_tasks()
+
+    tasks = sync_tasks[OrgKey("downstream", "org")]
+    upstream_url = f"127.0.0.1:{fake_quays[0].server_address[1]}"
+    assert len(tasks) == 20
+    assert tasks[0] == {
+        "mirror_url": f"docker://{upstream_url}/org/repo-0:v240",
+        "mirror_creds": "upstream-user:upstream-token",
+        "image_url": f"docker://127.0.0.1:{fake_quays[1].server_address[1]}"
+        "/org/repo-0:v240",
+    }
+    # 3 pages of 100 tags per repository on either side, no manifest fetches
+    assert fake_quays[0].tag_requests == fake_quays[1].tag_requests == 6
+    assert fake_quays[0].manifest_requests == fake_quays[1].manifest_requests == 0
+
+
+def test_sync_tasks_compare_manifests_of_changed_digests_only(
+    fake_quays: tuple[FakeQuay, FakeQuay],
+) -> None:
+    _populate(fake_quays, nr_repos=1, nr_tags=20)
+    fake_quays[1].repos["repo-0"]["v0"] = "sha256:single-arch-copy"
+    fake_quays[1].repos["repo-0"]["v1"] = "sha256:outdated"
+    qm = _mirror_org(fake_quays)
+    compared: list[str] = []
+
+    class FakeImage:
+        def __init__(self, url: str, **_: Any) -> None:
+            self.url = url
+
+        def __getitem__(self, tag: str) -> FakeImage:
+            return FakeImage(f"{self.url}:{tag}")
+
+        def __str__(self) -> str:
+            return self.url
+
+        def __eq__(self, other: object) -> bool:
+            compared.append(self.url)
+            return False
+
+        def is_part_of(self, other: FakeImage) -> bool:
+            if self.url.endswith(":v0"):
+                return True
+            raise ImageContainsError()
+
+    with patch("reconcile.quay_mirror_org.Image", FakeImage):
+        tasks = qm.process_sync_tasks()[OrgKey("downstream", "org")]
+
+    assert [c.rpartition(":")[2] for c in compared] == ["v0", "v1"]
+    assert [t["image_url"].rpartition(":")[2] for t in tasks] == [
+        "v1",
+        *(f"v{t}" for t in range(10, 20)),
+    ]
+
+
+def test_run_copies_with_bounded_pool(
+    quay_mirror_org_instance: tuple[QuayMirrorOrg, MagicMock],
+    mocker: MockerFixture,
+) -> None:
+    qm, mock_skopeo = quay_mirror_org_instance
+    qm.copy_pool_size = 3
+    org_key = ("quay.io", "test-org")
+    tasks = [
+        {
+            "mirror_url": f"docker.io/foo:{i}",
+            "mirror_creds": None,
+            "image_url": f"quay.io/test-org/foo:{i}",
+        }
+        for i in range(12)
+    ]
+    mocker.patch.object(qm, "process_sync_tasks", return_value={org_key: tasks})
+    mocker.patch.object(qm, "get_push_creds", return_value="user:token")
+    lock = threading.Lock()
+    in_flight = peak = 0
+
+    def copy(**_: Any) -> None:
+        nonlocal in_flight, peak
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+        time.sleep(0.01)
+        with lock:
+            in_flight -= 1
+
+    mock_skopeo.copy.side_effect = copy
+
+    qm.run()
+
+    assert mock_skopeo.copy.call_count == 12
+    assert peak == 3
+
+
+def test_sync_tasks_diff_10k_tags_by_tag_pages(
+    fake_quays: tuple[FakeQuay, FakeQuay],
+) -> None:
+    """4 repositories of 2500 tags: 25 tag pages per repository and side
+    instead of 2 manifest lookups per tag."""
+    _populate(fake_quays, nr_repos=4, nr_tags=2500)
+    qm = _mirror_org(fake_quays, thread_pool_size=4)
+
+    with patch.object(QuayMirrorOrg, "is_compare_tags", True):
+        tasks = qm.process_sync_tasks()[OrgKey("downstream", "org")]
+
+    assert len(tasks) == 40
+    assert fake_quays[0].tag_requests == fake_quays[1].tag_requests == 4 * 25
+    assert fake_quays[0].manifest_requests == fake_quays[1].manifest_requests == 0
@@ -1,8 +1,19 @@
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 import click
+import pytest
+
+from reconcile.run_integration import UnchangedRunSkipper, build_entry_point_args
+from reconcile.status import ExitCodes
 
-from reconcile.run_integration import build_entry_point_args
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from pathlib import Path
+
+    from pytest_httpserver import HTTPServer
+    from pytest_mock import MockerFixture
 
 
 @click.group()
@@ -48,3 +59,103 @@ def test_build_entry_point_args_keeps_quoted_arg_with_spaces_as_one_token() -> N
         "--keycloak-instances",
         '{"url": "https://example.com", "secret": {"a": "b"}}',
     ]
+
+
+@pytest.fixture
+def bundle_sha(httpserver: HTTPServer) -> Callable[[str], None]:
+    """Fake qontract-server serving a controllable bundle SHA."""
+
+    def set_sha(sha: str) -> None:
+        httpserver.clear()
+        httpserver.expect_request("/sha256").respond_with_data(sha)
+
+    set_sha("sha-1")
+    return set_sha
+
+
+@pytest.fixture
+def skipper(httpserver: HTTPServer, tmp_path: Path) -> UnchangedRunSkipper:
+    config = tmp_path / "config.toml"
+    config.write_text(
+        f'[graphql]\nserver = "{httpserver.url_for("/graphql")}"\n', encoding="utf-8"
+    )
+    return UnchangedRunSkipper(str(config), forced_refresh_secs=3600)
+
+
+def test_unchanged_run_skipper_first_run(
+    skipper: UnchangedRunSkipper, bundle_sha: Callable[[str], None]
+) -> None:
+    assert not skipper.should_skip(skipper.fingerprint(["--dry-run"]))
+
+
+def test_unchanged_run_skipper_skips_unchanged(
+    skipper: UnchangedRunSkipper, bundle_sha: Callable[[str], None]
+) -> None:
+    skipper.record_run(skipper.fingerprint(["--dry-run"]), ExitCodes.SUCCESS)
+
+    assert skipper.should_skip(skipper.fingerprint(["--dry-run"]))
+    assert not skipper.should_skip(skipper.fingerprint(["--no-dry-run"]))
+
+
+def test_unchanged_run_skipper_runs_on_new_sha(
+    skipper: UnchangedRunSkipper, bundle_sha: Callable[[str], None]
+) -> None:
+    skipper.record_run(skipper.fingerprint([]), ExitCodes.SUCCESS)
+    bundle_sha("sha-2")
+
+    fingerprint = skipper.fingerprint([])
+    assert not skipper.should_skip(fingerprint)
+    skipper.record_run(fingerprint, ExitCodes.SUCCESS)
+    assert skipper.should_skip(skipper.fingerprint([]))
+
+
+def test_unchanged_run_skipper_runs_after_failure(
+    skipper: UnchangedRunSkipper, bundle_sha: Callable[[str], None]
+) -> None:
+    skipper.record_run(skipper.fingerprint([]), ExitCodes.ERROR)
+
+    assert not skipper.should_skip(skipper.fingerprint([]))
+
+
+def test_unchanged_run_skipper_forced_refresh(
+    skipper: UnchangedRunSkipper,
+    bundle_sha: Callable[[str], None],
+    mocker: MockerFixture,
+) -> None:
+    monotonic = mocker.patch("reconcile.run_integration.time.monotonic")
+    monotonic.return_value = 1000.0
+    skipper.record_run(skipper.fingerprint([]), ExitCodes.SUCCESS)
+
+    monotonic.return_value = 1000.0 + 3599
+    assert skipper.should_skip(skipper.fingerprint([]))
+    monotonic.return_value = 1000.0 + 3600
+    assert not skipper.should_skip(skipper.fingerprint([]))
+
+
+def test_unchanged_run_skipper_external_fingerprints(
+    httpserver: HTTPServer,
+    skipper: UnchangedRunSkipper,
+    bundle_sha: Callable[[str], None],
+) -> None:
+    skipper.external_fingerprint_urls = [httpserver.url_for("/state")]
+    httpserver.expect_request("/state").respond_with_data(
+        "state", headers={"ETag": '"v1"'}
+    )
+    skipper.record_run(skipper.fingerprint([]), ExitCodes.SUCCESS)
+    assert skipper.should_skip(skipper.fingerprint([]))
+
+    bundle_sha("sha-1")
+    httpserver.expect_request("/state").respond_with_data(
+        "state", headers={"ETag": '"v2"'}
+    )
+    assert not skipper.should_skip(skipper.fingerprint([]))
+
+
+def test_unchanged_run_skipper_never_skips_unknown_inputs(
+    skipper: UnchangedRunSkipper, tmp_path: Path
+) -> None:
+    skipper.config_file = str(tmp_path / "missing.toml")
+    skipper.record_run(skipper.fingerprint([]), ExitCodes.SUCCESS)
+
+    assert skipper.fingerprint([]) is None
+    assert not skipper.should_skip(None)
@@ -23,6 +23,7 @@ from reconcile.gql_definitions.terraform_tgw_attachments.aws_accounts import (
     AWSAccountV1,
 )
 from reconcile.terraform_tgw_attachments import Accepter, DesiredStateItem, Requester
+from reconcile.utils.constants import DEFAULT_THREAD_POOL_SIZE
 from reconcile.utils.gql import GqlApi
 from reconcile.utils.runtime.integration import ShardedRunProposal
 from reconcile.utils.secret_reader import SecretReaderBase
@@ -844,6 +845,7 @@ def test_run_when_cluster_with_tgw_connection(
         clusters=[cluster_with_tgw_connection.model_dump(by_alias=True)],
         integration=QONTRACT_INTEGRATION,
         settings=app_interface_vault_settings.model_dump(by_alias=True),
+        thread_pool_size=DEFAULT_THREAD_POOL_SIZE,
     )
     mocks["ts"].populate_additional_providers.assert_called_once_with(
         tgw_account.name, [expected_cluster_account]
@@ -904,6 +906,7 @@ def test_run_when_cluster_with_mixed_connections(
         clusters=[cluster_with_mixed_connections.model_dump(by_alias=True)],
         integration=QONTRACT_INTEGRATION,
         settings=app_interface_vault_settings.model_dump(by_alias=True),
+        thread_pool_size=DEFAULT_THREAD_POOL_SIZE,
     )
     mocks["ts"].populate_additional_providers.assert_called_once_with(
         tgw_account.name, [expected_cluster_account]
@@ -989,6 +992,7 @@ def test_run_with_multiple_clusters(
         clusters=[cluster_with_tgw_connection.model_dump(by_alias=True)],
         integration=QONTRACT_INTEGRATION,
         settings=app_interface_vault_settings.model_dump(by_alias=True),
+        thread_pool_size=DEFAULT_THREAD_POOL_SIZE,
     )
     mocks["ts"].populate_additional_providers.assert_called_once_with(
         tgw_account.name, [expected_cluster_account]
@@ -1050,6 +1054,7 @@ def test_run_with_account_name_for_multiple_clusters(
         clusters=[cluster_with_tgw_connection.model_dump(by_alias=True)],
         integration=QONTRACT_INTEGRATION,
         settings=app_interface_vault_settings.model_dump(by_alias=True),
+        thread_pool_size=DEFAULT_THREAD_POOL_SIZE,
     )
     mocks["ts"].populate_additional_providers.assert_called_once_with(
         tgw_account.name, [expected_cluster_account]
@@ -1110,6 +1115,7 @@ def test_run_with_account_name_for_multiple_connections(
         clusters=[cluster_with_2_tgw_connections.model_dump(by_alias=True)],
         integration=QONTRACT_INTEGRATION,
         settings=app_interface_vault_settings.model_dump(by_alias=True),
+        thread_pool_size=DEFAULT_THREAD_POOL_SIZE,
     )
     mocks["ts"].populate_additional_providers.assert_called_once_with(
         tgw_account.name, [expected_cluster_account]
@@ -1,6 +1,12 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
 import pytest
 from jsonpath_ng.exceptions import JsonPathParserError
+from prometheus_client.core import REGISTRY
 
+from reconcile.utils.jinja2 import utils
 from reconcile.utils.jinja2.filters import (
     extract_jsonpath,
     hash_list,
@@ -8,6 +14,15 @@ from reconcile.utils.jinja2.filters import (
     matches_jsonpath,
     str_format,
 )
+from reconcile.utils.jinja2.utils import (
+    CompiledTemplateCache,
+    TemplateRenderOptions,
+    compile_jinja2_template,
+    process_jinja2_template,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
 
 
 def test_hash_list_empty() -> None:
@@ -134,3 +149,89 @@ def test_str_format() -> None:
     value = "path/to/object"
     format = "s3://%s"
     assert str_format(value, format) == "s3://path/to/object"
+
+
+@pytest.fixture
+def template_cache(monkeypatch: pytest.MonkeyPatch) -> Iterator[CompiledTemplateCache]:
+    monkeypatch.delenv("INTEGRATION_NAME", raising=False)
+    template_cache = CompiledTemplateCache(max_entries=100, max_bytes=1024 * 1024)
+    monkeypatch.setattr(utils, "compiled_template_cache", template_cache)
+    yield template_cache
+    template_cache.clear()
+
+
+def _cache_events(result: str) -> float:
+    return (
+        REGISTRY.get_sample_value(
+            "qontract_reconcile_jinja2_template_cache_total",
+            {"integration": "", "result": result},
+        )
+        or 0
+    )
+
+
+def test_compiled_template_cache_hit(template_cache: CompiledTemplateCache) -> None:
+    hits, misses = _cache_events("hit"), _cache_events("miss")
+
+    first = compile_jinja2_template("{{ a }}")
+    second = compile_jinja2_template("{{ a }}")
+
+    assert first is second
+    assert _cache_events("hit") == hits + 1
+    assert _cache_events("miss") == misses + 1
+
+
+def test_compiled_template_cache_keyed_by_settings(
+    template_cache: CompiledTemplateCache,
+) -> None:
+    plain = compile_jinja2_template("{{{ a }}}")
+    extra_curly = compile_jinja2_template("{{{ a }}}", extra_curly=True)
+    trimmed = compile_jinja2_template(
+        "{{{ a }}}", template_render_options=TemplateRenderOptions.create(True)
+    )
+
+    assert len({id(plain), id(extra_curly), id(trimmed)}) == 3
+    assert extra_curly.render({"a": "b"}) == "b"
+    assert len(template_cache) == 3
+
+
+def test_compiled_template_cache_evicts_lru(
+    template_cache: CompiledTemplateCache,
+) -> None:
+    evictions = _cache_events("eviction")
+    first = compile_jinja2_template("{{ a }}0")
+    for i in range(1, 100):
+        compile_jinja2_template(f"{{{{ a }}}}{i}")
+    # recently used, survives the eviction
+    assert compile_jinja2_template("{{ a }}0") is first
+
+    compile_jinja2_template("{{ a }}100")
+
+    assert len(template_cache) == 100
+    assert _cache_events("eviction") == evictions + 1
+    assert compile_jinja2_template("{{ a }}0") is first
+
+
+def test_compiled_template_cache_bounded_by_bytes() -> None:
+    template_cache = CompiledTemplateCache(max_entries=100, max_bytes=100)
+    settings = TemplateRenderOptions.create()
+
+    for i in range(10):
+        template_cache.get_or_compile(f"{i}" * 30, False, settings)
+    template_cache.get_or_compile("x" * 101, False, settings)
+
+    assert len(template_cache) == 3
+    assert template_cache.size_bytes == 90
+
+
+def test_compiled_template_cache_stays_bounded(
+    template_cache: CompiledTemplateCache,
+) -> None:
+    bodies = [f"{{% for x in xs %}}{{{{ x }}}}-{i}{{% endfor %}}" for i in range(4000)]
+    for i, body in enumerate(bodies):
+        assert process_jinja2_template(body, {"xs": [1]}) == f"1-{i}"
+
+    # only the 100 most recently used templates are kept
+    assert len(template_cache) == 100
+    assert template_cache.size_bytes == sum(len(b.encode()) for b in bodies[-100:])
+    assert template_cache.size_bytes <= template_cache.max_bytes
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import random
+import threading
 from typing import TYPE_CHECKING, Any
 
 import pytest
@@ -28,6 +30,8 @@ from reconcile.utils.vault import (
 )
 
 if TYPE_CHECKING:
+    from collections.abc import Mapping
+
     from pytest_mock import MockerFixture
 
 fxt = Fixtures("vault_replication")
@@ -587,3 +591,188 @@ def test_get_policy_secret_list_failure(
     vault_client = mocker.patch("reconcile.utils.vault.VaultClient", autospec=True)
     with pytest.raises(integ.VaultInvalidPathsError):
         integ.get_policy_secret_list(vault_client, paths)
+
+
+class FakeVault:
+    """In-memory KV v2 engine keeping the latest `max_versions` versions of
+    each secret, counting the reads of secret data."""
+
+    def __init__(self, max_versions: int = 10) -> None:
+        self.max_versions = max_versions
+        self.secrets: dict[str, list[dict[str, str]]] = {}
+        self.deleted: set[tuple[str, int]] = set()
+        self.data_reads = 0
+        self.writes = 0
+        self._lock = threading.Lock()
+
+    def put(self, path: str, data: dict[str, str]) -> None:
+        self.secrets.setdefault(path, []).append(data)
+
+    def _is_readable(self, path: str, version: int) -> bool:
+        current = len(self.secrets[path])
+        return (
+            current - self.max_versions < version <= current
+            and (path, version) not in self.deleted
+        )
+
+    def read_metadata(self, path: str) -> dict[str, Any]:
+        if path not in self.secrets:
+            raise SecretNotFoundError(path)
+        current = len(self.secrets[path])
+        return {
+            "current_version": current,
+            "versions": {
+                str(version): {
+                    "deletion_time": "2024-01-01T00:00:00Z"
+                    if (path, version) in self.deleted
+                    else "",
+                    "destroyed": False,
+                }
+                for version in range(
+                    max(1, current - self.max_versions + 1), current + 1
+                )
+            },
+        }
+
+    def read_all_with_version(self, secret: Mapping) -> tuple[dict, int]:
+        with self._lock:
+            self.data_reads += 1
+        path = secret["path"]
+        if path not in self.secrets:
+            raise SecretNotFoundError(path)
+        version = secret["version"]
+        if version == "LATEST":
+            version = len(self.secrets[path])
+        if not self._is_readable(path, version):
+            raise SecretVersionNotFoundError(path)
+        return self.secrets[path][version - 1], version
+
+    def write(
+        self, secret: Mapping, decode_base64: bool = True, force: bool = False
+    ) -> None:
+        with self._lock:
+            self.writes += 1
+            self.put(secret["path"], secret["data"])
+
+
+@pytest.fixture
+def diverged_vaults() -> tuple[FakeVault, FakeVault, int]:
+    """Thousands of secrets, a tenth of them behind in the destination."""
+    rnd = random.Random(42)
+    source, dest = FakeVault(), FakeVault()
+    diverged_reads = 0
+    for i in range(3000):
+        path = f"secret/app-{i}"
+        versions = rnd.randint(1, 25)
+        for version in range(1, versions + 1):
+            source.put(path, {"value": f"{i}-{version}"})
+        if version > 1 and rnd.random() < 0.2:
+            source.deleted.add((path, version - 1))
+        if i % 10:
+            dest.secrets[path] = list(source.secrets[path])
+            continue
+        dest_versions = rnd.randint(0, versions - 1)
+        dest.secrets[path] = source.secrets[path][:dest_versions]
+        if not dest_versions:
+            del dest.secrets[path]
+        diverged_reads += sum(
+            source._is_readable(path, version)
+            for version in range(dest_versions + 1, versions + 1)
+        )
+    return source, dest, diverged_reads
+
+
+@pytest.mark.parametrize("thread_pool_size", [1, 10])
+def test_replicate_secrets_reads_only_diverged_versions(
+    diverged_vaults: tuple[FakeVault, FakeVault, int], thread_pool_size: int
+) -> None:
+    source, dest, diverged_reads = diverged_vaults
+
+    integ.replicate_secrets(
+        dry_run=False,
+        source_vault=source,  # type: ignore[arg-type]
+        dest_vault=dest,  # type: ignore[arg-type]
+        paths=list(source.secrets),
+        thread_pool_size=thread_pool_size,
+    )
+
+    assert source.data_reads == diverged_reads
+    assert dest.data_reads == 0
+    assert {path: len(v) for path, v in dest.secrets.items()} == {
+        path: len(v) for path, v in source.secrets.items()
+    }
+    for path, versions in source.secrets.items():
+        for version in range(1, len(versions) + 1):
+            if source._is_readable(path, version):
+                assert dest.secrets[path][version - 1] == versions[version - 1]
+
+
+def test_replicate_secrets_in_sync(
+    diverged_vaults: tuple[FakeVault, FakeVault, int],
+) -> None:
+    source, _, _ = diverged_vaults
+    dest = FakeVault()
+    dest.secrets = {path: list(v) for path, v in source.secrets.items()}
+
+    integ.replicate_secrets(
+        dry_run=False,
+        source_vault=source,  # type: ignore[arg-type]
+        dest_vault=dest,  # type: ignore[arg-type]
+        paths=list(source.secrets),
+        thread_pool_size=10,
+    )
+
+    assert source.data_reads == dest.data_reads == dest.writes == 0
+
+
+def test_replicate_secrets_dry_run(
+    diverged_vaults: tuple[FakeVault, FakeVault, int],
+) -> None:
+    source, dest, diverged_reads = diverged_vaults
+
+    integ.replicate_secrets(
+        dry_run=True,
+        source_vault=source,  # type: ignore[arg-type]
+        dest_vault=dest,  # type: ignore[arg-type]
+        paths=list(source.secrets),
+        thread_pool_size=10,
+    )
+
+    assert source.data_reads == diverged_reads
+    assert dest.writes == 0
+
+
+def test_plan_secret_replication_dest_latest_deleted() -> None:
+    source, dest = FakeVault(), FakeVault()
+    for version in range(3):
+        source.put("secret/app", {"value": str(version)})
+    dest.secrets["secret/app"] = list(source.secrets["secret/app"][:2])
+    dest.deleted.add(("secret/app", 2))
+
+    assert integ.plan_secret_replication(
+        "secret/app",
+        source,  # type: ignore[arg-type]
+        dest,  # type: ignore[arg-type]
+    ) == integ.SecretReplicationPlan("secret/app")
+
+
+def test_plan_secret_replication_source_not_found() -> None:
+    assert (
+        integ.plan_secret_replication(
+            "secret/app",
+            FakeVault(),  # type: ignore[arg-type]
+            FakeVault(),  # type: ignore[arg-type]
+        )
+        is None
+    )
+
+
+def test_plan_secret_replication_v1(mocker: MockerFixture) -> None:
+    vault_client = mocker.patch(
+        "reconcile.vault_replication.VaultClient", autospec=True
+    )
+    vault_client.read_metadata.return_value = None
+
+    assert integ.plan_secret_replication(
+        "secret/app", vault_client, vault_client
+    ) == integ.SecretReplicationPlan("secret/app")
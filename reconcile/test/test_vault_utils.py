@@ -1,17 +1,29 @@
+from __future__ import annotations
+
 import importlib
+import json
 import logging
 import os
+import threading
 import time
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import TYPE_CHECKING, Any
 from unittest.mock import (
     MagicMock,
     patch,
 )
+from urllib.parse import parse_qs, urlparse
 
 import hvac.exceptions
 import pytest
 
 from reconcile.utils import vault
 
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
 
 class SleepCalledError(Exception):
     pass
@@ -132,3 +144,179 @@ def test_empty_kv2_engine(
     ):
         result = getattr(kv2_client_invalid_path, method_name)("engine/some/path")
         assert result == expected
+
+
+class FakeVaultHandler(BaseHTTPRequestHandler):
+    """Minimal Vault API: approle login, a KV v2 engine mounted at `kv`
+    and a KV v1 engine mounted at `kv1`. Secrets at paths containing
+    `missing` don't exist."""
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+    def _reply(self, status: int, body: dict[str, Any]) -> None:
+        payload = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def do_POST(self) -> None:
+        server: FakeVaultServer = self.server  # type: ignore[assignment]
+        body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        url = urlparse(self.path)
+        if url.path.startswith("/v1/kv/data/"):
+            path = url.path.removeprefix("/v1/kv/data/")
+            with server.lock:
+                server.writes[path].append(json.loads(body)["data"])
+            self._reply(200, {"data": {"version": 4}})
+            return
+        self._reply(200, {"auth": {"client_token": "token"}})
+
+    def do_GET(self) -> None:
+        server: FakeVaultServer = self.server  # type: ignore[assignment]
+        url = urlparse(self.path)
+        if url.path == "/v1/auth/token/lookup-self":
+            self._reply(200, {"data": {"id": "token"}})
+        elif url.path == "/v1/kv/config":
+            self._reply(200, {"data": {"max_versions": 10}})
+        elif url.path.startswith("/v1/kv/data/"):
+            time.sleep(server.latency)
+            path = url.path.removeprefix("/v1/kv/data/")
+            with server.lock:
+                server.reads[path] += 1
+            if "missing" in path:
+                self._reply(404, {"errors": []})
+                return
+            version = int(parse_qs(url.query).get("version", ["3"])[0])
+            self._reply(
+                200,
+                {
+                    "data": {
+                        "data": {"value": f"{path}-{version}"},
+                        "metadata": {"version": version},
+                    }
+                },
+            )
+        else:
+            self._reply(404, {"errors": []})
+
+
+class FakeVaultServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 64
+
+    def __init__(self, latency: float) -> None:
+        super().__init__(("127.0.0.1", 0), FakeVaultHandler)
+        self.latency = latency
+        self.lock = threading.Lock()
+        self.reads: Counter[str] = Counter()
+        self.writes: defaultdict[str, list[dict[str, Any]]] = defaultdict(list)
+
+
+@pytest.fixture
+def fake_vault() -> Iterator[FakeVaultServer]:
+    server = FakeVaultServer(latency=0.01)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def fake_vault_client(fake_vault: FakeVaultServer) -> Iterator[vault.VaultClient]:
+    with patch("reconcile.utils.vault.get_config", return_value={"vault": {}}):
+        client = vault.VaultClient(
+            server=f"http://127.0.0.1:{fake_vault.server_port}",
+            role_id="role",
+            secret_id="secret",
+            auto_refresh=False,
+        )
+    yield client
+    client.close()
+
+
+def test_prefetch_reads_each_secret_once(
+    fake_vault: FakeVaultServer, fake_vault_client: vault.VaultClient
+) -> None:
+    secrets = [
+        {"path": f"kv/app-{i % 100}", "version": 1 + i // 100 % 2} for i in range(400)
+    ] + [{"path": "kv1/app", "version": None}]
+
+    fake_vault_client.prefetch(secrets, thread_pool_size=10)
+
+    assert len(fake_vault.reads) == 100
+    assert fake_vault.reads.total() == 200
+    assert fake_vault_client.read_all({"path": "kv/app-7", "version": 2}) == {
+        "value": "app-7-2"
+    }
+    assert fake_vault.reads.total() == 200
+
+
+def test_prefetch_ignores_errors(
+    fake_vault: FakeVaultServer, fake_vault_client: vault.VaultClient
+) -> None:
+    fake_vault_client.prefetch([{"path": "kv/missing", "version": 1}])
+
+    with pytest.raises(vault.SecretVersionNotFoundError):
+        fake_vault_client.read_all({"path": "kv/missing", "version": 1})
+
+
+def test_concurrent_reads_are_coalesced(
+    fake_vault: FakeVaultServer, fake_vault_client: vault.VaultClient
+) -> None:
+    fake_vault.latency = 0.2
+    barrier = threading.Barrier(10)
+
+    def read() -> dict:
+        barrier.wait()
+        return fake_vault_client.read_all({"path": "kv/app", "version": 1})
+
+    with ThreadPoolExecutor(max_workers=10) as executor:
+        results = [f.result() for f in [executor.submit(read) for _ in range(10)]]
+
+    assert results == [{"value": "app-1"}] * 10
+    assert fake_vault.reads == {"app": 1}
+
+
+def test_prefetch_then_read_hits_cache(
+    fake_vault: FakeVaultServer, fake_vault_client: vault.VaultClient
+) -> None:
+    fake_vault.latency = 0.05
+    secrets = [{"path": f"kv/app-{i}", "version": 1} for i in range(50)]
+
+    # every secret is requested 4 times concurrently, one read each
+    fake_vault_client.prefetch(secrets * 4, thread_pool_size=10)
+    for secret in secrets:
+        fake_vault_client.read_all(secret)
+
+    assert fake_vault.reads == {f"app-{i}": 1 for i in range(50)}
+
+
+def test_write_kv2_skips_unchanged_data(
+    fake_vault: FakeVaultServer, fake_vault_client: vault.VaultClient
+) -> None:
+    fake_vault_client.write(
+        {"path": "kv/app", "data": {"value": "app-3"}}, decode_base64=False
+    )
+
+    assert fake_vault.reads == {"app": 1}
+    assert fake_vault.writes == {}
+
+
+def test_write_kv2_changed_data(
+    fake_vault: FakeVaultServer, fake_vault_client: vault.VaultClient
+) -> None:
+    fake_vault_client.write(
+        {"path": "kv/app", "data": {"value": "new"}}, decode_base64=False
+    )
+    fake_vault_client.write(
+        {"path": "kv/missing", "data": {"value": "new"}}, decode_base64=False
+    )
+
+    assert fake_vault.writes == {
+        "app": [{"value": "new"}],
+        "missing": [{"value": "new"}],
+    }
@@ -6,7 +6,7 @@ from typing import TYPE_CHECKING, Any
 import pytest
 
 from reconcile.utils.jobcontroller.controller import K8sJobController
-from reconcile.utils.oc import OCCli
+from reconcile.utils.oc import OCCli, OCNative
 
 if TYPE_CHECKING:
     from pytest_mock import MockerFixture
@@ -49,6 +49,26 @@ def controller(oc: OCCli, mocker: MockerFixture) -> K8sJobController:
     return controller
 
 
+@pytest.fixture
+def oc_native(mocker: MockerFixture) -> OCNative:
+    oc = mocker.create_autospec(OCNative)
+    oc.get_items.side_effect = [[]]
+    return oc
+
+
+@pytest.fixture
+def native_controller(oc_native: OCNative) -> K8sJobController:
+    return K8sJobController(
+        oc=oc_native,
+        cluster="some-cluster",
+        namespace="some-ns",
+        integration="some-integration",
+        integration_version="0.1",
+        dry_run=False,
+        time_module=TimeMock(),
+    )
+
+
 class TimeMock:
     def __init__(self) -> None:
         self.current_time = 0.0
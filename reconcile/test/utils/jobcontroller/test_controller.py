@@ -4,6 +4,7 @@ from typing import TYPE_CHECKING, Any
 from unittest.mock import patch
 
 import pytest
+from kubernetes.client.exceptions import ApiException
 
 from reconcile.test.utils.jobcontroller.fixtures import (
     SomeJob,
@@ -19,6 +20,7 @@ from reconcile.utils.jobcontroller.models import (
 if TYPE_CHECKING:
     from reconcile.test.utils.jobcontroller.conftest import OCItemSetter
     from reconcile.utils.jobcontroller.controller import K8sJobController
+    from reconcile.utils.oc import OCNative
 
 #
 # enqueue_job
@@ -297,6 +299,97 @@ def test_controller_wait_for_job_list_completion_no_timeout(
     assert controller.time_module.time() == 5
 
 
+def test_controller_wait_for_job_list_completion_watch(
+    native_controller: K8sJobController, oc_native: OCNative
+) -> None:
+    job1 = SomeJob(identifying_attribute="some-id-1", description="some-description")
+    job2 = SomeJob(identifying_attribute="some-id-2", description="some-description")
+    oc_native.watch_items.return_value = iter([  # type: ignore[attr-defined]
+        ("ADDED", build_job_resource(job1, build_job_status(active=1))),
+        ("ADDED", build_job_resource(job2, build_job_status(active=1))),
+        ("MODIFIED", build_job_resource(job2, build_job_status(failed=1))),
+        ("MODIFIED", build_job_resource(job1, build_job_status(succeeded=1))),
+    ])
+
+    assert list(
+        native_controller.iter_job_list_completion(
+            {job1.name(), job2.name()},
+            check_interval_seconds=5,
+            timeout_seconds=10,
+        )
+    ) == [
+        (job2.name(), JobStatus.ERROR),
+        (job1.name(), JobStatus.SUCCESS),
+    ]
+    oc_native.get_items.assert_not_called()  # type: ignore[attr-defined]
+    assert native_controller.time_module.time() == 0
+
+
+def test_controller_wait_for_job_list_completion_watch_timeout(
+    native_controller: K8sJobController, oc_native: OCNative
+) -> None:
+    job1 = SomeJob(identifying_attribute="some-id-1", description="some-description")
+    job2 = SomeJob(identifying_attribute="some-id-2", description="some-description")
+
+    def watch_items(**_: Any) -> Any:
+        yield ("ADDED", build_job_resource(job1, build_job_status(succeeded=1)))
+        yield ("ADDED", build_job_resource(job2, build_job_status(active=1)))
+        # the server closes the stream after the watch timeout
+        native_controller.time_module.sleep(10)  # type: ignore[attr-defined]
+
+    oc_native.watch_items.side_effect = watch_items  # type: ignore[attr-defined]
+
+    assert native_controller.wait_for_job_list_completion(
+        {job1.name(), job2.name(), "missing-job"},
+        check_interval_seconds=5,
+        timeout_seconds=10,
+    ) == {
+        job1.name(): JobStatus.SUCCESS,
+        job2.name(): JobStatus.IN_PROGRESS,
+        "missing-job": JobStatus.NOT_EXISTS,
+    }
+    oc_native.watch_items.assert_called_once_with(  # type: ignore[attr-defined]
+        kind="Job.batch", namespace="some-ns", timeout_seconds=10
+    )
+
+
+def test_controller_wait_for_job_list_completion_watch_error_fallback(
+    native_controller: K8sJobController, oc_native: OCNative
+) -> None:
+    job1 = SomeJob(identifying_attribute="some-id-1", description="some-description")
+    job2 = SomeJob(identifying_attribute="some-id-2", description="some-description")
+
+    def watch_items(**_: Any) -> Any:
+        yield ("ADDED", build_job_resource(job1, build_job_status(succeeded=1)))
+        raise ApiException(status=500, reason="watch failed")
+
+    oc_native.watch_items.side_effect = watch_items  # type: ignore[attr-defined]
+    oc_native.get_items.side_effect = [  # type: ignore[attr-defined]
+        # 0 seconds
+        [
+            build_job_resource(job1, build_job_status(succeeded=1)),
+            build_job_resource(job2, build_job_status(active=1)),
+        ],
+        # 5 seconds
+        [
+            build_job_resource(job1, build_job_status(succeeded=1)),
+            build_job_resource(job2, build_job_status(succeeded=1)),
+        ],
+    ]
+
+    assert list(
+        native_controller.iter_job_list_completion(
+            {job1.name(), job2.name()},
+            check_interval_seconds=5,
+            timeout_seconds=-1,
+        )
+    ) == [
+        (job1.name(), JobStatus.SUCCESS),
+        (job2.name(), JobStatus.SUCCESS),
+    ]
+    assert native_controller.time_module.time() == 5
+
+
 #
 # build secret
 #
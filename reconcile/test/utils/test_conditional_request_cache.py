@@ -0,0 +1,207 @@
+from __future__ import annotations
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import TYPE_CHECKING
+from unittest.mock import Mock
+
+import pytest
+import requests
+
+from reconcile.utils.conditional_request_cache import (
+    CachedResponse,
+    ConditionalRequestAdapter,
+    ResponseCache,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+
+class FakeServer(ThreadingHTTPServer):
+    body = b'[{"name": "lgtm"}]'
+    etag = 'W/"v1"'
+    requests: list[dict[str, str]]
+
+
+class Handler(BaseHTTPRequestHandler):
+    server: FakeServer
+
+    def do_GET(self) -> None:
+        self.server.requests.append(dict(self.headers))
+        if self.headers.get("If-None-Match") == self.server.etag:
+            self.send_response(304)
+            self.send_header("ETag", self.server.etag)
+            self.send_header("RateLimit-Remaining", "41")
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(self.server.body)))
+        self.send_header("ETag", self.server.etag)
+        self.send_header("X-Next-Page", "")
+        self.send_header("RateLimit-Remaining", "42")
+        self.end_headers()
+        self.wfile.write(self.server.body)
+
+    def log_message(self, *args: object) -> None:
+        pass
+
+
+@pytest.fixture
+def server() -> Iterator[FakeServer]:
+    server = FakeServer(("127.0.0.1", 0), Handler)
+    server.requests = []
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def url(server: FakeServer) -> str:
+    return f"http://127.0.0.1:{server.server_address[1]}/api/v4/projects/1/labels"
+
+
+CACHEABLE_PATHS = [r"/api/v4/projects/\d+/labels"]
+
+
+def session_with(adapter: ConditionalRequestAdapter) -> requests.Session:
+    session = requests.Session()
+    session.mount("http://", adapter)
+    return session
+
+
+def test_not_modified_response_is_replayed(server: FakeServer, url: str) -> None:
+    hits, misses, ratelimit_remaining = Mock(), Mock(), Mock()
+    adapter = ConditionalRequestAdapter(
+        ResponseCache(max_entries=10),
+        cacheable_paths=CACHEABLE_PATHS,
+        hits=hits,
+        misses=misses,
+        ratelimit_remaining=ratelimit_remaining,
+    )
+    session = session_with(adapter)
+
+    first = session.get(url, headers={"PRIVATE-TOKEN": "token"})
+    second = session.get(url, headers={"PRIVATE-TOKEN": "token"})
+
+    assert "If-None-Match" not in server.requests[0]
+    assert server.requests[1]["If-None-Match"] == 'W/"v1"'
+    assert second.status_code == 200
+    assert second.json() == first.json() == [{"name": "lgtm"}]
+    assert second.headers["Content-Type"] == "application/json"
+    assert second.headers["RateLimit-Remaining"] == "41"
+    hits.inc.assert_called_once_with()
+    misses.inc.assert_not_called()
+    assert ratelimit_remaining.set.call_args_list[-1].args == (41,)
+
+
+def test_changed_response_replaces_cached_one(server: FakeServer, url: str) -> None:
+    misses = Mock()
+    adapter = ConditionalRequestAdapter(
+        ResponseCache(max_entries=10), CACHEABLE_PATHS, misses=misses
+    )
+    session = session_with(adapter)
+
+    session.get(url)
+    server.body, server.etag = b'[{"name": "hold"}]', 'W/"v2"'
+    changed = session.get(url)
+    replayed = session.get(url)
+
+    assert changed.json() == replayed.json() == [{"name": "hold"}]
+    assert server.requests[2]["If-None-Match"] == 'W/"v2"'
+    misses.inc.assert_called_once_with()
+
+
+def test_responses_are_cached_per_token(server: FakeServer, url: str) -> None:
+    session = session_with(
+        ConditionalRequestAdapter(ResponseCache(max_entries=10), CACHEABLE_PATHS)
+    )
+
+    session.get(url, headers={"PRIVATE-TOKEN": "a"})
+    session.get(url, headers={"PRIVATE-TOKEN": "b"})
+
+    assert "If-None-Match" not in server.requests[1]
+
+
+def test_non_get_requests_are_not_cached(server: FakeServer, url: str) -> None:
+    cache = ResponseCache(max_entries=10)
+    session = session_with(ConditionalRequestAdapter(cache, CACHEABLE_PATHS))
+
+    session.get(url, stream=True)
+    session.head(url)
+
+    assert len(cache) == 0
+
+
+def test_other_paths_are_not_cached(server: FakeServer, url: str) -> None:
+    cache = ResponseCache(max_entries=10)
+    session = session_with(ConditionalRequestAdapter(cache, CACHEABLE_PATHS))
+
+    session.get(url.replace("/labels", "/repository/archive"))
+    session.get(url.replace("/labels", "/repository/files/a/raw"))
+
+    assert len(cache) == 0
+
+
+def entry(content: bytes) -> CachedResponse:
+    return CachedResponse(etag="e", last_modified=None, headers={}, content=content)
+
+
+def test_response_cache_evicts_least_recently_used() -> None:
+    cache = ResponseCache(max_entries=2)
+    cache.set("a", entry(b"a"))
+    cache.set("b", entry(b"b"))
+    cache.get("a")
+    cache.set("c", entry(b"c"))
+
+    assert cache.get("b") is None
+    assert cache.get("a") == entry(b"a")
+    assert cache.get("c") == entry(b"c")
+
+
+def test_response_cache_bounded_by_bytes() -> None:
+    cache = ResponseCache(max_entries=10, max_bytes=100)
+    for key in "abcd":
+        cache.set(key, entry(key.encode() * 10))
+    # larger than a tenth of max_bytes
+    cache.set("large", entry(b"x" * 11))
+    cache.set("a", entry(b"a" * 5))
+
+    assert cache.get("large") is None
+    assert cache.size_bytes == 35
+    assert len(cache) == 4
+
+
+def test_response_cache_evicts_by_bytes() -> None:
+    cache = ResponseCache(max_entries=100, max_bytes=50)
+    for i in range(10):
+        cache.set(str(i), entry(b"x" * 5))
+    cache.set("new", entry(b"y" * 5))
+
+    assert cache.get("0") is None
+    assert cache.size_bytes == 50
+
+
+def test_response_cache_persistence(tmp_path: Path) -> None:
+    path = str(tmp_path / "cache" / "gitlab.json")
+    cache = ResponseCache(max_entries=2, path=path)
+    cache.set("a", entry(b"\x00binary"))
+    cache.set("b", entry(b"b"))
+    cache.save()
+
+    restored = ResponseCache(max_entries=1, path=path)
+
+    assert len(restored) == 1
+    assert restored.get("b") == entry(b"b")
+
+
+def test_response_cache_ignores_unreadable_file(tmp_path: Path) -> None:
+    path = tmp_path / "gitlab.json"
+    path.write_text(json.dumps({"version": 1, "entries": [["a", {}]]}))
+
+    assert len(ResponseCache(max_entries=2, path=str(path))) == 0
@@ -41,10 +41,19 @@ from gitlab.v4.objects import (
 )
 from requests.exceptions import ConnectTimeout
 
-from reconcile.utils.gitlab_api import Assignment, Comment, GitLabApi
+from reconcile.utils.conditional_request_cache import (
+    ConditionalRequestAdapter,
+    ResponseCache,
+)
+from reconcile.utils.gitlab_api import (
+    Assignment,
+    Comment,
+    GitLabApi,
+    default_response_cache,
+)
 
 if TYPE_CHECKING:
-    from collections.abc import Mapping
+    from collections.abc import Generator, Mapping
 
     from pytest_mock import MockerFixture
 
@@ -140,6 +149,54 @@ def test_gitlab_api_init(
     mocked_gitlab_request.labels.assert_called_once_with(integration="test-gitlab")
 
 
+def test_gitlab_api_mounts_response_cache(
+    instance: Mapping,
+    mocked_gl: Mock,
+) -> None:
+    response_cache = ResponseCache(max_entries=1)
+
+    gitlab_api = GitLabApi(instance, project_id=1, response_cache=response_cache)
+
+    adapter = gitlab_api.session.get_adapter("https://gitlab.example.com")
+    assert isinstance(adapter, ConditionalRequestAdapter)
+    assert adapter.cache is response_cache
+
+
+def test_gitlab_api_response_cache_disabled(
+    instance: Mapping,
+    mocked_gl: Mock,
+    mocker: MockerFixture,
+) -> None:
+    mocker.patch("reconcile.utils.gitlab_api.default_response_cache", return_value=None)
+
+    gitlab_api = GitLabApi(instance, project_id=1)
+
+    assert gitlab_api.response_cache is None
+    adapter = gitlab_api.session.get_adapter("https://gitlab.example.com")
+    assert not isinstance(adapter, ConditionalRequestAdapter)
+
+
+@pytest.fixture
+def reset_default_response_cache() -> Generator[None]:
+    """The process wide GitLab response cache must not leak between tests."""
+    default_response_cache.cache_clear()
+    yield
+    default_response_cache.cache_clear()
+
+
+@pytest.mark.usefixtures("reset_default_response_cache")
+def test_default_response_cache_is_opt_in(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("GITLAB_RESPONSE_CACHE_ENABLED", raising=False)
+    assert default_response_cache() is None
+
+    default_response_cache.cache_clear()
+    monkeypatch.setenv("GITLAB_RESPONSE_CACHE_ENABLED", "true")
+    monkeypatch.setenv("GITLAB_RESPONSE_CACHE_MAX_BYTES", "1024")
+    response_cache = default_response_cache()
+    assert response_cache is not None
+    assert response_cache.max_bytes == 1024
+
+
 def test_remove_label_from_merge_request() -> None:
     expected_label = "a"
     to_be_removed_label = "b"
@@ -591,6 +648,62 @@ def test_get_merge_requests(
     project.mergerequests.list.assert_called_once_with(state="opened", get_all=True)
 
 
+def test_get_merge_request_commit_counts(
+    mocked_gitlab_api: GitLabApi,
+    mocked_gl: Mock,
+) -> None:
+    mocked_gl.projects.get.return_value.path_with_namespace = "group/project"
+    mocked_gl.http_post.side_effect = [
+        {
+            "data": {
+                "project": {
+                    "mergeRequests": {
+                        "pageInfo": {"hasNextPage": True, "endCursor": "c1"},
+                        "nodes": [{"iid": "1", "commitCount": 3}],
+                    }
+                }
+            }
+        },
+        {
+            "data": {
+                "project": {
+                    "mergeRequests": {
+                        "pageInfo": {"hasNextPage": False, "endCursor": None},
+                        "nodes": [
+                            {"iid": "2", "commitCount": 0},
+                            {"iid": "10", "commitCount": None},
+                        ],
+                    }
+                }
+            }
+        },
+    ]
+
+    commit_counts = mocked_gitlab_api.get_merge_request_commit_counts([10, 2, 1])
+
+    assert commit_counts == {1: 3, 2: 0}
+    assert mocked_gl.http_post.call_count == 2
+    first_variables = mocked_gl.http_post.call_args_list[0].kwargs["post_data"][
+        "variables"
+    ]
+    assert first_variables["project"] == "group/project"
+    assert first_variables["iids"] == ["1", "2", "10"]
+    second_variables = mocked_gl.http_post.call_args_list[1].kwargs["post_data"][
+        "variables"
+    ]
+    assert second_variables["after"] == "c1"
+
+
+def test_get_merge_request_commit_counts_raises_on_errors(
+    mocked_gitlab_api: GitLabApi,
+    mocked_gl: Mock,
+) -> None:
+    mocked_gl.http_post.return_value = {"errors": [{"message": "boom"}]}
+
+    with pytest.raises(GitlabGetError):
+        mocked_gitlab_api.get_merge_request_commit_counts([1])
+
+
 def test_get_merge_request_label_events() -> None:
     mr = create_autospec(ProjectMergeRequest)
     mr.resourcelabelevents = create_autospec(
@@ -1,10 +1,11 @@
 from __future__ import annotations
 
+import threading
 from typing import TYPE_CHECKING, Any
 
 import pytest
 
-from reconcile.utils.ocm import OCM
+from reconcile.utils.ocm import OCM, OCMMap
 from reconcile.utils.ocm_base_client import OCMBaseClient
 
 if TYPE_CHECKING:
@@ -101,3 +102,74 @@ def test__ready_for_app_interface(
 ) -> None:
     for cluster, readiness in clusters_by_readiness:
         assert ocm._ready_for_app_interface(cluster) == readiness
+
+
+def cluster_info(name: str, ocm_name: str, disabled: bool = False) -> dict[str, Any]:
+    return {
+        "name": name,
+        "ocm": {"name": ocm_name},
+        "disable": {"integrations": ["some-integration"] if disabled else []},
+    }
+
+
+def test_ocm_map_inits_ocm_clients_concurrently(mocker: MockerFixture) -> None:
+    # both OCM instances must be initiating at the same time to pass the barrier
+    barrier = threading.Barrier(2, timeout=5)
+
+    def init_ocm(self: OCMMap, ocm_info: dict[str, Any], **kwargs: Any) -> Any:
+        barrier.wait()
+        return ocm_info["name"]
+
+    init_ocm_mock = mocker.patch.object(
+        OCMMap, "_init_ocm", autospec=True, side_effect=init_ocm
+    )
+
+    ocm_map = OCMMap(
+        clusters=[
+            cluster_info("c1", "ocm-a"),
+            cluster_info("c2", "ocm-b"),
+            cluster_info("c3", "ocm-a"),
+            cluster_info("c4", "ocm-c", disabled=True),
+        ],
+        integration="some-integration",
+        thread_pool_size=2,
+    )
+
+    assert ocm_map.clusters_map == {"c1": "ocm-a", "c2": "ocm-b", "c3": "ocm-a"}
+    assert ocm_map.ocm_map == {"ocm-a": "ocm-a", "ocm-b": "ocm-b"}
+    assert init_ocm_mock.call_count == 2
+
+
+@pytest.mark.parametrize(
+    "ocm_count, thread_pool_size, expected_pool_sizes",
+    [
+        # one OCM instance may use the whole provision shards pool
+        (1, 10, (1, 10)),
+        (3, 10, (3, 6)),
+        (10, 10, (10, 2)),
+        # the HTTP connection pool caps the OCM instances initiated at once
+        (30, 50, (20, 1)),
+    ],
+)
+def test_ocm_map_pool_sizes_fit_http_pool(
+    mocker: MockerFixture,
+    ocm_count: int,
+    thread_pool_size: int,
+    expected_pool_sizes: tuple[int, int],
+) -> None:
+    threaded_run = mocker.patch("reconcile.utils.ocm.ocm.threaded.run")
+    threaded_run.side_effect = lambda func, iterable, size, **kwargs: [
+        i["name"] for i in iterable
+    ]
+
+    OCMMap(
+        clusters=[cluster_info(f"c{i}", f"ocm-{i}") for i in range(ocm_count)],
+        integration="some-integration",
+        thread_pool_size=thread_pool_size,
+    )
+
+    _, pool_size = threaded_run.call_args.args[1:]
+    provision_shards_pool_size = threaded_run.call_args.kwargs[
+        "provision_shards_thread_pool_size"
+    ]
+    assert (pool_size, provision_shards_pool_size) == expected_pool_sizes
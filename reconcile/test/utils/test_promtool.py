@@ -0,0 +1,189 @@
+from __future__ import annotations
+
+import os
+import tempfile
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from reconcile.utils import promtool
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from pytest_mock import MockerFixture
+
+RULE = {"groups": [{"name": "yak-shaver.rules", "rules": [{"alert": "YakDown"}]}]}
+OTHER_RULE = {"groups": [{"name": "other.rules", "rules": [{"alert": "OtherDown"}]}]}
+
+
+def _test_spec(rule_files: list[str]) -> dict[str, Any]:
+    return {"rule_files": rule_files, "tests": [{"interval": "1m"}]}
+
+
+def _calls(log: Path) -> list[str]:
+    return log.read_text(encoding="utf-8").splitlines()
+
+
+@pytest.fixture
+def cache(tmp_path: Path) -> promtool.ResultCache:
+    return promtool.ResultCache.from_dir(str(tmp_path))
+
+
+def test_run_test_cached(fake_promtool: Path, cache: promtool.ResultCache) -> None:
+    rule_files = {"rule.yaml": RULE, "other.yaml": OTHER_RULE}
+
+    first = promtool.run_test(_test_spec(["rule.yaml"]), rule_files, cache=cache)
+    second = promtool.run_test(_test_spec(["rule.yaml"]), rule_files, cache=cache)
+
+    assert first
+    assert second
+    assert second.message == first.message
+    assert len(_calls(fake_promtool)) == 1
+
+
+def test_run_test_cache_key(fake_promtool: Path, cache: promtool.ResultCache) -> None:
+    rule_files = {"rule.yaml": RULE, "other.yaml": OTHER_RULE}
+    promtool.run_test(_test_spec(["rule.yaml"]), rule_files, cache=cache)
+
+    # rule files the test doesn't read don't matter
+    promtool.run_test(
+        _test_spec(["rule.yaml"]), {"rule.yaml": RULE, "other.yaml": {}}, cache=cache
+    )
+    assert len(_calls(fake_promtool)) == 1
+
+    # the rules, the test and the promtool version do
+    promtool.run_test(_test_spec(["rule.yaml"]), {"rule.yaml": OTHER_RULE}, cache=cache)
+    promtool.run_test(_test_spec(["rule.yaml", "other.yaml"]), rule_files, cache=cache)
+    promtool.run_test(
+        _test_spec(["rule.yaml"]),
+        rule_files,
+        promtool_version=promtool.PROMTOOL_VERSION[0],
+        cache=cache,
+    )
+    assert len(_calls(fake_promtool)) == 4
+
+
+def test_failures_are_not_cached(
+    fake_promtool: Path, cache: promtool.ResultCache
+) -> None:
+    spec = {"groups": [{"name": "fake-promtool-fail"}]}
+
+    assert not promtool.check_rule(spec, cache=cache)
+    assert not promtool.check_rule(spec, cache=cache)
+
+    assert len(_calls(fake_promtool)) == 2
+    assert len(cache) == 0
+
+
+def test_result_cache_persists(fake_promtool: Path, tmp_path: Path) -> None:
+    cache = promtool.ResultCache.from_dir(str(tmp_path))
+    promtool.check_rule(RULE, cache=cache)
+    cache.save()
+
+    cache = promtool.ResultCache.from_dir(str(tmp_path))
+    assert promtool.check_rule(RULE, cache=cache)
+    assert len(_calls(fake_promtool)) == 1
+
+
+def test_result_cache_expired(fake_promtool: Path, tmp_path: Path) -> None:
+    cache = promtool.ResultCache.from_dir(str(tmp_path), max_age=0)
+    promtool.check_rule(RULE, cache=cache)
+    promtool.check_rule(RULE, cache=cache)
+
+    assert len(_calls(fake_promtool)) == 2
+
+
+def test_result_cache_corrupt(tmp_path: Path, caplog: pytest.LogCaptureFixture) -> None:
+    (tmp_path / promtool.RESULT_CACHE_FILE_NAME).write_text("{not json")
+
+    assert len(promtool.ResultCache.from_dir(str(tmp_path))) == 0
+    assert "Ignoring unreadable promtool cache" in caplog.text
+
+
+def test_result_cache_missing_dir(tmp_path: Path) -> None:
+    with pytest.raises(FileNotFoundError):
+        promtool.ResultCache.from_dir(str(tmp_path / "missing"))
+
+
+def test_run_test_cleans_up_rule_files(fake_promtool: Path) -> None:
+    before = set(os.listdir(tempfile.gettempdir()))
+
+    assert promtool.run_test(_test_spec(["rule.yaml"]), {"rule.yaml": RULE})
+
+    assert set(os.listdir(tempfile.gettempdir())) <= before
+
+
+def test_run_test_unknown_rule_file(fake_promtool: Path) -> None:
+    result = promtool.run_test(_test_spec(["missing.yaml"]), {"rule.yaml": RULE})
+
+    assert not result
+    assert "missing.yaml not in rule_files dict" in str(result)
+    assert _calls(fake_promtool) == []
+
+
+def test_check_rules_batched(fake_promtool: Path) -> None:
+    failing = {"groups": [{"name": "fake-promtool-fail"}]}
+    specs: list[dict[str, Any]] = [RULE, failing, OTHER_RULE, RULE, OTHER_RULE]
+
+    results = promtool.check_rules(specs, batch_size=3)
+
+    assert [bool(r) for r in results] == [True, False, True, True, True]
+    assert "fake failure" in str(results[1])
+    assert "SUCCESS" in str(results[0])
+    # two batches and the failed spec on its own
+    assert len(_calls(fake_promtool)) == 3
+
+
+def test_run_tests_batched(fake_promtool: Path, cache: promtool.ResultCache) -> None:
+    rule_files = {"rule.yaml": RULE, "other.yaml": OTHER_RULE}
+    failing = _test_spec(["rule.yaml"]) | {"name": "fake-promtool-fail"}
+    tests = [
+        (_test_spec(["rule.yaml"]), rule_files),
+        (_test_spec(["missing.yaml"]), rule_files),
+        (failing, rule_files),
+        (_test_spec(["rule.yaml", "other.yaml"]), rule_files),
+    ]
+
+    results = promtool.run_tests(tests, cache=cache)
+
+    assert [bool(r) for r in results] == [True, False, False, True]
+    assert "missing.yaml not in rule_files dict" in str(results[1])
+    assert "fake failure" in str(results[2])
+    assert len(_calls(fake_promtool)) == 2
+    # only the passing tests are cached
+    assert [bool(r) for r in promtool.run_tests(tests, cache=cache)] == [
+        True,
+        False,
+        False,
+        True,
+    ]
+    # one batch of the failed tests, the failing test again on its own
+    assert len(_calls(fake_promtool)) == 4
+
+
+def test_run_tests_writes_shared_rule_files_once(
+    fake_promtool: Path, mocker: MockerFixture
+) -> None:
+    write_yaml = mocker.spy(promtool, "_write_yaml")
+    rule_files = {"rule.yaml": RULE, "other.yaml": OTHER_RULE}
+
+    promtool.run_tests([(_test_spec(["rule.yaml"]), rule_files)] * 10)
+
+    # 10 test files, one rule file
+    assert write_yaml.call_count == 11
+
+
+def test_run_tests_batches_promtool_processes(fake_promtool: Path) -> None:
+    rule_files = {f"rule-{i}.yaml": RULE | {"name": str(i)} for i in range(10)}
+    tests = [(_test_spec([f"rule-{i % 10}.yaml"]), rule_files) for i in range(100)]
+
+    unbatched = promtool.run_tests(tests, batch_size=1)
+    unbatched_calls = len(_calls(fake_promtool))
+    batched = promtool.run_tests(tests)
+    batched_calls = len(_calls(fake_promtool)) - unbatched_calls
+
+    assert all(unbatched)
+    assert all(batched)
+    assert unbatched_calls == 100
+    assert batched_calls == 2
@@ -377,3 +377,23 @@ def test_delete_repo_robot_permissions_raises_other_status_codes(
 
     with pytest.raises(HTTPError):
         quay_api.delete_repo_robot_account_permissions("some-repo", "robot1")
+
+
+def test_list_repo_tags(quay_api: QuayApi, httpserver: HTTPServer) -> None:
+    for page, tags, has_additional in [
+        (1, [{"name": "v1", "manifest_digest": "sha256:1"}], True),
+        (2, [{"name": "v2", "manifest_digest": "sha256:2"}], False),
+    ]:
+        httpserver.expect_request(
+            "/api/v1/repository/other-org/repo/tag/",
+            query_string={
+                "onlyActiveTags": "true",
+                "limit": "100",
+                "page": str(page),
+            },
+        ).respond_with_json({"tags": tags, "has_additional": has_additional})
+
+    tags = quay_api.list_repo_tags("repo", namespace="other-org")
+
+    assert tags == {"v1": "sha256:1", "v2": "sha256:2"}
+    assert len(httpserver.log) == 2
@@ -0,0 +1,55 @@
+import pytest
+
+from reconcile.utils.rate_limiter import RateLimiter
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.now += seconds
+
+
+def test_rate_limiter_allows_burst() -> None:
+    clock = FakeClock()
+    limiter = RateLimiter(rate=5, clock=clock, sleep=clock.sleep)
+
+    for _ in range(5):
+        limiter.acquire()
+
+    assert clock.now == 0
+
+
+def test_rate_limiter_throttles_to_rate() -> None:
+    clock = FakeClock()
+    limiter = RateLimiter(rate=10, burst=1, clock=clock, sleep=clock.sleep)
+
+    for _ in range(101):
+        limiter.acquire()
+
+    assert clock.now == pytest.approx(10)
+
+
+def test_rate_limiter_refills_while_idle() -> None:
+    clock = FakeClock()
+    limiter = RateLimiter(rate=2, clock=clock, sleep=clock.sleep)
+    limiter.acquire()
+    limiter.acquire()
+
+    clock.now += 10
+    limiter.acquire()
+    limiter.acquire()
+
+    # the bucket holds at most `burst` tokens, idle time doesn't add more
+    assert clock.now == 10
+    limiter.acquire()
+    assert clock.now == pytest.approx(10.5)
+
+
+def test_rate_limiter_invalid_rate() -> None:
+    with pytest.raises(ValueError):
+        RateLimiter(rate=0)
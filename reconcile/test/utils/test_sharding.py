@@ -1,16 +1,30 @@
 from __future__ import annotations
 
 import importlib
+import random
+from collections import defaultdict
+from operator import itemgetter
 from typing import TYPE_CHECKING
 
+import pytest
+
 from reconcile.utils import sharding
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator, Mapping
+
     from pytest import MonkeyPatch
 
 VALUE = "saas-qontract-reconcile"
 
 
+@pytest.fixture(autouse=True)
+def reset_sharding() -> Iterator[None]:
+    """Reload with the restored environment, other tests use the module too."""
+    yield
+    importlib.reload(sharding)
+
+
 def test_is_in_shard_single_shard(monkeypatch: MonkeyPatch) -> None:
     monkeypatch.setenv("SHARDS", "1")
     monkeypatch.setenv("SHARD_ID", "0")
@@ -36,3 +50,100 @@ def test_is_in_shard_three_shards_fail(monkeypatch: MonkeyPatch) -> None:
     importlib.reload(sharding)
 
     assert sharding.is_in_shard(VALUE) is False
+
+
+def test_is_in_shard_rendezvous(monkeypatch: MonkeyPatch) -> None:
+    monkeypatch.setenv("SHARDS", "3")
+    monkeypatch.setenv("SHARDING_STRATEGY", "rendezvous")
+    shard = sharding.rendezvous_shard(VALUE, 3)
+    for shard_id in range(3):
+        monkeypatch.setenv("SHARD_ID", str(shard_id))
+        importlib.reload(sharding)
+
+        assert sharding.is_in_shard(VALUE) is (shard_id == shard)
+
+
+def test_unknown_sharding_strategy(monkeypatch: MonkeyPatch) -> None:
+    monkeypatch.setenv("SHARDING_STRATEGY", "rendevous")
+
+    with pytest.raises(ValueError, match="unknown SHARDING_STRATEGY 'rendevous'"):
+        importlib.reload(sharding)
+
+
+def test_filter_in_shard_partitions_items(monkeypatch: MonkeyPatch) -> None:
+    monkeypatch.setenv("SHARDS", "3")
+    monkeypatch.setenv("SHARDING_STRATEGY", "rendezvous")
+    items = [{"name": f"ns-{i}", "resources": i % 7} for i in range(100)]
+
+    shards = []
+    for shard_id in range(3):
+        monkeypatch.setenv("SHARD_ID", str(shard_id))
+        importlib.reload(sharding)
+        shards.append(
+            sharding.filter_in_shard(
+                items, key=itemgetter("name"), weight=itemgetter("resources")
+            )
+        )
+
+    assert sorted(i["name"] for s in shards for i in s) == sorted(
+        i["name"] for i in items
+    )
+
+
+def test_filter_in_shard_modulo_ignores_weights(monkeypatch: MonkeyPatch) -> None:
+    monkeypatch.setenv("SHARDS", "3")
+    monkeypatch.setenv("SHARD_ID", "1")
+    monkeypatch.delenv("SHARDING_STRATEGY", raising=False)
+    importlib.reload(sharding)
+    items = [f"ns-{i}" for i in range(30)]
+
+    assert sharding.filter_in_shard(items, key=str, weight=len) == [
+        i for i in items if sharding.is_in_shard(i)
+    ]
+
+
+def _moved(before: Mapping[str, int], after: Mapping[str, int]) -> float:
+    return sum(before[k] != after[k] for k in before) / len(before)
+
+
+def _skew(assignment: Mapping[str, int], weights: Mapping[str, float]) -> float:
+    """Load of the busiest shard relative to the average load."""
+    loads: dict[int, float] = defaultdict(float)
+    for key, shard in assignment.items():
+        loads[shard] += weights[key]
+    shards = max(assignment.values()) + 1
+    return max(loads.values()) / (sum(weights.values()) / shards)
+
+
+def test_simulate_key_movement_on_resize() -> None:
+    keys = [f"cluster-{i % 20}/namespace-{i}" for i in range(2000)]
+
+    modulo = [{k: sharding.modulo_shard(k, n) for k in keys} for n in (4, 5)]
+    rendezvous = [{k: sharding.rendezvous_shard(k, n) for k in keys} for n in (4, 5)]
+
+    # adding a 5th shard should only move the ~1/5 keys it takes over
+    assert _moved(*rendezvous) < 0.25
+    assert _moved(*modulo) > 0.7
+    # keys only ever move to the new shard
+    assert all(
+        rendezvous[1][k] == 4 for k in keys if rendezvous[0][k] != rendezvous[1][k]
+    )
+
+
+def test_simulate_weighted_load_skew() -> None:
+    rng = random.Random(0)
+    # heavy tailed namespace sizes, a few namespaces hold most resources
+    weights = {
+        f"namespace-{i}": 1 + int(rng.paretovariate(1.2) * 3) for i in range(200)
+    }
+
+    unweighted = {k: sharding.rendezvous_shard(k, 4) for k in weights}
+    modulo = {k: sharding.modulo_shard(k, 4) for k in weights}
+    weighted = [sharding.assign_shards(weights, n, load_factor=1.1) for n in (4, 5)]
+
+    assert _skew(weighted[0], weights) <= 1.1
+    assert _skew(weighted[0], weights) < _skew(unweighted, weights)
+    assert _skew(weighted[0], weights) < _skew(modulo, weights)
+    assert _skew(weighted[1], weights) <= 1.1
+    # bounded loads cost some extra movement, still far below modulo
+    assert _moved(*weighted) < 0.4
@@ -0,0 +1,290 @@
+"""
+HTTP cache for conditional GET requests.
+
+Responses carrying an ``ETag`` or ``Last-Modified`` header are stored per URL.
+Subsequent GET requests for the same URL are sent with ``If-None-Match`` /
+``If-Modified-Since`` and a ``304 Not Modified`` answer is replayed from the
+cache as if the server returned the full response.
+
+Only responses of URL paths matching one of the adapter's cacheable_paths
+are cached, list endpoints returning small JSON documents are the intended
+use. Large bodies are never cached.
+
+Usage:
+    cache = ResponseCache(max_entries=1000, max_bytes=64 * 1024 * 1024)
+    session.mount(
+        "https://", ConditionalRequestAdapter(cache, cacheable_paths=[...])
+    )
+"""
+
+from __future__ import annotations
+
+import base64
+import hashlib
+import json
+import logging
+import os
+import re
+import tempfile
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+from urllib.parse import urlparse
+
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from prometheus_client.core import Counter, Gauge
+    from requests import PreparedRequest, Response
+
+CACHE_FILE_VERSION = 1
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+# headers describing the encoded body on the wire, they don't apply to the
+# decoded content kept in the cache
+WIRE_HEADERS = frozenset({"content-encoding", "content-length", "transfer-encoding"})
+AUTH_HEADERS = ("Authorization", "PRIVATE-TOKEN", "JOB-TOKEN")
+RATELIMIT_REMAINING_HEADER = "RateLimit-Remaining"
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    etag: str | None
+    last_modified: str | None
+    headers: dict[str, str]
+    content: bytes
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "etag": self.etag,
+            "last_modified": self.last_modified,
+            "headers": self.headers,
+            "content": base64.b64encode(self.content).decode(),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> CachedResponse:
+        return cls(
+            etag=data["etag"],
+            last_modified=data["last_modified"],
+            headers=data["headers"],
+            content=base64.b64decode(data["content"]),
+        )
+
+
+class ResponseCache:
+    """
+    Thread safe LRU store of cacheable responses, bounded by the number of
+    entries and the total size of their bodies. A body larger than a tenth
+    of max_bytes is not stored.
+
+    When path is given, the cache is loaded from it on creation and written
+    back by save(), so it survives restarts of long-running processes.
+    """
+
+    def __init__(
+        self,
+        max_entries: int,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        path: str | None = None,
+    ) -> None:
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.size_bytes = 0
+        self.path = path
+        self._entries: OrderedDict[str, CachedResponse] = OrderedDict()
+        self._lock = threading.Lock()
+        self._dirty = False
+        if path:
+            self.load()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> CachedResponse | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, entry: CachedResponse) -> None:
+        if len(entry.content) > self.max_bytes // 10:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.size_bytes -= len(previous.content)
+            self._entries[key] = entry
+            self.size_bytes += len(entry.content)
+            self._evict()
+            self._dirty = True
+
+    def _evict(self) -> None:
+        while len(self._entries) > self.max_entries or self.size_bytes > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self.size_bytes -= len(evicted.content)
+
+    def load(self) -> None:
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") != CACHE_FILE_VERSION:
+                return
+            entries = [
+                (key, CachedResponse.from_dict(entry)) for key, entry in data["entries"]
+            ]
+        except OSError, ValueError, KeyError, TypeError:
+            logging.warning(f"ignoring unreadable response cache {self.path}")
+            return
+        with self._lock:
+            self._entries = OrderedDict(entries)
+            self.size_bytes = sum(len(e.content) for e in self._entries.values())
+            self._evict()
+            self._dirty = False
+
+    def save(self) -> None:
+        if not self.path:
+            return
+        with self._lock:
+            if not self._dirty:
+                return
+            data = {
+                "version": CACHE_FILE_VERSION,
+                "entries": [
+                    (key, entry.to_dict()) for key, entry in self._entries.items()
+                ],
+            }
+            self._dirty = False
+        directory = Path(self.path).parent
+        directory.mkdir(parents=True, exist_ok=True)
+        # write to a temporary file first, a crash must not leave a
+        # truncated cache behind
+        with tempfile.NamedTemporaryFile(
+            "w", dir=directory, delete=False, encoding="utf-8"
+        ) as f:
+            json.dump(data, f)
+        os.replace(f.name, self.path)
+
+
+def cache_key(request: PreparedRequest) -> str:
+    """
+    Key a request by URL and credentials.
+
+    Credentials are part of the key so a cache shared by several clients
+    never replays a response fetched with another token. Only a digest of
+    them is kept.
+    """
+    credentials = "\n".join(request.headers.get(h, "") for h in AUTH_HEADERS)
+    digest = hashlib.sha256(credentials.encode()).hexdigest()[:16]
+    return f"{digest} {request.url}"
+
+
+class ConditionalRequestAdapter(HTTPAdapter):
+    """
+    HTTPAdapter sending GET requests as conditional requests against the cache.
+
+    Only GET requests of URL paths matching one of cacheable_paths are
+    cached. hits and misses count conditional requests answered with 304
+    or with a full response, ratelimit_remaining tracks the
+    RateLimit-Remaining header of every response.
+    """
+
+    def __init__(
+        self,
+        cache: ResponseCache,
+        cacheable_paths: Iterable[str | re.Pattern[str]],
+        hits: Counter | None = None,
+        misses: Counter | None = None,
+        ratelimit_remaining: Gauge | None = None,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(**kwargs)
+        self.cache = cache
+        self.cacheable_paths = [re.compile(p) for p in cacheable_paths]
+        self.hits = hits
+        self.misses = misses
+        self.ratelimit_remaining = ratelimit_remaining
+
+    def send(  # type: ignore[override]
+        self, request: PreparedRequest, stream: bool = False, **kwargs: Any
+    ) -> Response:
+        cacheable = (
+            request.method == "GET"
+            and not stream
+            and "If-None-Match" not in request.headers
+            and "If-Modified-Since" not in request.headers
+            and self._cacheable_path(request)
+        )
+        if not cacheable:
+            return self._track(super().send(request, stream=stream, **kwargs))
+
+        key = cache_key(request)
+        entry = self.cache.get(key)
+        if entry:
+            if entry.etag:
+                request.headers["If-None-Match"] = entry.etag
+            if entry.last_modified:
+                request.headers["If-Modified-Since"] = entry.last_modified
+
+        response = self._track(super().send(request, stream=stream, **kwargs))
+        if entry and response.status_code == 304:
+            if self.hits:
+                self.hits.inc()
+            return self._replay(response, entry)
+        if entry and self.misses:
+            self.misses.inc()
+        if response.status_code == 200:
+            self._store(key, response)
+        return response
+
+    def _cacheable_path(self, request: PreparedRequest) -> bool:
+        path = urlparse(request.url or "").path
+        return any(p.fullmatch(path) for p in self.cacheable_paths)
+
+    def _track(self, response: Response) -> Response:
+        remaining = response.headers.get(RATELIMIT_REMAINING_HEADER)
+        if self.ratelimit_remaining and remaining and remaining.isdigit():
+            self.ratelimit_remaining.set(int(remaining))
+        return response
+
+    def _store(self, key: str, response: Response) -> None:
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if not etag and not last_modified:
+            return
+        self.cache.set(
+            key,
+            CachedResponse(
+                etag=etag,
+                last_modified=last_modified,
+                headers={
+                    k: v
+                    for k, v in response.headers.items()
+                    if k.lower() not in WIRE_HEADERS
+                },
+                content=response.content,
+            ),
+        )
+
+    @staticmethod
+    def _replay(response: Response, entry: CachedResponse) -> Response:
+        headers: CaseInsensitiveDict[str] = CaseInsensitiveDict(entry.headers)
+        # a 304 carries the current metadata, e.g. rate limit counters
+        headers.update({
+            k: v
+            for k, v in response.headers.items()
+            if k.lower() not in WIRE_HEADERS and k.lower() != "content-type"
+        })
+        response.status_code = 200
+        response.reason = "OK"
+        response.headers = headers
+        response._content = entry.content
+        return response
@@ -7,7 +7,7 @@ import re
 import tarfile
 from dataclasses import dataclass
 from datetime import datetime
-from functools import cached_property
+from functools import cache, cached_property
 from operator import attrgetter
 from typing import (
     TYPE_CHECKING,
@@ -49,8 +49,17 @@ from gitlab.v4.objects import (
 )
 from sretoolbox.utils import retry
 
+from reconcile.utils.conditional_request_cache import (
+    DEFAULT_MAX_BYTES,
+    ConditionalRequestAdapter,
+    ResponseCache,
+)
 from reconcile.utils.instrumented_wrappers import InstrumentedSession
-from reconcile.utils.metrics import gitlab_request
+from reconcile.utils.metrics import (
+    gitlab_conditional_request,
+    gitlab_ratelimit_remaining,
+    gitlab_request,
+)
 from reconcile.utils.secret_reader import SecretReader, SecretReaderBase
 
 if TYPE_CHECKING:
@@ -71,6 +80,23 @@ MR_DESCRIPTION_COMMENT_ID = 0
 DEFAULT_MAIN_BRANCH = "master"
 MAX_PER_PAGE = 100
 
+MERGE_REQUEST_COMMIT_COUNTS_QUERY = """
+query MergeRequestCommitCounts($project: ID!, $iids: [String!], $after: String) {
+  project(fullPath: $project) {
+    mergeRequests(iids: $iids, first: 100, after: $after) {
+      pageInfo {
+        hasNextPage
+        endCursor
+      }
+      nodes {
+        iid
+        commitCount
+      }
+    }
+  }
+}
+"""
+
 
 class MRState:
     """
@@ -116,6 +142,40 @@ class Comment:
     note: ProjectMergeRequestNote | None = None
 
 
+# List endpoints re-read on every integration loop whose responses rarely
+# change. Other responses, e.g. raw files and archives, are never cached.
+CACHEABLE_PATHS = [
+    r"/api/v4/projects/[^/]+/labels",
+    r"/api/v4/projects/[^/]+/hooks",
+    r"/api/v4/projects/[^/]+/pipelines",
+    r"/api/v4/projects/[^/]+/merge_requests/\d+/notes",
+    r"/api/v4/projects/[^/]+/merge_requests/\d+/pipelines",
+    r"/api/v4/groups/[^/]+/members(/all)?",
+]
+
+
+@cache
+def default_response_cache() -> ResponseCache | None:
+    """
+    Process wide cache of GitLab API responses, shared by all GitLabApi
+    instances so it outlives a single integration run.
+
+    The cache is off unless GITLAB_RESPONSE_CACHE_ENABLED is set.
+    GITLAB_RESPONSE_CACHE_MAX_ENTRIES and GITLAB_RESPONSE_CACHE_MAX_BYTES
+    bound the cached responses, GITLAB_RESPONSE_CACHE_PATH enables persisting
+    it. The persisted file is not encrypted.
+    """
+    if not os.getenv("GITLAB_RESPONSE_CACHE_ENABLED"):
+        return None
+    return ResponseCache(
+        max_entries=int(os.getenv("GITLAB_RESPONSE_CACHE_MAX_ENTRIES", "1000")),
+        max_bytes=int(
+            os.getenv("GITLAB_RESPONSE_CACHE_MAX_BYTES", str(DEFAULT_MAX_BYTES))
+        ),
+        path=os.getenv("GITLAB_RESPONSE_CACHE_PATH") or None,
+    )
+
+
 class GitLabApi:
     def __init__(
         self,
@@ -126,6 +186,7 @@ class GitLabApi:
         project_url: str | None = None,
         timeout: float = 120,
         session: Session | None = None,
+        response_cache: ResponseCache | None = None,
     ):
         self.server = instance["url"]
         if not secret_reader:
@@ -134,9 +195,31 @@ class GitLabApi:
         self.ssl_verify = (
             instance["sslVerify"] if instance["sslVerify"] is not None else True
         )
-        self.session = session or InstrumentedSession(
-            gitlab_request.labels(integration=os.getenv("INTEGRATION_NAME", ""))
-        )
+        integration = os.getenv("INTEGRATION_NAME", "")
+        self.response_cache = response_cache
+        if session is None:
+            session = InstrumentedSession(
+                gitlab_request.labels(integration=integration)
+            )
+            if response_cache is None:
+                self.response_cache = default_response_cache()
+        if self.response_cache is not None:
+            adapter = ConditionalRequestAdapter(
+                self.response_cache,
+                cacheable_paths=CACHEABLE_PATHS,
+                hits=gitlab_conditional_request.labels(
+                    integration=integration, result="hit"
+                ),
+                misses=gitlab_conditional_request.labels(
+                    integration=integration, result="miss"
+                ),
+                ratelimit_remaining=gitlab_ratelimit_remaining.labels(
+                    integration=integration
+                ),
+            )
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+        self.session = session
         self.gl = Gitlab(
             self.server,
             private_token=token,
@@ -181,8 +264,10 @@ class GitLabApi:
 
     def cleanup(self) -> None:
         """
-        Close session.
+        Close session and persist the response cache.
         """
+        if self.response_cache is not None:
+            self.response_cache.save()
         self.session.close()
 
     @retry()
@@ -367,6 +452,45 @@ class GitLabApi:
     def get_merge_requests(self, state: str) -> list[ProjectMergeRequest]:
         return self.project.mergerequests.list(state=state, get_all=True)
 
+    def get_merge_request_commit_counts(self, iids: Iterable[int]) -> dict[int, int]:
+        """
+        Get the number of commits of the given project MRs, keyed by iid.
+
+        Uses the GraphQL API to fetch the counts in batches of MAX_PER_PAGE
+        MRs instead of listing the commits of every MR. MRs GitLab does not
+        report a commit count for are missing from the result.
+        """
+        sorted_iids = sorted({str(iid) for iid in iids}, key=int)
+        commit_counts: dict[int, int] = {}
+        for i in range(0, len(sorted_iids), MAX_PER_PAGE):
+            variables: dict[str, Any] = {
+                "project": self.project.path_with_namespace,
+                "iids": sorted_iids[i : i + MAX_PER_PAGE],
+                "after": None,
+            }
+            while True:
+                result = cast(
+                    "dict",
+                    self.gl.http_post(
+                        f"{self.server}/api/graphql",
+                        post_data={
+                            "query": MERGE_REQUEST_COMMIT_COUNTS_QUERY,
+                            "variables": variables,
+                        },
+                    ),
+                )
+                if errors := result.get("errors"):
+                    raise GitlabGetError(error_message=str(errors))
+                merge_requests = result["data"]["project"]["mergeRequests"]
+                for node in merge_requests["nodes"]:
+                    if node["commitCount"] is not None:
+                        commit_counts[int(node["iid"])] = node["commitCount"]
+                page_info = merge_requests["pageInfo"]
+                if not page_info["hasNextPage"]:
+                    break
+                variables["after"] = page_info["endCursor"]
+        return commit_counts
+
     @staticmethod
     def get_merge_request_label_events(
         mr: ProjectMergeRequest,
@@ -1,10 +1,11 @@
 from __future__ import annotations
 
 import datetime
+import hashlib
 import json
 import os
 import threading
-from functools import cache
+from collections import OrderedDict
 from typing import TYPE_CHECKING, Any, Self
 
 import jinja2
@@ -34,6 +35,7 @@ from reconcile.utils.jinja2.filters import (
     urlunescape,
     yaml_to_dict,
 )
+from reconcile.utils.metrics import jinja2_template_cache
 from reconcile.utils.secret_reader import (
     SecretNotFoundError,
     SecretReader,
@@ -69,14 +71,11 @@ class TemplateRenderOptions(BaseModel, frozen=True):
         )
 
 
-@cache
-def compile_jinja2_template(
+def _compile_jinja2_template(
     body: str,
-    extra_curly: bool = False,
-    template_render_options: TemplateRenderOptions | None = None,
+    extra_curly: bool,
+    template_render_options: TemplateRenderOptions,
 ) -> Any:
-    if not template_render_options:
-        template_render_options = TemplateRenderOptions.create()
     env: dict[str, Any] = template_render_options.model_dump()
     if extra_curly:
         env.update({
@@ -108,6 +107,111 @@ def compile_jinja2_template(
     return jinja_env.from_string(body)
 
 
+# Bounds of the compiled template cache. Compiled templates grow with their
+# source, so the size of the cached template bodies bounds their memory.
+TEMPLATE_CACHE_MAX_ENTRIES = 4096
+TEMPLATE_CACHE_MAX_BYTES = 32 * 1024 * 1024
+
+
+class CompiledTemplateCache:
+    """Thread safe LRU of compiled templates, bounded by the number of
+    entries and the total size of their template bodies.
+
+    Templates are keyed by a hash of their body and environment settings,
+    hits, misses and evictions are counted in jinja2_template_cache.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = TEMPLATE_CACHE_MAX_ENTRIES,
+        max_bytes: int = TEMPLATE_CACHE_MAX_BYTES,
+    ) -> None:
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.size_bytes = 0
+        # key -> (compiled template, size of its body)
+        self._entries: OrderedDict[str, tuple[Any, int]] = OrderedDict()
+        self._lock = threading.Lock()
+        integration = os.getenv("INTEGRATION_NAME", "")
+        self._hits = jinja2_template_cache.labels(integration=integration, result="hit")
+        self._misses = jinja2_template_cache.labels(
+            integration=integration, result="miss"
+        )
+        self._evictions = jinja2_template_cache.labels(
+            integration=integration, result="eviction"
+        )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def key(
+        body: str, extra_curly: bool, template_render_options: TemplateRenderOptions
+    ) -> str:
+        settings = json.dumps(
+            [extra_curly, template_render_options.model_dump()], sort_keys=True
+        )
+        digest = hashlib.sha256(settings.encode())
+        digest.update(body.encode())
+        return digest.hexdigest()
+
+    def get_or_compile(
+        self,
+        body: str,
+        extra_curly: bool,
+        template_render_options: TemplateRenderOptions,
+    ) -> Any:
+        key = self.key(body, extra_curly, template_render_options)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+        if entry is not None:
+            self._hits.inc()
+            return entry[0]
+
+        self._misses.inc()
+        # compile outside the lock, a template compiled twice by concurrent
+        # renderings is cheaper than serializing all compilations
+        template = _compile_jinja2_template(body, extra_curly, template_render_options)
+        size = len(body.encode())
+        if size > self.max_bytes:
+            return template
+        with self._lock:
+            if key not in self._entries:
+                self._entries[key] = (template, size)
+                self.size_bytes += size
+            self._entries.move_to_end(key)
+            while (
+                len(self._entries) > self.max_entries
+                or self.size_bytes > self.max_bytes
+            ):
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self.size_bytes -= evicted_size
+                self._evictions.inc()
+        return template
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.size_bytes = 0
+
+
+compiled_template_cache = CompiledTemplateCache()
+
+
+def compile_jinja2_template(
+    body: str,
+    extra_curly: bool = False,
+    template_render_options: TemplateRenderOptions | None = None,
+) -> Any:
+    return compiled_template_cache.get_or_compile(
+        body,
+        extra_curly,
+        template_render_options or TemplateRenderOptions.create(),
+    )
+
+
 GH_BASE_URL = os.environ.get("GITHUB_API", "https://api.github.com")
 
 
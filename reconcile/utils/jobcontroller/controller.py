@@ -3,8 +3,9 @@ from __future__ import annotations
 import logging
 import time
 from datetime import datetime
-from typing import TYPE_CHECKING, Protocol, TextIO
+from typing import TYPE_CHECKING, Any, Protocol, TextIO
 
+import urllib3
 from kubernetes.client import (
     ApiClient,
     V1Job,
@@ -12,6 +13,8 @@ from kubernetes.client import (
     V1OwnerReference,
     V1Secret,
 )
+from kubernetes.client.exceptions import ApiException
+from kubernetes.dynamic.exceptions import DynamicApiError
 
 from reconcile.typed_queries.clusters_minimal import get_clusters_minimal
 from reconcile.utils.jobcontroller.models import (
@@ -21,10 +24,13 @@ from reconcile.utils.jobcontroller.models import (
     JobValidationError,
     K8sJob,
 )
+from reconcile.utils.oc import OCNative
 from reconcile.utils.oc_map import init_oc_map_from_clusters
 from reconcile.utils.openshift_resource import OpenshiftResource
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
     from reconcile.utils.oc import OCCli
     from reconcile.utils.secret_reader import SecretReaderBase
 
@@ -66,6 +72,13 @@ def build_job_controller(
     )
 
 
+# upper bound for a single watch stream when waiting without a timeout.
+# the watch is re-established until all jobs are finished.
+WATCH_TIMEOUT_SECONDS = 300
+
+FINISHED_JOB_STATUSES = {JobStatus.SUCCESS, JobStatus.ERROR}
+
+
 class TimeProtocol(Protocol):
     def time(self) -> float: ...
 
@@ -107,11 +120,7 @@ class K8sJobController:
             kind="Job.batch",
             namespace=self.namespace,
         ):
-            openshift_resource = OpenshiftResource(
-                body=item,
-                integration=self.integration,
-                integration_version=self.integration_version,
-            )
+            openshift_resource = self._build_job_resource(item)
             new_cache[openshift_resource.name] = openshift_resource
         self._cache = new_cache
         return self._cache
@@ -168,6 +177,13 @@ class K8sJobController:
         dt_completion_time = datetime.fromisoformat(completion_time)
         return int((dt_completion_time - dt_start_time).total_seconds())
 
+    def _build_job_resource(self, item: dict[str, Any]) -> OpenshiftResource:
+        return OpenshiftResource(
+            body=item,
+            integration=self.integration,
+            integration_version=self.integration_version,
+        )
+
     def wait_for_job_list_completion(
         self, job_names: set[str], check_interval_seconds: int, timeout_seconds: int
     ) -> dict[str, JobStatus]:
@@ -182,25 +198,115 @@ class K8sJobController:
         The timeout_seconds parameter is the maximum time to wait for all jobs to complete. If set to -1,
         the function will wait indefinitely.  If a timeout occures, a TimeoutError will be raised.
         """
-        jobs_left = job_names.copy()
         job_statuses: dict[str, JobStatus] = dict.fromkeys(
             job_names, JobStatus.NOT_EXISTS
         )
+        job_statuses.update(
+            self.iter_job_list_completion(
+                job_names, check_interval_seconds, timeout_seconds
+            )
+        )
+        return job_statuses
 
+    def iter_job_list_completion(
+        self, job_names: set[str], check_interval_seconds: int, timeout_seconds: int
+    ) -> Iterator[tuple[str, JobStatus]]:
+        """
+        Yields (job_name, status) for every job in the list as soon as it finishes,
+        so callers can start processing a finished job while the others are still running.
+        Jobs that did not finish within the timeout are yielded at the end with their
+        last known status (IN_PROGRESS or NOT_EXISTS).
+
+        Job status changes are streamed with a watch on the namespace if the client supports it.
+        If the watch is not available or fails, the jobs are polled every check_interval_seconds.
+        See wait_for_job_list_completion for the timeout semantics.
+        """
+        jobs_left = job_names.copy()
         start_time = self.time_module.time()
+        if isinstance(self.oc, OCNative):
+            try:
+                yield from self._watch_job_list_completion(
+                    jobs_left, start_time, timeout_seconds
+                )
+            except (ApiException, DynamicApiError, urllib3.exceptions.HTTPError) as e:
+                logging.warning(
+                    f"Watching jobs in {self.cluster}/{self.namespace} failed, falling back to polling: {e}"
+                )
+        if jobs_left:
+            yield from self._poll_job_list_completion(
+                jobs_left, start_time, check_interval_seconds, timeout_seconds
+            )
+
+    def _watch_job_list_completion(
+        self, jobs_left: set[str], start_time: float, timeout_seconds: int
+    ) -> Iterator[tuple[str, JobStatus]]:
+        """
+        Consumes job events from a watch and removes finished jobs from jobs_left.
+        The watch starts with an ADDED event for every existing job, so the cache
+        is rebuilt from the stream and stays a full view of the namespace.
+        """
+        assert isinstance(self.oc, OCNative)
+        while jobs_left:
+            watch_timeout = WATCH_TIMEOUT_SECONDS
+            if timeout_seconds >= 0:
+                remaining = timeout_seconds - (self.time_module.time() - start_time)
+                watch_timeout = min(WATCH_TIMEOUT_SECONDS, max(int(remaining), 0))
+            if watch_timeout <= 0:
+                break
+            new_cache: dict[str, OpenshiftResource] = {}
+            self._cache = new_cache
+            logging.info(f"Watching {jobs_left} for completion")
+            for event_type, item in self.oc.watch_items(
+                kind="Job.batch",
+                namespace=self.namespace,
+                timeout_seconds=watch_timeout,
+            ):
+                job_resource = self._build_job_resource(item)
+                match event_type:
+                    case "ADDED" | "MODIFIED":
+                        new_cache[job_resource.name] = job_resource
+                    case "DELETED":
+                        new_cache.pop(job_resource.name, None)
+                    case _:
+                        continue
+                if job_resource.name not in jobs_left:
+                    continue
+                status = self.get_job_status(job_resource.name)
+                if status in FINISHED_JOB_STATUSES:
+                    jobs_left.remove(job_resource.name)
+                    yield job_resource.name, status
+                if not jobs_left:
+                    return
+
+        if jobs_left:
+            logging.warning(f"Timeout waiting for jobs to complete: {jobs_left}")
+            for job_name in list(jobs_left):
+                jobs_left.remove(job_name)
+                yield job_name, self.get_job_status(job_name)
+
+    def _poll_job_list_completion(
+        self,
+        jobs_left: set[str],
+        start_time: float,
+        check_interval_seconds: int,
+        timeout_seconds: int,
+    ) -> Iterator[tuple[str, JobStatus]]:
         while jobs_left:
             self.update_cache()
             for job_name in list(jobs_left):
                 status = self.get_job_status(job_name)
-                job_statuses[job_name] = status
-                if status in {JobStatus.SUCCESS, JobStatus.ERROR}:
+                if status in FINISHED_JOB_STATUSES:
                     jobs_left.remove(job_name)
+                    yield job_name, status
             if jobs_left:
                 elapsed_time = self.time_module.time() - start_time
                 if timeout_seconds >= 0 and elapsed_time >= timeout_seconds:
                     logging.warning(
                         f"Timeout waiting for jobs to complete: {jobs_left}"
                     )
+                    for job_name in list(jobs_left):
+                        jobs_left.remove(job_name)
+                        yield job_name, self.get_job_status(job_name)
                     break
                 logging.info(
                     f"Waiting for {jobs_left} to complete. Rechecking in {check_interval_seconds} seconds"
@@ -208,7 +314,6 @@ class K8sJobController:
                 self._sleep_until_timeout(
                     elapsed_time, timeout_seconds, check_interval_seconds
                 )
-        return job_statuses
 
     def enqueue_job_and_wait_for_completion(
         self,
@@ -368,21 +473,15 @@ class K8sJobController:
         The timeout_seconds parameter is the maximum time to wait for all jobs to complete. If set to -1,
         the function will wait indefinitely. If a timeout occures, a TimeoutError will be raised.
         """
-        start_time = self.time_module.time()
-        while True:
-            self.update_cache()
-            status = self.get_job_status(job_name)
-            match status:
-                case JobStatus.SUCCESS:
-                    return True
-                case JobStatus.ERROR:
-                    return False
-            elapsed_time = self.time_module.time() - start_time
-            if timeout_seconds >= 0 and elapsed_time >= timeout_seconds:
-                raise TimeoutError(f"Timeout waiting for job {job_name} to complete")
-            self._sleep_until_timeout(
-                elapsed_time, timeout_seconds, check_interval_seconds
-            )
+        status = self.wait_for_job_list_completion(
+            {job_name}, check_interval_seconds, timeout_seconds
+        )[job_name]
+        match status:
+            case JobStatus.SUCCESS:
+                return True
+            case JobStatus.ERROR:
+                return False
+        raise TimeoutError(f"Timeout waiting for job {job_name} to complete")
 
     def _sleep_until_timeout(
         self,
@@ -70,6 +70,13 @@ execution_counter = Counter(
     labelnames=["integration", "shards", "shard_id"],
 )
 
+skipped_execution_counter = Counter(
+    name="qontract_reconcile_skipped_execution_counter",
+    documentation="Counts integration executions skipped because their inputs "
+    "did not change",
+    labelnames=["integration", "shards", "shard_id"],
+)
+
 reconcile_time = Histogram(
     name="qontract_reconcile_function_elapsed_seconds_since_bundle_commit",
     documentation="Run time seconds for tracked functions",
@@ -120,6 +127,26 @@ gitlab_request = Counter(
     labelnames=["integration"],
 )
 
+gitlab_conditional_request = Counter(
+    name="qontract_reconcile_gitlab_conditional_request_total",
+    documentation="Number of conditional calls made to Gitlab API. A hit is a "
+    "304 Not Modified answer served from the response cache",
+    labelnames=["integration", "result"],
+)
+
+gitlab_ratelimit_remaining = Gauge(
+    name="qontract_reconcile_gitlab_ratelimit_remaining",
+    documentation="Remaining calls to Gitlab API in the current rate limit window",
+    labelnames=["integration"],
+)
+
+jinja2_template_cache = Counter(
+    name="qontract_reconcile_jinja2_template_cache_total",
+    documentation="Lookups and evictions of the compiled jinja2 template cache, "
+    "by result: hit, miss or eviction",
+    labelnames=["integration", "result"],
+)
+
 ocm_request = Counter(
     name="qontract_reconcile_ocm_request_total",
     documentation="Number of calls made to OCM API",
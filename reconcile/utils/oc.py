@@ -57,7 +57,7 @@ from reconcile.utils.secret_reader import (
 from reconcile.utils.unleash import get_feature_toggle_state
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, Iterable, Mapping
+    from collections.abc import Callable, Iterable, Iterator, Mapping
 
     from reconcile.utils.oc_connection_parameters import OCConnectionParameters
 
@@ -1465,6 +1465,22 @@ class OCNative(OCCli):
         except NotFoundError as e:
             raise StatusCodeError(f"[{self.server}]: {e}") from None
 
+    def watch_items(
+        self, kind: str, namespace: str, timeout_seconds: int
+    ) -> Iterator[tuple[str, dict[str, Any]]]:
+        """
+        Streams (event type, resource) tuples for all objects of the given kind
+        in the namespace. The stream starts with an ADDED event for every existing
+        object, followed by ADDED, MODIFIED and DELETED events as they happen.
+        The server closes the stream after timeout_seconds.
+        """
+        resource = self.get_api_resource(kind)
+        obj_client = self._get_obj_client(
+            group_version=resource.group_version, kind=resource.kind
+        )
+        for event in obj_client.watch(namespace=namespace, timeout=timeout_seconds):
+            yield event["type"], event["raw_object"]
+
 
 OCClient = OCNative | OCCli
 
@@ -3,7 +3,7 @@ from __future__ import annotations
 import functools
 from typing import TYPE_CHECKING, Any
 
-from sretoolbox.utils import retry
+from sretoolbox.utils import retry, threaded
 
 import reconcile.utils.aws_helper as awsh
 from reconcile.gql_definitions.fragments.vault_secret import VaultSecret
@@ -14,6 +14,7 @@ from reconcile.utils.ocm.products import (
     build_product_portfolio,
 )
 from reconcile.utils.ocm_base_client import (
+    HTTP_POOL_MAXSIZE,
     OCMAPIClientConfiguration,
     OCMBaseClient,
     init_ocm_base_client,
@@ -43,6 +44,8 @@ ROUTER_DESIRED_KEYS = {"id", "listening", "dns_name", "route_selectors"}
 CLUSTER_ADDON_DESIRED_KEYS = {"id", "parameters"}
 
 REQUEST_TIMEOUT_SEC = 60
+OCM_MAP_THREAD_POOL_SIZE = 10
+PROVISION_SHARDS_THREAD_POOL_SIZE = 10
 
 
 class OCM:
@@ -56,6 +59,7 @@ class OCM:
     :param init_provision_shards: should initiate provision shards
     :param init_addons: should initiate addons
     :param init_version_gates: should initiate version gates
+    :param thread_pool_size: number of provision shards fetched concurrently
     :type init_provision_shards: bool
     :type init_addons: bool
     :type init_version_gates: bool
@@ -71,6 +75,7 @@ class OCM:
         init_addons: bool = False,
         init_version_gates: bool = False,
         product_portfolio: OCMProductPortfolio | None = None,
+        thread_pool_size: int = PROVISION_SHARDS_THREAD_POOL_SIZE,
     ):
         """Initiates access token and gets clusters information."""
         self.name = name
@@ -81,7 +86,10 @@ class OCM:
             self.product_portfolio = build_product_portfolio()
         else:
             self.product_portfolio = product_portfolio
-        self._init_clusters(init_provision_shards=init_provision_shards)
+        self._init_clusters(
+            init_provision_shards=init_provision_shards,
+            thread_pool_size=thread_pool_size,
+        )
 
         if init_addons:
             self._init_addons()
@@ -110,7 +118,11 @@ class OCM:
             and cluster["product"]["id"] in self.product_portfolio.product_names
         )
 
-    def _init_clusters(self, init_provision_shards: bool) -> None:
+    def _init_clusters(
+        self,
+        init_provision_shards: bool,
+        thread_pool_size: int = PROVISION_SHARDS_THREAD_POOL_SIZE,
+    ) -> None:
         api = f"{CS_API_BASE}/v1/clusters"
         product_csv = ",".join([f"'{p}'" for p in self.product_portfolio.product_names])
         params = {
@@ -123,16 +135,26 @@ class OCM:
         self.available_cluster_upgrades: dict[str, list[str]] = {}
         self.not_ready_clusters: set[str] = set()
 
+        ready_clusters = []
         for c in clusters:
-            cluster_name = c["name"]
             if self._ready_for_app_interface(c):
-                ocm_spec = self._get_cluster_ocm_spec(c, init_provision_shards)
-                self.clusters[cluster_name] = ocm_spec
-                self.available_cluster_upgrades[cluster_name] = c.get(
-                    "version", {}
-                ).get("available_upgrades")
+                ready_clusters.append(c)
             else:
-                self.not_ready_clusters.add(cluster_name)
+                self.not_ready_clusters.add(c["name"])
+
+        # fetching the provision shard is a request per cluster
+        ocm_specs = threaded.run(
+            self._get_cluster_ocm_spec,
+            ready_clusters,
+            thread_pool_size if init_provision_shards else 1,
+            init_provision_shards=init_provision_shards,
+        )
+        for c, ocm_spec in zip(ready_clusters, ocm_specs, strict=True):
+            cluster_name = c["name"]
+            self.clusters[cluster_name] = ocm_spec
+            self.available_cluster_upgrades[cluster_name] = c.get("version", {}).get(
+                "available_upgrades"
+            )
 
     def get_product_impl(
         self, product: str, hypershift: bool | None = False
@@ -748,6 +770,7 @@ class OCMMap:
     :type init_provision_shards: bool
     :type init_addons: bool
     :type init_version_gates bool
+    :param thread_pool_size: number of OCM instances initiated concurrently
     """
 
     def __init__(
@@ -761,6 +784,7 @@ class OCMMap:
         init_addons: bool = False,
         init_version_gates: bool = False,
         product_portfolio: OCMProductPortfolio | None = None,
+        thread_pool_size: int = OCM_MAP_THREAD_POOL_SIZE,
     ) -> None:
         """Initiates OCM instances for each OCM referenced in a cluster."""
         self.clusters_map: dict[str, str] = {}
@@ -772,35 +796,23 @@ class OCMMap:
         if len(inputs) > 1:
             raise KeyError("expected only one of clusters, namespaces or ocm.")
         if clusters:
-            for cluster_info in clusters:
-                self.init_ocm_client_from_cluster(
-                    cluster_info,
-                    init_provision_shards,
-                    init_addons,
-                    init_version_gates=init_version_gates,
-                    product_portfolio=product_portfolio,
-                )
+            ocm_infos = self._register_clusters(clusters)
         elif namespaces:
-            for namespace_info in namespaces:
-                cluster_info = namespace_info["cluster"]
-                self.init_ocm_client_from_cluster(
-                    cluster_info,
-                    init_provision_shards,
-                    init_addons,
-                    init_version_gates=init_version_gates,
-                    product_portfolio=product_portfolio,
-                )
+            ocm_infos = self._register_clusters(
+                namespace_info["cluster"] for namespace_info in namespaces
+            )
         elif ocms:
-            for ocm in ocms:
-                self.init_ocm_client(
-                    ocm,
-                    init_provision_shards,
-                    init_addons,
-                    init_version_gates=init_version_gates,
-                    product_portfolio=product_portfolio,
-                )
+            ocm_infos = list({ocm["name"]: ocm for ocm in ocms}.values())
         else:
             raise KeyError("expected one of clusters, namespaces or ocm.")
+        self.init_ocm_clients(
+            ocm_infos,
+            init_provision_shards,
+            init_addons,
+            init_version_gates=init_version_gates,
+            product_portfolio=product_portfolio,
+            thread_pool_size=thread_pool_size,
+        )
 
     def __getitem__(self, ocm_name: str) -> OCM:
         return self.ocm_map[ocm_name]
@@ -830,6 +842,63 @@ class OCMMap:
                 product_portfolio,
             )
 
+    def _register_clusters(
+        self, cluster_infos: Iterable[Mapping[str, Any]]
+    ) -> list[Mapping[str, Any]]:
+        """
+        Point each enabled cluster to its OCM instance and return the
+        distinct OCM instances referenced by them.
+        """
+        ocm_infos: dict[str, Mapping[str, Any]] = {}
+        for cluster_info in cluster_infos:
+            if self.cluster_disabled(cluster_info):
+                continue
+            ocm_info = cluster_info["ocm"]
+            self.clusters_map[cluster_info["name"]] = ocm_info["name"]
+            ocm_infos.setdefault(ocm_info["name"], ocm_info)
+        return list(ocm_infos.values())
+
+    def init_ocm_clients(
+        self,
+        ocm_infos: Iterable[Mapping[str, Any]],
+        init_provision_shards: bool,
+        init_addons: bool,
+        init_version_gates: bool,
+        product_portfolio: OCMProductPortfolio | None = None,
+        thread_pool_size: int = OCM_MAP_THREAD_POOL_SIZE,
+    ) -> None:
+        """
+        Initiate OCM clients concurrently, so the setup takes as long as
+        the slowest OCM instance rather than the sum of all of them.
+
+        :param ocm_infos: Graphql ocm query results
+        :param thread_pool_size: number of OCM instances initiated concurrently
+        """
+        ocm_infos = [
+            ocm_info for ocm_info in ocm_infos if ocm_info["name"] not in self.ocm_map
+        ]
+        # all OCM clients share one HTTP connection pool: split it between
+        # the OCM instances and their provision shard lookups, so the
+        # requests in flight don't outnumber the pooled connections
+        thread_pool_size = max(
+            1, min(thread_pool_size, len(ocm_infos), HTTP_POOL_MAXSIZE)
+        )
+        ocms = threaded.run(
+            self._init_ocm,
+            ocm_infos,
+            thread_pool_size,
+            init_provision_shards=init_provision_shards,
+            init_addons=init_addons,
+            init_version_gates=init_version_gates,
+            product_portfolio=product_portfolio,
+            provision_shards_thread_pool_size=min(
+                PROVISION_SHARDS_THREAD_POOL_SIZE,
+                HTTP_POOL_MAXSIZE // thread_pool_size,
+            ),
+        )
+        for ocm_info, ocm in zip(ocm_infos, ocms, strict=True):
+            self.ocm_map[ocm_info["name"]] = ocm
+
     def init_ocm_client(
         self,
         ocm_info: Mapping[str, Any],
@@ -841,8 +910,6 @@ class OCMMap:
         """
         Initiate OCM client.
         Gets the OCM information and initiates an OCM client.
-        Skip initiating OCM if it has already been initialized or if
-        the current integration is disabled on it.
 
         :param ocm_info: Graphql ocm query result
         :param init_provision_shards: should initiate provision shards
@@ -850,7 +917,23 @@ class OCMMap:
 
         :type cluster_info: dict
         """
-        ocm_name = ocm_info["name"]
+        self.ocm_map[ocm_info["name"]] = self._init_ocm(
+            ocm_info,
+            init_provision_shards,
+            init_addons,
+            init_version_gates,
+            product_portfolio,
+        )
+
+    def _init_ocm(
+        self,
+        ocm_info: Mapping[str, Any],
+        init_provision_shards: bool,
+        init_addons: bool,
+        init_version_gates: bool,
+        product_portfolio: OCMProductPortfolio | None = None,
+        provision_shards_thread_pool_size: int = PROVISION_SHARDS_THREAD_POOL_SIZE,
+    ) -> OCM:
         ocm_environment = ocm_info["environment"]
         access_token_client_id = (
             ocm_info.get("accessTokenClientId")
@@ -876,7 +959,7 @@ class OCMMap:
             secret_reader=SecretReader(settings=self.settings),
         )
 
-        self.ocm_map[ocm_name] = OCM(
+        return OCM(
             name,
             org_id,
             ocm_environment["name"],
@@ -885,6 +968,7 @@ class OCMMap:
             init_addons=init_addons,
             init_version_gates=init_version_gates,
             product_portfolio=product_portfolio,
+            thread_pool_size=provision_shards_thread_pool_size,
         )
 
     def instances(self) -> list[str]:
@@ -1,6 +1,10 @@
 from __future__ import annotations
 
 import logging
+import threading
+import time
+from collections import defaultdict
+from dataclasses import dataclass
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -9,11 +13,14 @@ from typing import (
 )
 
 from pydantic import BaseModel
+from qontract_utils.pagination import Page, iter_pages
 from qontract_utils.user_agent import resolve_version
 from requests import (
+    Response,
     Session,
     codes,
 )
+from requests.adapters import HTTPAdapter
 from sretoolbox.utils import retry
 
 from reconcile.utils.metrics import ocm_request
@@ -24,6 +31,7 @@ from reconcile.utils.secret_reader import (
 
 if TYPE_CHECKING:
     from collections.abc import (
+        Callable,
         Generator,
         Mapping,
     )
@@ -32,10 +40,88 @@ if TYPE_CHECKING:
     from reconcile.gql_definitions.fragments.aus_organization import AUSOCMOrganization
 
 REQUEST_TIMEOUT_SEC = 60
+# refresh access tokens this long before they expire
+ACCESS_TOKEN_REFRESH_MARGIN_SEC = 60
+DEFAULT_ACCESS_TOKEN_LIFETIME_SEC = 300
+HTTP_POOL_CONNECTIONS = 10
+HTTP_POOL_MAXSIZE = 20
 
 USER_AGENT = f"qontract-reconcile/{resolve_version('qontract-reconcile')}"
 
 
+@dataclass(frozen=True)
+class AccessToken:
+    value: str
+    refresh_at: float
+
+    @classmethod
+    def build(cls, value: str, expires_in: float) -> AccessToken:
+        lifetime = max(expires_in - ACCESS_TOKEN_REFRESH_MARGIN_SEC, expires_in / 2)
+        return cls(value=value, refresh_at=time.monotonic() + lifetime)
+
+    @property
+    def expired(self) -> bool:
+        return time.monotonic() >= self.refresh_at
+
+
+class AccessTokenCache:
+    """
+    Process wide cache of OCM access tokens keyed by token url and client id.
+
+    OCM clients for the same client id share one token instead of requesting
+    a new one on creation. Concurrent refreshes of the same token result in a
+    single token request.
+    """
+
+    def __init__(self) -> None:
+        self._tokens: dict[tuple[str, str], AccessToken] = {}
+        self._locks: dict[tuple[str, str], threading.Lock] = defaultdict(threading.Lock)
+        self._lock = threading.Lock()
+
+    def get(
+        self,
+        key: tuple[str, str],
+        fetch: Callable[[], AccessToken],
+        stale: str | None = None,
+    ) -> AccessToken:
+        """
+        Return the cached token for key, fetching a new one if there is none,
+        it is about to expire or it is the stale token a request got
+        rejected with.
+        """
+        with self._lock:
+            lock = self._locks[key]
+        with lock:
+            token = self._tokens.get(key)
+            if token is None or token.expired or token.value == stale:
+                token = fetch()
+                self._tokens[key] = token
+            return token
+
+    def clear(self) -> None:
+        with self._lock:
+            self._tokens.clear()
+
+
+access_token_cache = AccessTokenCache()
+
+
+class SharedHTTPAdapter(HTTPAdapter):
+    """
+    HTTPAdapter mounted on the sessions of all OCM clients, so they share
+    one connection pool.
+    """
+
+    def close(self) -> None:
+        # closing a client must not drop the connections of the others
+        pass
+
+
+shared_http_adapter = SharedHTTPAdapter(
+    pool_connections=HTTP_POOL_CONNECTIONS, pool_maxsize=HTTP_POOL_MAXSIZE
+)
+
+
 class OCMBaseClient:
     """
     Thin client for OCM. This class takes care of authentication
@@ -54,14 +140,20 @@ class OCMBaseClient:
         self._access_token_client_secret = access_token_client_secret
         self._access_token_client_id = access_token_client_id
         self._access_token_url = access_token_url
+        self._access_token: str | None = None
+        self._access_token_refresh_at = 0.0
         self._url = url
-        self._session = session or Session()
+        if session is None:
+            session = Session()
+            session.mount("https://", shared_http_adapter)
+            session.mount("http://", shared_http_adapter)
+        self._session = session
         self._session.headers["User-Agent"] = user_agent
         self._init_access_token()
         self._init_request_headers()
 
     @retry()
-    def _init_access_token(self) -> None:
+    def _fetch_access_token(self) -> AccessToken:
         data = {
             "grant_type": "client_credentials",
             "client_id": self._access_token_client_id,
@@ -71,21 +163,59 @@ class OCMBaseClient:
             self._access_token_url, data=data, timeout=REQUEST_TIMEOUT_SEC
         )
         r.raise_for_status()
-        self._access_token = r.json().get("access_token")
+        token = r.json()
+        return AccessToken.build(
+            value=token.get("access_token"),
+            expires_in=token.get("expires_in") or DEFAULT_ACCESS_TOKEN_LIFETIME_SEC,
+        )
+
+    def _init_access_token(self, stale: str | None = None) -> None:
+        token = access_token_cache.get(
+            (self._access_token_url, self._access_token_client_id),
+            self._fetch_access_token,
+            stale=stale,
+        )
+        self._access_token = token.value
+        self._access_token_refresh_at = token.refresh_at
 
     def _init_request_headers(self) -> None:
         self._session.headers.update({
-            "Authorization": f"Bearer {self._access_token}",
             "accept": "application/json",
         })
 
-    def get(self, api_path: str, params: Mapping[str, str] | None = None) -> Any:
-        ocm_request.labels(verb="GET", client_id=self._access_token_client_id).inc()
-        r = self._session.get(
+    def _auth_headers(self) -> dict[str, str]:
+        if time.monotonic() >= self._access_token_refresh_at:
+            self._init_access_token()
+        if self._access_token is None:
+            return {}
+        return {"Authorization": f"Bearer {self._access_token}"}
+
+    def _request(self, method: str, api_path: str, **kwargs: Any) -> Response:
+        """
+        Send a request with a valid access token. A request rejected with 401
+        is retried once with a refreshed token, e.g. when the token got revoked.
+        """
+        r = self._session.request(
+            method,
             f"{self._url}{api_path}",
-            params=params,
+            headers=self._auth_headers(),
             timeout=REQUEST_TIMEOUT_SEC,
+            **kwargs,
         )
+        if r.status_code == codes.unauthorized and self._access_token is not None:
+            self._init_access_token(stale=self._access_token)
+            r = self._session.request(
+                method,
+                f"{self._url}{api_path}",
+                headers=self._auth_headers(),
+                timeout=REQUEST_TIMEOUT_SEC,
+                **kwargs,
+            )
+        return r
+
+    def get(self, api_path: str, params: Mapping[str, str] | None = None) -> Any:
+        ocm_request.labels(verb="GET", client_id=self._access_token_client_id).inc()
+        r = self._request("GET", api_path, params=params)
         r.raise_for_status()
         return r.json()
 
@@ -95,25 +225,33 @@ class OCMBaseClient:
         params: dict[str, Any] | None = None,
         max_page_size: int = 100,
         max_pages: int | None = None,
+        concurrency: int = 1,
     ) -> Generator[dict[str, Any]]:
         """
         Note, that pagination is currently broken.
         Each call will return a random order, meaning pages are not consistent.
         ALWAYS by default try to use "orderBy: id", as id exists for every resource and has an index in the db.
+
+        With concurrency > 1, the pages following the first one are fetched in
+        parallel, based on the total reported by the first page. Items are still
+        yielded in page order, as soon as their page arrived.
         """
         params_copy = {} if not params else params.copy()
         params_copy["size"] = max_page_size
 
-        while True:
-            rs = self.get(api_path, params=params_copy)
-            yield from rs.get("items", [])
-            current_page = rs.get("page", 0)
-            records_on_page = rs.get("size", len(rs.get("items", [])))
-            if records_on_page < max_page_size:
-                return
-            if max_pages is not None and current_page >= max_pages:
-                return
-            params_copy["page"] = current_page + 1
+        def fetch_page(page: int) -> Page[dict[str, Any]]:
+            page_params = params_copy if page == 1 else params_copy | {"page": page}
+            rs = self.get(api_path, params=page_params)
+            items = rs.get("items", [])
+            return Page(items, rs.get("size", len(items)), rs.get("total"))
+
+        for items in iter_pages(
+            fetch_page,
+            page_size=max_page_size,
+            concurrency=concurrency,
+            max_pages=max_pages,
+        ):
+            yield from items
 
     def post(
         self,
@@ -122,12 +260,7 @@ class OCMBaseClient:
         params: Mapping[str, str] | None = None,
     ) -> Any:
         ocm_request.labels(verb="POST", client_id=self._access_token_client_id).inc()
-        r = self._session.post(
-            f"{self._url}{api_path}",
-            json=data,
-            params=params,
-            timeout=REQUEST_TIMEOUT_SEC,
-        )
+        r = self._request("POST", api_path, json=data, params=params)
         try:
             r.raise_for_status()
         except Exception:
@@ -144,12 +277,7 @@ class OCMBaseClient:
         params: Mapping[str, str] | None = None,
     ) -> None:
         ocm_request.labels(verb="PATCH", client_id=self._access_token_client_id).inc()
-        r = self._session.patch(
-            f"{self._url}{api_path}",
-            json=data,
-            params=params,
-            timeout=REQUEST_TIMEOUT_SEC,
-        )
+        r = self._request("PATCH", api_path, json=data, params=params)
         try:
             r.raise_for_status()
         except Exception:
@@ -158,7 +286,7 @@ class OCMBaseClient:
 
     def delete(self, api_path: str) -> None:
         ocm_request.labels(verb="DELETE", client_id=self._access_token_client_id).inc()
-        r = self._session.delete(f"{self._url}{api_path}", timeout=REQUEST_TIMEOUT_SEC)
+        r = self._request("DELETE", api_path)
         try:
             r.raise_for_status()
         except Exception:
@@ -2,41 +2,176 @@ from __future__ import annotations
 
 import contextlib
 import copy
+import hashlib
+import itertools
+import json
+import logging
 import os
 import subprocess
 import tempfile
-from typing import TYPE_CHECKING
+import threading
+import time
+from functools import cache
+from typing import TYPE_CHECKING, Any
 
 import yaml
+from sretoolbox.utils import threaded
 
-from reconcile.utils.defer import defer
 from reconcile.utils.structs import CommandExecutionResult
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable, Mapping, MutableMapping
+    from collections.abc import Callable, Iterable, Mapping, MutableMapping, Sequence
 
 PROMTOOL_VERSION = ["2.55.1", "3.9.1"]
 PROMTOOL_VERSION_REGEX = r"^promtool,\sversion\s([\d]+\.[\d]+\.[\d]+).+$"
 
+# Rule or test files passed to a single promtool process in batched runs
+PROMTOOL_BATCH_SIZE = 50
+
+RESULT_CACHE_FILE_NAME = "promtool-results.json"
+RESULT_CACHE_VERSION = 1
+# Results only depend on their key, expiring them just bounds the file size.
+RESULT_CACHE_MAX_AGE = 30 * 24 * 60 * 60
+
+_LOG = logging.getLogger(__name__)
+
 
 def _bin(version: str | None = None) -> str:
     return f"promtool-{version}" if version else "promtool"
 
 
+@cache
+def _bin_version(binary: str) -> str | None:
+    """Full version string of a promtool binary, None if it can't be run."""
+    try:
+        result = subprocess.run([binary, "--version"], capture_output=True, check=True)
+    except OSError, subprocess.CalledProcessError:
+        return None
+    return result.stdout.decode().strip()
+
+
+class ResultCache:
+    """Successful promtool results, persisted across runs.
+
+    A result is keyed by a hash of the promtool command, the version
+    reported by the promtool binary and the content of every yaml spec the
+    command reads (the test and the rule files it references). Unchanged
+    rules and tests are therefore not run again until one of them or
+    promtool changes. Failed results are never cached, the error message
+    should come from an actual run."""
+
+    def __init__(self, path: str, max_age: int = RESULT_CACHE_MAX_AGE) -> None:
+        self.path = path
+        self.max_age = max_age
+        self._lock = threading.Lock()
+        # key -> (promtool output, timestamp of the run)
+        self._entries: dict[str, tuple[str, float]] = self._load()
+
+    @classmethod
+    def from_dir(
+        cls, cache_dir: str, max_age: int = RESULT_CACHE_MAX_AGE
+    ) -> ResultCache:
+        """Construct a cache stored in cache_dir."""
+        if not os.path.isdir(cache_dir):
+            raise FileNotFoundError(
+                f"'{cache_dir}' does not exist or it is not a directory"
+            )
+        return cls(
+            path=os.path.join(cache_dir, RESULT_CACHE_FILE_NAME), max_age=max_age
+        )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def key(cmd: Iterable[str], *yaml_specs: Any) -> str | None:
+        """Cache key of a promtool command, None if the promtool version
+        is unknown."""
+        cmd = list(cmd)
+        version = _bin_version(cmd[0])
+        if version is None:
+            return None
+        content = json.dumps(
+            [cmd[1:], version, yaml_specs], sort_keys=True, default=str
+        )
+        return hashlib.sha256(content.encode()).hexdigest()
+
+    def get(self, key: str) -> CommandExecutionResult | None:
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is None or time.time() - entry[1] >= self.max_age:
+            return None
+        return CommandExecutionResult(True, entry[0])
+
+    def put(self, key: str, result: CommandExecutionResult) -> None:
+        if not result:
+            return
+        with self._lock:
+            self._entries[key] = (result.message, time.time())
+
+    def save(self) -> None:
+        """Write the cache, dropping expired entries. The file is replaced
+        atomically so an interrupted write leaves the previous cache."""
+        now = time.time()
+        with self._lock:
+            entries = {
+                key: [message, created_at]
+                for key, (message, created_at) in self._entries.items()
+                if now - created_at < self.max_age
+            }
+        fd, tmp_path = tempfile.mkstemp(
+            dir=os.path.dirname(self.path) or ".", prefix=".promtool-"
+        )
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({"version": RESULT_CACHE_VERSION, "entries": entries}, f)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def _load(self) -> dict[str, tuple[str, float]]:
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") != RESULT_CACHE_VERSION:
+                return {}
+            return {
+                key: (str(message), float(created_at))
+                for key, (message, created_at) in data["entries"].items()
+            }
+        except FileNotFoundError:
+            return {}
+        except (ValueError, TypeError, KeyError, AttributeError) as details:
+            # A corrupt cache only costs running promtool again
+            _LOG.warning(
+                "Ignoring unreadable promtool cache %s: %s", self.path, details
+            )
+            return {}
+
+
 def check_rule(
     yaml_spec: Mapping,
     promtool_version: str | None = None,
+    cache: ResultCache | None = None,
 ) -> CommandExecutionResult:
     """Run promtool check rules on the given yaml spec given as dict"""
-    return _run_yaml_spec_cmd(
-        cmd=[_bin(promtool_version), "check", "rules"], yaml_spec=yaml_spec
-    )
+    cmd = [_bin(promtool_version), "check", "rules"]
+    key = ResultCache.key(cmd, yaml_spec) if cache is not None else None
+    if cache is not None and key and (cached := cache.get(key)):
+        return cached
+
+    result = _run_yaml_spec_cmd(cmd=cmd, yaml_spec=yaml_spec)
+    if cache is not None and key:
+        cache.put(key, result)
+    return result
 
 
 def run_test(
     test_yaml_spec: MutableMapping,
     rule_files: Mapping[str, Mapping],
     promtool_version: str | None = None,
+    cache: ResultCache | None = None,
 ) -> CommandExecutionResult:
     """Run promtool test rules
 
@@ -45,34 +180,228 @@ def run_test(
     test_yaml_spec: test yaml spec dict
 
     rule_files: dict indexed by rule path containing rule files yaml dicts
+
+    cache: results of previous runs, skips running unchanged tests
     """
-    temp_rule_files = {}
-    try:
-        for rule_file, yaml_spec in rule_files.items():
-            with tempfile.NamedTemporaryFile(delete=False) as fp:
-                fp.write(yaml.dump(yaml_spec).encode())
-                temp_rule_files[rule_file] = fp.name
-    except Exception as e:
-        return CommandExecutionResult(False, f"Error building temp rule files: {e}")
-
-    # build a test yaml prometheus files that uses the temp files created
-    new_rule_files = []
     for rule_file in test_yaml_spec["rule_files"]:
-        if rule_file not in temp_rule_files:
+        if rule_file not in rule_files:
             return CommandExecutionResult(False, f"{rule_file} not in rule_files dict")
 
-        new_rule_files.append(temp_rule_files[rule_file])
+    cmd = [_bin(promtool_version), "test", "rules"]
+    key = (
+        ResultCache.key(
+            cmd,
+            test_yaml_spec,
+            [rule_files[rule_file] for rule_file in test_yaml_spec["rule_files"]],
+        )
+        if cache is not None
+        else None
+    )
+    if cache is not None and key and (cached := cache.get(key)):
+        return cached
+
+    temp_rule_files: dict[str, str] = {}
+    try:
+        try:
+            # only the rule files the test reads
+            for rule_file in test_yaml_spec["rule_files"]:
+                if rule_file in temp_rule_files:
+                    continue
+                with tempfile.NamedTemporaryFile(delete=False) as fp:
+                    temp_rule_files[rule_file] = fp.name
+                    fp.write(yaml.dump(rule_files[rule_file]).encode())
+        except Exception as e:
+            return CommandExecutionResult(False, f"Error building temp rule files: {e}")
+
+        # build a test yaml prometheus files that uses the temp files created
+        temp_test_yaml_spec = copy.deepcopy(test_yaml_spec)
+        temp_test_yaml_spec["rule_files"] = [
+            temp_rule_files[rule_file] for rule_file in test_yaml_spec["rule_files"]
+        ]
 
-    temp_test_yaml_spec = copy.deepcopy(test_yaml_spec)
-    temp_test_yaml_spec["rule_files"] = new_rule_files
+        result = _run_yaml_spec_cmd(cmd=cmd, yaml_spec=temp_test_yaml_spec)
+    finally:
+        _cleanup(temp_rule_files.values())
+    if cache is not None and key:
+        cache.put(key, result)
+    return result
+
+
+def check_rules(
+    yaml_specs: Sequence[Mapping],
+    promtool_version: str | None = None,
+    cache: ResultCache | None = None,
+    batch_size: int = PROMTOOL_BATCH_SIZE,
+    thread_pool_size: int = 1,
+) -> list[CommandExecutionResult]:
+    """Run promtool check rules on many yaml specs, with batch_size specs
+    per promtool process. Returns the results in the order of yaml_specs."""
+    cmd = [_bin(promtool_version), "check", "rules"]
 
-    defer(lambda: _cleanup(temp_rule_files.values()))
+    def run_batch(batch: Sequence[Mapping]) -> list[CommandExecutionResult]:
+        passed: dict[str, CommandExecutionResult] = {}
+        files = []
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            try:
+                for i, yaml_spec in enumerate(batch):
+                    files.append(_write_yaml(tmp_dir, f"rules-{i}.yaml", yaml_spec))
+                passed = _run_files_cmd(cmd, "Checking", files)
+            except Exception as e:
+                _LOG.debug(f"batched promtool run failed: {e}")
+        # failed specs run on their own, for an error message of their own
+        return [
+            (passed.get(file) if file else None)
+            or check_rule(yaml_spec, promtool_version)
+            for file, yaml_spec in itertools.zip_longest(files, batch)
+        ]
 
-    return _run_yaml_spec_cmd(
-        cmd=[_bin(promtool_version), "test", "rules"], yaml_spec=temp_test_yaml_spec
+    return _run_batched(
+        items=yaml_specs,
+        keys=[
+            ResultCache.key(cmd, yaml_spec) if cache is not None else None
+            for yaml_spec in yaml_specs
+        ],
+        run_batch=run_batch,
+        cache=cache,
+        batch_size=batch_size,
+        thread_pool_size=thread_pool_size,
     )
 
 
+def run_tests(
+    tests: Sequence[tuple[MutableMapping, Mapping[str, Mapping]]],
+    promtool_version: str | None = None,
+    cache: ResultCache | None = None,
+    batch_size: int = PROMTOOL_BATCH_SIZE,
+    thread_pool_size: int = 1,
+) -> list[CommandExecutionResult]:
+    """Run promtool test rules on many tests, with batch_size tests per
+    promtool process. Returns the results in the order of tests.
+
+    params:
+
+    tests: (test yaml spec dict, rule files) pairs, like the arguments of run_test
+
+    Rule files shared by tests in a batch are written once.
+    """
+    cmd = [_bin(promtool_version), "test", "rules"]
+
+    def run_batch(
+        batch: Sequence[tuple[MutableMapping, Mapping[str, Mapping]]],
+    ) -> list[CommandExecutionResult]:
+        passed: dict[str, CommandExecutionResult] = {}
+        files: list[str | None] = []
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            try:
+                # rule file content hash -> temp file
+                temp_rule_files: dict[str, str] = {}
+                for i, (test_yaml_spec, rule_files) in enumerate(batch):
+                    if not all(r in rule_files for r in test_yaml_spec["rule_files"]):
+                        files.append(None)
+                        continue
+                    new_rule_files = []
+                    for rule_file in test_yaml_spec["rule_files"]:
+                        content = yaml.dump(rule_files[rule_file])
+                        digest = hashlib.sha256(content.encode()).hexdigest()
+                        if digest not in temp_rule_files:
+                            temp_rule_files[digest] = _write_yaml(
+                                tmp_dir, f"{digest}.yaml", content
+                            )
+                        new_rule_files.append(temp_rule_files[digest])
+                    temp_test_yaml_spec = copy.deepcopy(test_yaml_spec)
+                    temp_test_yaml_spec["rule_files"] = new_rule_files
+                    files.append(
+                        _write_yaml(tmp_dir, f"test-{i}.yaml", temp_test_yaml_spec)
+                    )
+                passed = _run_files_cmd(
+                    cmd, "Unit Testing:", [f for f in files if f is not None]
+                )
+            except Exception as e:
+                _LOG.debug(f"batched promtool run failed: {e}")
+        # failed tests run on their own, for an error message of their own
+        return [
+            (passed.get(file) if file else None)
+            or run_test(test_yaml_spec, rule_files, promtool_version)
+            for file, (test_yaml_spec, rule_files) in itertools.zip_longest(
+                files, batch
+            )
+        ]
+
+    return _run_batched(
+        items=tests,
+        keys=[
+            ResultCache.key(
+                cmd,
+                test_yaml_spec,
+                [rule_files.get(r) for r in test_yaml_spec["rule_files"]],
+            )
+            if cache is not None
+            else None
+            for test_yaml_spec, rule_files in tests
+        ],
+        run_batch=run_batch,
+        cache=cache,
+        batch_size=batch_size,
+        thread_pool_size=thread_pool_size,
+    )
+
+
+def _run_batched[T](
+    items: Sequence[T],
+    keys: Sequence[str | None],
+    run_batch: Callable[[Sequence[T]], list[CommandExecutionResult]],
+    cache: ResultCache | None,
+    batch_size: int,
+    thread_pool_size: int,
+) -> list[CommandExecutionResult]:
+    results: list[CommandExecutionResult | None] = [
+        cache.get(key) if cache is not None and key else None for key in keys
+    ]
+    todo = [i for i, result in enumerate(results) if result is None]
+    batch_size = max(1, batch_size)
+    batches = [todo[i : i + batch_size] for i in range(0, len(todo), batch_size)]
+    batch_results = threaded.run(
+        lambda batch: run_batch([items[i] for i in batch]), batches, thread_pool_size
+    )
+    for batch, batch_result in zip(batches, batch_results, strict=True):
+        for i, result in zip(batch, batch_result, strict=True):
+            results[i] = result
+            key = keys[i]
+            if cache is not None and key:
+                cache.put(key, result)
+    return [result for result in results if result is not None]
+
+
+def _write_yaml(directory: str, name: str, yaml_spec: Mapping | str) -> str:
+    path = os.path.join(directory, name)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(yaml_spec if isinstance(yaml_spec, str) else yaml.dump(yaml_spec))
+    return path
+
+
+def _run_files_cmd(
+    cmd: Sequence[str], header: str, files: Sequence[str]
+) -> dict[str, CommandExecutionResult]:
+    """Run a promtool command on many files at once and return the result
+    of every file promtool reports a success for. promtool prints a section
+    starting with `header <file>` per file to stdout, with a SUCCESS line
+    if the file passed. Errors go to stderr and can't be told apart."""
+    if not files:
+        return {}
+    result = subprocess.run([*cmd, *files], capture_output=True, check=False)
+    sections: dict[str, list[str]] = {}
+    current: list[str] = []
+    for line in result.stdout.decode().splitlines():
+        if line.startswith(header):
+            current = sections.setdefault(line.removeprefix(header).strip(), [])
+        current.append(line)
+    return {
+        file: CommandExecutionResult(True, "\n".join(sections[file]) + "\n")
+        for file in files
+        if any(line.strip().startswith("SUCCESS") for line in sections.get(file, []))
+    }
+
+
 def _run_yaml_spec_cmd(cmd: list[str], yaml_spec: Mapping) -> CommandExecutionResult:
     with tempfile.NamedTemporaryFile() as fp:
         try:
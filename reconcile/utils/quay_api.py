@@ -28,6 +28,8 @@ class RobotAccountPermission(TypedDict):
 
 class QuayApi(ApiBase):
     LIMIT_FOLLOWS = 15
+    # maximum page size of the tag API
+    TAGS_PAGE_SIZE = 100
 
     def __init__(
         self,
@@ -209,6 +211,35 @@ class QuayApi(ApiBase):
             return self.list_images(images, next_page, count + 1)
         return images
 
+    def list_repo_tags(
+        self, repo_name: str, namespace: str | None = None
+    ) -> dict[str, str]:
+        """
+        Active tags of a repository, mapped to their manifest digest.
+
+        https://docs.quay.io/api/swagger/#!/tag/listRepoTags
+
+        :param namespace: org of the repository, defaults to this API's org
+        :raises HTTPError: failure when listing the tags of the repository
+        """
+        url = f"/api/v1/repository/{namespace or self.organization}/{repo_name}/tag/"
+        tags: dict[str, str] = {}
+        page = 1
+        while True:
+            body = self._get(
+                url,
+                params={
+                    "onlyActiveTags": "true",
+                    "limit": self.TAGS_PAGE_SIZE,
+                    "page": page,
+                },
+            )
+            for tag in body.get("tags", []):
+                tags[tag["name"]] = tag["manifest_digest"]
+            if not body.get("has_additional"):
+                return tags
+            page += 1
+
     def repo_create(self, repo_name: str, description: str, public: str) -> None:
         """Creates a repository called repo_name with the given description
         and public flag.
@@ -2,17 +2,22 @@ import logging
 import multiprocessing
 from collections.abc import Callable, Iterable, Mapping
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, cast
 
-from deepdiff import DeepHash
-from jsonpath_ng.ext.parser import parse
+import jsonpath_ng
 
 from reconcile.change_owners.diff import (
     Diff,
     DiffType,
     extract_diffs,
+    has_diff,
+)
+from reconcile.utils.jsonpath import (
+    apply_constraint_to_path,
+    jsonpath_parts,
+    narrow_jsonpath_node,
+    parse_jsonpath,
 )
-from reconcile.utils.jsonpath import apply_constraint_to_path
 from reconcile.utils.runtime.integration import (
     DesiredStateShardConfig,
     ShardedRunProposal,
@@ -47,6 +52,111 @@ class DesiredStateDiff:
         return not self.diff_found
 
 
+PathKey = tuple[str | int, ...]
+
+
+def _path_part_key(part: jsonpath_ng.JSONPath) -> str | int | None:
+    """
+    The hashable key of a concrete path element, e.g. a single field or index.
+    None is returned for elements that can match more than one element.
+    """
+    if isinstance(part, jsonpath_ng.Fields) and len(part.fields) == 1:
+        return part.fields[0]
+    if isinstance(part, jsonpath_ng.Index) and len(part.indices) == 1:
+        return part.indices[0]
+    return None
+
+
+def _is_indexable_selector_part(part: jsonpath_ng.JSONPath) -> bool:
+    if isinstance(part, jsonpath_ng.Fields | jsonpath_ng.Index):
+        return True
+    # only full slices (`[*]`) - `apply_constraint_to_path` narrows any slice
+    # to the index of a diff, regardless of its boundaries
+    return (
+        isinstance(part, jsonpath_ng.Slice)
+        and part.start is None
+        and part.end is None
+        and part.step is None
+    )
+
+
+class ShardPathIndex:
+    """
+    Indexes the shards a shard path selector finds in a desired state by the
+    concrete path prefixes leading to them, e.g. the selector `accounts[*].name`
+    finding `accounts.[3].name` registers the shard under `("accounts",)`,
+    `("accounts", 3)` and `("accounts", 3, "name")`.
+
+    The index is built with a single `find` on the desired state and answers
+    what `apply_constraint_to_path(selector, diff.path).find(desired_state)`
+    would find for a diff with a dictionary lookup.
+
+    Selectors with elements that don't map to exactly one concrete path element
+    (e.g. filters) are not indexable and fall back to a `find` per diff.
+    """
+
+    def __init__(
+        self, selector: jsonpath_ng.JSONPath, desired_state: Mapping[str, Any]
+    ) -> None:
+        self.selector = selector
+        self.desired_state = desired_state
+        self.selector_parts = jsonpath_parts(selector)
+        self.shards_by_prefix: dict[PathKey, set[Any]] | None = self._build()
+
+    def _build(self) -> dict[PathKey, set[Any]] | None:
+        if not all(_is_indexable_selector_part(p) for p in self.selector_parts):
+            return None
+        shards_by_prefix: dict[PathKey, set[Any]] = {}
+        for match in self.selector.find(self.desired_state):
+            keys = [_path_part_key(p) for p in jsonpath_parts(match.full_path)]
+            if len(keys) != len(self.selector_parts) or None in keys:
+                return None
+            for length in range(1, len(keys) + 1):
+                prefix = cast("PathKey", tuple(keys[:length]))
+                shards_by_prefix.setdefault(prefix, set()).add(match.value)
+        return shards_by_prefix
+
+    def find_shards(self, diff_path: jsonpath_ng.JSONPath) -> set[Any]:
+        if self.shards_by_prefix is None:
+            shard_path = apply_constraint_to_path(self.selector, diff_path)
+            if not shard_path:
+                return set()
+            return {shard.value for shard in shard_path.find(self.desired_state)}
+
+        # the selector narrowed down by the diff path covers the concrete diff
+        # path elements for the longest compatible prefix
+        diff_keys: list[str | int] = []
+        for diff_part, selector_part in zip(
+            jsonpath_parts(diff_path), self.selector_parts, strict=False
+        ):
+            diff_key = _path_part_key(diff_part)
+            if diff_key is None or not narrow_jsonpath_node(diff_part, selector_part):
+                break
+            diff_keys.append(diff_key)
+        if not diff_keys:
+            return set()
+        return self.shards_by_prefix.get(tuple(diff_keys), set())
+
+
+class DesiredStateShardIndex:
+    """
+    Lazily builds a `ShardPathIndex` per shard path selector for a desired state.
+    """
+
+    def __init__(self, desired_state: Mapping[str, Any]) -> None:
+        self.desired_state = desired_state
+        self._indices: dict[str, ShardPathIndex] = {}
+
+    def find_shards(
+        self, shard_path_spec: str, diff_path: jsonpath_ng.JSONPath
+    ) -> set[Any]:
+        index = self._indices.get(shard_path_spec)
+        if index is None:
+            index = ShardPathIndex(parse_jsonpath(shard_path_spec), self.desired_state)
+            self._indices[shard_path_spec] = index
+        return index.find_shards(diff_path)
+
+
 def find_changed_shards(
     diffs: Iterable[Diff],
     previous_desired_state: Mapping[str, Any],
@@ -58,19 +168,19 @@ def find_changed_shards(
     affected shards are determined by the shard path selectors from the
     provided `DesiredStateShardConfig`.
     """
+    previous_shards = DesiredStateShardIndex(previous_desired_state)
+    current_shards = DesiredStateShardIndex(current_desired_state)
     affected_shards = set()
     for d in diffs:
         for shard_path_spec in sharding_config.shard_path_selectors:
-            shard_path = apply_constraint_to_path(parse(shard_path_spec), d.path)
-            if shard_path:
-                if d.diff_type in {DiffType.CHANGED, d.diff_type.REMOVED}:
-                    affected_shards.update({
-                        shard.value for shard in shard_path.find(previous_desired_state)
-                    })
-                if d.diff_type in {DiffType.CHANGED, d.diff_type.ADDED}:
-                    affected_shards.update({
-                        shard.value for shard in shard_path.find(current_desired_state)
-                    })
+            if d.diff_type in {DiffType.CHANGED, DiffType.REMOVED}:
+                affected_shards.update(
+                    previous_shards.find_shards(shard_path_spec, d.path)
+                )
+            if d.diff_type in {DiffType.CHANGED, DiffType.ADDED}:
+                affected_shards.update(
+                    current_shards.find_shards(shard_path_spec, d.path)
+                )
     return affected_shards
 
 
@@ -183,11 +293,7 @@ def build_desired_state_diff(
     shards introduced by the change between the two desired states.
     """
     # is there even a difference?
-    previous_hash = DeepHash(previous_desired_state)
-    current_hash = DeepHash(current_desired_state)
-    desired_state_diff_found = previous_hash.get(
-        previous_desired_state
-    ) != current_hash.get(current_desired_state)
+    desired_state_diff_found = has_diff(previous_desired_state, current_desired_state)
 
     shards = set()
     exract_diff_timeout_seconds = 10
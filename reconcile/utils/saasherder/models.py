@@ -28,7 +28,7 @@ from reconcile.utils.saasherder.interfaces import (
     SaasResourceTemplate,
     SaasResourceTemplateTarget,
 )
-from reconcile.utils.secret_reader import SecretReaderBase
+from reconcile.utils.secret_reader import HasSecret, SecretReaderBase
 
 
 class Providers(Enum):
@@ -372,6 +372,20 @@ class TargetSpec:
     def error_prefix(self) -> str:
         return f"[{self.saas_file_name}/{self.resource_template_name}] {self.html_url}:"
 
+    @property
+    def secrets(self) -> list[HasSecret]:
+        """Secrets referenced by the secret parameters of this target."""
+        return [
+            sp.secret
+            for container in (
+                self.target.namespace.environment,
+                self.saas_file,
+                self.resource_template,
+                self.target,
+            )
+            for sp in container.secret_parameters or []
+        ]
+
     def parameters(self, adjust: bool = True) -> dict[str, Any]:
         environment_parameters = self._collect_parameters(
             self.target.namespace.environment, adjust=adjust
@@ -1348,6 +1348,16 @@ class SaasHerder:
         desired_state_specs: list[TargetSpec] = list(
             itertools.chain.from_iterable(results)
         )
+        # targets share most of their secret parameters, read each one once
+        self.secret_reader.prefetch_secrets(
+            (
+                secret
+                for spec in desired_state_specs
+                if not spec.delete
+                for secret in spec.secrets
+            ),
+            self.thread_pool_size,
+        )
         promotions = threaded.run(
             self.populate_desired_state_saas_file,
             desired_state_specs,
@@ -20,7 +20,7 @@ from reconcile.utils import (
 from reconcile.utils.vault import VaultClient
 
 if TYPE_CHECKING:
-    from collections.abc import Mapping
+    from collections.abc import Iterable, Mapping
 
 
 class VaultForbiddenError(Exception):
@@ -119,6 +119,20 @@ class SecretReaderBase(ABC):
             version=version,
         )
 
+    def prefetch(
+        self, secrets: Iterable[Mapping[str, Any]], thread_pool_size: int = 10
+    ) -> None:
+        """
+        Reads secrets ahead of their use, so that reading them afterwards
+        is served from a cache. Backends without a cache ignore this.
+        """
+        return
+
+    def prefetch_secrets(
+        self, secrets: Iterable[HasSecret], thread_pool_size: int = 10
+    ) -> None:
+        self.prefetch((self.to_dict(s) for s in secrets), thread_pool_size)
+
     def _parameters_to_dict(
         self, path: str, field: str, format: str | None, version: int | None
     ) -> dict[str, Any]:
@@ -174,6 +188,13 @@ class VaultSecretReader(SecretReaderBase):
             raise SecretNotFoundError(*e.args) from e
         return data
 
+    def prefetch(
+        self, secrets: Iterable[Mapping[str, Any]], thread_pool_size: int = 10
+    ) -> None:
+        # don't connect to Vault for nothing
+        if secrets := list(secrets):
+            self.vault_client.prefetch(secrets, thread_pool_size)
+
     def _read(
         self, path: str, field: str, format: str | None, version: int | None
     ) -> str:
@@ -259,6 +280,15 @@ class SecretReader(SecretReaderBase):
             self._vault_client = VaultClient.get_instance()
         return self._vault_client
 
+    def prefetch(
+        self, secrets: Iterable[Mapping[str, Any]], thread_pool_size: int = 10
+    ) -> None:
+        if not (self.settings and self.settings.get("vault")):
+            return
+        # don't connect to Vault for nothing
+        if secrets := list(secrets):
+            self.vault_client.prefetch(secrets, thread_pool_size)
+
     def _read(
         self, path: str, field: str, format: str | None, version: int | None
     ) -> str:
@@ -1,23 +1,97 @@
+from __future__ import annotations
+
 import hashlib
 import logging
 import os
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Mapping
 
 LOG = logging.getLogger(__name__)
 
 SHARDS = int(os.environ.get("SHARDS", "1"))
 SHARD_ID = int(os.environ.get("SHARD_ID", "0"))
 
+# modulo: md5 of the key modulo SHARDS, changing SHARDS moves almost every key
+# rendezvous: highest random weight hashing, changing SHARDS moves ~1/SHARDS keys
+#
+# With rendezvous and key weights (filter_in_shard with weight), the shard of a
+# key also depends on every other key and weight. Shards running on different
+# bundle SHAs (e.g. during a rollout) can then both own or both drop a key
+# until they run on the same data again.
+MODULO = "modulo"
+RENDEZVOUS = "rendezvous"
+SHARDING_STRATEGY = os.environ.get("SHARDING_STRATEGY", MODULO)
+if SHARDING_STRATEGY not in {MODULO, RENDEZVOUS}:
+    raise ValueError(
+        f"unknown SHARDING_STRATEGY '{SHARDING_STRATEGY}', "
+        f"expected '{MODULO}' or '{RENDEZVOUS}'"
+    )
+
+# With rendezvous sharding and key weights, no shard takes more than
+# this factor of the average load unless a single key exceeds it.
+SHARD_LOAD_FACTOR = float(os.environ.get("SHARD_LOAD_FACTOR", "1.1"))
 
-def is_in_shard(value: str) -> bool:
-    if SHARDS == 1:
-        return True
 
+def _md5_int(value: str) -> int:
     h = hashlib.new("md5", usedforsecurity=False)
     h.update(value.encode())
-    value_hex = h.hexdigest()
-    value_int = int(value_hex, base=16)
+    return int(h.hexdigest(), base=16)
+
+
+def modulo_shard(value: str, shards: int) -> int:
+    return _md5_int(value) % shards
+
+
+def rendezvous_ranking(value: str, shards: int) -> list[int]:
+    """Shards ordered by their score for value, the preferred shard first.
+    A key only changes its preferred shard if that shard is removed or a
+    new shard scores higher."""
+    return sorted(
+        range(shards), key=lambda shard: _md5_int(f"{shard}/{value}"), reverse=True
+    )
+
+
+def rendezvous_shard(value: str, shards: int) -> int:
+    return rendezvous_ranking(value, shards)[0]
 
-    in_shard = value_int % SHARDS == SHARD_ID
+
+def assign_shards(
+    weights: Mapping[str, float],
+    shards: int,
+    load_factor: float = SHARD_LOAD_FACTOR,
+) -> dict[str, int]:
+    """Assign weighted keys to shards with rendezvous hashing and bounded loads.
+
+    Keys are placed, heaviest first, on the highest ranked shard that stays
+    below load_factor times the average load. A key fitting nowhere goes to
+    the least loaded shard. The assignment only depends on the keys, their
+    weights and the number of shards, so every shard computes the same one.
+    """
+    capacity = load_factor * sum(weights.values()) / shards
+    loads = [0.0] * shards
+    assignment: dict[str, int] = {}
+    for key in sorted(weights, key=lambda k: (-weights[k], k)):
+        weight = weights[key]
+        ranking = rendezvous_ranking(key, shards)
+        shard = next(
+            (s for s in ranking if loads[s] + weight <= capacity),
+            min(ranking, key=lambda s: loads[s]),
+        )
+        loads[shard] += weight
+        assignment[key] = shard
+    return assignment
+
+
+def is_in_shard(value: str) -> bool:
+    if SHARDS == 1:
+        return True
+
+    if SHARDING_STRATEGY == RENDEZVOUS:
+        in_shard = rendezvous_shard(value, SHARDS) == SHARD_ID
+    else:
+        in_shard = modulo_shard(value, SHARDS) == SHARD_ID
 
     if in_shard:
         LOG.debug("IN_SHARD TRUE: %s", value)
@@ -25,3 +99,22 @@ def is_in_shard(value: str) -> bool:
         LOG.debug("IN_SHARD FALSE: %s", value)
 
     return in_shard
+
+
+def filter_in_shard[T](
+    items: Iterable[T],
+    key: Callable[[T], str],
+    weight: Callable[[T], float] | None = None,
+) -> list[T]:
+    """Items of this shard. With rendezvous sharding and a weight, shards are
+    balanced by the total weight of their items instead of the item count.
+    items must be the same on every shard."""
+    items = list(items)
+    if SHARDS == 1 or SHARDING_STRATEGY != RENDEZVOUS or weight is None:
+        return [item for item in items if is_in_shard(key(item))]
+
+    weights: dict[str, float] = {}
+    for item in items:
+        weights[key(item)] = weights.get(key(item), 0) + weight(item)
+    assignment = assign_shards(weights, SHARDS)
+    return [item for item in items if assignment[key(item)] == SHARD_ID]
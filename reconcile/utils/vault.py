@@ -5,6 +5,7 @@ import logging
 import os
 import threading
 import time
+from concurrent.futures import Future
 from functools import lru_cache
 from typing import TYPE_CHECKING, Any, Self
 
@@ -12,13 +13,14 @@ import hvac
 import requests
 from hvac.exceptions import InvalidPath
 from requests.adapters import HTTPAdapter
-from sretoolbox.utils import retry
+from sretoolbox.utils import retry, threaded
 
 from reconcile.utils.config import get_config
+from reconcile.utils.rate_limiter import RateLimitedHTTPAdapter, RateLimiter
 
 if TYPE_CHECKING:
     import builtins
-    from collections.abc import Mapping
+    from collections.abc import Callable, Hashable, Iterable, Mapping
 
 LOG = logging.getLogger(__name__)
 VAULT_AUTO_REFRESH_INTERVAL = int(os.getenv("VAULT_AUTO_REFRESH_INTERVAL") or 600)
@@ -53,6 +55,40 @@ class VaultConnectionError(Exception):
 
 
 SECRET_VERSION_LATEST = "LATEST"
+READ_CACHE_SIZE = 2048
+
+
+class _CoalescedCall[T]:
+    """Wraps a function so that concurrent calls with the same arguments
+    share the result of a single call instead of each calling it."""
+
+    def __init__(self, func: Callable[..., T]) -> None:
+        self._func = func
+        self._lock = threading.Lock()
+        self._in_flight: dict[Hashable, Future[T]] = {}
+
+    def __call__(self, *args: Hashable, **kwargs: Hashable) -> T:
+        key = (args, frozenset(kwargs.items()))
+        with self._lock:
+            future = self._in_flight.get(key)
+            if future is not None:
+                waiting = True
+            else:
+                waiting = False
+                future = self._in_flight[key] = Future()
+        if waiting:
+            return future.result()
+        try:
+            result = self._func(*args, **kwargs)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._in_flight[key]
 
 
 class VaultClient:
@@ -93,6 +129,7 @@ class VaultClient:
         kube_auth_role: str | None = None,
         kube_auth_mount: str | None = None,
         auto_refresh: bool = True,
+        max_requests_per_second: float | None = None,
     ):
         config = get_config()
 
@@ -121,11 +158,21 @@ class VaultClient:
             self.kube_auth_enabled = True
 
         self._get_mount_version = lru_cache(maxsize=128)(self.__get_mount_version)
-        self._read_all_v2 = lru_cache(maxsize=2048)(self.__read_all_v2)
+        # concurrent reads of the same secret wait for one request to Vault
+        self._read_all_v2 = lru_cache(maxsize=READ_CACHE_SIZE)(
+            _CoalescedCall(self.__read_all_v2)
+        )
+        self._read_all_v1 = _CoalescedCall(self.__read_all_v1)
 
         session = requests.Session()
         # There are at most 10 working threads in reconcile, plus 1 daemon thread for auto refresh
-        adapter = HTTPAdapter(pool_maxsize=11)
+        adapter = (
+            RateLimitedHTTPAdapter(
+                RateLimiter(max_requests_per_second), pool_maxsize=11
+            )
+            if max_requests_per_second
+            else HTTPAdapter(pool_maxsize=11)
+        )
         session.mount("https://", adapter)
         self._client = hvac.Client(url=server, session=session)
         self._close_lock = threading.Lock()
@@ -227,6 +274,63 @@ class VaultClient:
 
         return data, version
 
+    @retry(no_retry_exceptions=(SecretNotFoundError, SecretAccessForbiddenError))
+    def read_metadata(self, path: str) -> dict[str, Any] | None:
+        """Returns the metadata of a secret on a KV v2 engine, including
+        `current_version` and the `versions` still kept by the engine, each
+        with its `deletion_time` and `destroyed` state. Returns None for
+        secrets on a KV v1 engine, which has no metadata.
+
+        Reading metadata does not read any secret data.
+        """
+        if self._get_mount_version_by_secret_path(path) != 2:
+            return None
+        mount_point, read_path = path.split("/", 1)
+        try:
+            metadata = self._client.secrets.kv.v2.read_secret_metadata(
+                mount_point=mount_point,
+                path=read_path,
+            )
+        except InvalidPath:
+            raise SecretNotFoundError(path) from None
+        except hvac.exceptions.Forbidden:
+            msg = f"permission denied accessing secret '{path}'"
+            raise SecretAccessForbiddenError(msg) from None
+        return metadata["data"]
+
+    def prefetch(
+        self, secrets: Iterable[Mapping[str, Any]], thread_pool_size: int = 10
+    ) -> None:
+        """Reads secrets concurrently into the read cache, so that reading
+        them afterwards doesn't wait for Vault.
+
+        The input secrets are dictionaries like the ones passed to read_all.
+        Each secret path and version is read once. Only secrets on a KV v2
+        engine are cached, others are skipped. Errors are not raised: the
+        secret is left out of the cache and reading it raises as usual.
+        """
+        refs = sorted({
+            (secret["path"], secret.get("version") or SECRET_VERSION_LATEST)
+            for secret in secrets
+        })
+        refs = [
+            ref for ref in refs if self._get_mount_version_by_secret_path(ref[0]) == 2
+        ]
+        if len(refs) > READ_CACHE_SIZE:
+            LOG.warning(
+                f"prefetching {READ_CACHE_SIZE} of {len(refs)} secrets, "
+                "the rest don't fit into the read cache"
+            )
+            refs = refs[:READ_CACHE_SIZE]
+        threaded.run(self._prefetch, refs, thread_pool_size)
+
+    def _prefetch(self, ref: tuple[str, str]) -> None:
+        path, version = ref
+        try:
+            self._read_all_v2(path, version)
+        except Exception as e:
+            LOG.debug(f"prefetching secret {path} ({version}) failed: {e}")
+
     def read_all(self, secret: Mapping) -> dict:
         """Returns a dictionary of keys and values in a Vault secret.
 
@@ -284,7 +388,7 @@ class VaultClient:
         secret_version = secret["data"]["metadata"]["version"]
         return data, secret_version
 
-    def _read_all_v1(self, path: str) -> Any:
+    def __read_all_v1(self, path: str) -> Any:
         try:
             secret = self._client.read(path)
         except hvac.exceptions.Forbidden:
@@ -376,14 +480,16 @@ class VaultClient:
         mount_point = path_split[0]
         write_path = "/".join(path_split[1:])
 
-        try:
-            current_data, _ = self._read_all_v2(path, version=SECRET_VERSION_LATEST)
-            if current_data == data and not force:
-                logging.debug(f"current data is up-to-date, skipping {path}")
-                return
-        except SecretVersionNotFoundError:
-            # if the secret is not found we need to write it
-            logging.debug(f"secret not found in {path}, will create it")
+        # a forced write does not need the current data
+        if not force:
+            try:
+                current_data, _ = self._read_all_v2(path, version=SECRET_VERSION_LATEST)
+                if current_data == data:
+                    logging.debug(f"current data is up-to-date, skipping {path}")
+                    return
+            except SecretVersionNotFoundError:
+                # if the secret is not found we need to write it
+                logging.debug(f"secret not found in {path}, will create it")
 
         try:
             self._client.secrets.kv.v2.create_or_update_secret(
@@ -2,7 +2,10 @@ from __future__ import annotations
 
 import logging
 import re
-from typing import TYPE_CHECKING
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from sretoolbox.utils import threaded
 
 from reconcile.gql_definitions.jenkins_configs import jenkins_configs
 from reconcile.gql_definitions.jenkins_configs.jenkins_configs import (
@@ -36,7 +39,7 @@ from reconcile.utils.vault import (
 )
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable
+    from collections.abc import Container, Iterable
 
 
 QONTRACT_INTEGRATION = "vault-replication"
@@ -62,12 +65,24 @@ def deep_copy_versions(
     current_dest_version: int,
     current_source_version: int,
     path: str,
+    readable_versions: Container[int] | None = None,
 ) -> None:
     """Copies all versions of a V2 secret from the source vault to the destination vault, starting
-    on latest version present on the destination vault"""
+    on latest version present on the destination vault. Versions known to be gone from the
+    source (not in readable_versions, if given) are replaced by dummy versions without reading"""
     for version in range(current_dest_version + 1, current_source_version + 1):
         secret_dict = {"path": path, "version": version}
 
+        if readable_versions is not None and version not in readable_versions:
+            # deleted or destroyed in the source vault, no need to try reading it
+            write_dummy_versions(
+                dry_run=dry_run,
+                dest_vault=dest_vault,
+                secret_version=version,
+                path=path,
+            )
+            continue
+
         try:
             secret, src_version = source_vault.read_all_with_version(secret_dict)
         except SecretNotFoundError, SecretVersionNotFoundError:
@@ -252,6 +267,130 @@ def copy_vault_secret(
         )
 
 
+@dataclass(frozen=True)
+class SecretReplicationPlan:
+    """What replicating a secret takes, as planned from the KV v2 metadata
+    of both vaults, without reading any secret data."""
+
+    path: str
+    # (destination version, source version) for a KV v2 secret whose
+    # destination lags behind. None if the metadata can't tell (KV v1
+    # secrets, deleted latest versions), copy_vault_secret then compares
+    # the latest versions of both sides.
+    version_range: tuple[int, int] | None = None
+    # versions the source engine still keeps
+    readable_versions: frozenset[int] = frozenset()
+
+
+def _readable_versions(metadata: dict[str, Any]) -> frozenset[int]:
+    return frozenset(
+        int(version)
+        for version, version_metadata in (metadata.get("versions") or {}).items()
+        if not version_metadata.get("deletion_time")
+        and not version_metadata.get("destroyed")
+    )
+
+
+def plan_secret_replication(
+    path: str, source_vault: VaultClient, dest_vault: VaultClient
+) -> SecretReplicationPlan | None:
+    """Plans the replication of a secret, None if there is nothing to replicate."""
+    try:
+        source_metadata = source_vault.read_metadata(path)
+    except SecretAccessForbiddenError:
+        # Raise exception if we can't read the secret from the source vault.
+        # This is likely to be related to the approle permissions.
+        logging.error([
+            "replicate_vault_secret",
+            "Cannot read secret from source vault",
+            path,
+        ])
+        raise
+    except SecretNotFoundError:
+        logging.error(["replicate_vault_secret", "no versions found for secret", path])
+        return None
+
+    if source_metadata is None:
+        return SecretReplicationPlan(path)
+    source_version = source_metadata["current_version"]
+    readable_versions = _readable_versions(source_metadata)
+    if source_version not in readable_versions:
+        return SecretReplicationPlan(path)
+
+    try:
+        dest_metadata = dest_vault.read_metadata(path)
+    except SecretNotFoundError:
+        logging.info([
+            "replicate_vault_secret",
+            "Secret not found in destination",
+            path,
+        ])
+        dest_version = 0
+    else:
+        if dest_metadata is None:
+            return SecretReplicationPlan(path)
+        dest_version = dest_metadata["current_version"]
+        if dest_version not in _readable_versions(dest_metadata):
+            return SecretReplicationPlan(path)
+
+    if dest_version >= source_version:
+        return None
+    return SecretReplicationPlan(
+        path=path,
+        version_range=(dest_version, source_version),
+        readable_versions=readable_versions,
+    )
+
+
+def replicate_secret(
+    plan: SecretReplicationPlan,
+    dry_run: bool,
+    source_vault: VaultClient,
+    dest_vault: VaultClient,
+) -> None:
+    if plan.version_range is None:
+        copy_vault_secret(dry_run, source_vault, dest_vault, plan.path)
+        return
+    dest_version, source_version = plan.version_range
+    deep_copy_versions(
+        dry_run=dry_run,
+        source_vault=source_vault,
+        dest_vault=dest_vault,
+        current_dest_version=dest_version,
+        current_source_version=source_version,
+        path=plan.path,
+        readable_versions=plan.readable_versions,
+    )
+
+
+def replicate_secrets(
+    dry_run: bool,
+    source_vault: VaultClient,
+    dest_vault: VaultClient,
+    paths: Iterable[str],
+    thread_pool_size: int = 1,
+) -> None:
+    """Replicates secrets in two phases: plan every secret from the metadata
+    of both vaults, then copy the missing versions of the secrets that
+    diverged. Both phases work on thread_pool_size secrets at a time, the
+    versions of a secret are always copied in order."""
+    plans = threaded.run(
+        plan_secret_replication,
+        sorted(set(paths)),
+        thread_pool_size,
+        source_vault=source_vault,
+        dest_vault=dest_vault,
+    )
+    threaded.run(
+        replicate_secret,
+        [plan for plan in plans if plan is not None],
+        thread_pool_size,
+        dry_run=dry_run,
+        source_vault=source_vault,
+        dest_vault=dest_vault,
+    )
+
+
 def check_invalid_paths(
     path_list: Iterable[str],
     policy_paths: Iterable[str] | None,
@@ -388,6 +527,7 @@ def replicate_paths(
     source_vault: VaultClient,
     dest_vault: VaultClient,
     replications: VaultReplicationConfigV1,
+    thread_pool_size: int = 1,
 ) -> None:
     """For each path present in the definition of the vault instance, replicate
     the secrets from the source vault to the destination vault"""
@@ -395,6 +535,7 @@ def replicate_paths(
     if replications.paths is None:
         return
 
+    secret_paths: list[str] = []
     for path in replications.paths:
         if isinstance(path, VaultReplicationJenkinsV1):
             policy_paths = get_policy_paths(path.policy) if path.policy else None
@@ -403,8 +544,7 @@ def replicate_paths(
                 source_vault, path.jenkins_instance.name, jenkins_query_data
             )
             check_invalid_paths(path_list, policy_paths)
-            for vault_path in path_list:
-                copy_vault_secret(dry_run, source_vault, dest_vault, vault_path)
+            secret_paths.extend(path_list)
 
         elif isinstance(path, VaultReplicationPolicyV1):
             if path.policy is None:
@@ -414,9 +554,15 @@ def replicate_paths(
                     "Policy is required when using policy provider"
                 )
             policy_paths = get_policy_paths(path.policy)
-            path_list = get_policy_secret_list(source_vault, policy_paths)
-            for vault_path in path_list:
-                copy_vault_secret(dry_run, source_vault, dest_vault, vault_path)
+            secret_paths.extend(get_policy_secret_list(source_vault, policy_paths))
+
+    replicate_secrets(
+        dry_run=dry_run,
+        source_vault=source_vault,
+        dest_vault=dest_vault,
+        paths=secret_paths,
+        thread_pool_size=thread_pool_size,
+    )
 
 
 def _get_start_end_secret(path: str) -> tuple[str, str]:
@@ -468,7 +614,11 @@ def get_secrets_from_templated_path(path: str, vault_list: Iterable[str]) -> lis
     return secret_list
 
 
-def run(dry_run: bool) -> None:
+def run(
+    dry_run: bool,
+    thread_pool_size: int = 1,
+    vault_requests_per_second: float | None = None,
+) -> None:
     gqlapi = gql.get_api()
     vault_settings = get_app_interface_vault_settings(query_func=gqlapi.query)
     secret_reader = create_secret_reader(use_vault=vault_settings.vault)
@@ -496,11 +646,13 @@ def run(dry_run: bool) -> None:
                         server=source_creds["server"],
                         role_id=source_creds["role_id"],
                         secret_id=source_creds["secret_id"],
+                        max_requests_per_second=vault_requests_per_second,
                     ) as source_vault,
                     VaultClient(
                         server=dest_creds["server"],
                         role_id=dest_creds["role_id"],
                         secret_id=dest_creds["secret_id"],
+                        max_requests_per_second=vault_requests_per_second,
                     ) as dest_vault,
                 ):
                     replicate_paths(
@@ -508,4 +660,5 @@ def run(dry_run: bool) -> None:
                         source_vault=source_vault,
                         dest_vault=dest_vault,
                         replications=replication,
+                        thread_pool_size=thread_pool_size,
                     )
@@ -40,9 +40,6 @@ import reconcile.change_owners.change_log_tracking as cl
 import reconcile.openshift_base as ob
 import reconcile.openshift_resources_base as orb
 import reconcile.prometheus_rules_tester.integration as ptr
-import reconcile.terraform_resources as tfr
-import reconcile.terraform_users as tfu
-import reconcile.terraform_vpc_peerings as tfvpc
 from reconcile import queries
 from reconcile.aus.base import (
     AbstractUpgradePolicy,
@@ -93,7 +90,6 @@ from reconcile.gql_definitions.glitchtip.glitchtip_project import (
 )
 from reconcile.gql_definitions.integrations import integrations as integrations_gql
 from reconcile.gql_definitions.maintenance import maintenances as maintenances_gql
-from reconcile.jenkins_job_builder import init_jjb
 from reconcile.slack_base import slackapi_from_queries
 from reconcile.status_board import StatusBoardExporterIntegration
 from reconcile.typed_queries.alerting_services_settings import get_alerting_services
@@ -178,7 +174,6 @@ from reconcile.utils.secret_reader import (
 )
 from reconcile.utils.semver_helper import parse_semver
 from reconcile.utils.state import init_state
-from reconcile.utils.terraform_client import TerraformClient as Terraform
 from tools.cli_commands.cost_report.aws import AwsCostReportCommand
 from tools.cli_commands.cost_report.openshift import OpenShiftCostReportCommand
 from tools.cli_commands.cost_report.openshift_cost_optimization import (
@@ -1003,6 +998,8 @@ def has_cluster_account_access(cluster: dict[str, Any]) -> bool:
 @click.argument("name", default="")
 @click.pass_context
 def clusters_network(ctx: click.Context, name: str) -> None:
+    import reconcile.terraform_vpc_peerings as tfvpc
+
     settings = queries.get_app_interface_settings()
     clusters = [
         c
@@ -1352,6 +1349,9 @@ def clusters_aws_account_ids(ctx: click.Context) -> None:
 @click.argument("account_name")
 @click.pass_context
 def user_credentials_migrate_output(ctx: click.Context, account_name: str) -> None:
+    import reconcile.terraform_users as tfu
+    from reconcile.utils.terraform_client import TerraformClient as Terraform
+
     accounts = queries.get_state_aws_accounts()
     state = init_state(integration="account-notifier")
     skip_accounts, appsre_pgp_key, _ = tfu.get_reencrypt_settings()
@@ -1724,6 +1724,8 @@ def sshuttle_command(
 def jenkins_job_vault_secrets(
     ctx: click.Context, instance_name: str, job_name: str
 ) -> None:
+    from reconcile.jenkins_job_builder import init_jjb
+
     secret_reader = SecretReader(queries.get_secret_reader_settings())
     jjb: JJB = init_jjb(secret_reader, instance_name, config_name=None, print_only=True)
     jobs = jjb.get_all_jobs([job_name], instance_name)[instance_name]
@@ -1800,6 +1802,8 @@ def cluster_openshift_resources(ctx: click.Context) -> None:
 @get.command
 @click.pass_context
 def aws_terraform_resources(ctx: click.Context) -> None:
+    import reconcile.terraform_resources as tfr
+
     namespaces = tfr.get_namespaces()
     columns = ["name", "total"]
     results: dict = {}
@@ -1855,6 +1859,8 @@ def rds_region(
 @get.command
 @click.pass_context
 def rds(ctx: click.Context) -> None:
+    import reconcile.terraform_resources as tfr
+
     namespaces = tfr.get_namespaces()
     accounts = {a["name"]: a for a in queries.get_aws_accounts()}
     results = []
@@ -2357,6 +2363,7 @@ def app_interface_merge_queue(ctx: click.Context) -> None:
 @click.pass_context
 def app_interface_review_queue(ctx: click.Context) -> None:
     import reconcile.gitlab_housekeeping as glhk
+    from reconcile.jenkins_job_builder import init_jjb
 
     settings = queries.get_app_interface_settings()
     instance = queries.get_gitlab_instance()
@@ -3795,7 +3802,7 @@ def run_prometheus_test(
     use_vault = secret_reader == "vault"
     vault_settings = AppInterfaceSettingsV1(vault=use_vault)
     test = ptr.fetch_rule_and_tests(rule=rtf, vault_settings=vault_settings)
-    ptr.run_test(test=test, alerting_services=get_alerting_services())
+    ptr.run_tests([test], alerting_services=get_alerting_services(), thread_pool_size=1)
 
     print(test.result)
     if test.result is None:
@@ -4507,6 +4514,7 @@ def migrate(ctx: click.Context, dry_run: bool, skip_build: bool) -> None:
 
     E.g: qontract-reconcile --config=<config> external-resources migrate aws app-sre-stage rds dashdotdb-stage
     """
+    import reconcile.terraform_resources as tfr
 
     if not Confirm.ask(
         dedent("""
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import subprocess
+import sys
 from typing import TYPE_CHECKING
 from unittest.mock import Mock
 
@@ -412,7 +414,7 @@ def mock_review_queue_gl(mocker: MockerFixture) -> Mock:
         return_value={},
     )
     mocker.patch("tools.qontract_cli.SecretReader", autospec=True)
-    mocker.patch("tools.qontract_cli.init_jjb", autospec=True)
+    mocker.patch("reconcile.jenkins_job_builder.init_jjb", autospec=True)
     mocker.patch("tools.qontract_cli.slackapi_from_queries", autospec=True)
 
     mock_gl = mocker.patch("tools.qontract_cli.GitLabApi", autospec=True)
@@ -628,3 +630,57 @@ def test_review_queue_includes_bot_authored_self_serviceable_mr_with_pipeline_er
     )
     assert result.exit_code == 0
     assert "MR 7" in result.output
+
+
+def test_qontract_cli_does_not_import_terraform_and_jjb() -> None:
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import tools.qontract_cli"],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    modules = {
+        line.rsplit("|", 1)[-1].strip()
+        for line in result.stderr.splitlines()
+        if line.startswith("import time:") and "|" in line
+    }
+
+    assert "tools.qontract_cli" in modules
+    for module in [
+        "reconcile.terraform_resources",
+        "reconcile.terraform_users",
+        "reconcile.terraform_vpc_peerings",
+        "terrascript",
+        "jenkins_jobs",
+    ]:
+        assert module not in modules
+
+
+def test_run_prometheus_test(mocker: MockerFixture) -> None:
+    mocker.patch("reconcile.utils.binary.shutil.which", return_value="promtool")
+    mocker.patch(
+        "reconcile.utils.binary.subprocess.run",
+        return_value=Mock(stdout=b"promtool, version 2.55.1 (branch: HEAD)\n"),
+    )
+    ns = {"openshiftResources": [{"tests": ["/rules/test.yaml"]}]}
+    mocker.patch("tools.qontract_cli.orb.get_namespaces", return_value=([ns], None))
+    test = Mock(result="OK")
+    mock_fetch = mocker.patch(
+        "tools.qontract_cli.ptr.fetch_rule_and_tests", return_value=test
+    )
+    mock_run_tests = mocker.patch("tools.qontract_cli.ptr.run_tests")
+    mocker.patch("tools.qontract_cli.get_alerting_services", return_value={"service"})
+
+    runner = CliRunner()
+    result = runner.invoke(
+        qontract_cli.run_prometheus_test,
+        ["resources/rules/test.yaml", "cluster", "--secret-reader", "config"],
+        obj={},
+    )
+
+    assert result.exit_code == 0
+    assert result.output == "OK\n"
+    mock_fetch.assert_called_once()
+    mock_run_tests.assert_called_once_with(
+        [test], alerting_services={"service"}, thread_pool_size=1
+    )